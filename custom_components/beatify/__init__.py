@@ -16,18 +16,19 @@ from homeassistant.components.frontend import (
 )
 
 from .analytics import AnalyticsStorage
-from .const import DOMAIN
+from .const import CONF_ROOM_WORKERS, DOMAIN
 from .game.playlist import (
     async_discover_playlists,
     async_ensure_playlist_directory,
 )
-from .game.state import GameState
 from .server import async_register_static_paths
+from .server.rooms import GameRegistry, create_room, register_routes
 from .server.views import (
     AdminView,
     AnalyticsPageView,
     AnalyticsView,
     DashboardView,
+    DiagnosticsView,
     EndGameView,
     GameStatusView,
     LauncherView,
@@ -40,7 +41,7 @@ from .server.views import (
     StatsView,
     StatusView,
 )
-from .server.websocket import BeatifyWebSocketHandler
+from .services.game_store import GameStore
 from .services.media_player import async_get_media_players
 from .services.stats import StatsService
 
@@ -71,13 +72,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         len(playlists),
     )
 
-    # Initialize game state
-    game_state = GameState()
-
     # Initialize stats service (Story 14.4)
     stats_service = StatsService(hass)
     await stats_service.load()
-    _LOGGER.debug("Stats service initialized: %d games played", stats_service.games_played)
+    _LOGGER.debug(
+        "Stats service initialized: %d games played", stats_service.games_played
+    )
 
     # Initialize analytics storage (Story 19.1)
     analytics = AnalyticsStorage(hass)
@@ -87,20 +87,22 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Connect analytics to stats service for unified data collection
     stats_service.set_analytics(analytics)
 
-    # Connect stats service to game state for performance tracking (Story 14.4)
-    game_state.set_stats_service(stats_service)
-
-    # Initialize WebSocket handler
-    ws_handler = BeatifyWebSocketHandler(hass)
-
-    # Set up round end callback for timer expiry (Story 4.5)
-    game_state.set_round_end_callback(ws_handler.broadcast_state)
-
-    # Set up metadata update callback for fast transitions (Issue #42)
-    game_state.set_metadata_update_callback(ws_handler.broadcast_metadata_update)
+    # Default room: game state and WebSocket handler, wired to stats (Story 14.4)
+    # and analytics (Story 19.1); more rooms open when games run in parallel.
+    # With room workers, each room's game engine runs on its own event loop.
+    workers = entry.options.get(CONF_ROOM_WORKERS, False)
+    room = create_room(
+        hass, stats_service, analytics, "beatify_room_1" if workers else None
+    )
+    game_state, ws_handler = room.game, room.ws_handler
+    rooms = GameRegistry(hass, room, stats_service, analytics, workers=workers)
 
-    # Connect analytics to websocket handler for error recording (Story 19.1)
-    ws_handler.set_analytics(analytics)
+    # Restore a game interrupted by a restart or reload; snapshot from now on.
+    # The store belongs to the room's engine and reaches HA through its bridge.
+    game_store = GameStore(ws_handler.hass)
+    await ws_handler.run_in_room(game_store.async_restore, game_state)
+    ws_handler.set_game_store(game_store)
+    rooms.bind(room)
 
     # Store discovery results and game infrastructure
     hass.data[DOMAIN] = {
@@ -110,8 +112,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "playlist_dir": str(playlist_dir),
         "game": game_state,
         "ws_handler": ws_handler,
+        "rooms": rooms,
         "stats": stats_service,
         "analytics": analytics,
+        "game_store": game_store,
     }
 
     # Register HTTP views
@@ -126,13 +130,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.http.register_view(GameStatusView(hass))
     hass.http.register_view(DashboardView(hass))
     hass.http.register_view(StatsView(hass))
+    hass.http.register_view(DiagnosticsView(hass))
     hass.http.register_view(AnalyticsView(hass))
     hass.http.register_view(AnalyticsPageView(hass))
     hass.http.register_view(SongStatsView(hass))  # Story 19.7
     hass.http.register_view(PlaylistRequestsView(hass))  # Story 44
 
-    # Register WebSocket endpoint
-    hass.http.app.router.add_get("/beatify/ws", ws_handler.handle)
+    # Register WebSocket and SSE endpoints (once: they survive reloads)
+    register_routes(hass)
 
     # Register static file paths
     await async_register_static_paths(hass)
@@ -150,10 +155,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
     _LOGGER.debug("Beatify sidebar panel registered")
 
+    # Reload to apply changed options (room workers)
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
     _LOGGER.info("Beatify integration setup complete")
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the integration when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:  # noqa: ARG001
     """Unload a config entry."""
     _LOGGER.debug("Unloading Beatify integration")
@@ -167,7 +180,15 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Clean up domain data
     if DOMAIN in hass.data:
-        hass.data.pop(DOMAIN)
+        data = hass.data.pop(DOMAIN)
+        # Write out pending snapshots so a reload can restore the game
+        game_store = data.get("game_store")
+        if game_store:
+            await data["ws_handler"].run_in_room(game_store.async_flush)
+        # Stop the rooms' worker event loops
+        rooms = data.get("rooms")
+        if rooms:
+            await rooms.async_shutdown()
 
     _LOGGER.info("Beatify integration unloaded")
     return True
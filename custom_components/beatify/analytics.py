@@ -141,7 +141,9 @@ class AnalyticsStorage:
         async with self._save_lock:
             try:
                 # Ensure directory exists
-                await self._hass.async_add_executor_job(self._path.parent.mkdir, 0o755, True, True)
+                await self._hass.async_add_executor_job(
+                    self._path.parent.mkdir, 0o755, True, True
+                )
 
                 # Write to temp file first (atomic write pattern)
                 temp_path = self._path.with_suffix(".tmp")
@@ -297,7 +299,9 @@ class AnalyticsStorage:
         self._data["games"] = recent_games
 
         # Also prune old errors (keep last 90 days)
-        self._data["errors"] = [e for e in self._data["errors"] if e["timestamp"] >= cutoff]
+        self._data["errors"] = [
+            e for e in self._data["errors"] if e["timestamp"] >= cutoff
+        ]
 
         _LOGGER.info(
             "Pruned %d old games into %d monthly summaries",
@@ -380,7 +384,9 @@ class AnalyticsStorage:
             return self._playlist_display_names
 
         display_names: dict[str, str] = {}
-        playlist_dir = Path(self._hass.config.path("custom_components/beatify/playlists"))
+        playlist_dir = Path(
+            self._hass.config.path("custom_components/beatify/playlists")
+        )
 
         if not playlist_dir.exists():
             _LOGGER.debug("Playlist directory not found: %s", playlist_dir)
@@ -416,7 +422,9 @@ class AnalyticsStorage:
 
         for game in games:
             for playlist_name in game.get("playlist_names", []):
-                playlist_counts[playlist_name] = playlist_counts.get(playlist_name, 0) + 1
+                playlist_counts[playlist_name] = (
+                    playlist_counts.get(playlist_name, 0) + 1
+                )
 
         # Sort by count descending
         sorted_playlists = sorted(
@@ -432,14 +440,18 @@ class AnalyticsStorage:
 
         return [
             {
-                "name": display_names.get(slug, slug),  # Use display name or fallback to slug
+                "name": display_names.get(
+                    slug, slug
+                ),  # Use display name or fallback to slug
                 "play_count": count,
                 "percentage": round(count / total * 100, 1) if total > 0 else 0,
             }
             for slug, count in sorted_playlists
         ]
 
-    def compute_games_over_time(self, games: list[GameRecord], period: str) -> dict[str, Any]:
+    def compute_games_over_time(
+        self, games: list[GameRecord], period: str
+    ) -> dict[str, Any]:
         """
         Aggregate game counts for chart visualization (Story 19.5).
 
@@ -459,7 +471,9 @@ class AnalyticsStorage:
             # Daily aggregation
             days = 7
             granularity = "day"
-            buckets = {(now - timedelta(days=i)).strftime("%Y-%m-%d"): 0 for i in range(days)}
+            buckets = {
+                (now - timedelta(days=i)).strftime("%Y-%m-%d"): 0 for i in range(days)
+            }
 
             for game in games:
                 dt = datetime.fromtimestamp(game["ended_at"], tz=timezone.utc)
@@ -467,7 +481,10 @@ class AnalyticsStorage:
                 if key in buckets:
                     buckets[key] += 1
 
-            labels = [(now - timedelta(days=i)).strftime("%a") for i in range(days - 1, -1, -1)]
+            labels = [
+                (now - timedelta(days=i)).strftime("%a")
+                for i in range(days - 1, -1, -1)
+            ]
             values = [
                 buckets[(now - timedelta(days=i)).strftime("%Y-%m-%d")]
                 for i in range(days - 1, -1, -1)
@@ -554,7 +571,9 @@ class AnalyticsStorage:
             status = "critical"
 
         # Recent errors (last 10)
-        recent_errors = sorted(period_errors, key=lambda e: e["timestamp"], reverse=True)[:10]
+        recent_errors = sorted(
+            period_errors, key=lambda e: e["timestamp"], reverse=True
+        )[:10]
 
         return {
             "error_rate": round(error_rate, 4),
@@ -586,7 +605,9 @@ class AnalyticsStorage:
 
         # Get games for current and previous periods
         current_games = self.get_games(start_date=current_start, end_date=now)
-        previous_games = self.get_games(start_date=previous_start, end_date=current_start - 1)
+        previous_games = self.get_games(
+            start_date=previous_start, end_date=current_start - 1
+        )
 
         # Get errors for current period
         current_errors = self.get_errors(start_date=current_start, end_date=now)
@@ -610,16 +631,28 @@ class AnalyticsStorage:
         prev_total_games = len(previous_games)
         prev_total_players = sum(g["player_count"] for g in previous_games)
         prev_total_rounds = sum(g["rounds_played"] for g in previous_games)
-        prev_total_score = sum(g["average_score"] * g["player_count"] for g in previous_games)
-        prev_errors = self.get_errors(start_date=previous_start, end_date=current_start - 1)
+        prev_total_score = sum(
+            g["average_score"] * g["player_count"] for g in previous_games
+        )
+        prev_errors = self.get_errors(
+            start_date=previous_start, end_date=current_start - 1
+        )
         prev_total_errors = len(prev_errors)
 
-        prev_avg_players = prev_total_players / prev_total_games if prev_total_games > 0 else 0
-        prev_avg_score = prev_total_score / prev_total_players if prev_total_players > 0 else 0
-        prev_error_rate = prev_total_errors / prev_total_rounds if prev_total_rounds > 0 else 0
+        prev_avg_players = (
+            prev_total_players / prev_total_games if prev_total_games > 0 else 0
+        )
+        prev_avg_score = (
+            prev_total_score / prev_total_players if prev_total_players > 0 else 0
+        )
+        prev_error_rate = (
+            prev_total_errors / prev_total_rounds if prev_total_rounds > 0 else 0
+        )
 
         # Story 19.9: Calculate previous period average rounds
-        prev_avg_rounds = prev_total_rounds / prev_total_games if prev_total_games > 0 else 0
+        prev_avg_rounds = (
+            prev_total_rounds / prev_total_games if prev_total_games > 0 else 0
+        )
 
         # Calculate trends (percentage change)
         def calc_trend(current: float, previous: float) -> float:
@@ -630,7 +663,9 @@ class AnalyticsStorage:
         # Compute additional data for dashboard sections
         playlists = self.compute_playlist_stats(current_games)
         chart_data = self.compute_games_over_time(current_games, period)
-        error_stats = self.compute_error_stats(current_games, self._data["errors"], period)
+        error_stats = self.compute_error_stats(
+            current_games, self._data["errors"], period
+        )
 
         # Story 19.8: Calculate peak concurrent players
         peak_players = max((g["player_count"] for g in current_games), default=0)
@@ -652,7 +687,9 @@ class AnalyticsStorage:
                 "players": round(calc_trend(avg_players, prev_avg_players), 2),
                 "score": round(calc_trend(avg_score, prev_avg_score), 2),
                 "errors": round(calc_trend(error_rate, prev_error_rate), 2),
-                "rounds": round(calc_trend(avg_rounds, prev_avg_rounds), 2),  # Story 19.9
+                "rounds": round(
+                    calc_trend(avg_rounds, prev_avg_rounds), 2
+                ),  # Story 19.9
             },
             "playlists": playlists,
             "chart_data": chart_data,
@@ -734,6 +771,7 @@ class AnalyticsStorage:
 
 # Error type constants (AC: #2)
 ERROR_WEBSOCKET_DISCONNECT = "WEBSOCKET_DISCONNECT"
+ERROR_WEBSOCKET_SATURATED = "WEBSOCKET_SATURATED"
 ERROR_MEDIA_PLAYER_ERROR = "MEDIA_PLAYER_ERROR"
 ERROR_PLAYBACK_FAILURE = "PLAYBACK_FAILURE"
 ERROR_STATE_TRANSITION = "STATE_TRANSITION_ERROR"
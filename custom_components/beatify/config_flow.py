@@ -6,10 +6,16 @@ import logging
 from typing import Any
 
 import voluptuous as vol
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
+from homeassistant.core import callback
 from homeassistant.helpers import entity_registry as er
 
-from .const import DOMAIN
+from .const import CONF_ROOM_WORKERS, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -19,6 +25,12 @@ class BeatifyConfigFlow(ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> BeatifyOptionsFlow:
+        """Return the options flow."""
+        return BeatifyOptionsFlow(config_entry)
+
     async def async_step_user(
         self,
         user_input: dict[str, Any] | None = None,
@@ -51,7 +63,9 @@ class BeatifyConfigFlow(ConfigFlow, domain=DOMAIN):
             description_placeholders = {"warning": warning_msg}
         else:
             # Show available media players with friendly names
-            player_list = ", ".join(p.get("friendly_name", p["entity_id"]) for p in media_players)
+            player_list = ", ".join(
+                p.get("friendly_name", p["entity_id"]) for p in media_players
+            )
             count = len(media_players)
             description_placeholders = {
                 "warning": f"✓ Found {count} media player(s): {player_list}"
@@ -90,3 +104,31 @@ class BeatifyConfigFlow(ConfigFlow, domain=DOMAIN):
             [p["entity_id"] for p in media_players],
         )
         return media_players
+
+
+class BeatifyOptionsFlow(OptionsFlow):
+    """Options flow for Beatify."""
+
+    def __init__(self, config_entry: ConfigEntry) -> None:
+        """Initialize options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(
+        self,
+        user_input: dict[str, Any] | None = None,
+    ) -> ConfigFlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_ROOM_WORKERS,
+                        default=self._entry.options.get(CONF_ROOM_WORKERS, False),
+                    ): bool,
+                }
+            ),
+        )
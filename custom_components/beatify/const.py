@@ -4,7 +4,15 @@ DOMAIN = "beatify"
 
 # Game configuration
 MAX_PLAYERS = 20
+# Large-room mode (office parties): higher cap, players get a trimmed view
+MAX_PLAYERS_LARGE_ROOM = 500
+LARGE_ROOM_VISIBLE_PLAYERS = 25  # Top players listed in each player's state
+LEADERBOARD_TOP_K = 10  # Leaderboard entries broadcast to players in large rooms
 MIN_PLAYERS = 2
+# Concurrent games (rooms), each with its own speaker
+MAX_ROOMS = 4
+# Option: run each room's game engine on its own worker event loop (server/worker.py)
+CONF_ROOM_WORKERS = "room_workers"
 DEFAULT_ROUND_DURATION = 45  # seconds
 ROUND_DURATION_MIN = 15  # seconds (Story 13.1)
 ROUND_DURATION_MAX = 60  # seconds (Story 13.1)
@@ -12,6 +20,54 @@ MAX_NAME_LENGTH = 20
 MIN_NAME_LENGTH = 1
 LOBBY_DISCONNECT_GRACE_PERIOD = 5  # seconds before removing disconnected player
 
+# WebSocket permessage-deflate: frames smaller than this are sent uncompressed
+WS_COMPRESS_THRESHOLD = 1024  # bytes
+
+# Per-connection outbound queue: max queued frames and max seconds per write
+# before a connection counts as saturated and is evicted
+WS_OUTBOUND_QUEUE_SIZE = 64
+WS_SEND_TIMEOUT = 10  # seconds
+
+# Minimum seconds between rate-capped state broadcasts (phase changes bypass)
+STATE_BROADCAST_MIN_INTERVAL = 0.25
+
+# Minimum seconds between state pushes to read-only spectators (phase changes bypass)
+SPECTATOR_UPDATE_INTERVAL = 1.0
+
+# Server-Sent Events fallback: seconds between keepalive comments on idle streams
+SSE_KEEPALIVE_INTERVAL = 15
+
+# Largest inbound WebSocket frame / SSE message body accepted (client messages are tiny)
+WS_MAX_MESSAGE_SIZE = 16 * 1024  # bytes
+
+# Per-connection inbound token buckets: message class -> (burst, tokens per second).
+# "frame" applies to every inbound frame before it is parsed; the other classes
+# apply to the parsed message type (see server/ratelimit.py), "default" to the rest.
+WS_INBOUND_RATE_LIMITS: dict[str, tuple[int, float]] = {
+    "frame": (40, 20.0),
+    "state": (5, 1.0),
+    "reaction": (5, 2.0),
+    "steal_targets": (5, 1.0),
+    "sync": (8, 1.0),
+    "default": (20, 10.0),
+}
+
+# Application-level ping/pong: seconds between RTT probes on each connection
+WS_PING_INTERVAL = 10
+
+# Clock sync: client offsets at or above this are logged (see server/clock_sync.py)
+CLOCK_SKEW_WARN_MS = 2000
+
+# Latency-compensated speed scoring (opt-in per game): at most this many seconds
+# of estimated one-way latency (RTT / 2) are taken off a player's elapsed time
+LATENCY_COMPENSATION_MAX = 0.25  # seconds
+
+# Broadcast events kept per game for reconnect replay (see server/event_log.py)
+EVENT_LOG_SIZE = 256
+
+# Album art URLs remembered by song URI, so prefetched rounds start with artwork
+ALBUM_ART_CACHE_SIZE = 1000
+
 # Year range for guesses
 YEAR_MIN = 1950
 YEAR_MAX = 2026
@@ -90,10 +146,13 @@ ERR_SESSION_NOT_FOUND = "SESSION_NOT_FOUND"  # Story 11.2
 ERR_SESSION_TAKEOVER = "SESSION_TAKEOVER"  # Story 11.2 - dual-tab scenario
 ERR_ADMIN_CANNOT_LEAVE = "ADMIN_CANNOT_LEAVE"  # Story 11.5
 ERR_NO_STEAL_AVAILABLE = "NO_STEAL_AVAILABLE"  # Story 15.3 - player has no steal
-ERR_TARGET_NOT_SUBMITTED = "TARGET_NOT_SUBMITTED"  # Story 15.3 - target hasn't submitted
+ERR_TARGET_NOT_SUBMITTED = (
+    "TARGET_NOT_SUBMITTED"  # Story 15.3 - target hasn't submitted
+)
 ERR_CANNOT_STEAL_SELF = "CANNOT_STEAL_SELF"  # Story 15.3 - cannot target self
 ERR_NO_ARTIST_CHALLENGE = "NO_ARTIST_CHALLENGE"  # Story 20.3 - no artist challenge
 ERR_NO_MOVIE_CHALLENGE = "NO_MOVIE_CHALLENGE"  # Issue #28 - no movie quiz this round
+ERR_RATE_LIMITED = "RATE_LIMITED"  # Client sends messages too fast
 
 # Song difficulty rating constants (Story 15.1)
 MIN_PLAYS_FOR_DIFFICULTY = 3  # Minimum plays before showing difficulty rating
@@ -113,9 +172,13 @@ MIN_STREAK_FOR_AWARD = 3  # Minimum streak to qualify for Lucky Streak
 MIN_BETS_FOR_AWARD = 3  # Minimum bets placed to qualify for Risk Taker
 MIN_ROUNDS_FOR_CLUTCH = 3  # Minimum rounds played for Clutch Player
 MIN_CLOSE_CALLS = 2  # Minimum close guesses to qualify for Close Calls
-MIN_MOVIE_WINS_FOR_AWARD = 1  # Minimum movie quiz bonus points for Film Buff (Issue #28)
+MIN_MOVIE_WINS_FOR_AWARD = (
+    1  # Minimum movie quiz bonus points for Film Buff (Issue #28)
+)
 MIN_ROUNDS_FOR_COMEBACK = 6  # Minimum rounds played for Comeback King (Issue #143)
-MIN_COMEBACK_IMPROVEMENT = 2.0  # Minimum avg score improvement for Comeback King (Issue #143)
+MIN_COMEBACK_IMPROVEMENT = (
+    2.0  # Minimum avg score improvement for Comeback King (Issue #143)
+)
 MAX_SUPERLATIVES = 6  # Maximum number of superlatives to display
 
 # External URLs
@@ -131,7 +194,9 @@ SUPPORTED_PLATFORMS = ("music_assistant", "sonos", "alexa_media")
 
 # Multi-provider URI patterns (Story 17.1)
 URI_PATTERN_SPOTIFY = r"^spotify:track:[a-zA-Z0-9]{22}$"
-URI_PATTERN_APPLE_MUSIC = r"^applemusic://track/\d+$"  # Preserved for playlist validation
+URI_PATTERN_APPLE_MUSIC = (
+    r"^applemusic://track/\d+$"  # Preserved for playlist validation
+)
 URI_PATTERN_YOUTUBE_MUSIC = r"^https://music\.youtube\.com/watch\?v=[a-zA-Z0-9_-]{11}$"
 URI_PATTERN_TIDAL = r"^tidal://track/\d+$"
 
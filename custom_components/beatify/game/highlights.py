@@ -7,7 +7,7 @@ Read-only tracking — does not modify scoring or game mechanics.
 from __future__ import annotations
 
 import time
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 
 
 # Priority weights for ranking highlights
@@ -63,10 +63,13 @@ class HighlightsTracker:
 
     def __init__(self) -> None:
         self._highlights: list[GameHighlight] = []
+        # Bumped on every change so GameState can reuse its cached to_dict()
+        self.revision = 0
 
     def record_event(self, highlight: GameHighlight) -> None:
         """Record a generic highlight event."""
         self._highlights.append(highlight)
+        self.revision += 1
 
     def record_exact_match(
         self, player_name: str, song_title: str, year: int, round_num: int
@@ -184,9 +187,7 @@ class HighlightsTracker:
             )
         )
 
-    def record_photo_finish(
-        self, player_names: list[str], round_num: int
-    ) -> None:
+    def record_photo_finish(self, player_names: list[str], round_num: int) -> None:
         """Record tied scores between players."""
         self.record_event(
             GameHighlight(
@@ -216,6 +217,16 @@ class HighlightsTracker:
         """Convert top highlights to JSON-serializable list for get_state()."""
         return [h.to_dict() for h in self.get_top_highlights()]
 
+    def snapshot(self) -> list[dict]:
+        """Return every recorded highlight, for a crash-safe game snapshot."""
+        return [asdict(h) for h in self._highlights]
+
+    def restore(self, items: list[dict]) -> None:
+        """Replace the recorded highlights with snapshot() output."""
+        self._highlights = [GameHighlight(**item) for item in items]
+        self.revision += 1
+
     def reset(self) -> None:
         """Clear all recorded highlights."""
         self._highlights.clear()
+        self.revision += 1
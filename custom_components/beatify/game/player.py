@@ -2,14 +2,22 @@
 
 from __future__ import annotations
 
+import itertools
 import time
 import uuid
-from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING, Any
+
+from .registry import INDEXED_FIELDS
 
 if TYPE_CHECKING:
     from aiohttp import web
 
+# Global modification stamps shared by all sessions. Every attribute write
+# takes a fresh, strictly increasing stamp, so GameState can tell whether any
+# player changed since a cached state section was built.
+_STAMPS = itertools.count(1)
+
 
 @dataclass
 class PlayerSession:
@@ -27,6 +35,8 @@ class PlayerSession:
     submitted: bool = False
     current_guess: int | None = None
     submission_time: float | None = None
+    # Estimated one-way latency (RTT / 2) when the guess was received
+    submission_latency: float = 0.0
     # Round results (for Story 4.6)
     round_score: int = 0
     years_off: int | None = None
@@ -78,7 +88,9 @@ class PlayerSession:
     )  # Time-to-submit per round (seconds)
     bets_placed: int = 0  # Total bets placed (distinct from bets_won)
     close_calls: int = 0  # Number of +/-1 year guesses (not exact)
-    round_scores: list[int] = field(default_factory=list)  # All round scores for final 3 calc
+    round_scores: list[int] = field(
+        default_factory=list
+    )  # All round scores for final 3 calc
 
     # Steal power-up tracking (Story 15.3)
     steal_available: bool = False  # True if steal unlocked and not yet used
@@ -88,17 +100,40 @@ class PlayerSession:
         default_factory=list
     )  # Per-round: who stole this player's answer
 
-    def submit_guess(self, year: int, timestamp: float) -> None:
+    def __setattr__(self, name: str, value: object) -> None:
+        """Set attribute, record a new modification stamp and update indexes."""
+        registry = self.__dict__.get("_registry") if name in INDEXED_FIELDS else None
+        old = self.__dict__.get(name)
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, "_stamp", next(_STAMPS))
+        if registry is not None:
+            # Keep the owning PlayerRegistry's socket/session/role indexes current
+            registry.field_changed(self, name, old)
+
+    @property
+    def stamp(self) -> int:
+        """
+        Modification stamp of the last attribute write.
+
+        In-place list mutations (e.g. round_results.append) do not update
+        the stamp; they always happen alongside scalar field writes.
+
+        """
+        return self._stamp
+
+    def submit_guess(self, year: int, timestamp: float, latency: float = 0.0) -> None:
         """Record a guess submission."""
         self.submitted = True
         self.current_guess = year
         self.submission_time = timestamp
+        self.submission_latency = latency
 
     def reset_round(self) -> None:
         """Reset round-specific state for new round."""
         self.submitted = False
         self.current_guess = None
         self.submission_time = None
+        self.submission_latency = 0.0
         self.round_score = 0
         self.years_off = None
         self.missed_round = False
@@ -169,6 +204,36 @@ class PlayerSession:
         # Also reset round-level state
         self.reset_round()
 
+    def to_snapshot(self) -> dict[str, Any]:
+        """
+        Serialize the session for a crash-safe game snapshot.
+
+        Returns:
+            JSON-serializable dict of every field except the WebSocket
+
+        """
+        return {f.name: getattr(self, f.name) for f in _SNAPSHOT_FIELDS}
+
+    @classmethod
+    def from_snapshot(cls, data: dict[str, Any]) -> PlayerSession:
+        """
+        Rebuild a session from to_snapshot() output.
+
+        The player comes back disconnected and without a socket; they reclaim
+        the seat by reconnecting with their session_id (or rejoining by name).
+
+        Args:
+            data: Dict produced by to_snapshot()
+
+        Returns:
+            Disconnected PlayerSession
+
+        """
+        known = {f.name for f in _SNAPSHOT_FIELDS}
+        values = {key: value for key, value in data.items() if key in known}
+        values["connected"] = False
+        return cls(ws=None, **values)
+
     @property
     def avg_submission_time(self) -> float | None:
         """Average submission time in seconds (Story 15.2)."""
@@ -180,3 +245,7 @@ class PlayerSession:
     def final_three_score(self) -> int:
         """Sum of last 3 round scores (Story 15.2)."""
         return sum(self.round_scores[-3:]) if len(self.round_scores) >= 3 else 0
+
+
+# Fields persisted by to_snapshot(): everything but the live connection
+_SNAPSHOT_FIELDS = tuple(f for f in fields(PlayerSession) if f.name != "ws")
@@ -32,7 +32,9 @@ _LOGGER = logging.getLogger(__name__)
 class PlaylistManager:
     """Manages song selection and played tracking."""
 
-    def __init__(self, songs: list[dict[str, Any]], provider: str = PROVIDER_DEFAULT) -> None:
+    def __init__(
+        self, songs: list[dict[str, Any]], provider: str = PROVIDER_DEFAULT
+    ) -> None:
         """
         Initialize with list of songs from loaded playlists.
 
@@ -65,7 +67,9 @@ class PlaylistManager:
 
         """
         available = [
-            s for s in self._songs if get_song_uri(s, self._provider) not in self._played_uris
+            s
+            for s in self._songs
+            if get_song_uri(s, self._provider) not in self._played_uris
         ]
         if not available:
             return None
@@ -89,6 +93,21 @@ class PlaylistManager:
         """Reset played tracking for new game."""
         self._played_uris.clear()
 
+    @property
+    def played_uris(self) -> list[str]:
+        """URIs marked as played so far, sorted (for game snapshots)."""
+        return sorted(self._played_uris)
+
+    def restore_played(self, uris: list[str]) -> None:
+        """
+        Replace played tracking with URIs from a game snapshot.
+
+        Args:
+            uris: URIs previously returned by played_uris
+
+        """
+        self._played_uris = set(uris)
+
     def is_exhausted(self) -> bool:
         """
         Check if all songs have been played.
@@ -128,7 +147,9 @@ MAX_YEAR = 2030
 SUPPORTED_LANGUAGES = ("en", "de", "es", "fr")
 
 
-def get_localized_field(song: dict[str, Any], field: str, language: str) -> str | list[str] | None:
+def get_localized_field(
+    song: dict[str, Any], field: str, language: str
+) -> str | list[str] | None:
     """
     Get localized field value with English fallback.
 
@@ -228,7 +249,9 @@ async def _copy_bundled_playlists(dest_dir: Path) -> None:
             if not dest_file.exists():
                 # New playlist - copy it
                 await loop.run_in_executor(None, _copy_file, playlist_file, dest_file)
-                _LOGGER.info("Copied bundled playlist %s (v%s)", playlist_file.name, bundled_ver)
+                _LOGGER.info(
+                    "Copied bundled playlist %s (v%s)", playlist_file.name, bundled_ver
+                )
             elif _compare_versions(bundled_ver, existing_ver) > 0:
                 # Bundled version is newer - update
                 await loop.run_in_executor(None, _copy_file, playlist_file, dest_file)
@@ -239,9 +262,13 @@ async def _copy_bundled_playlists(dest_dir: Path) -> None:
                     bundled_ver,
                 )
             else:
-                _LOGGER.debug("Playlist %s is up to date (v%s)", playlist_file.name, existing_ver)
+                _LOGGER.debug(
+                    "Playlist %s is up to date (v%s)", playlist_file.name, existing_ver
+                )
         except Exception as err:  # noqa: BLE001
-            _LOGGER.warning("Failed to process playlist %s: %s", playlist_file.name, err)
+            _LOGGER.warning(
+                "Failed to process playlist %s: %s", playlist_file.name, err
+            )
 
 
 def validate_playlist(data: dict[str, Any]) -> tuple[bool, list[str]]:
@@ -322,7 +349,9 @@ def validate_playlist(data: dict[str, Any]) -> tuple[bool, list[str]]:
             if re.match(URI_PATTERN_TIDAL, uri_tidal):
                 has_valid_uri = True
             else:
-                errors.append(f"Song {i + 1}: 'uri_tidal' invalid (expected tidal://track/{{id}})")
+                errors.append(
+                    f"Song {i + 1}: 'uri_tidal' invalid (expected tidal://track/{{id}})"
+                )
 
         # Error if no valid URI found
         if not has_valid_uri:
@@ -336,9 +365,13 @@ def validate_playlist(data: dict[str, Any]) -> tuple[bool, list[str]]:
             else:
                 for j, alt in enumerate(alt_artists):
                     if not isinstance(alt, str) or not alt.strip():
-                        errors.append(f"Song {i + 1}: 'alt_artists[{j}]' must be non-empty string")
+                        errors.append(
+                            f"Song {i + 1}: 'alt_artists[{j}]' must be non-empty string"
+                        )
                 # Log warning if fewer than 2 alternatives (weak challenge)
-                valid_alts = [a for a in alt_artists if isinstance(a, str) and a.strip()]
+                valid_alts = [
+                    a for a in alt_artists if isinstance(a, str) and a.strip()
+                ]
                 if len(valid_alts) < 2:
                     _LOGGER.debug(
                         "Song %d has only %d alt_artists (2 recommended)",
@@ -399,7 +432,9 @@ def filter_songs_for_provider(
             filtered.append(song)
         else:
             year = song.get("year", "unknown")
-            _LOGGER.warning("Skipping song (year %s) - no URI for provider '%s'", year, provider)
+            _LOGGER.warning(
+                "Skipping song (year %s) - no URI for provider '%s'", year, provider
+            )
             skipped += 1
 
     return (filtered, skipped)
@@ -428,7 +463,9 @@ async def async_discover_playlists(hass: HomeAssistant) -> list[dict]:
 
             # Count songs per provider (Story 17.1)
             songs = data.get("songs", [])
-            spotify_count = sum(1 for s in songs if s.get("uri") or s.get("uri_spotify"))
+            spotify_count = sum(
+                1 for s in songs if s.get("uri") or s.get("uri_spotify")
+            )
             apple_music_count = sum(1 for s in songs if s.get("uri_apple_music"))
             youtube_music_count = sum(1 for s in songs if s.get("uri_youtube_music"))
             tidal_count = sum(1 for s in songs if s.get("uri_tidal"))
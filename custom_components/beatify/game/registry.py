@@ -0,0 +1,259 @@
+"""Indexed player registry for Beatify.
+
+``GameState.players`` maps display name to PlayerSession. The registry is a
+dict subclass with the same interface, plus O(1) secondary indexes by
+WebSocket, session ID, lower-cased name and role, so handlers never scan
+all players to find a sender.
+
+The socket and role indexes follow attribute writes on the sessions
+themselves (``player.ws = ws``, ``player.is_admin = True``): PlayerSession
+notifies the registry it belongs to when an indexed field changes.
+
+The registry also tracks which connected players still owe a guess
+(``submitted``, ``has_artist_guess``, ``has_movie_guess``), so the early
+reveal check after every submission is O(1) instead of a scan of the room.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from .player import PlayerSession
+
+ROLE_ADMIN = "admin"
+ROLE_PLAYER = "player"
+
+# Per-round progress flags counted over connected players
+PROGRESS_FIELDS = ("submitted", "has_artist_guess", "has_movie_guess")
+
+# PlayerSession fields mirrored in the registry's indexes
+INDEXED_FIELDS = frozenset(
+    {"ws", "is_admin", "session_id", "connected", *PROGRESS_FIELDS}
+)
+
+
+def name_key(name: str) -> str:
+    """Return the case-insensitive key under which player names are compared."""
+    return name.lower()
+
+
+def _role(player: PlayerSession) -> str:
+    return ROLE_ADMIN if player.is_admin else ROLE_PLAYER
+
+
+def _attach(
+    player: PlayerSession, registry: PlayerRegistry | None, name: str | None
+) -> None:
+    # Bypass PlayerSession.__setattr__: these are not game state
+    object.__setattr__(player, "_registry", registry)
+    object.__setattr__(player, "_registry_name", name)
+
+
+def _detach(player: PlayerSession) -> None:
+    _attach(player, None, None)
+
+
+class PlayerRegistry(dict[str, "PlayerSession"]):
+    """Players by name, with O(1) lookups by socket, session, name key and role."""
+
+    def __init__(self, players: Iterable[PlayerSession] = ()) -> None:
+        """
+        Initialize registry.
+
+        Args:
+            players: Sessions to register (keyed by their name)
+
+        """
+        super().__init__()
+        self._by_key: dict[str, str] = {}
+        self._by_session: dict[str, str] = {}
+        self._by_ws: dict[Any, str] = {}
+        self._by_role: dict[str, dict[str, None]] = {ROLE_ADMIN: {}, ROLE_PLAYER: {}}
+        self._connected: dict[str, None] = {}
+        # Connected players whose progress flag is still False, per flag
+        self._pending: dict[str, dict[str, None]] = {
+            flag: {} for flag in PROGRESS_FIELDS
+        }
+        for player in players:
+            self[player.name] = player
+
+    # -- dict mutators (keep the indexes in sync) ---------------------------
+
+    def __setitem__(self, name: str, player: PlayerSession) -> None:
+        """Register a player under ``name``, replacing any previous entry."""
+        if name in self:
+            self._unindex(name, super().__getitem__(name))
+        super().__setitem__(name, player)
+        self._index(name, player)
+
+    def __delitem__(self, name: str) -> None:
+        """Unregister a player."""
+        player = super().__getitem__(name)
+        super().__delitem__(name)
+        self._unindex(name, player)
+
+    def pop(self, name: str, *default: Any) -> Any:
+        """Unregister and return a player (dict.pop semantics)."""
+        if name not in self:
+            if default:
+                return default[0]
+            raise KeyError(name)
+        player = super().__getitem__(name)
+        del self[name]
+        return player
+
+    def popitem(self) -> tuple[str, PlayerSession]:
+        """Unregister and return the most recently added player."""
+        name = next(reversed(self))
+        return name, self.pop(name)
+
+    def setdefault(self, name: str, default: PlayerSession) -> PlayerSession:
+        """Register ``default`` unless ``name`` exists (dict semantics)."""
+        if name not in self:
+            self[name] = default
+        return super().__getitem__(name)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        """Register several players (dict.update semantics)."""
+        for name, player in dict(*args, **kwargs).items():
+            self[name] = player
+
+    def clear(self) -> None:
+        """Unregister all players."""
+        for player in self.values():
+            _detach(player)
+        super().clear()
+        self._by_key.clear()
+        self._by_session.clear()
+        self._by_ws.clear()
+        for names in self._by_role.values():
+            names.clear()
+        self._connected.clear()
+        for names in self._pending.values():
+            names.clear()
+
+    # -- lookups ------------------------------------------------------------
+
+    def get_by_key(self, name: str) -> PlayerSession | None:
+        """Find a player by name, ignoring case."""
+        registered = self._by_key.get(name_key(name))
+        return self.get(registered) if registered is not None else None
+
+    def get_by_session(self, session_id: str) -> PlayerSession | None:
+        """Find a player by session ID."""
+        registered = self._by_session.get(session_id)
+        return self.get(registered) if registered is not None else None
+
+    def get_by_ws(self, ws: Any) -> PlayerSession | None:
+        """Find the player currently bound to a WebSocket."""
+        if ws is None:
+            return None
+        registered = self._by_ws.get(ws)
+        return self.get(registered) if registered is not None else None
+
+    def by_role(self, role: str) -> list[PlayerSession]:
+        """Return all players with a role."""
+        return [self[name] for name in self._by_role[role]]
+
+    @property
+    def admin(self) -> PlayerSession | None:
+        """The admin player, if any."""
+        for name in self._by_role[ROLE_ADMIN]:
+            return self[name]
+        return None
+
+    @property
+    def connected_count(self) -> int:
+        """Number of connected players."""
+        return len(self._connected)
+
+    def pending_count(self, flag: str) -> int:
+        """
+        Count connected players whose progress flag is not set yet.
+
+        Args:
+            flag: One of PROGRESS_FIELDS
+
+        Returns:
+            Number of connected players with ``flag`` False
+
+        """
+        return len(self._pending[flag])
+
+    @property
+    def session_count(self) -> int:
+        """Number of sessions that can still be resumed."""
+        return len(self._by_session)
+
+    def clear_sessions(self) -> None:
+        """Invalidate all session IDs without removing players."""
+        self._by_session.clear()
+
+    # -- index maintenance ----------------------------------------------------
+
+    def _index(self, name: str, player: PlayerSession) -> None:
+        _attach(player, self, name)
+        self._by_key[name_key(name)] = name
+        self._by_session[player.session_id] = name
+        if player.ws is not None:
+            self._by_ws[player.ws] = name
+        self._by_role[_role(player)][name] = None
+        self._index_progress(name, player)
+
+    def _index_progress(self, name: str, player: PlayerSession) -> None:
+        self._connected.pop(name, None)
+        for names in self._pending.values():
+            names.pop(name, None)
+        if not player.connected:
+            return
+        self._connected[name] = None
+        for flag, names in self._pending.items():
+            if not getattr(player, flag):
+                names[name] = None
+
+    def _unindex(self, name: str, player: PlayerSession) -> None:
+        _detach(player)
+        if self._by_key.get(name_key(name)) == name:
+            del self._by_key[name_key(name)]
+        if self._by_session.get(player.session_id) == name:
+            del self._by_session[player.session_id]
+        if player.ws is not None and self._by_ws.get(player.ws) == name:
+            del self._by_ws[player.ws]
+        for names in self._by_role.values():
+            names.pop(name, None)
+        self._connected.pop(name, None)
+        for names in self._pending.values():
+            names.pop(name, None)
+
+    def field_changed(self, player: PlayerSession, field: str, old: Any) -> None:
+        """
+        Update the indexes after an indexed PlayerSession field changed.
+
+        Args:
+            player: Session whose attribute was written
+            field: Name of the written attribute (one of INDEXED_FIELDS)
+            old: Previous value
+
+        """
+        name = player.__dict__.get("_registry_name")
+        if name is None or self.get(name) is not player:
+            return
+        if field == "ws":
+            if old is not None and self._by_ws.get(old) == name:
+                del self._by_ws[old]
+            if player.ws is not None:
+                self._by_ws[player.ws] = name
+        elif field == "session_id":
+            if self._by_session.get(old) == name:
+                del self._by_session[old]
+            self._by_session[player.session_id] = name
+        elif field == "is_admin":
+            for names in self._by_role.values():
+                names.pop(name, None)
+            self._by_role[_role(player)][name] = None
+        else:
+            # connected or a progress flag
+            self._index_progress(name, player)
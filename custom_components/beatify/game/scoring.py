@@ -7,15 +7,22 @@ Advanced scoring (Epic 5) adds speed bonus, streaks, and betting.
 
 from __future__ import annotations
 
+import bisect
 from statistics import mean, median
 from typing import TYPE_CHECKING, Any
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on environment
+    np = None
+
 from custom_components.beatify.const import (
     ARTIST_BONUS_POINTS,
     DIFFICULTY_DEFAULT,
     DIFFICULTY_SCORING,
     INTRO_BONUS_TIERS,
     INTRO_DURATION_SECONDS,
+    LATENCY_COMPENSATION_MAX,
     MAX_SUPERLATIVES,
     MIN_BETS_FOR_AWARD,
     MIN_CLOSE_CALLS,
@@ -37,6 +44,11 @@ POINTS_WRONG = 0
 POINTS_ARTIST_EXACT = 10
 POINTS_ARTIST_PARTIAL = 5
 
+# ScoringService.score_round computes round scores as arrays from this many
+# scoring players on when NumPy is installed (below, the loop is faster)
+NUMPY_AVAILABLE = np is not None
+NUMPY_MIN_PLAYERS = 64
+
 
 def calculate_accuracy_score(
     guess: int,
@@ -78,7 +90,9 @@ def calculate_accuracy_score(
     return POINTS_WRONG
 
 
-def calculate_speed_multiplier(elapsed_time: float, round_duration: float) -> float:
+def calculate_speed_multiplier(
+    elapsed_time: float, round_duration: float, latency: float = 0.0
+) -> float:
     """
     Calculate speed bonus multiplier based on submission timing.
 
@@ -86,9 +100,14 @@ def calculate_speed_multiplier(elapsed_time: float, round_duration: float) -> fl
     - Instant submission (0s): 2.0x multiplier (double points!)
     - At deadline (30s): 1.0x multiplier (no bonus)
 
+    With latency compensation, the player's estimated one-way network
+    latency is taken off the elapsed time, capped at LATENCY_COMPENSATION_MAX
+    so a slow connection cannot buy more than a fraction of a second.
+
     Args:
         elapsed_time: Seconds elapsed since round started when player submitted
         round_duration: Total round duration in seconds (default 30)
+        latency: Estimated one-way latency in seconds (0 = no compensation)
 
     Returns:
         Multiplier between 1.0 and 2.0
@@ -97,6 +116,9 @@ def calculate_speed_multiplier(elapsed_time: float, round_duration: float) -> fl
     if round_duration <= 0:
         return 1.0
 
+    if latency > 0:
+        elapsed_time -= min(latency, LATENCY_COMPENSATION_MAX)
+
     # Calculate ratio (0.0 = instant, 1.0 = at deadline)
     submission_time_ratio = elapsed_time / round_duration
 
@@ -113,6 +135,7 @@ def calculate_round_score(
     elapsed_time: float,
     round_duration: float,
     difficulty: str = DIFFICULTY_DEFAULT,
+    latency: float = 0.0,
 ) -> tuple[int, int, float]:
     """
     Calculate total round score with speed bonus.
@@ -123,13 +146,14 @@ def calculate_round_score(
         elapsed_time: Seconds elapsed since round started
         round_duration: Total round duration in seconds
         difficulty: Difficulty level (easy/normal/hard)
+        latency: Estimated one-way latency to compensate (see calculate_speed_multiplier)
 
     Returns:
         Tuple of (final_score, base_score, speed_multiplier)
 
     """
     base_score = calculate_accuracy_score(guess, actual, difficulty)
-    speed_multiplier = calculate_speed_multiplier(elapsed_time, round_duration)
+    speed_multiplier = calculate_speed_multiplier(elapsed_time, round_duration, latency)
     final_score = int(base_score * speed_multiplier)
     return final_score, base_score, speed_multiplier
 
@@ -239,6 +263,8 @@ def calculate_artist_score(guess: str | None, actual: str) -> tuple[int, str | N
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from .player import PlayerSession
 
 
@@ -274,7 +300,9 @@ class ScoringService:
             return awards
 
         speed_candidates = [
-            (p, p.avg_submission_time) for p in players if p.avg_submission_time is not None
+            (p, p.avg_submission_time)
+            for p in players
+            if p.avg_submission_time is not None
         ]
         if speed_candidates:
             fastest = min(speed_candidates, key=lambda x: x[1])
@@ -341,7 +369,9 @@ class ScoringService:
                         }
                     )
 
-        close_candidates = [(p, p.close_calls) for p in players if p.close_calls >= MIN_CLOSE_CALLS]
+        close_candidates = [
+            (p, p.close_calls) for p in players if p.close_calls >= MIN_CLOSE_CALLS
+        ]
         if close_candidates:
             closest = max(close_candidates, key=lambda x: x[1])
             awards.append(
@@ -401,7 +431,9 @@ class ScoringService:
                 if len(p.round_scores) >= MIN_ROUNDS_FOR_COMEBACK:
                     mid = len(p.round_scores) // 2
                     first_half = sum(p.round_scores[:mid]) / mid
-                    second_half = sum(p.round_scores[mid:]) / (len(p.round_scores) - mid)
+                    second_half = sum(p.round_scores[mid:]) / (
+                        len(p.round_scores) - mid
+                    )
                     improvement = second_half - first_half
                     if improvement > MIN_COMEBACK_IMPROVEMENT:
                         comeback_candidates.append((p, round(improvement, 1)))
@@ -438,7 +470,11 @@ class ScoringService:
 
         all_guesses = sorted(
             [
-                {"name": p.name, "guess": p.current_guess, "years_off": p.years_off or 0}
+                {
+                    "name": p.name,
+                    "guess": p.current_guess,
+                    "years_off": p.years_off or 0,
+                }
                 for p in submitted
             ],
             key=lambda x: x["years_off"],
@@ -456,7 +492,9 @@ class ScoringService:
 
         speed_champion = None
         timed = [
-            p for p in submitted if p.submission_time is not None and round_start_time is not None
+            p
+            for p in submitted
+            if p.submission_time is not None and round_start_time is not None
         ]
         if timed:
             elapsed = [(p, p.submission_time - round_start_time) for p in timed]
@@ -487,6 +525,31 @@ class ScoringService:
             correct_decade=_get_decade_label(correct_year),
         )
 
+    @staticmethod
+    def intro_submission_times(
+        players: Iterable[PlayerSession], intro_round_start_time: float | None
+    ) -> list[float]:
+        """
+        Collect the submission times inside the intro window, sorted.
+
+        Args:
+            players: All players in the game
+            intro_round_start_time: Start of the intro round, or None
+
+        Returns:
+            Ascending submission times before the intro cutoff (empty if
+            the round is not an intro round)
+
+        """
+        if not intro_round_start_time:
+            return []
+        cutoff = intro_round_start_time + INTRO_DURATION_SECONDS
+        return sorted(
+            p.submission_time
+            for p in players
+            if p.submission_time is not None and p.submission_time < cutoff
+        )
+
     @staticmethod
     def score_player_round(
         player: PlayerSession,
@@ -502,117 +565,355 @@ class ScoringService:
         all_players: list[PlayerSession],
         streak_achievements: dict[str, int],
         bet_tracking: dict[str, int],
+        latency_compensation: bool = False,
+        intro_times: list[float] | None = None,
     ) -> None:
-        """Score a single player for the current round. Mutates player in-place."""
+        """
+        Score a single player for the current round. Mutates player in-place.
+
+        ``intro_times`` is the sorted list from ``intro_submission_times()``;
+        callers scoring a whole room should compute it once and pass it in,
+        otherwise it is rebuilt from ``all_players`` for this player. Use
+        ``score_round()`` to score a whole room in one pass.
+
+        """
+        scored = None
+        intro_rank = None
         if player.submitted and correct_year is not None:
             elapsed = (
                 player.submission_time - round_start_time
                 if player.submission_time is not None and round_start_time is not None
                 else round_duration
             )
-            speed_score, player.base_score, player.speed_multiplier = calculate_round_score(
-                player.current_guess, correct_year, elapsed, round_duration, difficulty
+            scored = calculate_round_score(
+                player.current_guess,
+                correct_year,
+                elapsed,
+                round_duration,
+                difficulty,
+                player.submission_latency if latency_compensation else 0.0,
             )
-            player.years_off = abs(player.current_guess - correct_year)
-            player.missed_round = False
-            player.round_score, player.bet_outcome = apply_bet_multiplier(speed_score, player.bet)
-
-            if speed_score > 0:
-                player.previous_streak = 0
-                player.streak += 1
-                # Track streak achievements (Issue #147)
-                if player.streak == 3:
-                    streak_achievements["streak_3"] += 1
-                elif player.streak == 5:
-                    streak_achievements["streak_5"] += 1
-                elif player.streak == 10:
-                    streak_achievements["streak_10"] += 1
-                elif player.streak == 15:
-                    streak_achievements["streak_15"] += 1
-                elif player.streak == 20:
-                    streak_achievements["streak_20"] += 1
-                elif player.streak == 25:
-                    streak_achievements["streak_25"] += 1
-                player.streak_bonus = calculate_streak_bonus(player.streak)
-                if player.streak == STEAL_UNLOCK_STREAK:
-                    player.unlock_steal()
-            else:
-                player.previous_streak = player.streak
-                player.streak = 0
-                player.streak_bonus = 0
-
-            player.artist_bonus = (
+            if is_intro_round and intro_round_start_time:
+                cutoff = intro_round_start_time + INTRO_DURATION_SECONDS
+                if player.submission_time and player.submission_time < cutoff:
+                    if intro_times is None:
+                        intro_times = ScoringService.intro_submission_times(
+                            all_players, intro_round_start_time
+                        )
+                    # Players who submitted strictly earlier within the intro
+                    intro_rank = bisect.bisect_left(intro_times, player.submission_time)
+
+        _apply_player_round(
+            player,
+            scored,
+            correct_year=correct_year,
+            round_start_time=round_start_time,
+            artist_bonus=(
                 ARTIST_BONUS_POINTS
                 if artist_challenge and artist_challenge.winner == player.name
                 else 0
+            ),
+            movie_bonus=movie_challenge.get_player_bonus(player.name)
+            if movie_challenge
+            else 0,
+            intro_rank=intro_rank,
+            streak_achievements=streak_achievements,
+            bet_tracking=bet_tracking,
+        )
+
+    @staticmethod
+    def score_round(
+        players: list[PlayerSession],
+        *,
+        correct_year: int | None,
+        round_start_time: float | None,
+        round_duration: float,
+        difficulty: str,
+        artist_challenge: Any | None,
+        movie_challenge: Any | None,
+        is_intro_round: bool,
+        intro_round_start_time: float | None,
+        streak_achievements: dict[str, int],
+        bet_tracking: dict[str, int],
+        latency_compensation: bool = False,
+        use_numpy: bool | None = None,
+    ) -> None:
+        """
+        Score all players for the current round in one pass. Mutates players in-place.
+
+        Gives the same results as ``score_player_round()`` for each player,
+        but sorts the intro submission times once into a time -> rank map
+        and reads movie bonuses from a name -> bonus map instead of
+        searching per player. Round scores of large rooms are computed as
+        arrays when NumPy is installed.
+
+        Args:
+            players: All players in the game
+            correct_year: Year of the round's song (None: nobody scores)
+            round_start_time: Start of the round
+            round_duration: Round duration in seconds
+            difficulty: Difficulty level
+            artist_challenge: Round's artist challenge, or None
+            movie_challenge: Round's movie challenge, or None
+            is_intro_round: Whether the round is an intro round
+            intro_round_start_time: Start of the intro round, or None
+            streak_achievements: Game streak counters (updated)
+            bet_tracking: Game bet counters (updated)
+            latency_compensation: Take players' latency off their elapsed time
+            use_numpy: Force the array (True) or per-player (False) round
+                score computation (default: arrays from NUMPY_MIN_PLAYERS
+                scoring players when NumPy is installed)
+
+        """
+        scoring = (
+            [p for p in players if p.submitted] if correct_year is not None else []
+        )
+        if use_numpy is None:
+            use_numpy = NUMPY_AVAILABLE and len(scoring) >= NUMPY_MIN_PLAYERS
+        round_scores = _round_scores_numpy if use_numpy else _round_scores
+        scores = round_scores(
+            scoring,
+            correct_year,
+            round_start_time,
+            round_duration,
+            difficulty,
+            latency_compensation,
+        )
+
+        # Submission time -> intro rank (players who submitted strictly earlier)
+        intro_ranks: dict[float, int] = {}
+        cutoff = None
+        if is_intro_round and intro_round_start_time:
+            cutoff = intro_round_start_time + INTRO_DURATION_SECONDS
+            for rank, submitted_at in enumerate(
+                ScoringService.intro_submission_times(players, intro_round_start_time)
+            ):
+                intro_ranks.setdefault(submitted_at, rank)
+
+        movie_bonuses = movie_challenge.bonuses() if movie_challenge else {}
+        artist_winner = artist_challenge.winner if artist_challenge else None
+
+        for player in players:
+            scored = scores.get(id(player))
+            intro_rank = None
+            if (
+                scored is not None
+                and cutoff is not None
+                and player.submission_time
+                and player.submission_time < cutoff
+            ):
+                intro_rank = intro_ranks[player.submission_time]
+            _apply_player_round(
+                player,
+                scored,
+                correct_year=correct_year,
+                round_start_time=round_start_time,
+                artist_bonus=ARTIST_BONUS_POINTS if artist_winner == player.name else 0,
+                movie_bonus=movie_bonuses.get(player.name, 0),
+                intro_rank=intro_rank,
+                streak_achievements=streak_achievements,
+                bet_tracking=bet_tracking,
             )
 
-            if movie_challenge:
-                player.movie_bonus = movie_challenge.get_player_bonus(player.name)
-                player.movie_bonus_total += player.movie_bonus
-            else:
-                player.movie_bonus = 0
 
-            player.intro_bonus = 0
-            if is_intro_round and intro_round_start_time:
-                cutoff = intro_round_start_time + INTRO_DURATION_SECONDS
-                if player.submission_time and player.submission_time < cutoff:
-                    player.intro_speed_bonuses += 1
-                    rank = len(
-                        [
-                            p
-                            for p in all_players
-                            if p.submission_time is not None
-                            and p.submission_time < cutoff
-                            and p.submission_time < player.submission_time
-                        ]
-                    )
-                    if rank < len(INTRO_BONUS_TIERS):
-                        player.intro_bonus = INTRO_BONUS_TIERS[rank]
-
-            player.score += (
-                player.round_score
-                + player.streak_bonus
-                + player.artist_bonus
-                + player.movie_bonus
-                + player.intro_bonus
+def _round_scores(
+    players: list[PlayerSession],
+    correct_year: int,
+    round_start_time: float | None,
+    round_duration: float,
+    difficulty: str,
+    latency_compensation: bool,
+) -> dict[int, tuple[int, int, float]]:
+    """
+    Compute the round scores of submitted players one by one.
+
+    Returns:
+        id(player) -> (speed_score, base_score, speed_multiplier)
+
+    """
+    scores = {}
+    for player in players:
+        elapsed = (
+            player.submission_time - round_start_time
+            if player.submission_time is not None and round_start_time is not None
+            else round_duration
+        )
+        scores[id(player)] = calculate_round_score(
+            player.current_guess,
+            correct_year,
+            elapsed,
+            round_duration,
+            difficulty,
+            player.submission_latency if latency_compensation else 0.0,
+        )
+    return scores
+
+
+def _round_scores_numpy(
+    players: list[PlayerSession],
+    correct_year: int,
+    round_start_time: float | None,
+    round_duration: float,
+    difficulty: str,
+    latency_compensation: bool,
+) -> dict[int, tuple[int, int, float]]:
+    """
+    Compute the round scores of submitted players as arrays.
+
+    Same float64 operations in the same order as calculate_round_score(),
+    so the results are identical.
+
+    Returns:
+        id(player) -> (speed_score, base_score, speed_multiplier)
+
+    """
+    if not players:
+        return {}
+    guesses = np.array([p.current_guess for p in players], dtype=np.int64)
+    diff = np.abs(guesses - correct_year)
+
+    # Weakest tier first, so stronger tiers overwrite it (as the checks in
+    # calculate_accuracy_score() take precedence)
+    scoring = DIFFICULTY_SCORING.get(difficulty, DIFFICULTY_SCORING[DIFFICULTY_DEFAULT])
+    base = np.full(len(players), POINTS_WRONG, dtype=np.int64)
+    if scoring["near_range"] > 0:
+        base[diff <= scoring["near_range"]] = scoring["near_points"]
+    if scoring["close_range"] > 0:
+        base[diff <= scoring["close_range"]] = scoring["close_points"]
+    base[diff == 0] = POINTS_EXACT
+
+    if round_duration <= 0:
+        multiplier = np.ones(len(players))
+    else:
+        elapsed = np.array(
+            [
+                p.submission_time - round_start_time
+                if p.submission_time is not None and round_start_time is not None
+                else round_duration
+                for p in players
+            ],
+            dtype=np.float64,
+        )
+        if latency_compensation:
+            latency = np.array(
+                [p.submission_latency for p in players], dtype=np.float64
             )
-            player.rounds_played += 1
-            player.best_streak = max(player.best_streak, player.streak)
-            if player.bet_outcome == "won":
-                player.bets_won += 1
-            if player.submission_time is not None and round_start_time is not None:
-                player.submission_times.append(player.submission_time - round_start_time)
-            if player.bet:
-                player.bets_placed += 1
-                bet_tracking["total_bets"] += 1
-                if player.bet_outcome == "won":
-                    bet_tracking["bets_won"] += 1
-            if player.years_off == 1:
-                player.close_calls += 1
-            player.round_scores.append(player.round_score)
-        else:
-            player.previous_streak = player.streak
-            player.round_score = 0
-            player.base_score = 0
-            player.speed_multiplier = 1.0
-            player.years_off = None
-            player.missed_round = True
-            player.streak = 0
-            player.streak_bonus = 0
-            player.bet_outcome = None
-            player.artist_bonus = (
-                ARTIST_BONUS_POINTS
-                if artist_challenge and artist_challenge.winner == player.name
-                else 0
+            elapsed = np.where(
+                latency > 0,
+                elapsed - np.minimum(latency, LATENCY_COMPENSATION_MAX),
+                elapsed,
             )
-            if player.artist_bonus:
-                player.score += player.artist_bonus
-            if movie_challenge:
-                player.movie_bonus = movie_challenge.get_player_bonus(player.name)
-                if player.movie_bonus > 0:
-                    player.movie_bonus_total += player.movie_bonus
-                    player.score += player.movie_bonus
-            else:
-                player.movie_bonus = 0
-            player.intro_bonus = 0
+        multiplier = 2.0 - np.clip(elapsed / round_duration, 0.0, 1.0)
+    final = (base * multiplier).astype(np.int64)
+
+    return {
+        id(player): (int(final[i]), int(base[i]), float(multiplier[i]))
+        for i, player in enumerate(players)
+    }
+
+
+def _apply_player_round(
+    player: PlayerSession,
+    scored: tuple[int, int, float] | None,
+    *,
+    correct_year: int | None,
+    round_start_time: float | None,
+    artist_bonus: int,
+    movie_bonus: int,
+    intro_rank: int | None,
+    streak_achievements: dict[str, int],
+    bet_tracking: dict[str, int],
+) -> None:
+    """
+    Apply a player's round result (shared by both ScoringService scoring paths).
+
+    Args:
+        player: Player to update
+        scored: (speed_score, base_score, speed_multiplier), or None if the
+            player did not score this round
+        correct_year: Year of the round's song
+        round_start_time: Start of the round
+        artist_bonus: Artist challenge bonus points
+        movie_bonus: Movie quiz bonus points
+        intro_rank: Rank among intro-window submissions, or None outside it
+        streak_achievements: Game streak counters (updated)
+        bet_tracking: Game bet counters (updated)
+
+    """
+    player.artist_bonus = artist_bonus
+    player.movie_bonus = movie_bonus
+    player.movie_bonus_total += movie_bonus
+
+    if scored is None:
+        player.intro_bonus = 0
+        player.previous_streak = player.streak
+        player.round_score = 0
+        player.base_score = 0
+        player.speed_multiplier = 1.0
+        player.years_off = None
+        player.missed_round = True
+        player.streak = 0
+        player.streak_bonus = 0
+        player.bet_outcome = None
+        player.score += artist_bonus + movie_bonus
+        return
+
+    speed_score, player.base_score, player.speed_multiplier = scored
+    player.years_off = abs(player.current_guess - correct_year)
+    player.missed_round = False
+    player.round_score, player.bet_outcome = apply_bet_multiplier(
+        speed_score, player.bet
+    )
+
+    if speed_score > 0:
+        player.previous_streak = 0
+        player.streak += 1
+        # Track streak achievements (Issue #147)
+        if player.streak == 3:
+            streak_achievements["streak_3"] += 1
+        elif player.streak == 5:
+            streak_achievements["streak_5"] += 1
+        elif player.streak == 10:
+            streak_achievements["streak_10"] += 1
+        elif player.streak == 15:
+            streak_achievements["streak_15"] += 1
+        elif player.streak == 20:
+            streak_achievements["streak_20"] += 1
+        elif player.streak == 25:
+            streak_achievements["streak_25"] += 1
+        player.streak_bonus = calculate_streak_bonus(player.streak)
+        if player.streak == STEAL_UNLOCK_STREAK:
+            player.unlock_steal()
+    else:
+        player.previous_streak = player.streak
+        player.streak = 0
+        player.streak_bonus = 0
+
+    intro_bonus = 0
+    if intro_rank is not None:
+        player.intro_speed_bonuses += 1
+        if intro_rank < len(INTRO_BONUS_TIERS):
+            intro_bonus = INTRO_BONUS_TIERS[intro_rank]
+    player.intro_bonus = intro_bonus
+
+    player.score += (
+        player.round_score
+        + player.streak_bonus
+        + player.artist_bonus
+        + player.movie_bonus
+        + player.intro_bonus
+    )
+    player.rounds_played += 1
+    player.best_streak = max(player.best_streak, player.streak)
+    if player.bet_outcome == "won":
+        player.bets_won += 1
+    if player.submission_time is not None and round_start_time is not None:
+        player.submission_times.append(player.submission_time - round_start_time)
+    if player.bet:
+        player.bets_placed += 1
+        bet_tracking["total_bets"] += 1
+        if player.bet_outcome == "won":
+            bet_tracking["bets_won"] += 1
+    if player.years_off == 1:
+        player.close_calls += 1
+    player.round_scores.append(player.round_score)
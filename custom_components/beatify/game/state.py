@@ -3,15 +3,18 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
+import heapq
 import logging
 import random
 import secrets
 import time
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
 from custom_components.beatify.const import (
+    ALBUM_ART_CACHE_SIZE,
     DEFAULT_ROUND_DURATION,
     DIFFICULTY_DEFAULT,
     DIFFICULTY_SCORING,
@@ -28,8 +31,11 @@ from custom_components.beatify.const import (
     ERR_TARGET_NOT_SUBMITTED,
     INTRO_DURATION_SECONDS,
     INTRO_ROUND_CHANCE,
+    LARGE_ROOM_VISIBLE_PLAYERS,
+    LEADERBOARD_TOP_K,
     MAX_NAME_LENGTH,
     MAX_PLAYERS,
+    MAX_PLAYERS_LARGE_ROOM,
     MIN_NAME_LENGTH,
     MOVIE_BONUS_TIERS,
     PROVIDER_DEFAULT,
@@ -40,10 +46,12 @@ from custom_components.beatify.const import (
 from .highlights import HighlightsTracker
 from .player import PlayerSession
 from .playlist import PlaylistManager
+from .registry import PlayerRegistry
 from .scoring import (
     ScoringService,
 )
 from .share import build_share_data
+from .timers import TimerHandle, TimerService
 
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
@@ -56,6 +64,41 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Plain JSON attributes round-tripped by GameState.to_snapshot()
+_SNAPSHOT_ATTRS = (
+    "game_id",
+    "playlists",
+    "media_player",
+    "join_url",
+    "provider",
+    "platform",
+    "language",
+    "difficulty",
+    "round_duration",
+    "volume_level",
+    "artist_challenge_enabled",
+    "movie_quiz_enabled",
+    "intro_mode_enabled",
+    "latency_compensation",
+    "large_room",
+    "round",
+    "total_rounds",
+    "deadline",
+    "current_song",
+    "last_round",
+    "pause_reason",
+    "disconnected_admin_name",
+    "round_start_time",
+    "song_stopped",
+    "streak_achievements",
+    "bet_tracking",
+    "is_intro_round",
+    "intro_stopped",
+    "_rounds_since_intro",
+    "_intro_round_start_time",
+    "_early_reveal",
+)
+
 
 class GamePhase(Enum):
     """Game phase states."""
@@ -147,8 +190,12 @@ class MovieChallenge:
 
     correct_movie: str
     options: list[str]  # Shuffled: 3 movie choices (correct + 2 decoys)
-    correct_guesses: list[dict[str, Any]] = field(default_factory=list)  # [{name, time}]
+    correct_guesses: list[dict[str, Any]] = field(
+        default_factory=list
+    )  # [{name, time}]
     wrong_guesses: list[dict[str, Any]] = field(default_factory=list)  # [{name, guess}]
+    # Name -> whether the guess was correct, for O(1) duplicate checks
+    guessed: dict[str, bool] = field(default_factory=dict, repr=False)
 
     def to_dict(self, include_answer: bool = False) -> dict[str, Any]:
         """
@@ -181,7 +228,9 @@ class MovieChallenge:
             )
         return {
             "winners": winners,
-            "wrong_guesses": [{"name": g["name"], "guess": g["guess"]} for g in self.wrong_guesses],
+            "wrong_guesses": [
+                {"name": g["name"], "guess": g["guess"]} for g in self.wrong_guesses
+            ],
         }
 
     def get_player_bonus(self, player_name: str) -> int:
@@ -195,11 +244,49 @@ class MovieChallenge:
             Bonus points (5/3/1/0 based on speed rank)
 
         """
-        for i, guess in enumerate(self.correct_guesses):
+        # Only the fastest len(MOVIE_BONUS_TIERS) correct guesses earn a bonus
+        for i, guess in enumerate(self.correct_guesses[: len(MOVIE_BONUS_TIERS)]):
             if guess["name"] == player_name:
-                return MOVIE_BONUS_TIERS[i] if i < len(MOVIE_BONUS_TIERS) else 0
+                return MOVIE_BONUS_TIERS[i]
         return 0
 
+    def bonuses(self) -> dict[str, int]:
+        """
+        Get the bonus points of all players with a bonus, for batch scoring.
+
+        Returns:
+            Player name -> bonus points (same values as get_player_bonus)
+
+        """
+        bonuses: dict[str, int] = {}
+        for i, guess in enumerate(self.correct_guesses[: len(MOVIE_BONUS_TIERS)]):
+            bonuses.setdefault(guess["name"], MOVIE_BONUS_TIERS[i])
+        return bonuses
+
+
+def _leaderboard_stats(leaderboard: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Summarize a leaderboard for views that only list its top entries.
+
+    Args:
+        leaderboard: Non-empty leaderboard in rank order (score descending)
+
+    Returns:
+        Dict with player count and top, average and median score
+
+    """
+    scores = [entry["score"] for entry in leaderboard]
+    middle = len(scores) // 2
+    median = (
+        scores[middle] if len(scores) % 2 else (scores[middle - 1] + scores[middle]) / 2
+    )
+    return {
+        "players": len(scores),
+        "top_score": scores[0],
+        "average_score": round(sum(scores) / len(scores), 1),
+        "median_score": median,
+    }
+
 
 def build_movie_options(song: dict[str, Any]) -> list[str] | None:
     """
@@ -228,7 +315,9 @@ def build_movie_options(song: dict[str, Any]) -> list[str] | None:
         return None
 
     # Filter valid choices
-    valid_choices = [c.strip() for c in movie_choices if isinstance(c, str) and c.strip()]
+    valid_choices = [
+        c.strip() for c in movie_choices if isinstance(c, str) and c.strip()
+    ]
 
     if len(valid_choices) < 2:
         return None
@@ -283,6 +372,19 @@ def build_artist_options(song: dict[str, Any]) -> list[str] | None:
     return options
 
 
+@dataclass
+class PreparedRound:
+    """The next round, prepared while the current one is revealed."""
+
+    song: dict[str, Any]
+    artist_challenge: ArtistChallenge | None
+    movie_challenge: MovieChallenge | None
+    # Cached album art for the song (None: fetched after playback starts)
+    album_art: str | None
+    # (artist_challenge_enabled, movie_quiz_enabled) the challenges were built for
+    settings: tuple[bool, bool]
+
+
 class GameState:
     """Manages game state and phase transitions."""
 
@@ -301,8 +403,8 @@ class GameState:
         self.songs: list[dict[str, Any]] = []
         self.media_player: str | None = None
         self.join_url: str | None = None
-        self.players: dict[str, PlayerSession] = {}
-        self._sessions: dict[str, str] = {}  # session_id → player_name
+        # Players by name, indexed by socket, session_id, name key and role
+        self.players: PlayerRegistry = PlayerRegistry()
 
         # Round tracking (Epic 4)
         self.round: int = 0
@@ -319,8 +421,10 @@ class GameState:
         self._playlist_manager: PlaylistManager | None = None
         self._media_player_service: MediaPlayerService | None = None
 
-        # Timer task for round expiry (Story 4.5)
-        self._timer_task: asyncio.Task | None = None
+        # Round expiry (Story 4.5), intro auto-stop (Issue #23) and the
+        # admin-disconnect pause run on one monotonic timer service per game
+        self.timers = TimerService()
+        self._round_timer: TimerHandle | None = None
         self._on_round_end: Callable[[], Awaitable[None]] | None = None
 
         # Round timing for speed bonus (Story 5.1)
@@ -388,14 +492,31 @@ class GameState:
         self.intro_mode_enabled: bool = False
         self.is_intro_round: bool = False  # Set per-round randomly
         self.intro_stopped: bool = False  # Track if 10s cutoff hit
-        self._intro_stop_task: asyncio.Task | None = None
-        self._rounds_since_intro: int = 0  # Track rounds without intro for guaranteed minimum
-        self._intro_round_start_time: float | None = None  # Track round start for bonus calc
+        self._intro_timer: TimerHandle | None = None
+        self._rounds_since_intro: int = (
+            0  # Track rounds without intro for guaranteed minimum
+        )
+        self._intro_round_start_time: float | None = (
+            None  # Track round start for bonus calc
+        )
+
+        # Latency-compensated speed scoring (opt-in): elapsed time minus RTT / 2
+        self.latency_compensation: bool = False
+
+        # Large-room mode: raised player cap, trimmed player lists for players
+        self.large_room: bool = False
 
         # Issue #42: Async metadata for fast transitions
         self.metadata_pending: bool = False
         self._metadata_task: asyncio.Task | None = None
-        self._on_metadata_update: Callable[[dict[str, Any]], Awaitable[None]] | None = None
+        # Album art by song URI, kept across games (rematches replay the same songs)
+        self._album_art: dict[str, str] = {}
+        # Next round, prepared during REVEAL so start_round() only has to play it
+        self._prepared_round: PreparedRound | None = None
+        self._prefetch_timer: TimerHandle | None = None
+        self._on_metadata_update: Callable[[dict[str, Any]], Awaitable[None]] | None = (
+            None
+        )
 
         # Story 20.9: Early reveal flag
         self._early_reveal: bool = False
@@ -408,6 +529,9 @@ class GameState:
         # Issue #75: Game highlights reel
         self.highlights_tracker = HighlightsTracker()
 
+        # Memoized get_state() sections: name -> (dependency key, value)
+        self._state_cache: dict[str, tuple[Any, Any]] = {}
+
     def create_game(
         self,
         playlists: list[str],
@@ -421,6 +545,8 @@ class GameState:
         artist_challenge_enabled: bool = True,
         movie_quiz_enabled: bool = True,
         intro_mode_enabled: bool = False,
+        latency_compensation: bool = False,
+        large_room: bool = False,
     ) -> dict[str, Any]:
         """
         Create a new game session.
@@ -437,6 +563,10 @@ class GameState:
             artist_challenge_enabled: Whether to enable artist guessing (default True)
             movie_quiz_enabled: Whether to enable movie quiz bonus (default True)
             intro_mode_enabled: Whether to enable intro mode (~20% random rounds)
+            latency_compensation: Whether speed scoring subtracts each player's
+                estimated one-way latency (capped, default False)
+            large_room: Whether to allow up to MAX_PLAYERS_LARGE_ROOM players
+                and send players a trimmed player list (default False)
 
         Returns:
             dict with game_id, join_url, song_count, phase
@@ -461,7 +591,7 @@ class GameState:
         self.songs = songs
         self.media_player = media_player
         self.join_url = f"{base_url}/beatify/play?game={self.game_id}"
-        self.players = {}
+        self.players.clear()
 
         # Store provider setting (Story 17.2)
         self.provider = provider
@@ -526,9 +656,15 @@ class GameState:
         self._rounds_since_intro = 0
         self._cancel_intro_timer()
 
+        self.latency_compensation = latency_compensation
+        self.large_room = large_room
+
         # Reset timer task for new game
         self.cancel_timer()
 
+        # Drop memoized state sections from any previous game
+        self._state_cache.clear()
+
         _LOGGER.info("Game created: %s with %d songs", self.game_id, len(songs))
 
         return {
@@ -542,7 +678,11 @@ class GameState:
         """
         Get current game state for broadcast.
 
-        Returns phase-specific data for each game phase.
+        Returns phase-specific data for each game phase. Expensive sections
+        (player lists, leaderboards, superlatives, highlights, share data,
+        game performance) are memoized and only rebuilt when the fields they
+        depend on change. Cached values are shared between calls and must
+        not be mutated by callers.
 
         Returns:
             Game state dict or None if no active game
@@ -551,11 +691,17 @@ class GameState:
         if not self.game_id:
             return None
 
+        # Dependency key shared by every player-derived section (see
+        # _players_key); sections are rebuilt only when their key changes
+        players_key = self._players_key()
+
         state: dict[str, Any] = {
             "game_id": self.game_id,
             "phase": self.phase.value,
             "player_count": len(self.players),
-            "players": self.get_players_state(),
+            "players": self._cached_section(
+                "players", players_key, self.get_players_state
+            ),
             "language": self.language,
             "difficulty": self.difficulty,
             # Issue #23: Intro mode (available in all phases)
@@ -575,10 +721,14 @@ class GameState:
             state["deadline"] = self.deadline
             state["last_round"] = self.last_round
             state["songs_remaining"] = (
-                self._playlist_manager.get_remaining_count() if self._playlist_manager else 0
+                self._playlist_manager.get_remaining_count()
+                if self._playlist_manager
+                else 0
             )
             # Submission tracking (Story 4.4)
-            state["submitted_count"] = sum(1 for p in self.players.values() if p.submitted)
+            state["submitted_count"] = sum(
+                1 for p in self.players.values() if p.submitted
+            )
             state["all_submitted"] = self.all_submitted()
             # Song info WITHOUT year during PLAYING (hidden until reveal)
             if self.current_song:
@@ -590,13 +740,19 @@ class GameState:
                     ),
                 }
             # Leaderboard (Story 5.5)
-            state["leaderboard"] = self.get_leaderboard()
+            state["leaderboard"] = self._cached_section(
+                "leaderboard", players_key, self.get_leaderboard
+            )
             # Story 20.1: Artist challenge (hide answer during PLAYING)
             if self.artist_challenge_enabled and self.artist_challenge:
-                state["artist_challenge"] = self.artist_challenge.to_dict(include_answer=False)
+                state["artist_challenge"] = self.artist_challenge.to_dict(
+                    include_answer=False
+                )
             # Issue #28: Movie quiz challenge (hide answer during PLAYING)
             if self.movie_quiz_enabled and self.movie_challenge:
-                state["movie_challenge"] = self.movie_challenge.to_dict(include_answer=False)
+                state["movie_challenge"] = self.movie_challenge.to_dict(
+                    include_answer=False
+                )
 
         elif self.phase == GamePhase.REVEAL:
             state["join_url"] = self.join_url
@@ -609,21 +765,34 @@ class GameState:
                     "artist": self.current_song.get("artist", "Unknown"),
                     "title": self.current_song.get("title", "Unknown"),
                     "year": self.current_song.get("year"),
-                    "album_art": self.current_song.get("album_art", "/beatify/static/img/no-artwork.svg"),
+                    "album_art": self.current_song.get(
+                        "album_art", "/beatify/static/img/no-artwork.svg"
+                    ),
                     "fun_fact": self.current_song.get("fun_fact", ""),
                     "fun_fact_de": self.current_song.get("fun_fact_de", ""),
                     "fun_fact_es": self.current_song.get("fun_fact_es", ""),
                     "fun_fact_fr": self.current_song.get("fun_fact_fr", ""),
                 }
             # Include reveal-specific player data (guesses, round_score, missed)
-            state["players"] = self.get_reveal_players_state()
+            state["players"] = self._cached_section(
+                "reveal_players",
+                (
+                    players_key,
+                    self.artist_challenge_enabled,
+                    self.movie_quiz_enabled,
+                    self.intro_mode_enabled,
+                ),
+                self.get_reveal_players_state,
+            )
             # Leaderboard (Story 5.5)
-            state["leaderboard"] = self.get_leaderboard()
+            state["leaderboard"] = self._cached_section(
+                "leaderboard", players_key, self.get_leaderboard
+            )
             # Round analytics (Story 13.3 AC4)
             if self.round_analytics:
                 state["round_analytics"] = self.round_analytics.to_dict()
             # Game performance comparison (Story 14.4 AC2, AC3, AC4, AC6)
-            game_performance = self.get_game_performance()
+            game_performance = self._cached_game_performance(players_key)
             if game_performance:
                 state["game_performance"] = game_performance
             # Song difficulty rating (Story 15.1 AC1, AC4)
@@ -635,10 +804,14 @@ class GameState:
                         state["song_difficulty"] = difficulty
             # Story 20.1: Artist challenge (reveal answer during REVEAL)
             if self.artist_challenge_enabled and self.artist_challenge:
-                state["artist_challenge"] = self.artist_challenge.to_dict(include_answer=True)
+                state["artist_challenge"] = self.artist_challenge.to_dict(
+                    include_answer=True
+                )
             # Issue #28: Movie quiz challenge (reveal answer + results during REVEAL)
             if self.movie_quiz_enabled and self.movie_challenge:
-                state["movie_challenge"] = self.movie_challenge.to_dict(include_answer=True)
+                state["movie_challenge"] = self.movie_challenge.to_dict(
+                    include_answer=True
+                )
             # Story 20.9: Early reveal flag for client-side toast
             if self._early_reveal:
                 state["early_reveal"] = True
@@ -648,7 +821,9 @@ class GameState:
 
         elif self.phase == GamePhase.END:
             # Final leaderboard with all player stats (Story 5.6)
-            state["leaderboard"] = self.get_final_leaderboard()
+            state["leaderboard"] = self._cached_section(
+                "final_leaderboard", players_key, self.get_final_leaderboard
+            )
             state["game_stats"] = {
                 "total_rounds": self.round,
                 "total_players": len(self.players),
@@ -658,18 +833,86 @@ class GameState:
                 winner = max(self.players.values(), key=lambda p: p.score)
                 state["winner"] = {"name": winner.name, "score": winner.score}
             # Game performance comparison for end screen (Story 14.4 AC5, AC6)
-            game_performance = self.get_game_performance()
+            game_performance = self._cached_game_performance(players_key)
             if game_performance:
                 state["game_performance"] = game_performance
             # Superlatives - fun awards (Story 15.2)
-            state["superlatives"] = self.calculate_superlatives()
+            state["superlatives"] = self._cached_section(
+                "superlatives",
+                (
+                    players_key,
+                    self.round,
+                    self.movie_quiz_enabled,
+                    self.intro_mode_enabled,
+                ),
+                self.calculate_superlatives,
+            )
             # Issue #75: Game highlights reel
-            state["highlights"] = self.highlights_tracker.to_dict()
+            state["highlights"] = self._cached_section(
+                "highlights",
+                self.highlights_tracker.revision,
+                self.highlights_tracker.to_dict,
+            )
             # Issue #120: Shareable result cards
-            state["share_data"] = build_share_data(self)
+            state["share_data"] = self._cached_section(
+                "share_data",
+                (players_key, self.round, tuple(self.playlists)),
+                lambda: build_share_data(self),
+            )
 
         return state
 
+    def _players_key(self) -> tuple[int, int]:
+        """
+        Build a cache key that changes whenever any player changes.
+
+        Every PlayerSession write takes a fresh global stamp, so the highest
+        stamp moves on any change or join, and the count moves on removals.
+
+        Returns:
+            Tuple of (player count, highest player modification stamp)
+
+        """
+        return (
+            len(self.players),
+            max((p.stamp for p in self.players.values()), default=0),
+        )
+
+    def _cached_section(self, name: str, key: Any, build: Callable[[], Any]) -> Any:
+        """
+        Return a memoized get_state() section, rebuilding it if stale.
+
+        Args:
+            name: Section name
+            key: Dependency key; the section is rebuilt when it changes
+            build: Function that computes the section
+
+        Returns:
+            Cached or freshly built section value
+
+        """
+        cached = self._state_cache.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        value = build()
+        self._state_cache[name] = (key, value)
+        return value
+
+    def _cached_game_performance(
+        self, players_key: tuple[int, int]
+    ) -> dict[str, Any] | None:
+        """Memoized get_game_performance(), keyed on scores and all-time stats."""
+        stats_key = (
+            (id(self._stats_service), self._stats_service.games_played)
+            if self._stats_service
+            else None
+        )
+        return self._cached_section(
+            "game_performance",
+            (players_key, self.round, stats_key),
+            self.get_game_performance,
+        )
+
     def finalize_game(self) -> dict[str, Any]:
         """
         Calculate final stats before ending the game (Story 14.4).
@@ -737,6 +980,7 @@ class GameState:
         """
         # Cancel async tasks before resetting references
         self._cancel_intro_timer()
+        self._discard_prepared_round()
         if self._metadata_task and not self._metadata_task.done():
             self._metadata_task.cancel()
         self._metadata_task = None
@@ -817,10 +1061,15 @@ class GameState:
         # Issue #28: Reset movie quiz challenge
         self.movie_challenge = None
         self.movie_quiz_enabled = True  # Reset to default
+        self.latency_compensation = False
+        self.large_room = False
 
         # Issue #75: Reset highlights tracker
         self.highlights_tracker.reset()
 
+        # Drop memoized state sections
+        self._state_cache.clear()
+
     def end_game(self) -> None:
         """End the current game and reset state."""
         _LOGGER.info("Game ended: %s", self.game_id)
@@ -828,7 +1077,7 @@ class GameState:
         self._reset_game_internals()
         self.game_id = None
         self.phase = GamePhase.LOBBY
-        self.players = {}
+        self.players.clear()
         self.clear_all_sessions()
 
     def rematch_game(self) -> None:
@@ -849,6 +1098,8 @@ class GameState:
         preserved_artist_challenge = self.artist_challenge_enabled
         preserved_movie_quiz = self.movie_quiz_enabled
         preserved_intro_mode = self.intro_mode_enabled
+        preserved_latency_compensation = self.latency_compensation
+        preserved_large_room = self.large_room
 
         self._reset_game_internals()
 
@@ -864,6 +1115,8 @@ class GameState:
         self.artist_challenge_enabled = preserved_artist_challenge
         self.movie_quiz_enabled = preserved_movie_quiz
         self.intro_mode_enabled = preserved_intro_mode
+        self.latency_compensation = preserved_latency_compensation
+        self.large_room = preserved_large_room
 
         # Re-create PlaylistManager with fresh song list
         self._playlist_manager = PlaylistManager(preserved_songs, preserved_provider)
@@ -910,16 +1163,14 @@ class GameState:
 
         # Store admin name for rejoin verification (Story 7-2)
         if reason == "admin_disconnected":
-            for player in self.players.values():
-                if player.is_admin:
-                    self.disconnected_admin_name = player.name
-                    break
+            admin = self.players.admin
+            if admin:
+                self.disconnected_admin_name = admin.name
 
-        # Stop timer if in PLAYING
+        # Freeze the round (and intro) timer if in PLAYING, keeping its remaining time
         if self.phase == GamePhase.PLAYING:
-            self.cancel_timer()
-            # Issue #23: Cancel intro timer if running
-            self._cancel_intro_timer()
+            self.timers.pause(self._round_timer)
+            self.timers.pause(self._intro_timer)
             # Stop media playback
             if self._media_player_service:
                 await self._media_player_service.stop()
@@ -948,12 +1199,22 @@ class GameState:
 
         # Restart timer if resuming to PLAYING and deadline still valid
         if previous == GamePhase.PLAYING and self.deadline:
-            now_ms = int(self._now() * 1000)
-            remaining_ms = self.deadline - now_ms
-
-            if remaining_ms > 0:
-                remaining_seconds = remaining_ms / 1000.0
-                self._timer_task = asyncio.create_task(self._timer_countdown(remaining_seconds))
+            round_timer = self._round_timer
+            if round_timer is not None and round_timer.paused:
+                # The round keeps the time it had left when it was paused
+                remaining_seconds = round_timer.remaining
+            else:
+                # Restored after a restart: only the wall-clock deadline survived
+                remaining_seconds = (self.deadline - int(self._now() * 1000)) / 1000.0
+
+            if remaining_seconds > 0:
+                # Clients count down to the moved deadline
+                self.deadline = int((self._now() + remaining_seconds) * 1000)
+                if round_timer is not None and round_timer.paused:
+                    self.timers.resume(round_timer)
+                else:
+                    self._start_round_timer(remaining_seconds)
+                self.timers.resume(self._intro_timer)
                 _LOGGER.info("Timer restarted with %.1fs remaining", remaining_seconds)
 
                 # Resume media playback if it was stopped
@@ -980,6 +1241,82 @@ class GameState:
 
         return True
 
+    def to_snapshot(self) -> dict[str, Any]:
+        """
+        Serialize the in-progress game for crash-safe persistence.
+
+        Songs are left out: they only change when a game is created, so the
+        store writes them once per game instead of at every transition.
+
+        Returns:
+            JSON-serializable snapshot, or an empty dict without a game
+
+        """
+        if self.game_id is None:
+            return {}
+        snapshot: dict[str, Any] = {
+            attr: getattr(self, attr) for attr in _SNAPSHOT_ATTRS
+        }
+        snapshot["phase"] = self.phase.value
+        snapshot["previous_phase"] = (
+            self._previous_phase.value if self._previous_phase else None
+        )
+        snapshot["round_analytics"] = (
+            asdict(self.round_analytics) if self.round_analytics else None
+        )
+        snapshot["artist_challenge"] = (
+            asdict(self.artist_challenge) if self.artist_challenge else None
+        )
+        snapshot["movie_challenge"] = (
+            asdict(self.movie_challenge) if self.movie_challenge else None
+        )
+        snapshot["played_uris"] = (
+            self._playlist_manager.played_uris if self._playlist_manager else []
+        )
+        snapshot["highlights"] = self.highlights_tracker.snapshot()
+        snapshot["players"] = [player.to_snapshot() for player in self.players.values()]
+        return snapshot
+
+    def restore_snapshot(
+        self, snapshot: dict[str, Any], songs: list[dict[str, Any]]
+    ) -> None:
+        """
+        Restore a game from to_snapshot() output after a restart.
+
+        Players come back disconnected and reclaim their seats by session_id.
+        No timers are started; callers pause the game until the host is back.
+
+        Args:
+            snapshot: Dict produced by to_snapshot()
+            songs: Song list of the game (persisted separately)
+
+        """
+        self.cancel_timer()
+        self._reset_game_internals()
+        for attr in _SNAPSHOT_ATTRS:
+            setattr(self, attr, snapshot[attr])
+        self.songs = songs
+        self._playlist_manager = PlaylistManager(songs, self.provider)
+        self._playlist_manager.restore_played(snapshot["played_uris"])
+
+        analytics = snapshot["round_analytics"]
+        self.round_analytics = RoundAnalytics(**analytics) if analytics else None
+        artist = snapshot["artist_challenge"]
+        self.artist_challenge = ArtistChallenge(**artist) if artist else None
+        movie = snapshot["movie_challenge"]
+        self.movie_challenge = MovieChallenge(**movie) if movie else None
+        self.highlights_tracker.restore(snapshot["highlights"])
+
+        self.players.clear()
+        for data in snapshot["players"]:
+            player = PlayerSession.from_snapshot(data)
+            self.players[player.name] = player
+
+        previous = snapshot["previous_phase"]
+        self._previous_phase = GamePhase(previous) if previous else None
+        self.phase = GamePhase(snapshot["phase"])
+        self._state_cache.clear()
+
     def get_average_score(self) -> int:
         """
         Calculate average score of all current players.
@@ -995,7 +1332,9 @@ class GameState:
         total = sum(p.score for p in self.players.values())
         return round(total / len(self.players))
 
-    def add_player(self, name: str, ws: web.WebSocketResponse) -> tuple[bool, str | None]:
+    def add_player(
+        self, name: str, ws: web.WebSocketResponse
+    ) -> tuple[bool, str | None]:
         """
         Add a player to the game.
 
@@ -1023,20 +1362,20 @@ class GameState:
 
         # Check for reconnection (Story 7-2, 7-3) - case-insensitive match
         # Allowed during PAUSED phase for reconnection
-        for existing_name, existing_player in self.players.items():
-            if existing_name.lower() == name.lower():
-                # Name exists - check if it's a reconnection (player disconnected)
-                if not existing_player.connected:
-                    # Reconnection: update WebSocket and mark connected
-                    existing_player.ws = ws
-                    existing_player.connected = True
-                    _LOGGER.info("Player reconnected: %s", existing_name)
-                    return True, None
-                # Player still connected, reject duplicate
-                return False, ERR_NAME_TAKEN
+        existing_player = self.players.get_by_key(name)
+        if existing_player:
+            # Name exists - check if it's a reconnection (player disconnected)
+            if not existing_player.connected:
+                # Reconnection: update WebSocket and mark connected
+                existing_player.ws = ws
+                existing_player.connected = True
+                _LOGGER.info("Player reconnected: %s", existing_player.name)
+                return True, None
+            # Player still connected, reject duplicate
+            return False, ERR_NAME_TAKEN
 
         # Check player limit
-        if len(self.players) >= MAX_PLAYERS:
+        if len(self.players) >= self.max_players:
             return False, ERR_GAME_FULL
 
         # Determine if late joiner
@@ -1050,7 +1389,6 @@ class GameState:
             name=name, ws=ws, score=initial_score, streak=0, joined_late=joined_late
         )
         self.players[name] = player
-        self._sessions[player.session_id] = name
 
         # Log join with score info
         if joined_late and initial_score > 0:
@@ -1093,8 +1431,7 @@ class GameState:
             PlayerSession or None if not found
 
         """
-        name = self._sessions.get(session_id)
-        return self.players.get(name) if name else None
+        return self.players.get_by_session(session_id)
 
     def get_player_by_ws(self, ws: web.WebSocketResponse) -> PlayerSession | None:
         """
@@ -1107,10 +1444,7 @@ class GameState:
             PlayerSession or None if not found
 
         """
-        for player in self.players.values():
-            if player.ws == ws:
-                return player
-        return None
+        return self.players.get_by_ws(ws)
 
     def record_reaction(self, player_name: str, emoji: str) -> bool:
         """
@@ -1216,9 +1550,7 @@ class GameState:
 
         """
         if name in self.players:
-            player = self.players[name]
-            # Clean up session mapping (Story 11.1)
-            self._sessions.pop(player.session_id, None)
+            # Also drops the session mapping (Story 11.1)
             del self.players[name]
             _LOGGER.info("Player removed: %s", name)
 
@@ -1230,10 +1562,164 @@ class GameState:
         END state before sessions are invalidated.
 
         """
-        session_count = len(self._sessions)
-        self._sessions.clear()
+        session_count = self.players.session_count
+        self.players.clear_sessions()
         _LOGGER.info("Cleared %d player sessions", session_count)
 
+    @property
+    def max_players(self) -> int:
+        """Player cap for the current game (raised in large-room mode)."""
+        return MAX_PLAYERS_LARGE_ROOM if self.large_room else MAX_PLAYERS
+
+    def player_view(
+        self, state: dict[str, Any]
+    ) -> tuple[dict[str, Any], dict[str, dict[str, dict[str, Any]]]]:
+        """
+        Trim a get_state() result for players in large-room mode.
+
+        Players only get the top LARGE_ROOM_VISIBLE_PLAYERS entries of the
+        player list (plus the admin), flagged with ``players_trimmed``, and
+        the top LEADERBOARD_TOP_K leaderboard entries plus aggregate
+        ``leaderboard_stats``, flagged with ``leaderboard_trimmed``.
+        Everything else, including the counts, is unchanged and shared by
+        all players.
+
+        Players left out get personal messages instead: ``player_entry``
+        with their own player list entry and ``player_rank`` with their own
+        leaderboard entry, rank, score, rank change and neighbors. Small
+        rooms and non-large-room games get ``state`` back as is.
+
+        Args:
+            state: State dict from get_state() (not mutated)
+
+        Returns:
+            Tuple of (state dict to send to players, personal messages by
+            player name and message type)
+
+        """
+        if not self.large_room or len(self.players) <= LARGE_ROOM_VISIBLE_PLAYERS:
+            return state, {}
+        players_key = self._players_key()
+        visible = self._cached_section(
+            "visible_players", players_key, self._visible_player_names
+        )
+        personal: dict[str, dict[str, dict[str, Any]]] = {}
+        shown: list[dict[str, Any]] = []
+        for entry in state.get("players", ()):
+            if entry["name"] in visible:
+                shown.append(entry)
+            else:
+                personal[entry["name"]] = {
+                    "player_entry": {"type": "player_entry", "entry": entry}
+                }
+        view = {**state, "players": shown, "players_trimmed": True}
+
+        leaderboard = state.get("leaderboard")
+        if leaderboard and len(leaderboard) > LEADERBOARD_TOP_K:
+            # The leaderboard sections are keyed on the players too; the
+            # phase tells the live leaderboard from the final one
+            key = (players_key, self.phase)
+            view["leaderboard"] = leaderboard[:LEADERBOARD_TOP_K]
+            view["leaderboard_trimmed"] = True
+            view["leaderboard_stats"] = self._cached_section(
+                "leaderboard_stats", key, lambda: _leaderboard_stats(leaderboard)
+            )
+            ranks = self._cached_section(
+                "leaderboard_ranks", key, lambda: self._rank_messages(leaderboard)
+            )
+            for name, message in ranks.items():
+                personal.setdefault(name, {})["player_rank"] = message
+        return view, personal
+
+    def _leaderboard_index(self, leaderboard: list[dict[str, Any]]) -> dict[str, int]:
+        """
+        Position of each player in a leaderboard, by name.
+
+        Memoized for the most recent leaderboard list (compared by identity;
+        the cache holds a reference, so the list cannot be replaced by a
+        different one at the same address).
+
+        """
+        cached = self._state_cache.get("leaderboard_index")
+        if cached is not None and cached[0] is leaderboard:
+            return cached[1]
+        index = {entry["name"]: i for i, entry in enumerate(leaderboard)}
+        self._state_cache["leaderboard_index"] = (leaderboard, index)
+        return index
+
+    def _rank_messages(
+        self, leaderboard: list[dict[str, Any]]
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Build the player_rank messages for everyone below the top K.
+
+        Args:
+            leaderboard: Leaderboard (live or final) in rank order
+
+        Returns:
+            player_rank message by player name
+
+        """
+        return {
+            name: self.get_player_rank(name, leaderboard)
+            for name, position in self._leaderboard_index(leaderboard).items()
+            if position >= LEADERBOARD_TOP_K
+        }
+
+    def get_player_rank(
+        self, name: str, leaderboard: list[dict[str, Any]] | None = None
+    ) -> dict[str, Any] | None:
+        """
+        Get one player's rank and neighbors as a player_rank message.
+
+        The position comes from an index memoized per leaderboard, so a
+        lookup does not re-sort the players.
+
+        Args:
+            name: Player name
+            leaderboard: Leaderboard to look in (default: the live one)
+
+        Returns:
+            Message with rank, score, rank_change, total, the player's own
+            leaderboard entry and the entries directly above and below,
+            or None if the player is not on the leaderboard
+
+        """
+        if leaderboard is None:
+            leaderboard = self._cached_section(
+                "leaderboard", self._players_key(), self.get_leaderboard
+            )
+        position = self._leaderboard_index(leaderboard).get(name)
+        if position is None:
+            return None
+        entry = leaderboard[position]
+        return {
+            "type": "player_rank",
+            "rank": entry["rank"],
+            "score": entry["score"],
+            "rank_change": entry.get("rank_change", 0),
+            "total": len(leaderboard),
+            "entry": entry,
+            "above": leaderboard[position - 1] if position > 0 else None,
+            "below": leaderboard[position + 1]
+            if position + 1 < len(leaderboard)
+            else None,
+        }
+
+    def _visible_player_names(self) -> frozenset[str]:
+        """Names listed in the trimmed player view: the top scorers and the admin."""
+        # O(N log K) partial sort, same order as get_leaderboard()
+        top = heapq.nsmallest(
+            LARGE_ROOM_VISIBLE_PLAYERS,
+            self.players.values(),
+            key=lambda p: (-p.score, p.name),
+        )
+        names = {p.name for p in top}
+        admin = self.players.admin
+        if admin is not None:
+            names.add(admin.name)
+        return frozenset(names)
+
     def get_players_state(self) -> list[dict[str, Any]]:
         """
         Get player list for state broadcast.
@@ -1268,10 +1754,10 @@ class GameState:
             True if all connected players have submitted, False otherwise
 
         """
-        connected_players = [p for p in self.players.values() if p.connected]
-        if not connected_players:
-            return False
-        return all(p.submitted for p in connected_players)
+        # O(1): the registry counts connected players still owing a guess
+        return self.players.connected_count > 0 and not self.players.pending_count(
+            "submitted"
+        )
 
     def check_all_guesses_complete(self) -> bool:
         """
@@ -1294,21 +1780,19 @@ class GameState:
         # or if no one has guessed yet (don't block early reveal for ignored challenges)
         if self.artist_challenge_enabled and self.artist_challenge:
             has_winner = getattr(self.artist_challenge, "winner", None) is not None
-            anyone_guessed = any(p.has_artist_guess for p in self.players.values() if p.connected)
-            if not has_winner and anyone_guessed:
-                for player in self.players.values():
-                    if player.connected and not player.has_artist_guess:
-                        return False
+            pending = self.players.pending_count("has_artist_guess")
+            anyone_guessed = pending < self.players.connected_count
+            if not has_winner and anyone_guessed and pending:
+                return False
 
         # Issue #28: If movie quiz enabled and active, check movie guesses
         # Skip check if challenge already has correct guesses or no one interacted
         if self.movie_quiz_enabled and self.movie_challenge:
             has_correct = len(self.movie_challenge.correct_guesses) > 0
-            anyone_guessed = any(p.has_movie_guess for p in self.players.values() if p.connected)
-            if not has_correct and anyone_guessed:
-                for player in self.players.values():
-                    if player.connected and not player.has_movie_guess:
-                        return False
+            pending = self.players.pending_count("has_movie_guess")
+            anyone_guessed = pending < self.players.connected_count
+            if not has_correct and anyone_guessed and pending:
+                return False
 
         return True
 
@@ -1480,8 +1964,9 @@ class GameState:
             _LOGGER.error("No playlist manager configured")
             return False
 
-        # Get next song
-        song = self._playlist_manager.get_next_song()
+        # Get next song (prepared during REVEAL when possible)
+        prepared = self._take_prepared_round()
+        song = prepared.song if prepared else self._playlist_manager.get_next_song()
         if not song:
             _LOGGER.info("All songs exhausted, ending game")
             self.phase = GamePhase.END
@@ -1548,7 +2033,9 @@ class GameState:
                 _LOGGER.warning(
                     "Failed to play song: %s", song.get("uri")
                 )  # Log original for debug
-                self._playlist_manager.mark_played(song.get("_resolved_uri") or song.get("uri"))
+                self._playlist_manager.mark_played(
+                    song.get("_resolved_uri") or song.get("uri")
+                )
 
                 # Check retry limit to prevent runaway loop
                 if _retry_count >= MAX_SONG_RETRIES:
@@ -1567,14 +2054,21 @@ class GameState:
 
             # Issue #42: Start round immediately, fetch album art in background
             # Fix #124: Use playlist artist/title as source of truth (never async)
-            self.metadata_pending = True
+            album_art = (
+                prepared.album_art if prepared else self._album_art.get(resolved_uri)
+            )
+            self.metadata_pending = album_art is None
             metadata = {
                 "artist": song.get("artist", "Unknown"),  # From playlist (reliable)
                 "title": song.get("title", "Unknown"),  # From playlist (reliable)
-                "album_art": "/beatify/static/img/no-artwork.svg",  # Async fill
+                "album_art": album_art
+                or "/beatify/static/img/no-artwork.svg",  # Async fill
             }
-            # Start background task to fetch album art only
-            self._metadata_task = asyncio.create_task(self._fetch_metadata_async(resolved_uri))
+            if album_art is None:
+                # Start background task to fetch album art only
+                self._metadata_task = asyncio.create_task(
+                    self._fetch_metadata_async(resolved_uri)
+                )
         else:
             # No media player (testing mode)
             self.metadata_pending = False
@@ -1606,11 +2100,15 @@ class GameState:
             **metadata,
         }
 
-        # Story 20.1: Initialize artist challenge for this round
-        self.artist_challenge = self._init_artist_challenge(song)
+        if prepared and prepared.settings == self._challenge_settings():
+            self.artist_challenge = prepared.artist_challenge
+            self.movie_challenge = prepared.movie_challenge
+        else:
+            # Story 20.1: Initialize artist challenge for this round
+            self.artist_challenge = self._init_artist_challenge(song)
 
-        # Issue #28: Initialize movie quiz challenge for this round
-        self.movie_challenge = self._init_movie_challenge(song)
+            # Issue #28: Initialize movie quiz challenge for this round
+            self.movie_challenge = self._init_movie_challenge(song)
 
         # Issue #23: Determine if this is an intro round
         self.is_intro_round = False
@@ -1630,8 +2128,8 @@ class GameState:
                     self._rounds_since_intro = 0
                     self._intro_round_start_time = self._now()
                     # Schedule auto-stop after intro duration
-                    self._intro_stop_task = asyncio.create_task(
-                        self._intro_auto_stop(INTRO_DURATION_SECONDS)
+                    self._intro_timer = self.timers.call_later(
+                        INTRO_DURATION_SECONDS, self._intro_auto_stop, "intro"
                     )
                     _LOGGER.info(
                         "Intro round activated for round %d%s",
@@ -1640,7 +2138,9 @@ class GameState:
                     )
                 else:
                     self._rounds_since_intro += 1
-                    _LOGGER.info("Skipping intro mode for short song (%dms)", song_duration_ms)
+                    _LOGGER.info(
+                        "Skipping intro mode for short song (%dms)", song_duration_ms
+                    )
             else:
                 self._rounds_since_intro += 1
 
@@ -1652,7 +2152,9 @@ class GameState:
         # Note: self.round_duration is set in create_game() (Story 13.1)
         # Intro rounds use INTRO_DURATION_SECONDS as the timer (#23)
         self.round_start_time = self._now()
-        effective_duration = INTRO_DURATION_SECONDS if self.is_intro_round else self.round_duration
+        effective_duration = (
+            INTRO_DURATION_SECONDS if self.is_intro_round else self.round_duration
+        )
         self.deadline = int((self.round_start_time + effective_duration) * 1000)
 
         # Reset player submissions for new round
@@ -1671,12 +2173,9 @@ class GameState:
         # Cancel any existing timer
         self.cancel_timer()
 
-        # Calculate delay until deadline
-        now_ms = int(self._now() * 1000)
-        delay_seconds = (self.deadline - now_ms) / 1000.0
-
-        # Start timer task for round expiry
-        self._timer_task = asyncio.create_task(self._timer_countdown(delay_seconds))
+        # Start the round expiry timer (monotonic: wall-clock steps don't move it)
+        delay_seconds = effective_duration
+        self._start_round_timer(delay_seconds)
 
         # Transition to PLAYING
         self.phase = GamePhase.PLAYING
@@ -1689,29 +2188,39 @@ class GameState:
         )
         return True
 
-    async def _timer_countdown(self, delay_seconds: float) -> None:
+    def _start_round_timer(self, delay_seconds: float) -> None:
+        """
+        Schedule the round expiry timer.
+
+        Args:
+            delay_seconds: Seconds until the round ends
+
+        """
+        self._round_timer = self.timers.call_later(
+            delay_seconds, self._on_round_timer, "round"
+        )
+
+    async def _on_round_timer(self) -> None:
         """
-        Wait for round to end, then trigger reveal.
+        Trigger reveal when the round timer expires.
 
-        This task may be cancelled by:
+        The timer may be cancelled (also while this runs) by:
         - Admin advancing to next round early
         - All players submitting (if auto_advance enabled)
-        - Game pause/end
+        - Game end (a pause freezes it instead)
 
         Always handle CancelledError gracefully.
 
-        Args:
-            delay_seconds: Seconds to wait before triggering reveal
-
         """
         try:
-            await asyncio.sleep(delay_seconds)
             # Check we're still in PLAYING phase (could have changed)
             if self.phase == GamePhase.PLAYING:
                 _LOGGER.info("Round timer expired, transitioning to REVEAL")
                 await self.end_round()
             else:
-                _LOGGER.debug("Timer expired but phase already changed to %s", self.phase)
+                _LOGGER.debug(
+                    "Timer expired but phase already changed to %s", self.phase
+                )
         except asyncio.CancelledError:
             _LOGGER.debug("Timer task cancelled")
             # Re-raise to properly complete cancellation
@@ -1741,10 +2250,11 @@ class GameState:
             # Fix #124: Only update album_art from media player.
             # Artist/title are authoritative from playlist data — media player
             # state can report stale/wrong track info (especially Sonos + Spotify).
+            album_art = metadata.get("album_art", "/beatify/static/img/no-artwork.svg")
+            if album_art != "/beatify/static/img/no-artwork.svg":
+                self._remember_album_art(uri, album_art)
             if self.current_song and self.current_song.get("uri") == uri:
-                self.current_song["album_art"] = metadata.get(
-                    "album_art", "/beatify/static/img/no-artwork.svg"
-                )
+                self.current_song["album_art"] = album_art
                 self.metadata_pending = False
 
                 _LOGGER.info(
@@ -1787,9 +2297,7 @@ class GameState:
         """Inner end_round logic. Caller MUST hold _score_lock."""
         # Guard: skip if already transitioned (e.g. timer + early reveal race)
         if self.phase != GamePhase.PLAYING:
-            _LOGGER.debug(
-                "end_round skipped — phase already %s", self.phase.value
-            )
+            _LOGGER.debug("end_round skipped — phase already %s", self.phase.value)
             return
 
         # Cancel timer if still running
@@ -1804,27 +2312,27 @@ class GameState:
         # Get correct year from current song
         correct_year = self.current_song.get("year") if self.current_song else None
 
-        # Calculate scores for all players — delegates to ScoringService (#139)
-        all_players = list(self.players.values())
-        for player in self.players.values():
-            ScoringService.score_player_round(
-                player,
-                correct_year=correct_year,
-                round_start_time=self.round_start_time,
-                round_duration=self.round_duration,
-                difficulty=self.difficulty,
-                artist_challenge=self.artist_challenge,
-                movie_challenge=self.movie_challenge,
-                is_intro_round=self.is_intro_round,
-                intro_round_start_time=self._intro_round_start_time,
-                all_players=all_players,
-                streak_achievements=self.streak_achievements,
-                bet_tracking=self.bet_tracking,
-            )
+        # Calculate scores for all players in one pass — delegates to ScoringService (#139)
+        ScoringService.score_round(
+            list(self.players.values()),
+            correct_year=correct_year,
+            round_start_time=self.round_start_time,
+            round_duration=self.round_duration,
+            difficulty=self.difficulty,
+            artist_challenge=self.artist_challenge,
+            movie_challenge=self.movie_challenge,
+            is_intro_round=self.is_intro_round,
+            intro_round_start_time=self._intro_round_start_time,
+            streak_achievements=self.streak_achievements,
+            bet_tracking=self.bet_tracking,
+            latency_compensation=self.latency_compensation,
+        )
 
         # Issue #120: Track round results for shareable result cards
         if correct_year is not None:
-            scoring_cfg = DIFFICULTY_SCORING.get(self.difficulty, DIFFICULTY_SCORING[DIFFICULTY_DEFAULT])
+            scoring_cfg = DIFFICULTY_SCORING.get(
+                self.difficulty, DIFFICULTY_SCORING[DIFFICULTY_DEFAULT]
+            )
             close_range = scoring_cfg["close_range"]
             near_range = scoring_cfg["near_range"]
             for player in self.players.values():
@@ -1888,7 +2396,9 @@ class GameState:
                     playlist_name = None
                     if self.playlists:
                         playlist_path = self.playlists[0]
-                        playlist_name = playlist_path.replace(".json", "").replace("-", " ").title()
+                        playlist_name = (
+                            playlist_path.replace(".json", "").replace("-", " ").title()
+                        )
                     await self._stats_service.record_song_result(
                         song_uri,
                         player_results,
@@ -1913,7 +2423,78 @@ class GameState:
             except Exception as err:
                 _LOGGER.error("Round_end callback failed: %s", err)
         else:
-            _LOGGER.warning("No round_end callback set - REVEAL state will not be broadcast!")
+            _LOGGER.warning(
+                "No round_end callback set - REVEAL state will not be broadcast!"
+            )
+
+        # Prepare the next round while this one is revealed
+        self._discard_prepared_round()
+        self._prefetch_timer = self.timers.call_later(
+            0, self._prefetch_next_round, "prefetch"
+        )
+
+    async def _prefetch_next_round(self) -> None:
+        """Prepare the next round if the game is still in REVEAL."""
+        if self.phase == GamePhase.REVEAL:
+            self.prepare_next_round()
+
+    def prepare_next_round(self) -> PreparedRound | None:
+        """
+        Prepare the next round ahead of start_round().
+
+        Picks the next song, checks it has a URI for the selected provider,
+        builds its artist and movie challenges and looks up its album art,
+        so start_round() only has to issue the play command. The song is
+        not marked played until the round starts.
+
+        Returns:
+            Prepared round, or None if no playable song was found (start_round()
+            then picks and skips songs itself)
+
+        """
+        if self._prepared_round is not None:
+            return self._prepared_round
+        if not self._playlist_manager:
+            return None
+        song = self._playlist_manager.get_next_song()
+        if not song:
+            return None
+        resolved_uri = song.get("_resolved_uri")
+        if not resolved_uri:
+            return None
+        self._prepared_round = PreparedRound(
+            song=song,
+            artist_challenge=self._init_artist_challenge(song),
+            movie_challenge=self._init_movie_challenge(song),
+            album_art=self._album_art.get(resolved_uri),
+            settings=self._challenge_settings(),
+        )
+        _LOGGER.debug("Prepared next round: %s", resolved_uri)
+        return self._prepared_round
+
+    def _take_prepared_round(self) -> PreparedRound | None:
+        """Hand the prepared round to start_round() (None if there is none)."""
+        prepared = self._prepared_round
+        self._discard_prepared_round()
+        return prepared
+
+    def _discard_prepared_round(self) -> None:
+        """Drop the prepared round and cancel a pending prefetch."""
+        if self._prefetch_timer is not None:
+            self._prefetch_timer.cancel()
+        self._prefetch_timer = None
+        self._prepared_round = None
+
+    def _challenge_settings(self) -> tuple[bool, bool]:
+        """Challenge settings a prepared round must match to be used."""
+        return (self.artist_challenge_enabled, self.movie_quiz_enabled)
+
+    def _remember_album_art(self, uri: str, album_art: str) -> None:
+        """Cache a song's album art, evicting the oldest entry when full."""
+        self._album_art.pop(uri, None)
+        if len(self._album_art) >= ALBUM_ART_CACHE_SIZE:
+            del self._album_art[next(iter(self._album_art))]
+        self._album_art[uri] = album_art
 
     def _record_round_highlights(self, correct_year: int | None) -> None:
         """Detect and record highlights for the current round (Issue #75)."""
@@ -1924,7 +2505,19 @@ class GameState:
         if self.current_song:
             song_title = self.current_song.get("title", "Unknown")
 
-        submitted_players = [p for p in self.players.values() if p.submitted and p.current_guess is not None]
+        submitted_players = [
+            p
+            for p in self.players.values()
+            if p.submitted and p.current_guess is not None
+        ]
+
+        # Current ranks, computed once per round (1-based, stable by join order)
+        current_ranks = {
+            p.name: i + 1
+            for i, p in enumerate(
+                sorted(self.players.values(), key=lambda p: p.score, reverse=True)
+            )
+        }
 
         for player in submitted_players:
             # Exact match
@@ -1953,14 +2546,7 @@ class GameState:
 
             # Comeback (gained 2+ positions)
             if player.previous_rank is not None:
-                # Calculate current rank
-                sorted_players = sorted(
-                    self.players.values(), key=lambda p: p.score, reverse=True
-                )
-                current_rank = next(
-                    (i + 1 for i, p in enumerate(sorted_players) if p.name == player.name),
-                    None,
-                )
+                current_rank = current_ranks.get(player.name)
                 if current_rank is not None:
                     positions_gained = player.previous_rank - current_rank
                     if positions_gained >= 2:
@@ -1982,39 +2568,34 @@ class GameState:
                 )
 
         # Photo finish (tied scores among top players)
-        scores = [p.score for p in self.players.values()]
-        if len(scores) >= 2:
-            from collections import Counter
-            score_counts = Counter(scores)
-            for score, count in score_counts.items():
-                if count >= 2 and score > 0:
-                    tied_names = [p.name for p in self.players.values() if p.score == score]
-                    # Only record if it's among the top scores
-                    top_score = max(scores)
-                    if score >= top_score * 0.8:
-                        self.highlights_tracker.record_photo_finish(tied_names, self.round)
-                        break  # Only one photo finish per round
+        if len(self.players) >= 2:
+            # Names per score in one pass, scores in first-seen order
+            by_score: dict[int, list[str]] = {}
+            for p in self.players.values():
+                by_score.setdefault(p.score, []).append(p.name)
+            top_score = max(by_score)
+            for score, tied_names in by_score.items():
+                # Only record if it's among the top scores
+                if len(tied_names) >= 2 and score > 0 and score >= top_score * 0.8:
+                    self.highlights_tracker.record_photo_finish(tied_names, self.round)
+                    break  # Only one photo finish per round
 
     def cancel_timer(self) -> None:
         """Cancel the round timer (synchronous, for cleanup)."""
-        if self._timer_task and not self._timer_task.done():
-            # Don't cancel if we're being called from within the timer task itself
-            # (happens when timer naturally expires and calls end_round)
-            current_task = asyncio.current_task()
-            if current_task != self._timer_task:
-                self._timer_task.cancel()
-        self._timer_task = None
+        # A callback ending its own round keeps running (TimerHandle.cancel)
+        if self._round_timer is not None:
+            self._round_timer.cancel()
+        self._round_timer = None
 
     def _cancel_intro_timer(self) -> None:
         """Cancel the intro auto-stop timer if running (Issue #23)."""
-        if self._intro_stop_task and not self._intro_stop_task.done():
-            self._intro_stop_task.cancel()
-        self._intro_stop_task = None
+        if self._intro_timer is not None:
+            self._intro_timer.cancel()
+        self._intro_timer = None
 
-    async def _intro_auto_stop(self, delay_seconds: float) -> None:
+    async def _intro_auto_stop(self) -> None:
         """Auto-pause playback after intro duration in intro round (Issue #23)."""
         try:
-            await asyncio.sleep(delay_seconds)
             if self.phase == GamePhase.PLAYING and not self.intro_stopped:
                 if self._media_player_service:
                     try:
@@ -2022,7 +2603,7 @@ class GameState:
                     except Exception as err:
                         _LOGGER.warning("Failed to pause for intro stop: %s", err)
                 self.intro_stopped = True
-                _LOGGER.info("Intro auto-stopped after %.1fs", delay_seconds)
+                _LOGGER.info("Intro auto-stopped after %.1fs", INTRO_DURATION_SECONDS)
                 # Broadcast updated state to all clients
                 if self._on_round_end:
                     await self._on_round_end()
@@ -2034,7 +2615,9 @@ class GameState:
         """
         Check if the round deadline has passed.
 
-        Uses the injected time function for testability.
+        While the round timer is pending, its monotonic clock decides (a
+        paused round has not passed its deadline). Otherwise uses the
+        injected time function for testability.
 
         Returns:
             True if deadline has passed, False otherwise.
@@ -2042,6 +2625,8 @@ class GameState:
         """
         if self.deadline is None:
             return False
+        if self._round_timer is not None and self._round_timer.pending:
+            return self.timers.remaining(self._round_timer) <= 0
         now_ms = int(self._now() * 1000)
         return now_ms > self.deadline
 
@@ -2355,7 +2940,9 @@ class GameState:
             wrong_guesses=[],
         )
 
-    def submit_movie_guess(self, player_name: str, movie: str, guess_time: float) -> dict[str, Any]:
+    def submit_movie_guess(
+        self, player_name: str, movie: str, guess_time: float
+    ) -> dict[str, Any]:
         """
         Submit movie guess for bonus points (Issue #28).
 
@@ -2379,12 +2966,14 @@ class GameState:
             raise ValueError("No movie challenge active")
 
         # Check if player already guessed
-        for g in self.movie_challenge.correct_guesses:
-            if g["name"] == player_name:
-                return {"correct": True, "already_guessed": True, "rank": None, "bonus": 0}
-        for g in self.movie_challenge.wrong_guesses:
-            if g["name"] == player_name:
-                return {"correct": False, "already_guessed": True, "rank": None, "bonus": 0}
+        previous = self.movie_challenge.guessed.get(player_name)
+        if previous is not None:
+            return {
+                "correct": previous,
+                "already_guessed": True,
+                "rank": None,
+                "bonus": 0,
+            }
 
         # Calculate elapsed time from round start (server-side timing)
         elapsed = 0.0
@@ -2401,16 +2990,13 @@ class GameState:
             "bonus": 0,
         }
 
+        self.movie_challenge.guessed[player_name] = correct
         if correct:
-            self.movie_challenge.correct_guesses.append({"name": player_name, "time": elapsed})
-            # Sort by time (fastest first) - ensures ranking is consistent
-            self.movie_challenge.correct_guesses.sort(key=lambda g: g["time"])
-            # Determine rank (0-indexed position)
-            rank = next(
-                i
-                for i, g in enumerate(self.movie_challenge.correct_guesses)
-                if g["name"] == player_name
-            )
+            # Keep the list sorted by time (fastest first); ties rank in
+            # arrival order. The insertion index is the 0-indexed rank.
+            guesses = self.movie_challenge.correct_guesses
+            rank = bisect.bisect_right(guesses, elapsed, key=lambda g: g["time"])
+            guesses.insert(rank, {"name": player_name, "time": elapsed})
             bonus = MOVIE_BONUS_TIERS[rank] if rank < len(MOVIE_BONUS_TIERS) else 0
             result["rank"] = rank + 1  # 1-indexed for display
             result["bonus"] = bonus
@@ -2422,7 +3008,9 @@ class GameState:
                 elapsed,
             )
         else:
-            self.movie_challenge.wrong_guesses.append({"name": player_name, "guess": movie.strip()})
+            self.movie_challenge.wrong_guesses.append(
+                {"name": player_name, "guess": movie.strip()}
+            )
             _LOGGER.debug(
                 "Movie quiz wrong by %s: '%s' (correct: '%s')",
                 player_name,
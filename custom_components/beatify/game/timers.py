@@ -0,0 +1,231 @@
+"""Per-game timers on the event loop's monotonic clock.
+
+Round expiry, the intro auto-stop and the admin-disconnect pause each used
+to sleep in a task of their own, with the round timer derived from the wall
+clock. A TimerService keeps all of a game's deadlines on ``loop.time()``
+(monotonic: NTP steps on the host neither shorten nor lengthen a round)
+and a single task sleeps until the earliest one.
+
+    - call_later() returns a TimerHandle; cancel() drops it, and also
+      stops its callback if that is already running
+    - pause() freezes a timer with its remaining time, resume() schedules
+      it again from now
+    - fired callbacks run in a task of their own, so a slow callback (ending
+      a round) never delays the next deadline
+
+The lateness of every fired timer (actual minus scheduled fire time) is
+recorded as drift for diagnostics.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(eq=False)
+class TimerHandle:
+    """A scheduled callback of a TimerService."""
+
+    name: str
+    callback: Callable[[], Awaitable[None]]
+    # Loop time the timer fires at (None while paused or done)
+    when: float | None = None
+    # Seconds left while paused
+    remaining: float | None = None
+    cancelled: bool = False
+    fired: bool = False
+    # Running callback, once fired
+    task: asyncio.Task | None = None
+    # Heap entry currently scheduling this handle
+    _token: int | None = field(default=None, repr=False)
+
+    @property
+    def pending(self) -> bool:
+        """Whether the timer is scheduled or paused (not fired or cancelled)."""
+        return not (self.cancelled or self.fired)
+
+    @property
+    def paused(self) -> bool:
+        """Whether the timer is paused."""
+        return self.pending and self.remaining is not None
+
+    def cancel(self) -> None:
+        """
+        Cancel the timer, and its callback if that is running.
+
+        A callback cancelling its own timer (ending a round from the round
+        timer) keeps running.
+        """
+        self.cancelled = True
+        self.when = None
+        self._token = None
+        task = self.task
+        if task is not None and not task.done() and task is not asyncio.current_task():
+            task.cancel()
+
+
+class TimerService:
+    """One game's timers, driven by a single sleeping task."""
+
+    def __init__(self) -> None:
+        """Initialize timer service."""
+        self._heap: list[tuple[float, int, TimerHandle]] = []
+        self._tokens = itertools.count()
+        self._task: asyncio.Task | None = None
+        self._wakeup: asyncio.Event | None = None
+        # Diagnostics: fired timers and how late they fired
+        self.fired = 0
+        self.drift_last: float | None = None
+        self.drift_max = 0.0
+        self._drift_total = 0.0
+
+    @staticmethod
+    def _now() -> float:
+        return asyncio.get_running_loop().time()
+
+    def call_later(
+        self, delay: float, callback: Callable[[], Awaitable[None]], name: str
+    ) -> TimerHandle:
+        """
+        Schedule a coroutine function to run after ``delay`` seconds.
+
+        Args:
+            delay: Seconds from now (monotonic)
+            callback: Coroutine function called without arguments
+            name: Timer name for logs
+
+        Returns:
+            Handle to cancel, pause or resume the timer
+
+        """
+        handle = TimerHandle(name, callback)
+        self._schedule(handle, max(0.0, delay))
+        return handle
+
+    def pause(self, handle: TimerHandle | None) -> None:
+        """
+        Freeze a scheduled timer, keeping its remaining time.
+
+        Args:
+            handle: Timer to pause (None and finished timers are ignored)
+
+        """
+        if handle is None or not handle.pending or handle.when is None:
+            return
+        handle.remaining = max(0.0, handle.when - self._now())
+        handle.when = None
+        handle._token = None
+
+    def resume(self, handle: TimerHandle | None) -> None:
+        """
+        Schedule a paused timer again with its remaining time.
+
+        Args:
+            handle: Timer to resume (None and unpaused timers are ignored)
+
+        """
+        if handle is None or not handle.paused:
+            return
+        remaining = handle.remaining
+        handle.remaining = None
+        self._schedule(handle, remaining)
+
+    def remaining(self, handle: TimerHandle) -> float | None:
+        """
+        Return the seconds until a timer fires.
+
+        Args:
+            handle: Timer
+
+        Returns:
+            Seconds left (frozen while paused), None once fired or cancelled
+
+        """
+        if not handle.pending:
+            return None
+        if handle.remaining is not None:
+            return handle.remaining
+        return max(0.0, handle.when - self._now())
+
+    def _schedule(self, handle: TimerHandle, delay: float) -> None:
+        handle.when = self._now() + delay
+        handle._token = next(self._tokens)
+        heapq.heappush(self._heap, (handle.when, handle._token, handle))
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+        elif self._heap[0][2] is handle:
+            # New earliest deadline: the sleeper wakes up to re-arm
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        """Sleep until the earliest deadline and fire due timers."""
+        while self._heap:
+            when, token, handle = self._heap[0]
+            if token != handle._token:
+                # Cancelled, paused or rescheduled since it was pushed
+                heapq.heappop(self._heap)
+                continue
+            delay = when - self._now()
+            if delay > 0:
+                self._wakeup.clear()
+                try:
+                    async with asyncio.timeout(delay):
+                        await self._wakeup.wait()
+                except TimeoutError:
+                    pass
+                continue
+            heapq.heappop(self._heap)
+            self._fire(handle, -delay)
+
+    def _fire(self, handle: TimerHandle, drift: float) -> None:
+        """Start a due timer's callback and record how late it fired."""
+        handle.fired = True
+        handle.when = None
+        handle._token = None
+        self.fired += 1
+        self.drift_last = drift
+        self.drift_max = max(self.drift_max, drift)
+        self._drift_total += drift
+        _LOGGER.debug("Timer %s fired (%.1f ms late)", handle.name, drift * 1000)
+        handle.task = asyncio.create_task(handle.callback())
+
+    def cancel_all(self) -> None:
+        """Cancel every scheduled timer and stop the sleeping task."""
+        for _when, _token, handle in self._heap:
+            handle.cancel()
+        self._heap.clear()
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._task = None
+
+    @property
+    def scheduled(self) -> int:
+        """Number of scheduled (not paused) timers."""
+        return sum(1 for _when, token, handle in self._heap if token == handle._token)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return timer counters as a JSON-serializable dict."""
+        return {
+            "scheduled": self.scheduled,
+            "fired": self.fired,
+            "drift_last_ms": (
+                round(self.drift_last * 1000, 2)
+                if self.drift_last is not None
+                else None
+            ),
+            "drift_max_ms": round(self.drift_max * 1000, 2),
+            "drift_mean_ms": (
+                round(self._drift_total / self.fired * 1000, 2) if self.fired else None
+            ),
+        }
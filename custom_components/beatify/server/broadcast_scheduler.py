@@ -0,0 +1,124 @@
+"""Rate-capped state broadcast scheduling for Beatify.
+
+Player actions (joins, submits, reconnects, leaves, steals, guesses) each
+change the game state, and pushing a full state per action turns the last
+seconds of a round into O(N²) messages. Instead, these call sites *request*
+a state broadcast and the scheduler pushes at most one per
+``min_interval``:
+
+- the first request after a quiet period is flushed immediately
+- requests arriving within the interval are coalesced into one trailing
+  flush at the end of the interval
+- a request made after a phase transition is flushed immediately, so
+  REVEAL/END screens never wait on the rate cap
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from custom_components.beatify.const import STATE_BROADCAST_MIN_INTERVAL
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class BroadcastScheduler:
+    """Coalesce state broadcast requests for one game."""
+
+    def __init__(
+        self,
+        flush: Callable[[], Awaitable[None]],
+        min_interval: float = STATE_BROADCAST_MIN_INTERVAL,
+        time_fn: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize scheduler.
+
+        Args:
+            flush: Coroutine function performing the actual broadcast; it
+                must call mark_flushed() (BeatifyWebSocketHandler does)
+            min_interval: Minimum seconds between scheduled broadcasts
+            time_fn: Monotonic clock (injectable for tests)
+
+        """
+        self._flush = flush
+        self.min_interval = min_interval
+        self._now = time_fn
+        self._last_flush: float | None = None
+        self._last_phase: str | None = None
+        self._pending: asyncio.Task | None = None
+        self.requests = 0
+        self.flushes = 0
+        self.coalesced = 0
+
+    @property
+    def pending(self) -> bool:
+        """Whether a trailing flush is scheduled."""
+        return self._pending is not None and not self._pending.done()
+
+    async def request(self, phase: str | None = None) -> None:
+        """
+        Request a state broadcast.
+
+        Args:
+            phase: Current game phase; a change since the last flush
+                bypasses the rate cap
+
+        """
+        self.requests += 1
+        if self.pending:
+            # Already scheduled: this change rides along with it
+            self.coalesced += 1
+            return
+
+        if phase != self._last_phase:
+            await self._flush()
+            return
+
+        delay = 0.0
+        if self._last_flush is not None:
+            delay = self._last_flush + self.min_interval - self._now()
+        if delay <= 0:
+            await self._flush()
+            return
+
+        self._pending = asyncio.create_task(self._flush_later(delay))
+
+    def mark_flushed(self, phase: str | None = None) -> None:
+        """
+        Record that the state was just broadcast (by us or directly).
+
+        A scheduled trailing flush is cancelled since its changes went out.
+
+        Args:
+            phase: Phase of the state that was broadcast
+
+        """
+        self.flushes += 1
+        self._last_flush = self._now()
+        self._last_phase = phase
+        if self.pending and self._pending is not asyncio.current_task():
+            # A direct broadcast overtook the trailing flush
+            self._pending.cancel()
+            self.coalesced += 1
+        self._pending = None
+
+    def cancel(self) -> None:
+        """Drop any scheduled flush."""
+        if self.pending:
+            self._pending.cancel()
+        self._pending = None
+
+    async def _flush_later(self, delay: float) -> None:
+        """Flush after the rate-cap delay."""
+        await asyncio.sleep(delay)
+        try:
+            await self._flush()
+        except Exception:
+            _LOGGER.exception("Scheduled state broadcast failed")
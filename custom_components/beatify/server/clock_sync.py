@@ -0,0 +1,166 @@
+"""NTP-style clock offset exchange for Beatify clients.
+
+Deadlines are sent as server wall-clock milliseconds, so a phone whose clock
+is off shows a wrong countdown. Clients therefore estimate their offset to
+the server clock with the classic four-timestamp exchange:
+
+    client -> {"type": "time_sync", "t0": <client ms>}
+    server -> {"type": "time_sync", "t0": t0, "t1": <server ms at arrival>,
+               "t2": <server ms at reply>}
+
+With t3 the client time the reply arrives, the client computes
+
+    rtt    = (t3 - t0) - (t2 - t1)
+    offset = ((t1 - t0) + (t2 - t3)) / 2      (server clock - client clock)
+
+and renders countdowns against ``Date.now() + offset``. A client runs a
+short burst of exchanges on connect, keeps the lowest-RTT sample (least
+affected by asymmetric delays) and repeats the exchange periodically.
+
+Requests after the first carry the client's current estimate as ``offset``
+and ``rtt`` (ms), which the server records to report the skew distribution.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+from typing import TYPE_CHECKING, Any
+
+from custom_components.beatify.const import CLOCK_SKEW_WARN_MS
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from aiohttp import web
+
+    from custom_components.beatify.game.player import PlayerSession
+
+_LOGGER = logging.getLogger(__name__)
+
+# Upper bounds (ms) of the |offset| histogram buckets, plus one overflow bucket
+SKEW_BUCKETS_MS = (10, 50, 100, 250, 500, 1000, 5000, 30000)
+
+
+def _is_number(value: Any) -> bool:
+    """Return True for int/float values (bool excluded)."""
+    return isinstance(value, int | float) and not isinstance(value, bool)
+
+
+def sync_reply(data: dict, received_at: float, now: float) -> dict | None:
+    """
+    Build the server half of a clock sync exchange.
+
+    Args:
+        data: time_sync request from the client
+        received_at: Wall-clock seconds the request arrived (t1)
+        now: Wall-clock seconds the reply is sent (t2)
+
+    Returns:
+        Reply message, or None for a request without a numeric t0
+
+    """
+    t0 = data.get("t0")
+    if not _is_number(t0):
+        return None
+    return {
+        "type": "time_sync",
+        "t0": t0,
+        "t1": int(received_at * 1000),
+        "t2": int(now * 1000),
+    }
+
+
+class ClockSync:
+    """Clock offsets reported by connected clients and their distribution."""
+
+    def __init__(self) -> None:
+        """Initialize empty stats."""
+        # Latest (offset_ms, rtt_ms) reported per connection
+        self.clients: dict[web.WebSocketResponse, tuple[float, float]] = {}
+        self.reports = 0
+        self.max_skew_ms = 0.0
+        self.buckets = [0] * (len(SKEW_BUCKETS_MS) + 1)
+
+    def handle(
+        self, ws: web.WebSocketResponse, data: dict, received_at: float, now: float
+    ) -> dict | None:
+        """
+        Answer a time_sync request and record the client's reported estimate.
+
+        Args:
+            ws: Client connection
+            data: time_sync request
+            received_at: Wall-clock seconds the request arrived
+            now: Current wall-clock seconds
+
+        Returns:
+            Reply message, or None for a malformed request
+
+        """
+        offset, rtt = data.get("offset"), data.get("rtt")
+        if _is_number(offset) and _is_number(rtt):
+            self.report(ws, float(offset), float(rtt))
+        return sync_reply(data, received_at, now)
+
+    def report(
+        self, ws: web.WebSocketResponse, offset_ms: float, rtt_ms: float
+    ) -> None:
+        """
+        Record a client's current clock offset estimate.
+
+        Args:
+            ws: Client connection
+            offset_ms: Server clock minus client clock in ms
+            rtt_ms: Round-trip time of the sample the estimate came from
+
+        """
+        skew = abs(offset_ms)
+        first = ws not in self.clients
+        self.clients[ws] = (offset_ms, rtt_ms)
+        self.reports += 1
+        self.max_skew_ms = max(self.max_skew_ms, skew)
+        self.buckets[bisect.bisect_left(SKEW_BUCKETS_MS, skew)] += 1
+        if first and skew >= CLOCK_SKEW_WARN_MS:
+            _LOGGER.info(
+                "Client clock off by %.0f ms (rtt %.0f ms), countdowns use the server offset",
+                offset_ms,
+                rtt_ms,
+            )
+        else:
+            _LOGGER.debug(
+                "Client clock offset %.0f ms (rtt %.0f ms)", offset_ms, rtt_ms
+            )
+
+    def forget(self, ws: web.WebSocketResponse) -> None:
+        """Drop a closed connection's estimate."""
+        self.clients.pop(ws, None)
+
+    def distribution(self) -> dict[str, int]:
+        """Return report counts per |offset| bucket, keyed by label."""
+        labels = [f"<={bound}ms" for bound in SKEW_BUCKETS_MS]
+        labels.append(f">{SKEW_BUCKETS_MS[-1]}ms")
+        return dict(zip(labels, self.buckets, strict=True))
+
+    def as_dict(self, players: Iterable[PlayerSession] = ()) -> dict[str, Any]:
+        """
+        Return skew stats as a JSON-serializable dict.
+
+        Args:
+            players: Players whose latest estimate is listed by name
+
+        """
+        return {
+            "reports": self.reports,
+            "clients": len(self.clients),
+            "max_skew_ms": round(self.max_skew_ms, 1),
+            "distribution": self.distribution(),
+            "players": {
+                p.name: {
+                    "offset_ms": round(self.clients[p.ws][0], 1),
+                    "rtt_ms": round(self.clients[p.ws][1], 1),
+                }
+                for p in players
+                if p.ws in self.clients
+            },
+        }
@@ -0,0 +1,132 @@
+"""Wire codecs for Beatify WebSocket and HTTP payloads.
+
+JSON uses orjson when it is installed (Home Assistant ships it) and falls
+back to the stdlib json module otherwise. Both backends produce documents
+that decode to the same values; orjson output is compact UTF-8 where stdlib
+escapes non-ASCII characters, which clients treat identically.
+
+WebSocket clients may instead negotiate the ``beatify.msgpack`` subprotocol,
+which carries the same message schema as MessagePack binary frames. It is
+only offered when the optional msgpack package is installed; JSON text
+frames (``beatify.json`` or no subprotocol at all) remain the default.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from aiohttp import web
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - depends on environment
+    msgpack = None
+
+JSON_BACKEND = "orjson" if orjson else "json"
+
+# WebSocket subprotocols (Sec-WebSocket-Protocol values)
+WS_PROTOCOL_JSON = "beatify.json"
+WS_PROTOCOL_MSGPACK = "beatify.msgpack"
+MSGPACK_AVAILABLE = msgpack is not None
+
+
+def _stdlib_dumps(obj: Any) -> str:
+    """Encode with the stdlib json module."""
+    return json.dumps(obj)
+
+
+def _stdlib_loads(data: str | bytes) -> Any:
+    """Decode with the stdlib json module."""
+    return json.loads(data)
+
+
+if orjson:
+    # Non-string dict keys (e.g. int keys) are stringified like stdlib does
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def _orjson_dumps(obj: Any) -> str:
+        """Encode with orjson, falling back to stdlib for unsupported values."""
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode("utf-8")
+        except TypeError:
+            # e.g. integers beyond 64 bits; stdlib raises the same TypeError
+            # as before for genuinely unserializable objects
+            return _stdlib_dumps(obj)
+
+    def _orjson_loads(data: str | bytes) -> Any:
+        """Decode with orjson, falling back to stdlib for non-strict input."""
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # stdlib accepts NaN/Infinity literals that orjson rejects
+            return _stdlib_loads(data)
+
+    json_dumps = _orjson_dumps
+    json_loads = _orjson_loads
+else:  # pragma: no cover - depends on environment
+    json_dumps = _stdlib_dumps
+    json_loads = _stdlib_loads
+
+
+def msgpack_dumps(obj: Any) -> bytes:
+    """
+    Encode a message as MessagePack.
+
+    Strings are packed as str (not bin) so every client decoder yields
+    text. Map keys are packed as-is; Beatify messages only use str keys.
+
+    Args:
+        obj: JSON-compatible value
+
+    Returns:
+        Encoded bytes
+
+    Raises:
+        RuntimeError: If msgpack is not installed
+
+    """
+    if msgpack is None:
+        raise RuntimeError("msgpack is not installed")
+    return msgpack.packb(obj, use_bin_type=True)
+
+
+def msgpack_loads(data: bytes) -> Any:
+    """
+    Decode a MessagePack message.
+
+    Args:
+        data: Encoded bytes
+
+    Returns:
+        Decoded value
+
+    Raises:
+        RuntimeError: If msgpack is not installed
+        ValueError: If the data is not valid MessagePack
+
+    """
+    if msgpack is None:
+        raise RuntimeError("msgpack is not installed")
+    return msgpack.unpackb(data, raw=False)
+
+
+def json_response(data: Any, *, status: int = 200, **kwargs: Any) -> web.Response:
+    """
+    Build a JSON HTTP response using the fast codec.
+
+    Args:
+        data: JSON-serializable payload
+        status: HTTP status code
+        **kwargs: Extra arguments for aiohttp's json_response
+
+    Returns:
+        aiohttp Response
+
+    """
+    return web.json_response(data, status=status, dumps=json_dumps, **kwargs)
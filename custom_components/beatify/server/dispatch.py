@@ -0,0 +1,153 @@
+"""Per-handler latency and call metrics for Beatify WebSocket messages.
+
+Every registered message handler and admin action runs through
+HandlerMetrics.run(), which counts calls and errors and records the
+latency into a fixed-bucket histogram. Handlers that take longer than
+SLOW_HANDLER_THRESHOLD (e.g. ``admin.start_game`` waiting on a slow
+``play_media``) are also logged, so stalls are visible from the server.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+_LOGGER = logging.getLogger(__name__)
+
+# Histogram bucket upper bounds in milliseconds (last bucket is unbounded)
+LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+# Handlers slower than this (seconds) are logged
+SLOW_HANDLER_THRESHOLD = 1.0
+
+
+class HandlerStats:
+    """Call count, error count and latency histogram for one handler."""
+
+    def __init__(self) -> None:
+        """Initialize empty stats."""
+        self.calls = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        # One count per bucket in LATENCY_BUCKETS_MS plus the overflow bucket
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def record(self, duration_ms: float, *, error: bool = False) -> None:
+        """
+        Record one handler call.
+
+        Args:
+            duration_ms: Call latency in milliseconds
+            error: Whether the call raised
+
+        """
+        self.calls += 1
+        if error:
+            self.errors += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS_MS, duration_ms)] += 1
+
+    def percentile(self, fraction: float) -> float | None:
+        """
+        Estimate a latency percentile from the histogram.
+
+        Args:
+            fraction: Percentile as a fraction (0.95 for p95)
+
+        Returns:
+            Upper bound of the bucket holding the percentile in ms (the
+            observed maximum for the overflow bucket), or None without calls
+
+        """
+        if not self.calls:
+            return None
+        rank = fraction * self.calls
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank and count:
+                if index < len(LATENCY_BUCKETS_MS):
+                    return float(min(LATENCY_BUCKETS_MS[index], self.max_ms))
+                return self.max_ms
+        return self.max_ms
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the stats as a JSON-serializable dict."""
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "avg_ms": round(self.total_ms / self.calls, 2) if self.calls else None,
+            "max_ms": round(self.max_ms, 2),
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "histogram": {
+                **{
+                    f"le_{bound}": count
+                    for bound, count in zip(
+                        LATENCY_BUCKETS_MS, self.buckets, strict=False
+                    )
+                },
+                "overflow": self.buckets[-1],
+            },
+        }
+
+
+class HandlerMetrics:
+    """Time handler calls and keep HandlerStats per handler name."""
+
+    def __init__(self, time_fn: Callable[[], float] = time.perf_counter) -> None:
+        """
+        Initialize metrics.
+
+        Args:
+            time_fn: High-resolution clock in seconds (injectable for tests)
+
+        """
+        self._now = time_fn
+        self.handlers: dict[str, HandlerStats] = {}
+
+    async def run(
+        self,
+        name: str,
+        handler: Callable[..., Awaitable[None]],
+        *args: Any,
+    ) -> None:
+        """
+        Run a handler, recording its latency and outcome.
+
+        Exceptions are counted and re-raised unchanged.
+
+        Args:
+            name: Handler name (message type or ``admin.<action>``)
+            handler: Coroutine function to run
+            *args: Arguments for the handler
+
+        """
+        stats = self.handlers.get(name)
+        if stats is None:
+            stats = self.handlers[name] = HandlerStats()
+
+        start = self._now()
+        error = False
+        try:
+            await handler(*args)
+        except BaseException:
+            error = True
+            raise
+        finally:
+            elapsed = self._now() - start
+            stats.record(elapsed * 1000, error=error)
+            if elapsed >= SLOW_HANDLER_THRESHOLD:
+                _LOGGER.warning("Slow WebSocket handler %s took %.2fs", name, elapsed)
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        """Return all handler stats keyed by handler name."""
+        return {name: stats.as_dict() for name, stats in sorted(self.handlers.items())}
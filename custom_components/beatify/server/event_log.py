@@ -0,0 +1,128 @@
+"""Bounded, sequence-numbered log of broadcast events for reconnect replay.
+
+Every message broadcast to the players is stamped with a ``seq`` number and
+kept in a ring buffer of the most recent ``EVENT_LOG_SIZE`` events. State
+pushes are logged once per state version, as a ``state_patch`` from the
+previously logged version (or, if that version is no longer retained, as a
+bare ``{"type": "state", "version": N}`` marker).
+
+A reconnecting client presents the highest ``seq`` it saw; if everything
+after it is still in the buffer it only gets the missed events instead of a
+full snapshot. The log is scoped to one game: seq numbers keep counting up
+across games, but a new game empties the buffer, so a client from an older
+game always falls back to a snapshot.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Any
+
+from custom_components.beatify.const import EVENT_LOG_SIZE
+
+# Broadcasts that are only meaningful live and are never replayed
+TRANSIENT_MESSAGE_TYPES = frozenset({"player_reaction"})
+
+
+class EventLog:
+    """Ring buffer of the most recent broadcast events."""
+
+    def __init__(self, size: int = EVENT_LOG_SIZE) -> None:
+        """
+        Initialize an empty log.
+
+        Args:
+            size: Maximum number of events retained
+
+        """
+        self.seq = 0
+        self._events: deque[dict[str, Any]] = deque(maxlen=size)
+        self._game_id: str | None = None
+        # Lowest seq a client may present and still be replayed
+        self._floor = 1
+        # State version of the last logged state event
+        self.state_version: int | None = None
+
+    def bind(self, game_id: str | None) -> None:
+        """
+        Scope the log to a game, emptying it when the game changes.
+
+        Args:
+            game_id: Current game id
+
+        """
+        if game_id != self._game_id:
+            self._game_id = game_id
+            self.reset()
+
+    def append(self, message: dict[str, Any]) -> dict[str, Any]:
+        """
+        Log a broadcast message.
+
+        Args:
+            message: Message about to be broadcast (not mutated)
+
+        Returns:
+            The message stamped with its ``seq``
+
+        """
+        self.seq += 1
+        event = {**message, "seq": self.seq}
+        self._events.append(event)
+        return event
+
+    def append_state(self, version: int, ops: list[list[Any]] | None) -> int:
+        """
+        Log a new state version.
+
+        Args:
+            version: State version being broadcast
+            ops: Patch from ``self.state_version`` to ``version``, or None
+                if no patch is available
+
+        Returns:
+            Seq of the logged event
+
+        """
+        if ops is None or self.state_version is None:
+            event: dict[str, Any] = {"type": "state", "version": version}
+        else:
+            event = {
+                "type": "state_patch",
+                "base": self.state_version,
+                "version": version,
+                "ops": ops,
+            }
+        self.state_version = version
+        return self.append(event)["seq"]
+
+    def since(self, seq: Any) -> list[dict[str, Any]] | None:
+        """
+        Return the events after ``seq``.
+
+        Args:
+            seq: Highest seq the client saw
+
+        Returns:
+            Missed events in order (possibly empty), or None when the gap is
+            not covered by the buffer and the client needs a snapshot
+
+        """
+        if not isinstance(seq, int) or isinstance(seq, bool):
+            return None
+        if seq < self._floor or seq > self.seq:
+            return None
+        oldest = self._events[0]["seq"] if self._events else self.seq + 1
+        if seq < oldest - 1:
+            return None
+        return [event for event in self._events if event["seq"] > seq]
+
+    def reset(self) -> None:
+        """Drop all events (seq keeps counting up)."""
+        self._events.clear()
+        self._floor = self.seq + 1
+        self.state_version = None
+
+    def __len__(self) -> int:
+        """Return the number of retained events."""
+        return len(self._events)
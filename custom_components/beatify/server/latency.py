@@ -0,0 +1,109 @@
+"""Application-level round-trip time tracking for Beatify connections.
+
+The WebSocket heartbeat (protocol ping/pong frames) keeps proxies awake but
+is answered by the browser below the page, so its timing is not visible to
+the app. Instead the server periodically sends ``{"type": "ping", "id": n}``
+to every connection and the client answers ``{"type": "pong", "id": n}``.
+The time between the two, measured on the server's monotonic clock, is one
+RTT sample; samples are smoothed with an exponentially weighted moving
+average (the classic TCP SRTT estimator).
+
+Both the ping and the pong go through the same queues as game messages, so
+the estimate includes the app-level delays a guess submission sees too.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Weight of a new sample in the smoothed RTT (RFC 6298 uses 1/8)
+RTT_SMOOTHING = 0.125
+
+# Unanswered pings remembered per connection (older ones are forgotten)
+MAX_PENDING_PINGS = 4
+
+
+class LatencyTracker:
+    """Smoothed RTT estimate for one connection."""
+
+    __slots__ = ("_next_id", "_now", "_pending", "last", "max", "min", "rtt", "samples")
+
+    def __init__(self, time_fn: Callable[[], float] = time.monotonic) -> None:
+        """
+        Initialize tracker.
+
+        Args:
+            time_fn: Monotonic clock (injectable for tests)
+
+        """
+        self._now = time_fn
+        self._next_id = 0
+        # Ping id -> send time, oldest first
+        self._pending: dict[int, float] = {}
+        self.rtt: float | None = None
+        self.last: float | None = None
+        self.min: float | None = None
+        self.max: float | None = None
+        self.samples = 0
+
+    @property
+    def one_way(self) -> float:
+        """Estimated one-way latency in seconds (0 until measured)."""
+        return self.rtt / 2 if self.rtt is not None else 0.0
+
+    def ping(self) -> dict[str, Any]:
+        """
+        Start a probe.
+
+        Returns:
+            Ping message to send to the client
+
+        """
+        self._next_id += 1
+        self._pending[self._next_id] = self._now()
+        while len(self._pending) > MAX_PENDING_PINGS:
+            del self._pending[next(iter(self._pending))]
+        return {"type": "ping", "id": self._next_id}
+
+    def pong(self, ping_id: Any) -> float | None:
+        """
+        Complete a probe.
+
+        Args:
+            ping_id: Id echoed by the client
+
+        Returns:
+            RTT sample in seconds, or None for an unknown or stale id
+
+        """
+        sent = self._pending.pop(ping_id, None) if isinstance(ping_id, int) else None
+        if sent is None:
+            return None
+        sample = self._now() - sent
+        self.last = sample
+        self.samples += 1
+        if self.rtt is None:
+            self.rtt = self.min = self.max = sample
+        else:
+            self.rtt += RTT_SMOOTHING * (sample - self.rtt)
+            self.min = min(self.min, sample)
+            self.max = max(self.max, sample)
+        return sample
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the estimate in milliseconds as a JSON-serializable dict."""
+
+        def ms(seconds: float | None) -> float | None:
+            return round(seconds * 1000, 1) if seconds is not None else None
+
+        return {
+            "rtt_ms": ms(self.rtt),
+            "last_ms": ms(self.last),
+            "min_ms": ms(self.min),
+            "max_ms": ms(self.max),
+            "samples": self.samples,
+        }
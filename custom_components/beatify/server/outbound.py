@@ -0,0 +1,218 @@
+"""Per-connection outbound queues for Beatify WebSocket clients.
+
+Every connection gets a bounded queue drained by its own writer task, so a
+slow phone only ever delays its own messages and never the coroutine that
+triggered a broadcast.
+
+Queued frames are split into two lanes: the priority lane (state pushes,
+acks, errors, phase events) is always drained before the bulk lane
+(reactions, metadata and volume updates). A queued ``state`` or
+``state_patch`` frame is superseded by the next one rather than stacking
+up: patches are always built from the client's acknowledged version, so
+only the newest state frame is ever needed.
+
+A connection whose queue is full of frames that cannot be dropped, or whose
+socket does not accept a frame within the send timeout, is saturated and is
+evicted via the ``on_evict`` callback.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from custom_components.beatify.const import WS_OUTBOUND_QUEUE_SIZE, WS_SEND_TIMEOUT
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+_LOGGER = logging.getLogger(__name__)
+
+# Message types that may wait behind (and be dropped before) everything else
+BULK_MESSAGE_TYPES = frozenset({"player_reaction", "metadata_update", "volume_changed"})
+
+# Message types where only the newest queued frame matters
+COALESCED_MESSAGE_TYPES = frozenset({"state", "state_patch"})
+
+_PRIORITY = 0
+_BULK = 1
+
+
+@dataclass
+class OutboundStats:
+    """Counters shared by all outbound queues of a handler."""
+
+    coalesced: int = 0
+    dropped: int = 0
+    evicted: int = 0
+    send_failures: int = 0
+
+
+class _Item:
+    """A queued frame (compared by identity so it can be removed)."""
+
+    __slots__ = ("frame", "label")
+
+    def __init__(self, frame: str | bytes, label: str | None) -> None:
+        self.frame = frame
+        self.label = label
+
+
+class OutboundQueue:
+    """Bounded two-lane send queue with its own writer task."""
+
+    def __init__(
+        self,
+        ws: Any,
+        write: Callable[[Any, str | bytes], Awaitable[None]],
+        on_evict: Callable[[Any, str], None],
+        stats: OutboundStats,
+        *,
+        maxsize: int = WS_OUTBOUND_QUEUE_SIZE,
+        send_timeout: float = WS_SEND_TIMEOUT,
+    ) -> None:
+        """
+        Initialize queue.
+
+        Args:
+            ws: WebSocket connection the queue writes to
+            write: Coroutine function writing one frame to a socket
+            on_evict: Called with (ws, reason) when the socket is saturated
+            stats: Shared counters
+            maxsize: Maximum number of queued frames
+            send_timeout: Seconds a single frame may take to write
+
+        """
+        self.ws = ws
+        self._write = write
+        self._on_evict = on_evict
+        self._stats = stats
+        self._maxsize = maxsize
+        self._send_timeout = send_timeout
+        self._lanes: tuple[deque[_Item], deque[_Item]] = (deque(), deque())
+        self._state_item: _Item | None = None
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._task: asyncio.Task | None = None
+        self.closed = False
+
+    def __len__(self) -> int:
+        """Return the number of queued frames."""
+        return len(self._lanes[_PRIORITY]) + len(self._lanes[_BULK])
+
+    def put(self, frame: str | bytes, label: str | None) -> bool:
+        """
+        Queue a frame for sending.
+
+        Args:
+            frame: Pre-encoded frame
+            label: Message type (selects lane and coalescing)
+
+        Returns:
+            True if the frame was queued, False if it was dropped or the
+            connection was closed or evicted
+
+        """
+        if self.closed:
+            return False
+
+        lane = _BULK if label in BULK_MESSAGE_TYPES else _PRIORITY
+        if label in COALESCED_MESSAGE_TYPES and self._state_item is not None:
+            # Supersede the pending state frame; the new one goes to the back
+            # so it stays ordered after anything queued in between
+            self._lanes[_PRIORITY].remove(self._state_item)
+            self._state_item = None
+            self._stats.coalesced += 1
+
+        if len(self) >= self._maxsize:
+            if self._lanes[_BULK]:
+                self._lanes[_BULK].popleft()
+                self._stats.dropped += 1
+            elif lane == _BULK:
+                self._stats.dropped += 1
+                return False
+            else:
+                self.evict("outbound queue full")
+                return False
+
+        item = _Item(frame, label)
+        self._lanes[lane].append(item)
+        if label in COALESCED_MESSAGE_TYPES:
+            self._state_item = item
+
+        self._idle.clear()
+        self._wakeup.set()
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        return True
+
+    async def join(self, timeout: float | None = None) -> bool:
+        """
+        Wait until every queued frame has been written.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if the queue drained, False on timeout
+
+        """
+        try:
+            async with asyncio.timeout(timeout):
+                await self._idle.wait()
+        except TimeoutError:
+            return False
+        return True
+
+    def evict(self, reason: str) -> None:
+        """Stop sending to a saturated socket and report it."""
+        if self.closed:
+            return
+        self.close()
+        self._stats.evicted += 1
+        self._on_evict(self.ws, reason)
+
+    def close(self) -> None:
+        """Discard queued frames and stop the writer task."""
+        self.closed = True
+        self._lanes[_PRIORITY].clear()
+        self._lanes[_BULK].clear()
+        self._state_item = None
+        self._idle.set()
+        if self._task is not None and self._task is not asyncio.current_task():
+            self._task.cancel()
+
+    def _pop(self) -> _Item | None:
+        """Take the next frame, priority lane first."""
+        for lane in self._lanes:
+            if lane:
+                item = lane.popleft()
+                if item is self._state_item:
+                    self._state_item = None
+                return item
+        return None
+
+    async def _run(self) -> None:
+        """Write queued frames until the queue is closed."""
+        while not self.closed:
+            item = self._pop()
+            if item is None:
+                self._idle.set()
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            try:
+                async with asyncio.timeout(self._send_timeout):
+                    await self._write(self.ws, item.frame)
+            except TimeoutError:
+                self.evict(f"send blocked for more than {self._send_timeout}s")
+            except Exception as err:  # noqa: BLE001
+                # The socket is gone; the connection handler cleans up
+                _LOGGER.warning("Failed to send to WebSocket: %s", err)
+                self._stats.send_failures += 1
+                self.close()
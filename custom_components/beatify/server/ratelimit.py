@@ -0,0 +1,122 @@
+"""Per-connection inbound rate limiting for Beatify.
+
+Every connection gets a set of token buckets. The ``frame`` bucket is
+charged for each inbound frame before it is parsed, so floods of malformed
+frames are cheap to reject. Parsed messages are then charged to the bucket
+of their message class: ``get_state`` (a full state rebuild and send),
+reactions, steal target lookups and clock sync exchanges have small budgets
+of their own, and everything else shares the ``default`` bucket.
+
+Throttled messages are dropped; the handler counts them per class.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+from custom_components.beatify.const import WS_INBOUND_RATE_LIMITS
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+FRAME_CLASS = "frame"
+DEFAULT_CLASS = "default"
+
+# Message types with a budget of their own
+MESSAGE_CLASSES = {
+    "get_state": "state",
+    "reaction": "reaction",
+    "get_steal_targets": "steal_targets",
+    "time_sync": "sync",
+}
+
+
+def message_class(msg_type: str | None) -> str:
+    """Return the rate limit class of a message type."""
+    return MESSAGE_CLASSES.get(msg_type, DEFAULT_CLASS)
+
+
+class TokenBucket:
+    """Classic token bucket: ``burst`` tokens, refilled at ``rate`` per second."""
+
+    __slots__ = ("burst", "rate", "rejected_streak", "tokens", "updated")
+
+    def __init__(self, burst: int, rate: float, now: float) -> None:
+        """
+        Initialize a full bucket.
+
+        Args:
+            burst: Maximum tokens (messages allowed back to back)
+            rate: Tokens added per second
+            now: Current monotonic time
+
+        """
+        self.burst = burst
+        self.rate = rate
+        self.tokens = float(burst)
+        self.updated = now
+        # Consecutive rejections since the last accepted message
+        self.rejected_streak = 0
+
+    def take(self, now: float) -> bool:
+        """
+        Take one token if available.
+
+        Args:
+            now: Current monotonic time
+
+        Returns:
+            True if the message may proceed
+
+        """
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            self.rejected_streak = 0
+            return True
+        self.rejected_streak += 1
+        return False
+
+
+class InboundLimiter:
+    """Token buckets for one connection, created on first use per class."""
+
+    def __init__(
+        self,
+        limits: Mapping[str, tuple[int, float]] = WS_INBOUND_RATE_LIMITS,
+        time_fn: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize limiter.
+
+        Args:
+            limits: Message class -> (burst, tokens per second)
+            time_fn: Monotonic clock (injectable for tests)
+
+        """
+        self._limits = limits
+        self._now = time_fn
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def bucket(self, klass: str) -> TokenBucket:
+        """Get (or create) the bucket of a message class."""
+        bucket = self._buckets.get(klass)
+        if bucket is None:
+            burst, rate = self._limits.get(klass, self._limits[DEFAULT_CLASS])
+            bucket = self._buckets[klass] = TokenBucket(burst, rate, self._now())
+        return bucket
+
+    def allow(self, klass: str) -> bool:
+        """
+        Charge one message to a class.
+
+        Args:
+            klass: Message class (FRAME_CLASS or a message_class() result)
+
+        Returns:
+            True if the message may proceed, False if it is throttled
+
+        """
+        return self.bucket(klass).take(self._now())
@@ -0,0 +1,330 @@
+"""Game rooms: several concurrent Beatify games per Home Assistant.
+
+A room pairs a GameState with its own BeatifyWebSocketHandler, so the
+connection set, state sync, outbound queues, admin-disconnect timer, round
+timers and media player service all belong to one game. Broadcasts of one
+room never touch another room's sockets.
+
+Requests are routed once, by the ``game`` query parameter (the game_id in
+every join URL): a WebSocket is handed to its room's handler at connect
+time, so messages cost the same however many rooms exist. Requests without
+a game id go to the default room, the single game of earlier versions.
+Game ids a room had before a rematch keep routing to it, so players can
+reconnect from the page they joined on.
+
+aiohttp routes cannot be removed, so the endpoints are registered once per
+Home Assistant run (register_routes) and look up the current registry in
+``hass.data`` on every request; a reloaded integration serves its new rooms.
+
+With the ``room_workers`` option each room's game engine runs on an event
+loop of its own (see worker.py), so rooms no longer share Home Assistant's.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from custom_components.beatify.const import DOMAIN, MAX_ROOMS
+from custom_components.beatify.game.state import GamePhase, GameState
+
+from .codec import json_response
+from .websocket import BeatifyWebSocketHandler
+from .worker import HassBridge, HomeProxy, RoomWorker
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from aiohttp import web
+    from homeassistant.core import HomeAssistant
+
+    from custom_components.beatify.analytics import AnalyticsStorage
+    from custom_components.beatify.services.stats import StatsService
+
+_LOGGER = logging.getLogger(__name__)
+
+# hass.data key marking the routed endpoints as registered (outlives reloads)
+DATA_ROUTES_REGISTERED = f"{DOMAIN}_routes_registered"
+
+
+@dataclass
+class Room:
+    """One game and the handler serving its connections."""
+
+    game: GameState
+    ws_handler: BeatifyWebSocketHandler
+
+    @property
+    def is_active(self) -> bool:
+        """Whether a game is running (ended games free the room)."""
+        return self.game.game_id is not None and self.game.phase != GamePhase.END
+
+    @property
+    def worker(self) -> RoomWorker | None:
+        """Event loop running the room's game engine (None: Home Assistant's)."""
+        return self.ws_handler.worker
+
+
+def create_room(
+    hass: HomeAssistant,
+    stats_service: StatsService | None = None,
+    analytics: AnalyticsStorage | None = None,
+    worker_name: str | None = None,
+) -> Room:
+    """
+    Create a room with its game state and WebSocket handler wired together.
+
+    Args:
+        hass: Home Assistant instance
+        stats_service: Stats service shared by all rooms (Story 14.4)
+        analytics: Analytics storage shared by all rooms (Story 19.1)
+        worker_name: Run the room's game engine on a worker event loop
+            with this thread name (default: on Home Assistant's loop)
+
+    Returns:
+        New room without a game
+
+    """
+    worker = None
+    engine_hass: HomeAssistant | HassBridge = hass
+    if worker_name:
+        worker = RoomWorker(worker_name, hass.loop)
+        worker.start()
+        # The engine reaches Home Assistant and the shared services only
+        # through the bridge
+        engine_hass = HassBridge(hass, worker)
+        if stats_service:
+            stats_service = HomeProxy(stats_service, worker)
+        if analytics:
+            analytics = HomeProxy(analytics, worker)
+    game_state = GameState()
+    ws_handler = BeatifyWebSocketHandler(engine_hass, game_state, worker)
+    if stats_service:
+        game_state.set_stats_service(stats_service)
+        ws_handler.set_stats_service(stats_service)
+    # Round end on timer expiry (Story 4.5) and fast metadata updates (Issue #42)
+    game_state.set_round_end_callback(ws_handler.broadcast_state)
+    game_state.set_metadata_update_callback(ws_handler.broadcast_metadata_update)
+    if analytics:
+        ws_handler.set_analytics(analytics)
+    return Room(game_state, ws_handler)
+
+
+class GameRegistry:
+    """Rooms by game_id, plus request routing to the right room."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        default: Room,
+        stats_service: StatsService | None = None,
+        analytics: AnalyticsStorage | None = None,
+        max_rooms: int = MAX_ROOMS,
+        workers: bool = False,
+    ) -> None:
+        """
+        Initialize registry.
+
+        Args:
+            hass: Home Assistant instance
+            default: Room serving requests without a game id
+            stats_service: Stats service wired into new rooms
+            analytics: Analytics storage wired into new rooms
+            max_rooms: Maximum number of rooms, the default one included
+            workers: Run new rooms on worker event loops (room_workers option)
+
+        """
+        self._hass = hass
+        self._stats_service = stats_service
+        self._analytics = analytics
+        self.max_rooms = max_rooms
+        self.workers = workers
+        self.rooms: list[Room] = [default]
+        # Current and pre-rematch game ids -> room
+        self._by_game_id: dict[str, Room] = {}
+        self.bind(default)
+
+    @property
+    def default(self) -> Room:
+        """Room serving requests without a game id."""
+        return self.rooms[0]
+
+    def get(self, game_id: str | None) -> Room | None:
+        """
+        Find the room of a game.
+
+        Args:
+            game_id: Game id, or None for the default room
+
+        Returns:
+            Room, or None if no room ever ran that game
+
+        """
+        if not game_id:
+            return self.default
+        room = self._by_game_id.get(game_id)
+        if room is None:
+            # Ids created outside the views (restore, admin socket actions)
+            for candidate in self.rooms:
+                if candidate.game.game_id == game_id:
+                    room = self.bind(candidate)
+                    break
+        return room
+
+    def bind(self, room: Room) -> Room:
+        """
+        Index a room under its current game id.
+
+        Call after creating or rematching a game. Earlier ids of the room
+        stay indexed until it hosts a new game.
+
+        Args:
+            room: Room whose game id changed
+
+        Returns:
+            The room
+
+        """
+        if room.game.game_id:
+            self._by_game_id[room.game.game_id] = room
+        return room
+
+    def release(self, room: Room) -> None:
+        """
+        Drop the game ids of a room that is about to host a new game.
+
+        Args:
+            room: Room being reused
+
+        """
+        self._by_game_id = {
+            game_id: indexed
+            for game_id, indexed in self._by_game_id.items()
+            if indexed is not room
+        }
+
+    def open_room(self) -> Room | None:
+        """
+        Return a room without a running game, creating one if needed.
+
+        Returns:
+            Idle room, or None if all max_rooms rooms are busy
+
+        """
+        for room in self.rooms:
+            if not room.is_active:
+                return room
+        if len(self.rooms) >= self.max_rooms:
+            return None
+        worker_name = f"beatify_room_{len(self.rooms) + 1}" if self.workers else None
+        room = create_room(
+            self._hass, self._stats_service, self._analytics, worker_name
+        )
+        self.rooms.append(room)
+        _LOGGER.info("Opened room %d", len(self.rooms))
+        return room
+
+    def media_player_in_use(self, entity_id: str, exclude: Room | None = None) -> bool:
+        """
+        Check whether another room's running game plays on a speaker.
+
+        Args:
+            entity_id: Media player entity id
+            exclude: Room to ignore (the one about to use the speaker)
+
+        Returns:
+            True if a running game in another room uses the speaker
+
+        """
+        return any(
+            room is not exclude
+            and room.is_active
+            and room.game.media_player == entity_id
+            for room in self.rooms
+        )
+
+    async def async_shutdown(self) -> None:
+        """Stop the worker event loops of all rooms."""
+        for room in self.rooms:
+            if room.worker:
+                await room.worker.async_stop()
+
+    def room_for_request(self, request: web.Request) -> Room | None:
+        """Find the room named by a request's ``game`` query parameter."""
+        return self.get(request.query.get("game"))
+
+    # -- routed endpoints --------------------------------------------------------
+
+    async def handle_ws(self, request: web.Request) -> web.StreamResponse:
+        """Hand a player WebSocket to its room's handler."""
+        room = self.room_for_request(request)
+        if room is None:
+            return _not_found()
+        return await room.ws_handler.handle(request)
+
+    async def handle_spectate(self, request: web.Request) -> web.StreamResponse:
+        """Hand a spectator WebSocket to its room's channel."""
+        room = self.room_for_request(request)
+        if room is None:
+            return _not_found()
+        return await room.ws_handler.spectators.handle(request)
+
+    async def handle_sse_stream(self, request: web.Request) -> web.StreamResponse:
+        """Hand a Server-Sent Events stream to its room's transport."""
+        room = self.room_for_request(request)
+        if room is None:
+            return _not_found()
+        return await room.ws_handler.sse.handle_stream(request)
+
+    async def handle_sse_send(self, request: web.Request) -> web.Response:
+        """Hand a Server-Sent Events client message to its room's transport."""
+        room = self.room_for_request(request)
+        if room is None:
+            return _not_found()
+        return await room.ws_handler.sse.handle_send(request)
+
+
+def _not_found() -> web.Response:
+    return json_response(
+        {"error": "GAME_NOT_FOUND", "message": "No such game"}, status=404
+    )
+
+
+def register_routes(hass: HomeAssistant) -> None:
+    """
+    Register the WebSocket and SSE endpoints, once per Home Assistant run.
+
+    Routes stay registered across config entry reloads; each request is
+    handed to the GameRegistry in ``hass.data`` at that moment.
+
+    Args:
+        hass: Home Assistant instance
+
+    """
+    if hass.data.get(DATA_ROUTES_REGISTERED):
+        return
+    hass.data[DATA_ROUTES_REGISTERED] = True
+    router = hass.http.app.router
+    # Routed to rooms by the ?game= parameter
+    router.add_get("/beatify/ws", _routed(hass, GameRegistry.handle_ws))
+    router.add_get("/beatify/ws/spectate", _routed(hass, GameRegistry.handle_spectate))
+    # Server-Sent Events fallback for networks that block WebSockets
+    router.add_get("/beatify/events", _routed(hass, GameRegistry.handle_sse_stream))
+    router.add_post("/beatify/events/send", _routed(hass, GameRegistry.handle_sse_send))
+
+
+def _routed(
+    hass: HomeAssistant,
+    endpoint: Callable[[GameRegistry, web.Request], Awaitable[web.StreamResponse]],
+) -> Callable[[web.Request], Awaitable[web.StreamResponse]]:
+    """Wrap a GameRegistry endpoint to run on the registry current at request time."""
+
+    async def handler(request: web.Request) -> web.StreamResponse:
+        rooms = hass.data.get(DOMAIN, {}).get("rooms")
+        if rooms is None:
+            # Integration unloaded (or still setting up)
+            return _not_found()
+        return await endpoint(rooms, request)
+
+    return handler
@@ -0,0 +1,253 @@
+"""Read-only spectator channel for Beatify.
+
+Dashboards on TVs and remote viewers only watch the game. They connect to
+``/beatify/ws/spectate`` instead of ``/beatify/ws`` and are kept out of the
+player connection set, so player broadcasts never iterate over them.
+
+Spectators get the game state at a lower rate than players
+(``update_interval``, phase changes are pushed immediately). Each update is
+encoded once and the same frame is queued for every spectator; a queued
+state frame is superseded by the next one, so a slow screen only ever gets
+the newest state. Reactions and song metadata are forwarded as well, since
+the dashboard shows them.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import WSMsgType, web
+
+from custom_components.beatify.const import SPECTATOR_UPDATE_INTERVAL
+
+from .broadcast_scheduler import BroadcastScheduler
+from .clock_sync import sync_reply
+from .codec import json_dumps, json_loads
+from .outbound import OutboundQueue
+from .worker import run_here
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from custom_components.beatify.game.state import GameState
+
+    from .outbound import OutboundStats
+
+_LOGGER = logging.getLogger(__name__)
+
+# Non-state messages forwarded to spectators (what the dashboard renders)
+SPECTATOR_MESSAGE_TYPES = frozenset({"player_reaction", "metadata_update"})
+
+
+class SpectatorChannel:
+    """Shared, rate-limited state feed for read-only viewers."""
+
+    # Same keepalive as player connections (must stay below proxy timeouts)
+    HEARTBEAT_INTERVAL = 30
+
+    def __init__(
+        self,
+        game: Callable[[], GameState | None],
+        write: Callable[[Any, str | bytes], Awaitable[None]],
+        on_evict: Callable[[Any, str], None],
+        stats: OutboundStats,
+        update_interval: float = SPECTATOR_UPDATE_INTERVAL,
+        run: Callable[..., Awaitable[Any]] = run_here,
+    ) -> None:
+        """
+        Initialize channel.
+
+        Args:
+            game: Returns the game whose state is shown
+            write: Coroutine function writing one frame to a socket
+            on_evict: Called with (ws, reason) when a spectator is saturated
+            stats: Outbound counters shared with the player connections
+            update_interval: Minimum seconds between state pushes
+            run: Runs a function on the room's event loop (see worker.py)
+
+        """
+        self._game = game
+        self._run = run
+        self._write = write
+        self._on_evict = on_evict
+        self._stats = stats
+        self.sockets: set[web.WebSocketResponse] = set()
+        self._queues: dict[web.WebSocketResponse, OutboundQueue] = {}
+        self.scheduler = BroadcastScheduler(self._flush, min_interval=update_interval)
+        # Latest published state and its encoded frame (encoded lazily, once)
+        self._state: dict | None = None
+        self._frame: str | None = None
+        self.frames_encoded = 0
+        self.frames_queued = 0
+
+    @property
+    def update_interval(self) -> float:
+        """Minimum seconds between state pushes."""
+        return self.scheduler.min_interval
+
+    @update_interval.setter
+    def update_interval(self, seconds: float) -> None:
+        self.scheduler.min_interval = seconds
+
+    async def handle(self, request: web.Request) -> web.WebSocketResponse:
+        """
+        Handle a spectator WebSocket connection.
+
+        The current state is sent on connect and on ``get_state``, and
+        ``time_sync`` requests are answered so dashboards render countdowns
+        on the server clock; every other incoming message is ignored.
+
+        Args:
+            request: aiohttp request
+
+        Returns:
+            WebSocket response
+
+        """
+        ws = web.WebSocketResponse(heartbeat=self.HEARTBEAT_INTERVAL, compress=True)
+        await ws.prepare(request)
+        await self._run(self._opened, ws)
+
+        try:
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+                received_at = time.time()
+                try:
+                    data = json_loads(msg.data)
+                except ValueError:
+                    continue
+                if not isinstance(data, dict):
+                    continue
+                if data.get("type") == "get_state":
+                    await self._run(self._send_current, ws)
+                elif data.get("type") == "time_sync":
+                    reply = sync_reply(data, received_at, time.time())
+                    if reply is not None:
+                        await self._run(self._send_reply, ws, reply)
+        finally:
+            await self._run(self._closed, ws)
+            _LOGGER.debug("Spectator disconnected, total: %d", len(self.sockets))
+
+        return ws
+
+    def _opened(self, ws: web.WebSocketResponse) -> None:
+        """Register a spectator and send it the current state."""
+        self.sockets.add(ws)
+        _LOGGER.debug("Spectator connected, total: %d", len(self.sockets))
+        self._send_current(ws)
+
+    def _closed(self, ws: web.WebSocketResponse) -> None:
+        """Forget a spectator and stop its writer."""
+        self.sockets.discard(ws)
+        queue = self._queues.pop(ws, None)
+        if queue is not None:
+            queue.close()
+
+    def _send_reply(self, ws: web.WebSocketResponse, reply: dict) -> None:
+        """Queue a clock sync reply for one spectator."""
+        self._queue(ws).put(json_dumps(reply), "time_sync")
+
+    async def publish(self, state: dict) -> None:
+        """
+        Offer a new game state to spectators.
+
+        Cheap when nobody is watching: the state is only kept for the next
+        spectator to connect. Otherwise a push is requested from the rate
+        limiter, which sends the newest state when it fires.
+
+        Args:
+            state: State dict from GameState.get_state() (not mutated)
+
+        """
+        if state is not self._state:
+            self._state = state
+            self._frame = None
+        if self.sockets:
+            await self.scheduler.request(state.get("phase"))
+
+    async def forward(self, message: dict) -> None:
+        """
+        Forward a broadcast message to spectators if they use it.
+
+        Args:
+            message: Message broadcast to the players
+
+        """
+        if not self.sockets:
+            return
+        msg_type = message.get("type")
+        if msg_type == "state":
+            await self.publish(
+                {k: v for k, v in message.items() if k not in ("type", "version")}
+            )
+        elif msg_type in SPECTATOR_MESSAGE_TYPES:
+            self._fan_out(json_dumps(message), msg_type)
+
+    async def _flush(self) -> None:
+        """Queue the newest state frame for every spectator."""
+        frame = self._current_frame()
+        self.scheduler.mark_flushed(self._state.get("phase") if self._state else None)
+        if frame is not None:
+            self._fan_out(frame, "state")
+
+    def _current_frame(self) -> str | None:
+        """Return the encoded newest state, encoding it at most once."""
+        if self._state is None:
+            game_state = self._game()
+            self._state = game_state.get_state() if game_state else None
+            if self._state is None:
+                return None
+        if self._frame is None:
+            self._frame = json_dumps({"type": "state", **self._state})
+            self.frames_encoded += 1
+        return self._frame
+
+    def _send_current(self, ws: web.WebSocketResponse) -> None:
+        """Queue the newest state for one spectator."""
+        frame = self._current_frame()
+        if frame is not None:
+            self._queue(ws).put(frame, "state")
+
+    def _fan_out(self, frame: str, label: str) -> None:
+        """Queue one shared frame for every open spectator socket."""
+        for ws in list(self.sockets):
+            if not ws.closed and self._queue(ws).put(frame, label):
+                self.frames_queued += 1
+
+    def _queue(self, ws: web.WebSocketResponse) -> OutboundQueue:
+        """Get (or create) the outbound queue of a spectator."""
+        queue = self._queues.get(ws)
+        if queue is None or queue.closed:
+            queue = OutboundQueue(ws, self._write, self._on_evict, self._stats)
+            self._queues[ws] = queue
+        return queue
+
+    async def drain(self, timeout: float | None = None) -> None:
+        """
+        Wait until every spectator's queued frames have been written.
+
+        Args:
+            timeout: Maximum seconds to wait per spectator
+
+        """
+        for queue in list(self._queues.values()):
+            await queue.join(timeout)
+
+    def reset(self) -> None:
+        """Forget the cached state and drop any scheduled push."""
+        self.scheduler.cancel()
+        self._state = None
+        self._frame = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return spectator counters as a JSON-serializable dict."""
+        return {
+            "connections": len(self.sockets),
+            "update_interval": self.update_interval,
+            "frames_encoded": self.frames_encoded,
+            "frames_queued": self.frames_queued,
+            "coalesced": self.scheduler.coalesced,
+        }
@@ -0,0 +1,267 @@
+"""Server-Sent Events fallback transport for Beatify.
+
+Some guest networks and proxies drop WebSockets. Those clients can open an
+event stream at ``/beatify/events`` instead and POST their messages to
+``/beatify/events/send``.
+
+An SSE stream is registered with BeatifyWebSocketHandler like any other
+connection: it receives the same broadcasts (sharing the encoded JSON frame
+with WebSocket clients), goes through the same outbound queue, and its
+POSTed messages run through the same message handlers. Every message is
+sent as one ``data:`` event holding the JSON frame. The first event is
+``{"type": "connected", "connection_id": ...}``; clients include that ID
+in every POST so replies (acks, errors) arrive on their stream.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import secrets
+import time
+from typing import TYPE_CHECKING
+
+from aiohttp import web
+
+from custom_components.beatify.const import SSE_KEEPALIVE_INTERVAL, WS_MAX_MESSAGE_SIZE
+
+from .codec import json_dumps, json_loads, json_response
+from .ratelimit import FRAME_CLASS
+
+if TYPE_CHECKING:
+    from .websocket import BeatifyWebSocketHandler
+
+_LOGGER = logging.getLogger(__name__)
+
+# Milliseconds browsers wait before reconnecting a dropped stream
+SSE_RETRY_MS = 2000
+
+
+class SSEConnection:
+    """An event stream that looks like a WebSocket to the message handlers."""
+
+    # SSE streams carry JSON text only and are never deflated per frame
+    compress = 0
+    ws_protocol = None
+
+    def __init__(self) -> None:
+        """Initialize connection."""
+        self.response = web.StreamResponse(
+            headers={
+                "Content-Type": "text/event-stream",
+                "Cache-Control": "no-cache",
+                # Stop nginx-style proxies from buffering the stream
+                "X-Accel-Buffering": "no",
+            }
+        )
+        self.connection_id = secrets.token_urlsafe(16)
+        self.closed = False
+        self._closed_event = asyncio.Event()
+        self._lock = asyncio.Lock()
+
+    async def prepare(self, request: web.Request) -> None:
+        """
+        Start the event stream.
+
+        Args:
+            request: aiohttp request
+
+        """
+        await self.response.prepare(request)
+        await self._write(f"retry: {SSE_RETRY_MS}\n\n")
+
+    async def send_str(self, data: str) -> None:
+        """Send a JSON frame as one event."""
+        await self._write(f"data: {data}\n\n")
+
+    async def send_bytes(self, data: bytes) -> None:
+        """Reject binary frames (SSE is text only)."""
+        msg = "SSE streams cannot carry binary frames"
+        raise TypeError(msg)
+
+    async def send_json(self, data: dict) -> None:
+        """Send a message as one event."""
+        await self.send_str(json_dumps(data))
+
+    async def ping(self) -> None:
+        """Send a keepalive comment so proxies keep the stream open."""
+        await self._write(": keepalive\n\n")
+
+    async def close(self) -> None:
+        """End the stream."""
+        self.closed = True
+        self._closed_event.set()
+
+    async def wait_closed(self, timeout: float) -> bool:
+        """
+        Wait for the stream to be closed.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if the stream was closed, False on timeout
+
+        """
+        try:
+            async with asyncio.timeout(timeout):
+                await self._closed_event.wait()
+        except TimeoutError:
+            return False
+        return True
+
+    async def _write(self, chunk: str) -> None:
+        """Write raw event stream data, closing the stream on failure."""
+        if self.closed:
+            msg = "SSE stream is closed"
+            raise ConnectionResetError(msg)
+        try:
+            async with self._lock:
+                await self.response.write(chunk.encode("utf-8"))
+        except Exception:
+            await self.close()
+            raise
+
+
+class SSETransport:
+    """Event stream and message endpoints backed by the WebSocket handler."""
+
+    def __init__(
+        self,
+        handler: BeatifyWebSocketHandler,
+        keepalive_interval: float = SSE_KEEPALIVE_INTERVAL,
+    ) -> None:
+        """
+        Initialize transport.
+
+        Args:
+            handler: Handler owning connections, broadcasts and dispatch
+            keepalive_interval: Seconds between keepalive comments
+
+        """
+        self._handler = handler
+        self.keepalive_interval = keepalive_interval
+        self.streams: dict[str, SSEConnection] = {}
+
+    async def handle_stream(self, request: web.Request) -> web.StreamResponse:
+        """
+        Serve an event stream until the client goes away.
+
+        Args:
+            request: aiohttp request
+
+        Returns:
+            Event stream response
+
+        """
+        conn = SSEConnection()
+        await conn.prepare(request)
+
+        handler = self._handler
+        await handler.run_in_room(self._stream_opened, conn)
+
+        try:
+            while not await conn.wait_closed(self.keepalive_interval):
+                await conn.ping()
+        except ConnectionResetError:
+            pass
+        finally:
+            await conn.close()
+            await handler.run_in_room(self._stream_closed, conn)
+            _LOGGER.debug(
+                "SSE stream disconnected, total: %d", len(handler.connections)
+            )
+
+        return conn.response
+
+    async def _stream_opened(self, conn: SSEConnection) -> None:
+        """Register a new stream as a connection of the handler."""
+        handler = self._handler
+        self.streams[conn.connection_id] = conn
+        handler.connections.add(conn)
+        _LOGGER.debug(
+            "SSE stream connected, total connections: %d", len(handler.connections)
+        )
+        await handler._send(
+            conn, {"type": "connected", "connection_id": conn.connection_id}
+        )
+        handler._start_pinger()
+
+    async def _stream_closed(self, conn: SSEConnection) -> None:
+        """Forget a stream that ended."""
+        self.streams.pop(conn.connection_id, None)
+        await self._handler._connection_closed(conn)
+
+    async def handle_send(self, request: web.Request) -> web.Response:
+        """
+        Accept one client message for an event stream.
+
+        The body is the message the client would send over the WebSocket,
+        plus its ``connection_id``. Replies arrive on the stream. The same
+        size cap and rate limits as for WebSocket frames apply.
+
+        Args:
+            request: aiohttp request
+
+        Returns:
+            JSON response acknowledging receipt
+
+        """
+        handler = self._handler
+        received_at = time.time()
+        body = b""
+        too_large = (request.content_length or 0) > WS_MAX_MESSAGE_SIZE
+        if not too_large:
+            # Chunked bodies have no length up front; check what was read
+            body = await request.read()
+            too_large = len(body) > WS_MAX_MESSAGE_SIZE
+        if too_large:
+            handler.oversized_messages += 1
+            return json_response(
+                {"error": "INVALID_REQUEST", "message": "Message too large"},
+                status=413,
+            )
+        try:
+            data = json_loads(body)
+        except ValueError:
+            data = None
+        if not isinstance(data, dict):
+            return json_response(
+                {"error": "INVALID_REQUEST", "message": "Invalid JSON"},
+                status=400,
+            )
+
+        conn = self.streams.get(data.pop("connection_id", None))
+        if conn is None or conn.closed:
+            return json_response(
+                {"error": "CONNECTION_NOT_FOUND", "message": "Event stream not found"},
+                status=404,
+            )
+
+        if not await handler.run_in_room(self._receive, conn, data, received_at):
+            return json_response(
+                {"error": "RATE_LIMITED", "message": "Too many messages, slow down"},
+                status=429,
+            )
+        return json_response({"success": True})
+
+    async def _receive(
+        self, conn: SSEConnection, data: dict, received_at: float
+    ) -> bool:
+        """
+        Handle one POSTed message of a stream.
+
+        Args:
+            conn: Stream the message belongs to
+            data: Parsed message
+            received_at: Wall-clock time the message arrived
+
+        Returns:
+            False if the message was rate limited
+
+        """
+        handler = self._handler
+        if not await handler._inbound_allowed(conn, FRAME_CLASS):
+            return False
+        await handler._handle_message(conn, data, received_at)
+        return True
@@ -0,0 +1,248 @@
+"""Versioned state sync for Beatify WebSocket clients.
+
+Every state push carries a monotonically increasing ``version``. Clients
+that opt in by acknowledging a version (``{"type": "state_ack", "version": N}``)
+receive compact ``state_patch`` messages from their acknowledged version to
+the current one instead of the full state dict. Clients that never ack,
+are new, or have fallen behind the retained history get full snapshots.
+
+Patch format - a list of operations applied in order:
+
+- ``["set", path, value]``: set the value at ``path`` (creating dict keys)
+- ``["del", path]``: delete the dict key at ``path``
+
+``path`` is a list of dict keys and list indexes from the state root.
+
+Retained snapshots are immutable and share unchanged subtrees: each new
+snapshot is the previous one with the changed paths copied, so a push costs
+one diff against the previous snapshot, not a full copy of the state.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any
+
+# Number of past snapshots kept so slightly lagging clients still get patches
+STATE_HISTORY_SIZE = 4
+
+_OP_SET = "set"
+_OP_DEL = "del"
+
+
+def diff_state(old: Any, new: Any, path: list[Any] | None = None) -> list[list[Any]]:
+    """
+    Compute patch operations that transform ``old`` into ``new``.
+
+    Dicts are compared key by key and lists of equal length element by
+    element. Anything else that differs is replaced wholesale.
+
+    Args:
+        old: Previous JSON-compatible value
+        new: Current JSON-compatible value
+        path: Path prefix of the values being compared (internal)
+
+    Returns:
+        List of patch operations (empty if the values are equal)
+
+    """
+    path = path or []
+    if old is new:
+        return []
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops: list[list[Any]] = []
+        for key, value in new.items():
+            if key not in old:
+                ops.append([_OP_SET, [*path, key], value])
+            else:
+                ops.extend(diff_state(old[key], value, [*path, key]))
+        ops.extend([_OP_DEL, [*path, key]] for key in old if key not in new)
+        return ops
+
+    if isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        ops = []
+        for index, (old_item, new_item) in enumerate(zip(old, new, strict=True)):
+            ops.extend(diff_state(old_item, new_item, [*path, index]))
+        return ops
+
+    # Scalars, type changes and resized lists: replace (bool/int are distinct)
+    if type(old) is type(new) and old == new:
+        return []
+    return [[_OP_SET, path, new]]
+
+
+def _clone(value: Any) -> Any:
+    """Copy the dicts and lists of a JSON-compatible value (scalars are shared)."""
+    if isinstance(value, dict):
+        return {key: _clone(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_clone(item) for item in value]
+    return value
+
+
+def _apply_copy_on_write(doc: Any, ops: list[list[Any]]) -> Any:
+    """
+    Apply patch operations to a copy of ``doc`` that shares unchanged subtrees.
+
+    Only the containers along the patched paths are copied, so ``doc`` and
+    everything it shares with earlier snapshots stay untouched.
+
+    Args:
+        doc: Snapshot to patch (not modified)
+        ops: Patch operations whose values are not referenced elsewhere
+
+    Returns:
+        The patched snapshot
+
+    """
+    copied: set[int] = set()
+
+    def own(container: Any) -> Any:
+        if id(container) in copied:
+            return container
+        container = dict(container) if isinstance(container, dict) else list(container)
+        copied.add(id(container))
+        return container
+
+    for op in ops:
+        kind, path = op[0], op[1]
+        if not path:
+            if kind == _OP_SET:
+                doc = op[2]
+                copied.clear()
+            continue
+
+        doc = parent = own(doc)
+        for key in path[:-1]:
+            parent[key] = parent = own(parent[key])
+
+        if kind == _OP_SET:
+            parent[path[-1]] = op[2]
+        elif kind == _OP_DEL:
+            del parent[path[-1]]
+    return doc
+
+
+def apply_state_patch(doc: Any, ops: list[list[Any]]) -> Any:
+    """
+    Apply patch operations produced by diff_state() to a document.
+
+    The document is modified in place where possible; the (possibly new)
+    root is returned because a root-level ``set`` replaces it.
+
+    Args:
+        doc: JSON-compatible document to patch
+        ops: Patch operations
+
+    Returns:
+        The patched document
+
+    """
+    for op in ops:
+        kind, path = op[0], op[1]
+        if not path:
+            if kind == _OP_SET:
+                doc = op[2]
+            continue
+
+        parent = doc
+        for key in path[:-1]:
+            parent = parent[key]
+
+        if kind == _OP_SET:
+            parent[path[-1]] = op[2]
+        elif kind == _OP_DEL:
+            del parent[path[-1]]
+    return doc
+
+
+class StateSync:
+    """Track state versions and recent snapshots for delta pushes."""
+
+    def __init__(self, history_size: int = STATE_HISTORY_SIZE) -> None:
+        """
+        Initialize state sync.
+
+        Args:
+            history_size: Number of snapshots retained for patch bases
+
+        """
+        self.version = 0
+        self._history_size = history_size
+        self._history: OrderedDict[int, Any] = OrderedDict()
+        # Patch from the previous version to the current one (made by commit)
+        self._last_patch: list[list[Any]] | None = None
+        self._game_id: str | None = None
+
+    def commit(self, state: dict[str, Any]) -> bool:
+        """
+        Record a state snapshot, bumping the version if it changed.
+
+        A different ``game_id`` drops the history so no patch ever spans
+        two games.
+
+        Args:
+            state: State dict from GameState.get_state()
+
+        Returns:
+            True if the state changed and a new version was created
+
+        """
+        game_id = state.get("game_id")
+        previous = self._history.get(self.version)
+        if previous is not None and game_id == self._game_id:
+            ops = diff_state(previous, state)
+            if not ops:
+                return False
+            # Values are copied so the snapshot (and logged patches) never
+            # change with the live objects the state dict references
+            ops = [
+                [op[0], op[1], _clone(op[2])] if op[0] == _OP_SET else op for op in ops
+            ]
+            snapshot = _apply_copy_on_write(previous, ops)
+        else:
+            # First state of a game: no patch spans two games
+            self._history.clear()
+            self._game_id = game_id
+            ops = None
+            snapshot = _clone(state)
+
+        self.version += 1
+        self._last_patch = ops
+        self._history[self.version] = snapshot
+        while len(self._history) > self._history_size:
+            self._history.popitem(last=False)
+        return True
+
+    def snapshot(self) -> dict[str, Any] | None:
+        """Return the current snapshot (as clients see it), if any."""
+        return self._history.get(self.version)
+
+    def has_version(self, version: int) -> bool:
+        """Check whether ``version`` is still available as a patch base."""
+        return version in self._history
+
+    def patch_from(self, base_version: int) -> list[list[Any]] | None:
+        """
+        Build a patch from ``base_version`` to the current version.
+
+        Args:
+            base_version: Version the client acknowledged
+
+        Returns:
+            Patch operations, or None if the base is no longer retained
+
+        """
+        base = self._history.get(base_version)
+        if base is None or self.version not in self._history:
+            return None
+        if base_version == self.version - 1 and self._last_patch is not None:
+            return self._last_patch
+        return diff_state(base, self._history[self.version])
+
+    def reset(self) -> None:
+        """Drop all retained snapshots (version keeps counting up)."""
+        self._history.clear()
+        self._last_patch = None
+        self._game_id = None
@@ -32,9 +32,16 @@ from custom_components.beatify.services.media_player import (
     get_platform_capabilities,
 )
 
+from .codec import json_loads, json_response
+from .worker import run_here
+
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from homeassistant.core import HomeAssistant
 
+    from .websocket import BeatifyWebSocketHandler
+
 _LOGGER = logging.getLogger(__name__)
 
 # Version is set here and bumped alongside manifest.json in release commits.
@@ -54,6 +61,50 @@ def _read_file(path: Path) -> str:
     return path.read_text(encoding="utf-8")
 
 
+def _get_room(
+    hass: HomeAssistant, game_id: str | None
+) -> tuple[GameState | None, BeatifyWebSocketHandler | None]:
+    """
+    Look up the game and WebSocket handler of a room.
+
+    Args:
+        hass: Home Assistant instance
+        game_id: Game id from the request, or None for the default room
+
+    Returns:
+        (game_state, ws_handler), both None for an unknown game id
+
+    """
+    data = hass.data.get(DOMAIN, {})
+    rooms = data.get("rooms")
+    if rooms is None:
+        return data.get("game"), data.get("ws_handler")
+    room = rooms.get(game_id)
+    if room is None:
+        return None, None
+    return room.game, room.ws_handler
+
+
+async def _in_room(
+    ws_handler: BeatifyWebSocketHandler | None, func: Callable[..., Any], *args: Any
+) -> Any:
+    """
+    Run ``func(*args)`` on the event loop of a room's game engine.
+
+    Args:
+        ws_handler: Handler of the room (None: run here)
+        func: Function or coroutine function touching the room's game
+        *args: Positional arguments
+
+    Returns:
+        The function's result
+
+    """
+    if ws_handler is None:
+        return await run_here(func, *args)
+    return await ws_handler.run_in_room(func, *args)
+
+
 class AdminView(HomeAssistantView):
     """Serve the admin page."""
 
@@ -111,15 +162,28 @@ class StatusView(HomeAssistantView):
         """Initialize the status view."""
         self.hass = hass
 
-    async def get(self, request: web.Request) -> web.Response:  # noqa: ARG002
+    async def get(self, request: web.Request) -> web.Response:
         """Return current status as JSON."""
         data = self.hass.data.get(DOMAIN, {})
 
-        # Check for active game
-        game_state = data.get("game")
+        # Check for active game (in the requested room)
+        game_state, ws_handler = _get_room(self.hass, request.query.get("game"))
         active_game = None
         if game_state and game_state.game_id:
-            active_game = game_state.get_state()
+            active_game = await _in_room(ws_handler, game_state.get_state)
+
+        # Running games of all rooms
+        rooms = data.get("rooms")
+        active_rooms = [
+            {
+                "game_id": room.game.game_id,
+                "phase": room.game.phase.value,
+                "media_player": room.game.media_player,
+                "player_count": len(room.game.players),
+            }
+            for room in (rooms.rooms if rooms else ())
+            if room.game.game_id
+        ]
 
         # Fetch media players fresh (not cached) - Story 8-2
         media_players = await async_get_media_players(self.hass)
@@ -131,7 +195,8 @@ class StatusView(HomeAssistantView):
         # Detect Music Assistant integration (not based on entity names)
         # Check if music_assistant integration is loaded via config entries
         has_music_assistant = any(
-            entry.domain == "music_assistant" for entry in self.hass.config_entries.async_entries()
+            entry.domain == "music_assistant"
+            for entry in self.hass.config_entries.async_entries()
         )
 
         status = {
@@ -142,10 +207,11 @@ class StatusView(HomeAssistantView):
             "playlist_docs_url": PLAYLIST_DOCS_URL,
             "media_player_docs_url": MEDIA_PLAYER_DOCS_URL,
             "active_game": active_game,
+            "rooms": active_rooms,
             "has_music_assistant": has_music_assistant,
         }
 
-        return web.json_response(status)
+        return json_response(status)
 
 
 class StartGameView(HomeAssistantView):
@@ -162,7 +228,39 @@ class StartGameView(HomeAssistantView):
     async def post(self, request: web.Request) -> web.Response:  # noqa: PLR0911, PLR0912
         """Start a new game."""
         data = self.hass.data.get(DOMAIN, {})
-        game_state = data.get("game")
+
+        try:
+            body = await request.json(loads=json_loads)
+        except Exception:  # noqa: BLE001
+            return json_response(
+                {"error": "INVALID_REQUEST", "message": "Invalid JSON"},
+                status=400,
+            )
+
+        # Pick the room: a free one for an additional game, else the requested one
+        rooms = data.get("rooms")
+        room = None
+        if rooms is None:
+            game_state, ws_handler = data.get("game"), data.get("ws_handler")
+        else:
+            new_room = bool(body.get("new_room", False))
+            room = (
+                rooms.open_room() if new_room else rooms.get(request.query.get("game"))
+            )
+            if room is None and new_room:
+                return json_response(
+                    {
+                        "error": "ROOM_LIMIT_REACHED",
+                        "message": f"At most {rooms.max_rooms} games can run at once",
+                    },
+                    status=409,
+                )
+            if room is None:
+                return json_response(
+                    {"error": "GAME_NOT_FOUND", "message": "No such game"},
+                    status=404,
+                )
+            game_state, ws_handler = room.game, room.ws_handler
 
         # Check for existing game
         if game_state and game_state.game_id:
@@ -171,30 +269,29 @@ class StartGameView(HomeAssistantView):
             if game_state.phase == GamePhase.END:
                 # Game is already finished — auto-clean state so a new game can start
                 # without requiring the user to explicitly dismiss the end screen (#206)
-                game_state.end_game()
+                await _in_room(ws_handler, game_state.end_game)
             else:
-                return web.json_response(
-                    {"error": "GAME_ALREADY_STARTED", "message": "End current game first"},
+                return json_response(
+                    {
+                        "error": "GAME_ALREADY_STARTED",
+                        "message": "End current game first",
+                    },
                     status=409,
                 )
 
-        try:
-            body = await request.json()
-        except Exception:  # noqa: BLE001
-            return web.json_response(
-                {"error": "INVALID_REQUEST", "message": "Invalid JSON"},
-                status=400,
-            )
-
         playlist_paths = body.get("playlists", [])
         media_player = body.get("media_player")
         language = body.get("language", "en")
         round_duration = body.get("round_duration")  # Story 13.1
         difficulty = body.get("difficulty", DIFFICULTY_DEFAULT)  # Story 14.1
         provider = body.get("provider", PROVIDER_DEFAULT)  # Story 17.2
-        artist_challenge_enabled = body.get("artist_challenge_enabled", True)  # Story 20.7
+        artist_challenge_enabled = body.get(
+            "artist_challenge_enabled", True
+        )  # Story 20.7
         movie_quiz_enabled = body.get("movie_quiz_enabled", True)  # Issue #28
         intro_mode_enabled = body.get("intro_mode_enabled", False)  # Issue #23
+        latency_compensation = bool(body.get("latency_compensation", False))
+        large_room = bool(body.get("large_room", False))
 
         # Validate difficulty (Story 14.1)
         valid_difficulties = (DIFFICULTY_EASY, DIFFICULTY_NORMAL, DIFFICULTY_HARD)
@@ -211,7 +308,7 @@ class StartGameView(HomeAssistantView):
             try:
                 round_duration = int(round_duration)
                 if not (ROUND_DURATION_MIN <= round_duration <= ROUND_DURATION_MAX):
-                    return web.json_response(
+                    return json_response(
                         {
                             "error": "INVALID_REQUEST",
                             "message": (
@@ -222,7 +319,7 @@ class StartGameView(HomeAssistantView):
                         status=400,
                     )
             except (ValueError, TypeError):
-                return web.json_response(
+                return json_response(
                     {
                         "error": "INVALID_REQUEST",
                         "message": "Invalid round duration value",
@@ -231,13 +328,13 @@ class StartGameView(HomeAssistantView):
                 )
 
         if not playlist_paths:
-            return web.json_response(
+            return json_response(
                 {"error": "INVALID_REQUEST", "message": "No playlists selected"},
                 status=400,
             )
 
         if not media_player:
-            return web.json_response(
+            return json_response(
                 {"error": "INVALID_REQUEST", "message": "No media player selected"},
                 status=400,
             )
@@ -245,16 +342,26 @@ class StartGameView(HomeAssistantView):
         # Validate media player entity exists
         media_player_state = self.hass.states.get(media_player)
         if not media_player_state:
-            return web.json_response(
+            return json_response(
                 {"error": "INVALID_REQUEST", "message": "Media player not found"},
                 status=400,
             )
         if media_player_state.state == "unavailable":
-            return web.json_response(
+            return json_response(
                 {"error": "INVALID_REQUEST", "message": "Media player is unavailable"},
                 status=400,
             )
 
+        # One game per speaker
+        if rooms is not None and rooms.media_player_in_use(media_player, exclude=room):
+            return json_response(
+                {
+                    "error": "MEDIA_PLAYER_IN_USE",
+                    "message": "Another game is playing on this media player",
+                },
+                status=409,
+            )
+
         # Load and validate playlists
         songs: list[dict[str, Any]] = []
         warnings: list[str] = []
@@ -278,20 +385,24 @@ class StartGameView(HomeAssistantView):
                     continue
 
                 # Read file in executor to avoid blocking event loop
-                file_content = await self.hass.async_add_executor_job(_read_file, full_path)
-                playlist_data = json.loads(file_content)
+                file_content = await self.hass.async_add_executor_job(
+                    _read_file, full_path
+                )
+                playlist_data = json_loads(file_content)
 
                 for song in playlist_data.get("songs", []):
                     if "year" in song and "uri" in song:
                         songs.append(song)
                     else:
-                        warnings.append(f"Invalid song in {playlist_path}: missing year or uri")
+                        warnings.append(
+                            f"Invalid song in {playlist_path}: missing year or uri"
+                        )
 
             except Exception as err:  # noqa: BLE001
                 warnings.append(f"Failed to load {playlist_path}: {err}")
 
         if not songs:
-            return web.json_response(
+            return json_response(
                 {
                     "error": "INVALID_REQUEST",
                     "message": "No valid songs found in selected playlists",
@@ -321,17 +432,19 @@ class StartGameView(HomeAssistantView):
         # Validate platform is supported
         capabilities = get_platform_capabilities(platform)
         if not capabilities.get("supported"):
-            return web.json_response(
+            return json_response(
                 {
                     "error": "UNSUPPORTED_PLAYER",
-                    "message": capabilities.get("reason", "This player type is not supported"),
+                    "message": capabilities.get(
+                        "reason", "This player type is not supported"
+                    ),
                 },
                 status=400,
             )
 
         # Validate provider is supported by platform
         if provider == "apple_music" and not capabilities.get("apple_music"):
-            return web.json_response(
+            return json_response(
                 {
                     "error": "PROVIDER_NOT_SUPPORTED",
                     "message": "Apple Music is not supported on this speaker. Use Music Assistant.",
@@ -340,7 +453,7 @@ class StartGameView(HomeAssistantView):
             )
 
         if provider == PROVIDER_YOUTUBE_MUSIC and not capabilities.get("youtube_music"):
-            return web.json_response(
+            return json_response(
                 {
                     "error": "PROVIDER_NOT_SUPPORTED",
                     "message": "YouTube Music is not supported on this speaker. Use Music Assistant.",
@@ -349,7 +462,7 @@ class StartGameView(HomeAssistantView):
             )
 
         if provider == PROVIDER_TIDAL and not capabilities.get("tidal"):
-            return web.json_response(
+            return json_response(
                 {
                     "error": "PROVIDER_NOT_SUPPORTED",
                     "message": "Tidal is not supported on this speaker. Use Music Assistant.",
@@ -371,36 +484,49 @@ class StartGameView(HomeAssistantView):
             "artist_challenge_enabled": artist_challenge_enabled,  # Story 20.7
             "movie_quiz_enabled": movie_quiz_enabled,  # Issue #28
             "intro_mode_enabled": intro_mode_enabled,  # Issue #23
+            "latency_compensation": latency_compensation,
+            "large_room": large_room,
         }
         if round_duration is not None:
             create_kwargs["round_duration"] = round_duration
 
-        result = game_state.create_game(**create_kwargs)
+        async def start_game() -> dict[str, Any]:
+            result = game_state.create_game(**create_kwargs)
+
+            # Set game language (Story 12.4, 16.3)
+            if language in ("en", "de", "es"):
+                game_state.language = language
+
+            # Broadcast to WebSocket clients
+            if ws_handler:
+                state = game_state.get_state()
+                if state:
+                    await ws_handler.broadcast({"type": "state", **state})
+            return result
+
+        result = await _in_room(ws_handler, start_game)
         result["warnings"] = warnings
+        if room is not None:
+            # Links to the room's previous game no longer lead here
+            rooms.release(room)
+            rooms.bind(room)
 
         # Record game start time for analytics (Story 19.1)
         stats_service = data.get("stats")
         if stats_service:
             stats_service.record_game_start()
 
-        # Set game language (Story 12.4, 16.3)
-        if language in ("en", "de", "es"):
-            game_state.language = language
-
-        # Broadcast to WebSocket clients
-        ws_handler = data.get("ws_handler")
-        if ws_handler:
-            state = game_state.get_state()
-            if state:
-                await ws_handler.broadcast({"type": "state", **state})
-
-        return web.json_response(result)
+        return json_response(result)
 
     def _get_base_url(self, request: web.Request) -> str:
         """Get base URL for join URL construction from request."""
         # Use the request URL - this is what the user actually used to access the app
         url = request.url
-        return f"{url.scheme}://{url.host}:{url.port}" if url.port else f"{url.scheme}://{url.host}"
+        return (
+            f"{url.scheme}://{url.host}:{url.port}"
+            if url.port
+            else f"{url.scheme}://{url.host}"
+        )
 
 
 class EndGameView(HomeAssistantView):
@@ -414,26 +540,26 @@ class EndGameView(HomeAssistantView):
         """Initialize view."""
         self.hass = hass
 
-    async def post(self, request: web.Request) -> web.Response:  # noqa: ARG002
+    async def post(self, request: web.Request) -> web.Response:
         """End the current game."""
-        data = self.hass.data.get(DOMAIN, {})
-        game_state = data.get("game")
+        game_state, ws_handler = _get_room(self.hass, request.query.get("game"))
 
         if not game_state or not game_state.game_id:
-            return web.json_response(
+            return json_response(
                 {"error": "GAME_NOT_STARTED", "message": "No active game"},
                 status=404,
             )
 
-        game_state.end_game()
+        async def end_game() -> None:
+            game_state.end_game()
 
-        # Broadcast game_ended to WebSocket clients so players clean up properly
-        ws_handler = data.get("ws_handler")
-        if ws_handler:
-            await ws_handler.broadcast({"type": "game_ended"})
-            await ws_handler.broadcast_state()
+            # Broadcast game_ended to WebSocket clients so players clean up properly
+            if ws_handler:
+                await ws_handler.broadcast({"type": "game_ended"})
+                await ws_handler.broadcast_state()
 
-        return web.json_response({"success": True})
+        await _in_room(ws_handler, end_game)
+        return json_response({"success": True})
 
 
 class RematchGameView(HomeAssistantView):
@@ -447,35 +573,45 @@ class RematchGameView(HomeAssistantView):
         """Initialize view."""
         self.hass = hass
 
-    async def post(self, request: web.Request) -> web.Response:  # noqa: ARG002
+    async def post(self, request: web.Request) -> web.Response:
         """Start a rematch with current players."""
         from custom_components.beatify.game.state import GamePhase  # noqa: PLC0415
 
-        data = self.hass.data.get(DOMAIN, {})
-        game_state = data.get("game")
+        rooms = self.hass.data.get(DOMAIN, {}).get("rooms")
+        room = rooms.get(request.query.get("game")) if rooms is not None else None
+        game_state, ws_handler = _get_room(self.hass, request.query.get("game"))
 
         if not game_state or not game_state.game_id:
-            return web.json_response(
+            return json_response(
                 {"error": "GAME_NOT_FOUND", "message": "No active game"},
                 status=404,
             )
 
         if game_state.phase != GamePhase.END:
-            return web.json_response(
-                {"error": "INVALID_PHASE", "message": "Can only rematch from END phase"},
+            return json_response(
+                {
+                    "error": "INVALID_PHASE",
+                    "message": "Can only rematch from END phase",
+                },
                 status=400,
             )
 
         player_count = len(game_state.players)
-        game_state.rematch_game()
 
-        # Broadcast to WebSocket clients
-        ws_handler = data.get("ws_handler")
-        if ws_handler:
-            await ws_handler.broadcast({"type": "rematch_started"})
-            await ws_handler.broadcast_state()
+        async def rematch_game() -> None:
+            game_state.rematch_game()
 
-        return web.json_response(
+            # Broadcast to WebSocket clients
+            if ws_handler:
+                await ws_handler.broadcast({"type": "rematch_started"})
+                await ws_handler.broadcast_state()
+
+        await _in_room(ws_handler, rematch_game)
+        if room is not None:
+            # Route the new game id here too (links with the old one keep working)
+            rooms.bind(room)
+
+        return json_response(
             {
                 "success": True,
                 "player_count": player_count,
@@ -495,45 +631,50 @@ class StartGameplayView(HomeAssistantView):
         """Initialize view."""
         self.hass = hass
 
-    async def post(self, request: web.Request) -> web.Response:  # noqa: ARG002
+    async def post(self, request: web.Request) -> web.Response:
         """Start gameplay from lobby."""
         from custom_components.beatify.game.state import GamePhase  # noqa: PLC0415
 
-        data = self.hass.data.get(DOMAIN, {})
-        game_state = data.get("game")
+        game_state, ws_handler = _get_room(self.hass, request.query.get("game"))
 
         if not game_state or not game_state.game_id:
-            return web.json_response(
+            return json_response(
                 {"error": "GAME_NOT_STARTED", "message": "No active game"},
                 status=404,
             )
 
         if game_state.phase != GamePhase.LOBBY:
-            return web.json_response(
+            return json_response(
                 {"error": "INVALID_PHASE", "message": "Game already started"},
                 status=409,
             )
 
-        # Set round end callback for broadcasting
-        ws_handler = data.get("ws_handler")
-        if ws_handler:
-            game_state.set_round_end_callback(ws_handler.broadcast_state)
-            # Set metadata update callback for fast transitions (Issue #42)
-            game_state.set_metadata_update_callback(ws_handler.broadcast_metadata_update)
+        async def start_gameplay() -> bool:
+            # Set round end callback for broadcasting
+            if ws_handler:
+                game_state.set_round_end_callback(ws_handler.broadcast_state)
+                # Set metadata update callback for fast transitions (Issue #42)
+                game_state.set_metadata_update_callback(
+                    ws_handler.broadcast_metadata_update
+                )
+
+            # Start the first round (worker rooms reach HA through the handler's bridge)
+            success = await game_state.start_round(
+                ws_handler.hass if ws_handler else self.hass
+            )
+
+            # Broadcast state to all connected players
+            if success and ws_handler:
+                await ws_handler.broadcast_state()
+            return success
 
-        # Start the first round
-        success = await game_state.start_round(self.hass)
-        if not success:
-            return web.json_response(
+        if not await _in_room(ws_handler, start_gameplay):
+            return json_response(
                 {"error": "START_FAILED", "message": "Failed to start - no songs"},
                 status=500,
             )
 
-        # Broadcast state to all connected players
-        if ws_handler:
-            await ws_handler.broadcast_state()
-
-        return web.json_response({"success": True, "phase": game_state.phase.value})
+        return json_response({"success": True, "phase": game_state.phase.value})
 
 
 class PlayerView(HomeAssistantView):
@@ -576,7 +717,7 @@ class GameStatusView(HomeAssistantView):
 
         # No game ID provided
         if not game_id:
-            return web.json_response(
+            return json_response(
                 {
                     "exists": False,
                     "phase": None,
@@ -584,12 +725,12 @@ class GameStatusView(HomeAssistantView):
                 }
             )
 
-        # Get game state with safe access
-        game_state = self.hass.data.get(DOMAIN, {}).get("game")
+        # Get the game's room with safe access
+        game_state, _ws_handler = _get_room(self.hass, game_id)
 
         # No game state or different game ID
         if not game_state:
-            return web.json_response(
+            return json_response(
                 {
                     "exists": False,
                     "phase": None,
@@ -598,7 +739,7 @@ class GameStatusView(HomeAssistantView):
             )
 
         if game_state.game_id != game_id:
-            return web.json_response(
+            return json_response(
                 {
                     "exists": False,
                     "phase": None,
@@ -611,7 +752,7 @@ class GameStatusView(HomeAssistantView):
         # Late join supported during LOBBY, PLAYING, and REVEAL (Story 16.5)
         can_join = phase in ("LOBBY", "PLAYING", "REVEAL")
 
-        return web.json_response(
+        return json_response(
             {
                 "exists": True,
                 "phase": phase,
@@ -659,7 +800,7 @@ class StatsView(HomeAssistantView):
         stats_service = self.hass.data.get(DOMAIN, {}).get("stats")
 
         if not stats_service:
-            return web.json_response(
+            return json_response(
                 {
                     "summary": {
                         "games_played": 0,
@@ -673,7 +814,7 @@ class StatsView(HomeAssistantView):
         summary = await stats_service.get_summary()
         history = await stats_service.get_history(limit=10)
 
-        return web.json_response(
+        return json_response(
             {
                 "summary": summary,
                 "history": history,
@@ -681,6 +822,33 @@ class StatsView(HomeAssistantView):
         )
 
 
+class DiagnosticsView(HomeAssistantView):
+    """API endpoint for WebSocket server runtime diagnostics.
+
+    Requires Home Assistant authentication: the counters include player
+    names, round-trip times and clock offsets.
+    """
+
+    url = "/beatify/api/diagnostics"
+    name = "beatify:api:diagnostics"
+    requires_auth = True
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize view."""
+        self.hass = hass
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Get handler latency histograms and connection counters."""
+        _game_state, ws_handler = _get_room(self.hass, request.query.get("game"))
+        if not ws_handler:
+            return json_response(
+                {"error": "NOT_INITIALIZED", "message": "Beatify is not set up"},
+                status=503,
+            )
+
+        return json_response(await ws_handler.run_in_room(ws_handler.diagnostics))
+
+
 class AnalyticsView(HomeAssistantView):
     """API endpoint for analytics dashboard data (Story 19.2)."""
 
@@ -745,7 +913,7 @@ class AnalyticsView(HomeAssistantView):
         # Rate limiting check
         client_ip = request.remote or "unknown"
         if not self._check_rate_limit(client_ip):
-            return web.json_response(
+            return json_response(
                 {"error": "RATE_LIMITED", "message": "Too many requests"},
                 status=429,
             )
@@ -758,7 +926,7 @@ class AnalyticsView(HomeAssistantView):
         analytics = self.hass.data.get(DOMAIN, {}).get("analytics")
 
         if not analytics:
-            return web.json_response(
+            return json_response(
                 {
                     "period": period,
                     "total_games": 0,
@@ -777,14 +945,14 @@ class AnalyticsView(HomeAssistantView):
             and self._cache.get("period") == period
             and (now - self._cache_time) < self._cache_ttl
         ):
-            return web.json_response(self._cache)
+            return json_response(self._cache)
 
         # Compute fresh metrics
         data = analytics.compute_metrics(period)
         self._cache = data
         self._cache_time = now
 
-        return web.json_response(data)
+        return json_response(data)
 
 
 class AnalyticsPageView(HomeAssistantView):
@@ -834,7 +1002,7 @@ class SongStatsView(HomeAssistantView):
         stats_service = self.hass.data.get(DOMAIN, {}).get("stats")
 
         if not stats_service:
-            return web.json_response(
+            return json_response(
                 {
                     "most_played": None,
                     "hardest": None,
@@ -850,7 +1018,7 @@ class SongStatsView(HomeAssistantView):
             and self._cache_playlist == playlist_filter
             and (now - self._cache_time) < self.CACHE_TTL
         ):
-            return web.json_response(self._cache)
+            return json_response(self._cache)
 
         # Compute fresh stats
         data = stats_service.compute_song_stats(playlist_filter)
@@ -858,7 +1026,7 @@ class SongStatsView(HomeAssistantView):
         self._cache_time = now
         self._cache_playlist = playlist_filter
 
-        return web.json_response(data)
+        return json_response(data)
 
 
 class PlaylistRequestsView(HomeAssistantView):
@@ -901,22 +1069,25 @@ class PlaylistRequestsView(HomeAssistantView):
     async def get(self, request: web.Request) -> web.Response:  # noqa: ARG002
         """Get all playlist requests."""
         data = await self.hass.async_add_executor_job(self._load_requests)
-        return web.json_response(data)
+        return json_response(data)
 
     async def post(self, request: web.Request) -> web.Response:
         """Save playlist requests (replaces all data)."""
         try:
-            body = await request.json()
+            body = await request.json(loads=json_loads)
         except Exception:  # noqa: BLE001
-            return web.json_response(
+            return json_response(
                 {"error": "INVALID_REQUEST", "message": "Invalid JSON"},
                 status=400,
             )
 
         # Validate data structure
         if not isinstance(body.get("requests"), list):
-            return web.json_response(
-                {"error": "INVALID_REQUEST", "message": "Missing or invalid requests array"},
+            return json_response(
+                {
+                    "error": "INVALID_REQUEST",
+                    "message": "Missing or invalid requests array",
+                },
                 status=400,
             )
 
@@ -929,9 +1100,9 @@ class PlaylistRequestsView(HomeAssistantView):
         # Save to file
         success = await self.hass.async_add_executor_job(self._save_requests, data)
         if not success:
-            return web.json_response(
+            return json_response(
                 {"error": "SAVE_FAILED", "message": "Failed to save request"},
                 status=500,
             )
 
-        return web.json_response({"success": True, "requests": data["requests"]})
+        return json_response({"success": True, "requests": data["requests"]})
@@ -5,9 +5,12 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
-from typing import TYPE_CHECKING
+import zlib
+from collections import OrderedDict
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any
 
-from aiohttp import WSMsgType, web
+from aiohttp import WebSocketError, WSCloseCode, WSMessage, WSMsgType, web
 
 from custom_components.beatify.const import (
     ARTIST_BONUS_POINTS,
@@ -27,22 +30,108 @@ from custom_components.beatify.const import (
     ERR_NO_SONGS_REMAINING,
     ERR_NOT_ADMIN,
     ERR_NOT_IN_GAME,
+    ERR_RATE_LIMITED,
     ERR_ROUND_EXPIRED,
     ERR_SESSION_NOT_FOUND,
     ERR_SESSION_TAKEOVER,
     LOBBY_DISCONNECT_GRACE_PERIOD,
+    WS_COMPRESS_THRESHOLD,
+    WS_MAX_MESSAGE_SIZE,
+    WS_PING_INTERVAL,
     YEAR_MAX,
     YEAR_MIN,
 )
+from custom_components.beatify.game.registry import name_key
 from custom_components.beatify.game.state import GamePhase, GameState
+from custom_components.beatify.services.game_store import (
+    OP_ARTIST,
+    OP_GUESS,
+    OP_JOIN,
+    OP_LEAVE,
+    OP_MOVIE,
+    OP_STEAL,
+)
+
+from .broadcast_scheduler import BroadcastScheduler
+from .clock_sync import ClockSync
+from .codec import (
+    MSGPACK_AVAILABLE,
+    WS_PROTOCOL_JSON,
+    WS_PROTOCOL_MSGPACK,
+    json_dumps,
+    json_loads,
+    msgpack_dumps,
+    msgpack_loads,
+)
+from .dispatch import HandlerMetrics
+from .event_log import TRANSIENT_MESSAGE_TYPES, EventLog
+from .latency import LatencyTracker
+from .outbound import OutboundQueue, OutboundStats
+from .ratelimit import FRAME_CLASS, InboundLimiter, message_class
+from .spectators import SpectatorChannel
+from .sse import SSETransport
+from .state_sync import StateSync
+from .worker import run_here
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from homeassistant.core import HomeAssistant
 
     from custom_components.beatify.analytics import AnalyticsStorage
+    from custom_components.beatify.game.timers import TimerHandle
+    from custom_components.beatify.services.game_store import GameStore
+    from custom_components.beatify.services.stats import StatsService
+
+    from .worker import RoomWorker
+
+    # Registered message / admin action handler: (ws, data, game_state)
+    MessageHandler = Callable[[web.WebSocketResponse, dict, GameState], Awaitable[None]]
 
 _LOGGER = logging.getLogger(__name__)
 
+# A pre-encoded frame: JSON text or MessagePack bytes
+Frame = str | bytes
+
+# Distinct frames whose deflate savings are remembered (a broadcast reuses
+# the same frame object for every socket, so this only needs to be small)
+_DEFLATE_CACHE_SIZE = 8
+
+
+def _frame_size(frame: Frame) -> int:
+    """Return the payload size of a frame in bytes."""
+    return len(frame) if isinstance(frame, bytes) else len(frame.encode("utf-8"))
+
+
+async def _send_uncompressed(ws: web.WebSocketResponse, frame: Frame) -> None:
+    """
+    Send a frame without permessage-deflate.
+
+    aiohttp compresses every frame once the extension is negotiated, and a
+    per-message ``compress=0`` falls back to the writer's level, so the
+    writer's (private) level is switched off for this frame. Should aiohttp
+    stop exposing it, the frame is sent compressed as usual. Runs on the
+    socket's own loop; each socket has a single writer task, so no other
+    data frame is in flight meanwhile.
+
+    Args:
+        ws: WebSocket connection
+        frame: JSON text or MessagePack bytes
+
+    """
+    send = ws.send_bytes if isinstance(frame, bytes) else ws.send_str
+    writer = getattr(ws, "_writer", None)
+    level = getattr(writer, "compress", None)
+    if not isinstance(level, int):
+        await send(frame)
+        return
+
+    writer.compress = 0
+    try:
+        await send(frame)
+    finally:
+        writer.compress = level
+
 
 class BeatifyWebSocketHandler:
     """Handle WebSocket connections for Beatify."""
@@ -51,22 +140,214 @@ class BeatifyWebSocketHandler:
     # aiohttp's heartbeat sends ping frames automatically
     HEARTBEAT_INTERVAL = 30
 
-    def __init__(self, hass: HomeAssistant) -> None:
+    # Subprotocols offered to clients, in server preference order
+    PROTOCOLS = (
+        (WS_PROTOCOL_MSGPACK, WS_PROTOCOL_JSON)
+        if MSGPACK_AVAILABLE
+        else (WS_PROTOCOL_JSON,)
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        game_state: GameState | None = None,
+        worker: RoomWorker | None = None,
+    ) -> None:
         """
         Initialize handler.
 
         Args:
-            hass: Home Assistant instance
+            hass: Home Assistant instance (a HassBridge for worker rooms)
+            game_state: Game of the room this handler serves (defaults to
+                the game in hass.data)
+            worker: Event loop running the room's game engine (default:
+                Home Assistant's loop)
 
         """
         self.hass = hass
+        self._game_state = game_state
+        self.worker = worker
         self.connections: set[web.WebSocketResponse] = set()
         self._pending_removals: dict[str, asyncio.Task] = {}
-        self._admin_disconnect_task: asyncio.Task | None = None
+        # Admin-disconnect pause, on the game's timer service (Story 7-1)
+        self._admin_disconnect_timer: TimerHandle | None = None
         self._analytics: AnalyticsStorage | None = None
-        # Debouncing for concurrent player joins (Issue #41)
-        self._broadcast_debounce_task: asyncio.Task | None = None
-        self._broadcast_debounce_delay = 0.05  # 50ms
+        self._stats_service: StatsService | None = None
+        # Crash-safe game snapshots and submission log (restored on setup)
+        self._game_store: GameStore | None = None
+        # Rate-capped state pushes for player action storms (Issue #41)
+        self.state_scheduler = BroadcastScheduler(self.broadcast_state)
+        # Message dispatch: handler per message type and per admin action
+        self.handler_metrics = HandlerMetrics()
+        self._message_handlers: dict[str, MessageHandler] = {
+            "join": self._handle_join,
+            "submit": self._handle_submit,
+            "admin": self._handle_admin,
+            "reconnect": self._handle_reconnect,  # Story 11.2
+            "leave": self._handle_leave,  # Story 11.5
+            "get_state": self._handle_get_state,  # Story 10.4
+            "state_ack": self._handle_state_ack,
+            "get_steal_targets": self._handle_get_steal_targets,  # Story 15.3
+            "steal": self._handle_steal,  # Story 15.3
+            "reaction": self._handle_reaction,  # Story 18.9
+            "artist_guess": self._handle_artist_guess,  # Story 20.3
+            "movie_guess": self._handle_movie_guess,  # Issue #28
+        }
+        self._admin_handlers: dict[str, MessageHandler] = {
+            "start_game": self._admin_start_game,
+            "next_round": self._admin_next_round,
+            "stop_song": self._admin_stop_song,
+            "set_volume": self._admin_set_volume,
+            "end_game": self._admin_end_game,
+            "dismiss_game": self._admin_dismiss_game,
+            "rematch_game": self._admin_rematch_game,
+            "set_language": self._admin_set_language,
+        }
+        # Broadcast accounting (frames are encoded once per broadcast)
+        self.broadcast_count = 0
+        self.broadcast_bytes_total = 0
+        # Versioned delta state sync: last state version acked per socket
+        self._state_sync = StateSync()
+        self._state_acks: dict[web.WebSocketResponse, int] = {}
+        # Large-room mode: personal messages (own player entry and rank) last
+        # sent to each player left out of the trimmed lists, by message type
+        self._personal: dict[web.WebSocketResponse, dict[str, dict]] = {}
+        # Connections that negotiated the MessagePack subprotocol
+        self._msgpack_sockets: set[web.WebSocketResponse] = set()
+        # permessage-deflate: frames below the threshold skip compression
+        self.compress_threshold = WS_COMPRESS_THRESHOLD
+        self.compressed_frames = 0
+        # Estimated from a fresh deflate context per frame (_deflate_saving)
+        self.compression_bytes_saved_estimate = 0
+        self._deflate_savings: OrderedDict[Frame, int] = OrderedDict()
+        # Per-connection outbound queues, each drained by its own writer task
+        self._outbound: dict[web.WebSocketResponse, OutboundQueue] = {}
+        self.outbound_stats = OutboundStats()
+        self._close_tasks: set[asyncio.Task] = set()
+        # Read-only viewers (dashboards), kept out of self.connections
+        self.spectators = SpectatorChannel(
+            lambda: self.game_state,
+            self._write,
+            self._evict,
+            self.outbound_stats,
+            run=self.run_in_room,
+        )
+        # Server-Sent Events fallback: streams join self.connections
+        self.sse = SSETransport(self)
+        # Inbound limits: token buckets per connection, throttled count per class
+        self._limiters: dict[web.WebSocketResponse, InboundLimiter] = {}
+        self.inbound_throttled: dict[str, int] = {}
+        self.oversized_messages = 0
+        # App-level ping/pong RTT per connection, and when its last message arrived
+        self.ping_interval: float = WS_PING_INTERVAL
+        self._latency: dict[web.WebSocketResponse, LatencyTracker] = {}
+        self._received_at: dict[web.WebSocketResponse, float] = {}
+        self._ping_task: asyncio.Task | None = None
+        # Client clock offsets reported through the time_sync exchange
+        self.clock_sync = ClockSync()
+        # Recent broadcasts, replayed to reconnecting clients
+        self._event_log = EventLog()
+        self.replayed_events = 0
+        self.replay_snapshots = 0
+
+    @property
+    def game_state(self) -> GameState | None:
+        """Game of this handler's room (the default game when unbound)."""
+        if self._game_state is not None:
+            return self._game_state
+        return self.hass.data.get(DOMAIN, {}).get("game")
+
+    @property
+    def stats_service(self) -> StatsService | None:
+        """Stats service of this handler's room (defaults to the one in hass.data)."""
+        if self._stats_service is not None:
+            return self._stats_service
+        return self.hass.data.get(DOMAIN, {}).get("stats")
+
+    async def run_in_room(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run ``func(*args)`` on the event loop of this handler's room.
+
+        Everything that touches the room's game or the handler's
+        bookkeeping goes through here when called from Home Assistant's
+        loop (views, socket receive loops). Without a worker it is a plain
+        call.
+
+        Args:
+            func: Function or coroutine function
+            *args: Positional arguments
+
+        Returns:
+            The function's result
+
+        """
+        if self.worker is None:
+            return await run_here(func, *args)
+        return await self.worker.run(func, *args)
+
+    async def _home(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a socket operation on Home Assistant's loop, where sockets live."""
+        if self.worker is None:
+            return await func(*args)
+        return await self.worker.call_home(func, *args)
+
+    def diagnostics(self) -> dict[str, Any]:
+        """
+        Return runtime counters for the WebSocket server.
+
+        Returns:
+            Dict with per-handler latency stats, broadcast, compression,
+            outbound queue and state scheduler counters, per-player RTT and
+            client clock skew
+
+        """
+        game_state = self.game_state
+        players = game_state.players.values() if game_state else ()
+        return {
+            "connections": len(self.connections),
+            "sse_streams": len(self.sse.streams),
+            "handlers": self.handler_metrics.as_dict(),
+            "broadcasts": {
+                "count": self.broadcast_count,
+                "bytes_total": self.broadcast_bytes_total,
+            },
+            "compression": {
+                "threshold": self.compress_threshold,
+                "frames": self.compressed_frames,
+                "bytes_saved_estimate": self.compression_bytes_saved_estimate,
+            },
+            "outbound": {
+                "queues": len(self._outbound),
+                **asdict(self.outbound_stats),
+            },
+            "state_scheduler": {
+                "requests": self.state_scheduler.requests,
+                "flushes": self.state_scheduler.flushes,
+                "coalesced": self.state_scheduler.coalesced,
+            },
+            "spectators": self.spectators.as_dict(),
+            "inbound": {
+                "throttled": dict(self.inbound_throttled),
+                "oversized": self.oversized_messages,
+            },
+            "latency": {
+                "compensation": bool(game_state and game_state.latency_compensation),
+                "players": {
+                    p.name: self._latency[p.ws].as_dict()
+                    for p in players
+                    if p.ws in self._latency
+                },
+            },
+            "clock_sync": self.clock_sync.as_dict(players),
+            "event_log": {
+                "seq": self._event_log.seq,
+                "retained": len(self._event_log),
+                "replayed_events": self.replayed_events,
+                "snapshots": self.replay_snapshots,
+            },
+            "worker": self.worker.as_dict() if self.worker else None,
+            "timers": game_state.timers.as_dict() if game_state else None,
+        }
 
     def set_analytics(self, analytics: AnalyticsStorage) -> None:
         """
@@ -78,6 +359,31 @@ class BeatifyWebSocketHandler:
         """
         self._analytics = analytics
 
+    def set_stats_service(self, stats_service: StatsService) -> None:
+        """
+        Set the stats service game results are recorded to (Story 14.4).
+
+        Args:
+            stats_service: StatsService instance
+
+        """
+        self._stats_service = stats_service
+
+    def set_game_store(self, store: GameStore) -> None:
+        """
+        Set the store that snapshots the game at phase transitions.
+
+        Args:
+            store: GameStore instance
+
+        """
+        self._game_store = store
+
+    def _log_action(self, op: str, player: str, **fields: Any) -> None:
+        """Append a player action to the game store's write-ahead log."""
+        if self._game_store:
+            self._game_store.append(op, player, **fields)
+
     def _record_error(self, error_type: str, message: str) -> None:
         """
         Record error event to analytics (Story 19.1 AC: #2).
@@ -102,492 +408,805 @@ class BeatifyWebSocketHandler:
 
         """
         # heartbeat parameter enables automatic ping/pong to prevent proxy timeouts
-        ws = web.WebSocketResponse(heartbeat=self.HEARTBEAT_INTERVAL)
+        # Clients that request no (or an unknown) subprotocol get plain JSON.
+        # compress=True accepts permessage-deflate for clients that offer it;
+        # _write() decides per frame whether it is worth compressing.
+        # max_msg_size makes the frame reader reject oversized frames before
+        # they are buffered or parsed (the socket is closed with 1009).
+        ws = web.WebSocketResponse(
+            heartbeat=self.HEARTBEAT_INTERVAL,
+            protocols=self.PROTOCOLS,
+            compress=True,
+            max_msg_size=WS_MAX_MESSAGE_SIZE,
+        )
         await ws.prepare(request)
-
-        self.connections.add(ws)
-        _LOGGER.debug("WebSocket connected, total: %d", len(self.connections))
+        await self.run_in_room(self._connection_opened, ws)
 
         try:
             async for msg in ws:
-                if msg.type == WSMsgType.TEXT:
-                    try:
-                        await self._handle_message(ws, msg.json())
-                    except Exception as err:  # noqa: BLE001
-                        _LOGGER.warning("Failed to parse WebSocket message: %s", err)
-                elif msg.type == WSMsgType.ERROR:
-                    err_msg = str(ws.exception())
-                    _LOGGER.error("WebSocket error: %s", err_msg)
-                    # Record WebSocket error to analytics (Story 19.1 AC: #2)
-                    from custom_components.beatify.analytics import (  # noqa: PLC0415
-                        ERROR_WEBSOCKET_DISCONNECT,
-                    )
-
-                    self._record_error(ERROR_WEBSOCKET_DISCONNECT, err_msg)
-
+                # Taken before parsing so slow parsing never counts against a guess
+                await self.run_in_room(self._receive, ws, msg, time.time())
         finally:
-            self.connections.discard(ws)
-            await self._handle_disconnect(ws)
+            await self.run_in_room(self._connection_closed, ws)
             _LOGGER.debug("WebSocket disconnected, total: %d", len(self.connections))
 
         return ws
 
-    async def _handle_message(  # noqa: PLR0912, PLR0915
-        self, ws: web.WebSocketResponse, data: dict
+    def _connection_opened(self, ws: web.WebSocketResponse) -> None:
+        """
+        Register a new WebSocket connection.
+
+        Args:
+            ws: Connection that was just accepted
+
+        """
+        self.connections.add(ws)
+        if ws.ws_protocol == WS_PROTOCOL_MSGPACK:
+            self._msgpack_sockets.add(ws)
+        _LOGGER.debug(
+            "WebSocket connected (%s), total: %d",
+            ws.ws_protocol or "json",
+            len(self.connections),
+        )
+        self._start_pinger()
+
+    async def _receive(
+        self, ws: web.WebSocketResponse, msg: WSMessage, received_at: float
+    ) -> None:
+        """
+        Handle one frame from a WebSocket's receive loop.
+
+        Args:
+            ws: WebSocket connection
+            msg: Received frame
+            received_at: Wall-clock time the frame arrived
+
+        """
+        if msg.type in (WSMsgType.TEXT, WSMsgType.BINARY) and not (
+            await self._inbound_allowed(ws, FRAME_CLASS)
+        ):
+            return
+        if msg.type == WSMsgType.TEXT:
+            try:
+                await self._handle_message(ws, json_loads(msg.data), received_at)
+            except Exception as err:  # noqa: BLE001
+                _LOGGER.warning("Failed to parse WebSocket message: %s", err)
+        elif msg.type == WSMsgType.BINARY:
+            if ws not in self._msgpack_sockets:
+                _LOGGER.warning("Ignoring binary frame on JSON WebSocket")
+                return
+            try:
+                await self._handle_message(ws, msgpack_loads(msg.data), received_at)
+            except Exception as err:  # noqa: BLE001
+                _LOGGER.warning("Failed to parse WebSocket message: %s", err)
+        elif msg.type == WSMsgType.ERROR:
+            if (
+                isinstance(msg.data, WebSocketError)
+                and msg.data.code == WSCloseCode.MESSAGE_TOO_BIG
+            ):
+                self.oversized_messages += 1
+            err_msg = str(ws.exception() or msg.data)
+            _LOGGER.error("WebSocket error: %s", err_msg)
+            # Record WebSocket error to analytics (Story 19.1 AC: #2)
+            from custom_components.beatify.analytics import (
+                ERROR_WEBSOCKET_DISCONNECT,
+            )
+
+            self._record_error(ERROR_WEBSOCKET_DISCONNECT, err_msg)
+
+    async def _connection_closed(self, ws: web.WebSocketResponse) -> None:
+        """
+        Forget a closed connection (WebSocket or SSE stream).
+
+        Args:
+            ws: Connection that ended
+
+        """
+        self.connections.discard(ws)
+        self._state_acks.pop(ws, None)
+        self._personal.pop(ws, None)
+        self._msgpack_sockets.discard(ws)
+        self._limiters.pop(ws, None)
+        self._latency.pop(ws, None)
+        self._received_at.pop(ws, None)
+        self.clock_sync.forget(ws)
+        queue = self._outbound.pop(ws, None)
+        if queue is not None:
+            queue.close()
+        if not self.connections and self._ping_task is not None:
+            self._ping_task.cancel()
+            self._ping_task = None
+        await self._handle_disconnect(ws)
+
+    def _start_pinger(self) -> None:
+        """Start the RTT probe loop unless it is already running."""
+        if self._ping_task is None or self._ping_task.done():
+            self._ping_task = asyncio.create_task(self._ping_loop())
+
+    async def _ping_loop(self) -> None:
+        """Send an app-level ping to every connection each ping_interval."""
+        while self.connections:
+            await asyncio.sleep(self.ping_interval)
+            for ws in list(self.connections):
+                if not ws.closed:
+                    await self._send(ws, self._latency_tracker(ws).ping())
+
+    def _latency_tracker(self, ws: web.WebSocketResponse) -> LatencyTracker:
+        """Get (or create) the RTT tracker of a connection."""
+        tracker = self._latency.get(ws)
+        if tracker is None:
+            tracker = self._latency[ws] = LatencyTracker()
+        return tracker
+
+    def _handle_pong(self, ws: web.WebSocketResponse, data: dict) -> None:
+        """
+        Record the RTT sample of an answered app-level ping.
+
+        Args:
+            ws: WebSocket connection
+            data: Pong message echoing the ping id
+
+        """
+        tracker = self._latency.get(ws)
+        if tracker is not None and tracker.pong(data.get("id")) is not None:
+            _LOGGER.debug(
+                "RTT sample %.1f ms (smoothed %.1f ms)",
+                tracker.last * 1000,
+                tracker.rtt * 1000,
+            )
+
+    def _receive_time(self, ws: web.WebSocketResponse) -> float:
+        """Return when the message being handled arrived (wall clock)."""
+        return self._received_at.get(ws) or time.time()
+
+    async def _handle_message(
+        self, ws: web.WebSocketResponse, data: dict, received_at: float | None = None
     ) -> None:
         """
         Handle incoming WebSocket message.
 
+        Looks up the handler registered for the message type and runs it
+        under the dispatch metrics (latency histogram, call/error counts).
+
         Args:
             ws: WebSocket connection
             data: Parsed message data
+            received_at: Wall-clock time the frame arrived (default: now)
 
         """
+        self._received_at[ws] = received_at if received_at is not None else time.time()
         msg_type = data.get("type")
-        game_state = self.hass.data.get(DOMAIN, {}).get("game")
+        if not await self._inbound_allowed(ws, message_class(msg_type)):
+            return
+
+        # RTT probes and clock sync are answered with or without a game
+        if msg_type == "pong":
+            self._handle_pong(ws, data)
+            return
+        if msg_type == "time_sync":
+            reply = self.clock_sync.handle(ws, data, self._received_at[ws], time.time())
+            if reply is not None:
+                await self._send(ws, reply)
+            return
+
+        game_state = self.game_state
 
         if not game_state or not game_state.game_id:
-            await ws.send_json(
+            await self._send(
+                ws,
                 {
                     "type": "error",
                     "code": ERR_GAME_NOT_STARTED,
                     "message": "No active game",
-                }
+                },
             )
             return
 
-        if msg_type == "join":
-            name = data.get("name", "").strip()
-            is_admin = data.get("is_admin", False)
-
-            success, error_code = game_state.add_player(name, ws)
-
-            if success:
-                # Get the player session for session_id (Story 11.1)
-                player = game_state.get_player(name)
-
-                # Handle admin join/reconnection (Story 7-2)
-                if is_admin:
-                    # Check if reconnecting as the disconnected admin
-                    if game_state.disconnected_admin_name:
-                        if name.lower() == game_state.disconnected_admin_name.lower():
-                            # Same admin reconnecting - cancel disconnect task
-                            if self._admin_disconnect_task:
-                                self._admin_disconnect_task.cancel()
-                                self._admin_disconnect_task = None
-                                _LOGGER.info("Admin reconnected, cancelled pause task: %s", name)
-
-                            # Cancel pending removal if any
-                            self.cancel_pending_removal(name)
-
-                            # Resume game if paused
-                            if game_state.phase == GamePhase.PAUSED:
-                                if await game_state.resume_game():
-                                    _LOGGER.info("Game resumed by admin reconnection")
-                        else:
-                            # Different person trying to claim admin
-                            game_state.remove_player(name)
-                            await ws.send_json(
-                                {
-                                    "type": "error",
-                                    "code": ERR_ADMIN_EXISTS,
-                                    "message": "Only the original host can reconnect",
-                                }
+        handler = self._message_handlers.get(msg_type)
+        if handler is None:
+            _LOGGER.warning("Unknown message type: %s", msg_type)
+            return
+        await self.handler_metrics.run(msg_type, handler, ws, data, game_state)
+
+    async def _inbound_allowed(self, ws: web.WebSocketResponse, klass: str) -> bool:
+        """
+        Charge an inbound message to the connection's token bucket.
+
+        Throttled messages are counted per class and dropped. The client is
+        told once per burst, so throttling never amplifies a flood.
+
+        Args:
+            ws: WebSocket connection
+            klass: Rate limit class (see ratelimit.py)
+
+        Returns:
+            True if the message may be processed
+
+        """
+        limiter = self._limiters.get(ws)
+        if limiter is None:
+            limiter = self._limiters[ws] = InboundLimiter()
+        if limiter.allow(klass):
+            return True
+
+        self.inbound_throttled[klass] = self.inbound_throttled.get(klass, 0) + 1
+        if limiter.bucket(klass).rejected_streak == 1:
+            _LOGGER.warning("Throttling WebSocket client: too many %s messages", klass)
+            await self._send(
+                ws,
+                {
+                    "type": "error",
+                    "code": ERR_RATE_LIMITED,
+                    "message": "Too many messages, slow down",
+                },
+            )
+        return False
+
+    async def _handle_join(
+        self, ws: web.WebSocketResponse, data: dict, game_state: GameState
+    ) -> None:
+        """
+        Handle a player joining the game.
+
+        Args:
+            ws: WebSocket connection
+            data: Message data
+            game_state: Current game state
+
+        """
+        name = data.get("name", "").strip()
+        is_admin = data.get("is_admin", False)
+
+        success, error_code = game_state.add_player(name, ws)
+
+        if success:
+            # Get the player session for session_id (Story 11.1)
+            player = game_state.get_player(name)
+
+            # Handle admin join/reconnection (Story 7-2)
+            if is_admin:
+                # Check if reconnecting as the disconnected admin
+                if game_state.disconnected_admin_name:
+                    if name_key(name) == name_key(game_state.disconnected_admin_name):
+                        # Same admin reconnecting - cancel disconnect timer
+                        if self._admin_disconnect_timer:
+                            self._admin_disconnect_timer.cancel()
+                            self._admin_disconnect_timer = None
+                            _LOGGER.info(
+                                "Admin reconnected, cancelled pause task: %s", name
                             )
-                            return
+
+                        # Cancel pending removal if any
+                        self.cancel_pending_removal(name)
+
+                        # Resume game if paused
+                        if (
+                            game_state.phase == GamePhase.PAUSED
+                            and await game_state.resume_game()
+                        ):
+                            _LOGGER.info("Game resumed by admin reconnection")
                     else:
-                        # No disconnected admin - check for existing admin
-                        existing_admin = any(
-                            p.is_admin for p in game_state.players.values() if p.name != name
+                        # Different person trying to claim admin
+                        game_state.remove_player(name)
+                        await self._send(
+                            ws,
+                            {
+                                "type": "error",
+                                "code": ERR_ADMIN_EXISTS,
+                                "message": "Only the original host can reconnect",
+                            },
                         )
-                        if existing_admin:
-                            # Remove the just-added player and return error
-                            game_state.remove_player(name)
-                            await ws.send_json(
-                                {
-                                    "type": "error",
-                                    "code": ERR_ADMIN_EXISTS,
-                                    "message": "Game already has an admin",
-                                }
-                            )
-                            return
-                        game_state.set_admin(name)
+                        return
                 else:
-                    # Regular player - cancel pending removal on reconnect
-                    self.cancel_pending_removal(name)
-
-                # Send join acknowledgment with session_id (Story 11.1)
-                # Only the joining player receives their session_id (security)
-                if player:
-                    await ws.send_json(
-                        {
-                            "type": "join_ack",
-                            "session_id": player.session_id,
-                            "game_id": game_state.game_id,
-                        }
-                    )
-
-                # Send full state to newly joined player
-                state_msg = {"type": "state", **game_state.get_state()}
-                try:
-                    await ws.send_json(state_msg)
-                except Exception as err:  # noqa: BLE001
-                    _LOGGER.warning("Failed to send state to new player: %s", err)
-                    return
-                # Debounced broadcast to others (Issue #41 - batches concurrent joins)
-                # Joiner already got state above; this notifies other players
-                await self.debounced_broadcast_state()
+                    # No disconnected admin - check for existing admin
+                    admin = game_state.players.admin
+                    if admin is not None and admin.name != name:
+                        # Remove the just-added player and return error
+                        game_state.remove_player(name)
+                        await self._send(
+                            ws,
+                            {
+                                "type": "error",
+                                "code": ERR_ADMIN_EXISTS,
+                                "message": "Game already has an admin",
+                            },
+                        )
+                        return
+                    game_state.set_admin(name)
             else:
-                error_messages = {
-                    ERR_NAME_TAKEN: "Name taken, choose another",
-                    ERR_NAME_INVALID: "Please enter a name",
-                    ERR_GAME_FULL: "Game is full",
-                    ERR_GAME_ENDED: "This game has ended",
-                }
-                await ws.send_json(
+                # Regular player - cancel pending removal on reconnect
+                self.cancel_pending_removal(name)
+
+            # Send join acknowledgment with session_id (Story 11.1)
+            # Only the joining player receives their session_id (security)
+            if player:
+                self._log_action(OP_JOIN, player.name, session=player.to_snapshot())
+                await self._send(
+                    ws,
                     {
-                        "type": "error",
-                        "code": error_code,
-                        "message": error_messages.get(error_code, "Join failed"),
-                    }
+                        "type": "join_ack",
+                        "session_id": player.session_id,
+                        "game_id": game_state.game_id,
+                    },
                 )
 
-        elif msg_type == "submit":
-            await self._handle_submit(ws, data, game_state)
+            # Send full state to newly joined player
+            try:
+                await self._send_player_state(ws, game_state)
+            except Exception as err:  # noqa: BLE001
+                _LOGGER.warning("Failed to send state to new player: %s", err)
+                return
+            # Rate-capped broadcast to others (Issue #41 - batches concurrent joins)
+            # Joiner already got state above; this notifies other players
+            await self.request_state_broadcast()
+        else:
+            error_messages = {
+                ERR_NAME_TAKEN: "Name taken, choose another",
+                ERR_NAME_INVALID: "Please enter a name",
+                ERR_GAME_FULL: "Game is full",
+                ERR_GAME_ENDED: "This game has ended",
+            }
+            await self._send(
+                ws,
+                {
+                    "type": "error",
+                    "code": error_code,
+                    "message": error_messages.get(error_code, "Join failed"),
+                },
+            )
 
-        elif msg_type == "admin":
-            action = data.get("action")
+    async def _handle_admin(
+        self, ws: web.WebSocketResponse, data: dict, game_state: GameState
+    ) -> None:
+        """
+        Check the sender is the admin and run the requested admin action.
 
-            # Find sender's player session
-            sender = None
-            for player in game_state.players.values():
-                if player.ws == ws:
-                    sender = player
-                    break
+        Args:
+            ws: WebSocket connection
+            data: Message data
+            game_state: Current game state
 
-            if not sender or not sender.is_admin:
-                await ws.send_json(
-                    {
-                        "type": "error",
-                        "code": ERR_NOT_ADMIN,
-                        "message": "Only admin can perform this action",
-                    }
-                )
-                return
+        """
+        action = data.get("action")
+
+        # Find sender's player session
+        sender = game_state.get_player_by_ws(ws)
+
+        if not sender or not sender.is_admin:
+            await self._send(
+                ws,
+                {
+                    "type": "error",
+                    "code": ERR_NOT_ADMIN,
+                    "message": "Only admin can perform this action",
+                },
+            )
+            return
+
+        handler = self._admin_handlers.get(action)
+        if handler is None:
+            _LOGGER.warning("Unknown admin action: %s", action)
+            return
+        await self.handler_metrics.run(f"admin.{action}", handler, ws, data, game_state)
+
+    async def _admin_start_game(
+        self,
+        ws: web.WebSocketResponse,
+        data: dict,
+        game_state: GameState,
+    ) -> None:
+        """
+        Start the first round (admin action).
+
+        Args:
+            ws: WebSocket connection
+            data: Message data
+            game_state: Current game state
+
+        """
+        if game_state.phase != GamePhase.LOBBY:
+            await self._send(
+                ws,
+                {
+                    "type": "error",
+                    "code": ERR_INVALID_ACTION,
+                    "message": "Game already started",
+                },
+            )
+            return
 
-            if action == "start_game":
-                if game_state.phase != GamePhase.LOBBY:
-                    await ws.send_json(
-                        {
-                            "type": "error",
-                            "code": ERR_INVALID_ACTION,
-                            "message": "Game already started",
-                        }
+        # Start the first round (plays song, sets timer)
+        success = await game_state.start_round(self.hass)
+        if success:
+            await self.broadcast_state()
+        else:
+            # Determine specific error based on game state
+            error_code = ERR_GAME_NOT_STARTED
+            error_message = "Failed to start game"
+
+            if game_state.phase == GamePhase.PAUSED:
+                # Game paused due to specific error
+                pause_reason = game_state.pause_reason
+                error_detail = game_state.last_error_detail
+                if pause_reason == "media_player_error":
+                    error_code = ERR_MEDIA_PLAYER_UNAVAILABLE
+                    if error_detail:
+                        error_message = f"Media player error: {error_detail}"
+                    else:
+                        error_message = (
+                            "Media player not responding - check speaker connection"
+                        )
+                elif pause_reason == "no_songs_available":
+                    error_message = "No playable songs for selected provider"
+                else:
+                    error_message = f"Game paused: {pause_reason}"
+            elif game_state.phase == GamePhase.END:
+                error_code = ERR_NO_SONGS_REMAINING
+                error_message = "No songs available in playlist"
+
+            await self._send(
+                ws,
+                {
+                    "type": "error",
+                    "code": error_code,
+                    "message": error_message,
+                },
+            )
+
+    async def _admin_next_round(
+        self, ws: web.WebSocketResponse, data: dict, game_state: GameState
+    ) -> None:
+        """
+        Advance to the next round or end the game (admin action).
+
+        Args:
+            ws: WebSocket connection
+            data: Message data
+            game_state: Current game state
+
+        """
+        if game_state.phase == GamePhase.PLAYING:
+            # Early advance - end current round first
+            await game_state.end_round()
+            # Broadcast handled by round_end_callback
+        elif game_state.phase == GamePhase.REVEAL:
+            # Start next round or end game
+            if game_state.last_round:
+                # Record game stats before ending (Story 14.4, 19.1)
+                stats_service = self.stats_service
+                if stats_service:
+                    game_summary = game_state.finalize_game()
+                    await stats_service.record_game(
+                        game_summary, difficulty=game_state.difficulty
                     )
-                    return
+                    _LOGGER.debug("Game stats recorded for natural end")
 
-                # Start the first round (plays song, sets timer)
+                # No more rounds, end game
+                game_state.phase = GamePhase.END
+                await self.broadcast_state()
+            else:
+                # Start next round
                 success = await game_state.start_round(self.hass)
                 if success:
                     await self.broadcast_state()
                 else:
-                    # Determine specific error based on game state
-                    error_code = ERR_GAME_NOT_STARTED
-                    error_message = "Failed to start game"
-
-                    if game_state.phase == GamePhase.PAUSED:
-                        # Game paused due to specific error
-                        pause_reason = game_state.pause_reason
-                        error_detail = game_state.last_error_detail
-                        if pause_reason == "media_player_error":
-                            error_code = ERR_MEDIA_PLAYER_UNAVAILABLE
-                            if error_detail:
-                                error_message = f"Media player error: {error_detail}"
-                            else:
-                                error_message = (
-                                    "Media player not responding - check speaker connection"
-                                )
-                        elif pause_reason == "no_songs_available":
-                            error_message = "No playable songs for selected provider"
-                        else:
-                            error_message = f"Game paused: {pause_reason}"
-                    elif game_state.phase == GamePhase.END:
-                        error_code = ERR_NO_SONGS_REMAINING
-                        error_message = "No songs available in playlist"
-
-                    await ws.send_json(
-                        {
-                            "type": "error",
-                            "code": error_code,
-                            "message": error_message,
-                        }
-                    )
+                    # Record stats before ending due to no songs (Story 14.4, 19.1)
+                    stats_service = self.stats_service
+                    if stats_service:
+                        game_summary = game_state.finalize_game()
+                        await stats_service.record_game(
+                            game_summary, difficulty=game_state.difficulty
+                        )
+                        _LOGGER.debug("Game stats recorded (no songs remaining)")
 
-            elif action == "next_round":
-                if game_state.phase == GamePhase.PLAYING:
-                    # Early advance - end current round first
-                    await game_state.end_round()
-                    # Broadcast handled by round_end_callback
-                elif game_state.phase == GamePhase.REVEAL:
-                    # Start next round or end game
-                    if game_state.last_round:
-                        # Record game stats before ending (Story 14.4, 19.1)
-                        stats_service = self.hass.data.get(DOMAIN, {}).get("stats")
-                        if stats_service:
-                            game_summary = game_state.finalize_game()
-                            await stats_service.record_game(
-                                game_summary, difficulty=game_state.difficulty
-                            )
-                            _LOGGER.debug("Game stats recorded for natural end")
+                    # No more songs
+                    game_state.phase = GamePhase.END
+                    await self.broadcast_state()
+        else:
+            await self._send(
+                ws,
+                {
+                    "type": "error",
+                    "code": ERR_INVALID_ACTION,
+                    "message": "Cannot advance round in current phase",
+                },
+            )
 
-                        # No more rounds, end game
-                        game_state.phase = GamePhase.END
-                        await self.broadcast_state()
-                    else:
-                        # Start next round
-                        success = await game_state.start_round(self.hass)
-                        if success:
-                            await self.broadcast_state()
-                        else:
-                            # Record stats before ending due to no songs (Story 14.4, 19.1)
-                            stats_service = self.hass.data.get(DOMAIN, {}).get("stats")
-                            if stats_service:
-                                game_summary = game_state.finalize_game()
-                                await stats_service.record_game(
-                                    game_summary, difficulty=game_state.difficulty
-                                )
-                                _LOGGER.debug("Game stats recorded (no songs remaining)")
-
-                            # No more songs
-                            game_state.phase = GamePhase.END
-                            await self.broadcast_state()
-                else:
-                    await ws.send_json(
-                        {
-                            "type": "error",
-                            "code": ERR_INVALID_ACTION,
-                            "message": "Cannot advance round in current phase",
-                        }
-                    )
+    async def _admin_stop_song(
+        self,
+        ws: web.WebSocketResponse,
+        data: dict,
+        game_state: GameState,
+    ) -> None:
+        """
+        Stop the current song (admin action).
 
-            elif action == "stop_song":
-                if game_state.phase != GamePhase.PLAYING:
-                    await ws.send_json(
-                        {
-                            "type": "error",
-                            "code": ERR_INVALID_ACTION,
-                            "message": "No song playing",
-                        }
-                    )
-                    return
-
-                if game_state.song_stopped:
-                    # Already stopped, no-op
-                    return
-
-                # Stop playback
-                if game_state._media_player_service:
-                    await game_state._media_player_service.stop()
-
-                game_state.song_stopped = True
-                _LOGGER.info("Admin stopped song in round %d", game_state.round)
-
-                # Notify all clients
-                await self.broadcast({"type": "song_stopped"})
-
-            elif action == "set_volume":
-                direction = data.get("direction")  # "up" or "down"
-                if direction not in ("up", "down"):
-                    await ws.send_json(
-                        {
-                            "type": "error",
-                            "code": ERR_INVALID_ACTION,
-                            "message": "Invalid volume direction",
-                        }
-                    )
-                    return
+        Args:
+            ws: WebSocket connection
+            data: Message data
+            game_state: Current game state
 
-                # Calculate new volume
-                new_level = game_state.adjust_volume(direction)
+        """
+        if game_state.phase != GamePhase.PLAYING:
+            await self._send(
+                ws,
+                {
+                    "type": "error",
+                    "code": ERR_INVALID_ACTION,
+                    "message": "No song playing",
+                },
+            )
+            return
 
-                # Apply to media player
-                if game_state._media_player_service:
-                    success = await game_state._media_player_service.set_volume(new_level)
-                    if not success:
-                        _LOGGER.warning("Failed to set volume to %.0f%%", new_level * 100)
+        if game_state.song_stopped:
+            # Already stopped, no-op
+            return
 
-                _LOGGER.info("Volume adjusted %s to %.0f%%", direction, new_level * 100)
+        # Stop playback
+        if game_state._media_player_service:
+            await game_state._media_player_service.stop()
 
-                # Send feedback to requester only (not broadcast)
-                await ws.send_json(
-                    {
-                        "type": "volume_changed",
-                        "level": new_level,
-                    }
-                )
+        game_state.song_stopped = True
+        _LOGGER.info("Admin stopped song in round %d", game_state.round)
 
-            elif action == "end_game":
-                # Issue #108: Modified to stay in END phase without wiping players
-                if game_state.phase not in (GamePhase.PLAYING, GamePhase.REVEAL):
-                    await ws.send_json(
-                        {
-                            "type": "error",
-                            "code": ERR_INVALID_ACTION,
-                            "message": "Cannot end game in current phase",
-                        }
-                    )
-                    return
+        # Notify all clients
+        await self.broadcast({"type": "song_stopped"})
 
-                # Cancel timer if running
-                game_state.cancel_timer()
+    async def _admin_set_volume(
+        self, ws: web.WebSocketResponse, data: dict, game_state: GameState
+    ) -> None:
+        """
+        Adjust the media player volume (admin action, Story 6.4).
 
-                # Stop media playback
-                if game_state._media_player_service:
-                    await game_state._media_player_service.stop()
+        Args:
+            ws: WebSocket connection
+            data: Message data
+            game_state: Current game state
 
-                # Record game stats BEFORE transitioning to END (Story 14.4, 19.1)
-                stats_service = self.hass.data.get(DOMAIN, {}).get("stats")
-                if stats_service:
-                    game_summary = game_state.finalize_game()
-                    await stats_service.record_game(game_summary, difficulty=game_state.difficulty)
-                    _LOGGER.debug("Game stats recorded for early end")
+        """
+        direction = data.get("direction")  # "up" or "down"
+        if direction not in ("up", "down"):
+            await self._send(
+                ws,
+                {
+                    "type": "error",
+                    "code": ERR_INVALID_ACTION,
+                    "message": "Invalid volume direction",
+                },
+            )
+            return
 
-                # Transition to END - players stay connected for rematch option
-                game_state.phase = GamePhase.END
-                _LOGGER.info(
-                    "Admin ended game early at round %d - players preserved for rematch",
-                    game_state.round,
-                )
+        # Calculate new volume
+        new_level = game_state.adjust_volume(direction)
+
+        # Apply to media player
+        if game_state._media_player_service:
+            success = await game_state._media_player_service.set_volume(new_level)
+            if not success:
+                _LOGGER.warning("Failed to set volume to %.0f%%", new_level * 100)
+
+        _LOGGER.info("Volume adjusted %s to %.0f%%", direction, new_level * 100)
+
+        # Send feedback to requester only (not broadcast)
+        await self._send(
+            ws,
+            {
+                "type": "volume_changed",
+                "level": new_level,
+            },
+        )
+
+    async def _admin_end_game(
+        self, ws: web.WebSocketResponse, data: dict, game_state: GameState
+    ) -> None:
+        """
+        End the game early, keeping players for a rematch (Issue #108).
+
+        Args:
+            ws: WebSocket connection
+            data: Message data
+            game_state: Current game state
+
+        """
+        # Issue #108: Modified to stay in END phase without wiping players
+        if game_state.phase not in (GamePhase.PLAYING, GamePhase.REVEAL):
+            await self._send(
+                ws,
+                {
+                    "type": "error",
+                    "code": ERR_INVALID_ACTION,
+                    "message": "Cannot end game in current phase",
+                },
+            )
+            return
+
+        # Cancel timer if running
+        game_state.cancel_timer()
+
+        # Stop media playback
+        if game_state._media_player_service:
+            await game_state._media_player_service.stop()
+
+        # Record game stats BEFORE transitioning to END (Story 14.4, 19.1)
+        stats_service = self.stats_service
+        if stats_service:
+            game_summary = game_state.finalize_game()
+            await stats_service.record_game(
+                game_summary, difficulty=game_state.difficulty
+            )
+            _LOGGER.debug("Game stats recorded for early end")
+
+        # Transition to END - players stay connected for rematch option
+        game_state.phase = GamePhase.END
+        _LOGGER.info(
+            "Admin ended game early at round %d - players preserved for rematch",
+            game_state.round,
+        )
+
+        # Broadcast final state to all players
+        await self.broadcast_state()
+        # NOTE: game_state.end_game() NOT called - admin can now Rematch or Dismiss
+        # NOTE: game_ended NOT sent here - only sent on dismiss_game
+
+    async def _admin_dismiss_game(
+        self,
+        ws: web.WebSocketResponse,
+        data: dict,
+        game_state: GameState,
+    ) -> None:
+        """
+        Tear down the game and clear all players (Issue #108).
+
+        Args:
+            ws: WebSocket connection
+            data: Message data
+            game_state: Current game state
+
+        """
+        # Issue #108: Full teardown - only allowed from END phase
+        if game_state.phase != GamePhase.END:
+            await self._send(
+                ws,
+                {
+                    "type": "error",
+                    "code": ERR_INVALID_ACTION,
+                    "message": "Can only dismiss from END phase",
+                },
+            )
+            return
 
-                # Broadcast final state to all players
-                await self.broadcast_state()
-                # NOTE: game_state.end_game() NOT called - admin can now Rematch or Dismiss
-                # NOTE: game_ended NOT sent here - only sent on dismiss_game
-
-            elif action == "dismiss_game":
-                # Issue #108: Full teardown - only allowed from END phase
-                if game_state.phase != GamePhase.END:
-                    await ws.send_json(
-                        {
-                            "type": "error",
-                            "code": ERR_INVALID_ACTION,
-                            "message": "Can only dismiss from END phase",
-                        }
-                    )
-                    return
+        # Fully reset game state - wipes all players
+        game_state.end_game()
+        _LOGGER.info("Game dismissed - all players cleared")
 
-                # Fully reset game state - wipes all players
-                game_state.end_game()
-                _LOGGER.info("Game dismissed - all players cleared")
+        # Send game_ended notification to kick all players
+        await self.broadcast({"type": "game_ended"})
 
-                # Send game_ended notification to kick all players
-                await self.broadcast({"type": "game_ended"})
+        # Broadcast cleared state
+        await self.broadcast_state()
 
-                # Broadcast cleared state
-                await self.broadcast_state()
+        # Cleanup pending tasks
+        await self.cleanup_game_tasks()
 
-                # Cleanup pending tasks
-                await self.cleanup_game_tasks()
-
-            elif action == "rematch_game":
-                # Issue #108: Soft reset for rematch - preserves players
-                if game_state.phase != GamePhase.END:
-                    await ws.send_json(
-                        {
-                            "type": "error",
-                            "code": ERR_INVALID_ACTION,
-                            "message": "Can only rematch from END phase",
-                        }
-                    )
-                    return
+    async def _admin_rematch_game(
+        self,
+        ws: web.WebSocketResponse,
+        data: dict,
+        game_state: GameState,
+    ) -> None:
+        """
+        Reset the game for a rematch with the same players (Issue #108).
 
-                player_count = len(game_state.players)
-                game_state.rematch_game()
-                _LOGGER.info("Rematch started with %d players", player_count)
+        Args:
+            ws: WebSocket connection
+            data: Message data
+            game_state: Current game state
 
-                # Broadcast rematch event so clients transition to lobby
-                await self.broadcast({"type": "rematch_started"})
-                await self.broadcast_state()
+        """
+        # Issue #108: Soft reset for rematch - preserves players
+        if game_state.phase != GamePhase.END:
+            await self._send(
+                ws,
+                {
+                    "type": "error",
+                    "code": ERR_INVALID_ACTION,
+                    "message": "Can only rematch from END phase",
+                },
+            )
+            return
 
-            elif action == "set_language":
-                # Language selection (Story 12.4) - only in LOBBY phase
-                if game_state.phase != GamePhase.LOBBY:
-                    await ws.send_json(
-                        {
-                            "type": "error",
-                            "code": ERR_INVALID_ACTION,
-                            "message": "Can only change language in lobby",
-                        }
-                    )
-                    return
+        player_count = len(game_state.players)
+        game_state.rematch_game()
+        _LOGGER.info("Rematch started with %d players", player_count)
 
-                language = data.get("language", "en")
-                if language not in ("en", "de", "es", "fr"):
-                    language = "en"  # Default to English for invalid codes
+        # Broadcast rematch event so clients transition to lobby
+        await self.broadcast({"type": "rematch_started"})
+        await self.broadcast_state()
 
-                game_state.language = language
-                _LOGGER.info("Game language set to: %s", language)
+    async def _admin_set_language(
+        self, ws: web.WebSocketResponse, data: dict, game_state: GameState
+    ) -> None:
+        """
+        Set the game language while in the lobby (Story 12.4).
 
-                # Broadcast state with updated language
-                await self.broadcast_state()
+        Args:
+            ws: WebSocket connection
+            data: Message data
+            game_state: Current game state
 
-            else:
-                _LOGGER.warning("Unknown admin action: %s", action)
+        """
+        # Language selection (Story 12.4) - only in LOBBY phase
+        if game_state.phase != GamePhase.LOBBY:
+            await self._send(
+                ws,
+                {
+                    "type": "error",
+                    "code": ERR_INVALID_ACTION,
+                    "message": "Can only change language in lobby",
+                },
+            )
+            return
 
-        elif msg_type == "reconnect":
-            # Session-based reconnection (Story 11.2)
-            await self._handle_reconnect(ws, data, game_state)
+        language = data.get("language", "en")
+        if language not in ("en", "de", "es", "fr"):
+            language = "en"  # Default to English for invalid codes
 
-        elif msg_type == "leave":
-            # Intentional leave game (Story 11.5)
-            await self._handle_leave(ws, game_state)
+        game_state.language = language
+        _LOGGER.info("Game language set to: %s", language)
 
-        elif msg_type == "get_state":
-            # Dashboard/observer requesting current state (Story 10.4)
-            state = game_state.get_state()
-            if state:
-                await ws.send_json({"type": "state", **state})
+        # Broadcast state with updated language
+        await self.broadcast_state()
 
-        elif msg_type == "get_steal_targets":
-            # Request available steal targets (Story 15.3 AC2, AC5)
-            await self._handle_get_steal_targets(ws, game_state)
+    async def _handle_get_state(
+        self,
+        ws: web.WebSocketResponse,
+        data: dict,
+        game_state: GameState,
+    ) -> None:
+        """
+        Send the current state to a dashboard/observer (Story 10.4).
 
-        elif msg_type == "steal":
-            # Execute steal power-up (Story 15.3 AC2, AC3)
-            await self._handle_steal(ws, data, game_state)
+        Args:
+            ws: WebSocket connection
+            data: Message data
+            game_state: Current game state
 
-        elif msg_type == "reaction":
-            # Live reactions during reveal (Story 18.9)
-            player = game_state.get_player_by_ws(ws)
-            if not player:
-                return
+        """
+        # Dashboard/observer requesting current state (Story 10.4)
+        await self._send_player_state(ws, game_state)
 
-            if game_state.phase != GamePhase.REVEAL:
-                return  # Silent ignore - only during REVEAL
+    async def _handle_reaction(
+        self, ws: web.WebSocketResponse, data: dict, game_state: GameState
+    ) -> None:
+        """
+        Broadcast a live reaction during reveal (Story 18.9).
 
-            emoji = data.get("emoji", "")
-            if emoji not in ["🔥", "😂", "😱", "👏", "🤔"]:
-                return  # Invalid emoji
+        Args:
+            ws: WebSocket connection
+            data: Message data
+            game_state: Current game state
 
-            if game_state.record_reaction(player.name, emoji):
-                await self.broadcast(
-                    {
-                        "type": "player_reaction",
-                        "player_name": player.name,
-                        "emoji": emoji,
-                    }
-                )
+        """
+        # Live reactions during reveal (Story 18.9)
+        player = game_state.get_player_by_ws(ws)
+        if not player:
+            return
 
-        elif msg_type == "artist_guess":
-            # Artist challenge guess submission (Story 20.3)
-            await self._handle_artist_guess(ws, data, game_state)
+        if game_state.phase != GamePhase.REVEAL:
+            return  # Silent ignore - only during REVEAL
 
-        elif msg_type == "movie_guess":
-            # Movie quiz guess submission (Issue #28)
-            await self._handle_movie_guess(ws, data, game_state)
+        emoji = data.get("emoji", "")
+        if emoji not in ["🔥", "😂", "😱", "👏", "🤔"]:
+            return  # Invalid emoji
 
-        else:
-            _LOGGER.warning("Unknown message type: %s", msg_type)
+        if game_state.record_reaction(player.name, emoji):
+            await self.broadcast(
+                {
+                    "type": "player_reaction",
+                    "player_name": player.name,
+                    "emoji": emoji,
+                }
+            )
 
     async def _handle_submit(
         self, ws: web.WebSocketResponse, data: dict, game_state: GameState
@@ -602,64 +1221,65 @@ class BeatifyWebSocketHandler:
 
         """
         # Find player by WebSocket
-        player = None
-        for p in game_state.players.values():
-            if p.ws == ws:
-                player = p
-                break
+        player = game_state.get_player_by_ws(ws)
 
         if not player:
-            await ws.send_json(
+            await self._send(
+                ws,
                 {
                     "type": "error",
                     "code": ERR_NOT_IN_GAME,
                     "message": "Not in game",
-                }
+                },
             )
             return
 
         # Check phase
         if game_state.phase != GamePhase.PLAYING:
-            await ws.send_json(
+            await self._send(
+                ws,
                 {
                     "type": "error",
                     "code": ERR_INVALID_ACTION,
                     "message": "Not in playing phase",
-                }
+                },
             )
             return
 
         # Check if already submitted
         if player.submitted:
-            await ws.send_json(
+            await self._send(
+                ws,
                 {
                     "type": "error",
                     "code": ERR_ALREADY_SUBMITTED,
                     "message": "Already submitted",
-                }
+                },
             )
             return
 
         # Check deadline (uses game_state's time function for testability)
         if game_state.is_deadline_passed():
-            await ws.send_json(
+            await self._send(
+                ws,
                 {
                     "type": "error",
                     "code": ERR_ROUND_EXPIRED,
                     "message": "Time's up!",
-                }
+                },
             )
             return
 
         # Validate year
         year = data.get("year")
         if not isinstance(year, int) or year < YEAR_MIN or year > YEAR_MAX:
-            await ws.send_json(
+            await self._send(
+                ws,
                 {
                     "type": "error",
                     "code": ERR_INVALID_ACTION,
                     "message": "Invalid year",
-                }
+                },
             )
             return
 
@@ -667,20 +1287,30 @@ class BeatifyWebSocketHandler:
         bet = data.get("bet", False)
         player.bet = bool(bet)
 
-        # Record submission
-        submission_time = time.time()
-        player.submit_guess(year, submission_time)
+        # Record submission at frame arrival, with the connection's latency estimate
+        submission_time = self._receive_time(ws)
+        tracker = self._latency.get(ws)
+        player.submit_guess(year, submission_time, tracker.one_way if tracker else 0.0)
+        self._log_action(
+            OP_GUESS,
+            player.name,
+            year=year,
+            time=submission_time,
+            latency=player.submission_latency,
+            bet=player.bet,
+        )
 
         # Send acknowledgment
-        await ws.send_json(
+        await self._send(
+            ws,
             {
                 "type": "submit_ack",
                 "year": year,
-            }
+            },
         )
 
         # Broadcast updated state (player.submitted now True)
-        await self.broadcast_state()
+        await self.request_state_broadcast()
 
         # Story 20.9: Check for early reveal when all guesses are complete
         # Note: _trigger_early_reveal() calls end_round() which broadcasts via callback
@@ -694,7 +1324,9 @@ class BeatifyWebSocketHandler:
         if game_state.phase == GamePhase.PLAYING and all_complete:
             await game_state._trigger_early_reveal()
 
-        _LOGGER.info("Player %s submitted guess: %d at %.2f", player.name, year, submission_time)
+        _LOGGER.info(
+            "Player %s submitted guess: %d at %.2f", player.name, year, submission_time
+        )
 
     async def _handle_reconnect(
         self, ws: web.WebSocketResponse, data: dict, game_state: GameState
@@ -710,49 +1342,57 @@ class BeatifyWebSocketHandler:
         """
         session_id = data.get("session_id")
         if not session_id:
-            await ws.send_json(
+            await self._send(
+                ws,
                 {
                     "type": "error",
                     "code": ERR_SESSION_NOT_FOUND,
                     "message": "Session ID required",
-                }
+                },
             )
             return
 
         # Find player by session ID
         player = game_state.get_player_by_session_id(session_id)
         if not player:
-            await ws.send_json(
+            await self._send(
+                ws,
                 {
                     "type": "error",
                     "code": ERR_SESSION_NOT_FOUND,
                     "message": "Session not found or game was reset",
-                }
+                },
             )
             return
 
         # Check game phase - cannot reconnect to ended game
         if game_state.phase == GamePhase.END:
-            await ws.send_json(
+            await self._send(
+                ws,
                 {
                     "type": "error",
                     "code": ERR_GAME_ENDED,
                     "message": "Game has ended",
-                }
+                },
             )
             return
 
+        # A quick reconnect can beat the old socket's close: then the other
+        # players never saw this player drop and need no state push
+        was_connected = player.connected
+
         # Handle dual-tab scenario: close old connection if still active
         if player.connected and player.ws and not player.ws.closed:
             try:
-                await player.ws.send_json(
+                await self._send(
+                    player.ws,
                     {
                         "type": "error",
                         "code": ERR_SESSION_TAKEOVER,
                         "message": "Session taken over by another tab",
-                    }
+                    },
                 )
-                await player.ws.close()
+                await self._close(player.ws)
             except Exception:  # noqa: BLE001
                 pass  # Old connection may already be dead
             _LOGGER.info("Session takeover: %s (old tab disconnected)", player.name)
@@ -766,9 +1406,9 @@ class BeatifyWebSocketHandler:
 
         # If admin, handle reconnect logic
         if player.is_admin:
-            if self._admin_disconnect_task:
-                self._admin_disconnect_task.cancel()
-                self._admin_disconnect_task = None
+            if self._admin_disconnect_timer:
+                self._admin_disconnect_timer.cancel()
+                self._admin_disconnect_timer = None
                 _LOGGER.info("Admin reconnected via session, cancelled pause task")
 
             # Resume game if paused
@@ -776,117 +1416,246 @@ class BeatifyWebSocketHandler:
                 if await game_state.resume_game():
                     _LOGGER.info("Game resumed by admin session reconnection")
 
+        # Replay the broadcasts the client missed if they are still logged
+        missed = self._event_log.since(data.get("last_seq"))
+
         # Send reconnect acknowledgment
-        await ws.send_json(
+        await self._send(
+            ws,
             {
                 "type": "reconnect_ack",
                 "name": player.name,
                 "success": True,
-            }
+                "replay": missed is not None,
+            },
         )
 
-        # Send current state to reconnected player
-        state_msg = {"type": "state", **game_state.get_state()}
-        await ws.send_json(state_msg)
+        if missed is None:
+            # Send current state to reconnected player
+            self.replay_snapshots += 1
+            await self._send_player_state(ws, game_state, tag_seq=True)
+        else:
+            await self._replay(ws, missed, data.get("state_version"), game_state)
 
         # Broadcast updated state to all players (connected status changed)
-        await self.broadcast_state()
+        if not was_connected:
+            await self.request_state_broadcast()
+
+        _LOGGER.info(
+            "Player reconnected via session: %s (score: %d)", player.name, player.score
+        )
+
+    async def _replay(
+        self,
+        ws: web.WebSocketResponse,
+        events: list[dict],
+        state_version: Any,
+        game_state: GameState,
+    ) -> None:
+        """
+        Send the logged broadcasts a reconnecting client missed.
+
+        State patches are replayed while they chain from the state version
+        the client holds. Otherwise (legacy clients, or a state pushed while
+        the patch chain was broken) the missed state changes collapse into
+        one snapshot sent after the other events.
+
+        Args:
+            ws: Reconnected WebSocket
+            events: Missed events from the event log, in order
+            state_version: State version the client holds (if it tracks one)
+            game_state: Current game state
+
+        """
+        held = state_version if isinstance(state_version, int) else None
+        stale = False
+        for event in events:
+            if event["type"] == "state_patch" and not stale and event["base"] == held:
+                held = event["version"]
+            elif event["type"] in ("state", "state_patch"):
+                stale = True
+                continue
+            await self._send(ws, event)
+            self.replayed_events += 1
+
+        if stale:
+            self.replay_snapshots += 1
+            await self._send_player_state(ws, game_state, tag_seq=True)
+        else:
+            # Personal messages are not logged; resend the current ones
+            self._personal.pop(ws, None)
+            await self._send_personal(ws, game_state)
+            if held is not None:
+                self._state_acks[ws] = held
+        _LOGGER.debug(
+            "Replayed %d missed event(s)%s",
+            len(events),
+            " plus snapshot" if stale else "",
+        )
+
+    async def _send_player_state(
+        self, ws: web.WebSocketResponse, game_state: GameState, *, tag_seq: bool = False
+    ) -> None:
+        """
+        Send the current state to one client, as players see it.
+
+        In large-room mode the client's own player entry is sent first when
+        the trimmed player list leaves it out.
+
+        Args:
+            ws: WebSocket connection
+            game_state: Current game state
+            tag_seq: Tag the state with the event log head; a snapshot
+                supersedes every logged event, so the client may resume
+                replay from the current ``seq`` next time
+
+        """
+        state = game_state.get_state()
+        if not state:
+            return
+        view, personal = game_state.player_view(state)
+        self._personal.pop(ws, None)
+        await self._send_personal(ws, game_state, personal)
+        message = self._state_message(view)
+        if tag_seq and self._event_log.seq:
+            message["seq"] = self._event_log.seq
+        await self._send(ws, message)
+
+    async def _send_personal(
+        self,
+        ws: web.WebSocketResponse,
+        game_state: GameState,
+        personal: dict[str, dict[str, dict]] | None = None,
+    ) -> None:
+        """
+        Send a player the personal messages the trimmed lists call for.
+
+        Each message type (own ``player_entry``, ``player_rank``) is only
+        sent when it changed since the last one sent to ``ws``.
 
-        _LOGGER.info("Player reconnected via session: %s (score: %d)", player.name, player.score)
+        Args:
+            ws: WebSocket connection
+            game_state: Current game state
+            personal: Personal messages by player name and type, from
+                player_view() (computed from the current state if not given)
 
-    async def _handle_leave(self, ws: web.WebSocketResponse, game_state: GameState) -> None:
+        """
+        if personal is None:
+            state = game_state.get_state()
+            personal = game_state.player_view(state)[1] if state else {}
+        player = game_state.get_player_by_ws(ws)
+        messages = personal.get(player.name) if player is not None else None
+        if not messages:
+            self._personal.pop(ws, None)
+            return
+        sent = self._personal.setdefault(ws, {})
+        for msg_type in [t for t in sent if t not in messages]:
+            del sent[msg_type]
+        for msg_type, message in messages.items():
+            previous = sent.get(msg_type)
+            if previous is message or previous == message:
+                continue
+            sent[msg_type] = message
+            await self._send(ws, message)
+
+    async def _handle_leave(
+        self,
+        ws: web.WebSocketResponse,
+        data: dict,
+        game_state: GameState,
+    ) -> None:
         """
         Handle intentional leave game (Story 11.5).
 
         Args:
             ws: WebSocket connection
+            data: Message data
             game_state: Current game state
 
         """
         # Find player by WebSocket
-        player = None
-        player_name = None
-        for name, p in game_state.players.items():
-            if p.ws == ws:
-                player = p
-                player_name = name
-                break
-
+        player = game_state.get_player_by_ws(ws)
         if not player:
             return
+        player_name = player.name
 
         # Block admin leave
         if player.is_admin:
-            await ws.send_json(
+            await self._send(
+                ws,
                 {
                     "type": "error",
                     "code": ERR_ADMIN_CANNOT_LEAVE,
                     "message": "Host cannot leave. End the game instead.",
-                }
+                },
             )
             return
 
         # Remove player completely (also clears session mapping via Story 11.1)
         game_state.remove_player(player_name)
+        self._log_action(OP_LEAVE, player_name)
 
         # Confirm to leaving player
-        await ws.send_json({"type": "left"})
+        await self._send(ws, {"type": "left"})
 
         # Close WebSocket from server side (prevents client auto-reconnect)
-        await ws.close()
+        await self._close(ws)
 
         # Broadcast state update to remaining players
-        await self.broadcast_state()
+        await self.request_state_broadcast()
 
         _LOGGER.info("Player left game intentionally: %s", player_name)
 
     async def _handle_get_steal_targets(
-        self, ws: web.WebSocketResponse, game_state: GameState
+        self,
+        ws: web.WebSocketResponse,
+        data: dict,
+        game_state: GameState,
     ) -> None:
         """
         Handle request for available steal targets (Story 15.3 AC2, AC5).
 
         Args:
             ws: WebSocket connection
+            data: Message data
             game_state: Current game state
 
         """
         # Find player by WebSocket
-        player = None
-        for p in game_state.players.values():
-            if p.ws == ws:
-                player = p
-                break
+        player = game_state.get_player_by_ws(ws)
 
         if not player:
-            await ws.send_json(
+            await self._send(
+                ws,
                 {
                     "type": "error",
                     "code": ERR_NOT_IN_GAME,
                     "message": "Not in game",
-                }
+                },
             )
             return
 
         # Check if player has steal available
         if not player.steal_available:
-            await ws.send_json(
+            await self._send(
+                ws,
                 {
                     "type": "error",
                     "code": ERR_INVALID_ACTION,
                     "message": "No steal available",
-                }
+                },
             )
             return
 
         # Get available targets (privacy: only requesting player sees this)
         targets = game_state.get_steal_targets(player.name)
 
-        await ws.send_json(
+        await self._send(
+            ws,
             {
                 "type": "steal_targets",
                 "targets": targets,
-            }
+            },
         )
 
     async def _handle_steal(
@@ -902,30 +1671,28 @@ class BeatifyWebSocketHandler:
 
         """
         # Find player by WebSocket
-        player = None
-        for p in game_state.players.values():
-            if p.ws == ws:
-                player = p
-                break
+        player = game_state.get_player_by_ws(ws)
 
         if not player:
-            await ws.send_json(
+            await self._send(
+                ws,
                 {
                     "type": "error",
                     "code": ERR_NOT_IN_GAME,
                     "message": "Not in game",
-                }
+                },
             )
             return
 
         target_name = data.get("target")
         if not target_name:
-            await ws.send_json(
+            await self._send(
+                ws,
                 {
                     "type": "error",
                     "code": ERR_INVALID_ACTION,
                     "message": "Target name required",
-                }
+                },
             )
             return
 
@@ -933,26 +1700,31 @@ class BeatifyWebSocketHandler:
         result = game_state.use_steal(player.name, target_name)
 
         if result["success"]:
+            self._log_action(
+                OP_STEAL, player.name, target=target_name, time=player.submission_time
+            )
             # Send acknowledgment to stealer
-            await ws.send_json(
+            await self._send(
+                ws,
                 {
                     "type": "steal_ack",
                     "success": True,
                     "target": result["target"],
                     "year": result["year"],
-                }
+                },
             )
 
             # Broadcast updated state (stealer now has submitted)
-            await self.broadcast_state()
+            await self.request_state_broadcast()
         else:
             # Send error to stealer
-            await ws.send_json(
+            await self._send(
+                ws,
                 {
                     "type": "error",
                     "code": result["error"],
                     "message": self._get_steal_error_message(result["error"]),
-                }
+                },
             )
 
     def _get_steal_error_message(self, error_code: str) -> str:
@@ -980,56 +1752,61 @@ class BeatifyWebSocketHandler:
         """
         # Validate phase
         if game_state.phase != GamePhase.PLAYING:
-            await ws.send_json(
+            await self._send(
+                ws,
                 {
                     "type": "error",
                     "code": ERR_INVALID_ACTION,
                     "message": "Can only guess during PLAYING phase",
-                }
+                },
             )
             return
 
         # Get player from connection
         player = game_state.get_player_by_ws(ws)
         if not player:
-            await ws.send_json(
+            await self._send(
+                ws,
                 {
                     "type": "error",
                     "code": ERR_NOT_IN_GAME,
                     "message": "Not in game",
-                }
+                },
             )
             return
 
         # Validate artist challenge exists
         if not game_state.artist_challenge:
-            await ws.send_json(
+            await self._send(
+                ws,
                 {
                     "type": "error",
                     "code": ERR_NO_ARTIST_CHALLENGE,
                     "message": "No artist challenge this round",
-                }
+                },
             )
             return
 
         # Get and validate artist guess
         artist = data.get("artist", "").strip()
         if not artist:
-            await ws.send_json(
+            await self._send(
+                ws,
                 {
                     "type": "error",
                     "code": ERR_INVALID_ACTION,
                     "message": "Artist cannot be empty",
-                }
+                },
             )
             return
 
         # Submit guess
-        guess_time = time.time()
+        guess_time = self._receive_time(ws)
         result = game_state.submit_artist_guess(player.name, artist, guess_time)
 
         # Story 20.9: Track that player has made an artist guess
         player.has_artist_guess = True
+        self._log_action(OP_ARTIST, player.name, artist=artist, time=guess_time)
 
         # Send acknowledgment
         response: dict = {
@@ -1044,15 +1821,18 @@ class BeatifyWebSocketHandler:
             else:
                 response["winner"] = result["winner"]
 
-        await ws.send_json(response)
+        await self._send(ws, response)
 
         # Broadcast state if winner changed (so all players see winner)
         if result.get("first"):
-            await self.broadcast_state()
+            await self.request_state_broadcast()
 
         # Story 20.9: Check for early reveal when all guesses are complete
         # Note: _trigger_early_reveal() calls end_round() which broadcasts via callback
-        if game_state.phase == GamePhase.PLAYING and game_state.check_all_guesses_complete():
+        if (
+            game_state.phase == GamePhase.PLAYING
+            and game_state.check_all_guesses_complete()
+        ):
             await game_state._trigger_early_reveal()
 
         _LOGGER.debug(
@@ -1077,56 +1857,61 @@ class BeatifyWebSocketHandler:
         """
         # Validate phase
         if game_state.phase != GamePhase.PLAYING:
-            await ws.send_json(
+            await self._send(
+                ws,
                 {
                     "type": "error",
                     "code": ERR_INVALID_ACTION,
                     "message": "Can only guess during PLAYING phase",
-                }
+                },
             )
             return
 
         # Get player from connection
         player = game_state.get_player_by_ws(ws)
         if not player:
-            await ws.send_json(
+            await self._send(
+                ws,
                 {
                     "type": "error",
                     "code": ERR_NOT_IN_GAME,
                     "message": "Not in game",
-                }
+                },
             )
             return
 
         # Validate movie challenge exists
         if not game_state.movie_challenge:
-            await ws.send_json(
+            await self._send(
+                ws,
                 {
                     "type": "error",
                     "code": ERR_NO_MOVIE_CHALLENGE,
                     "message": "No movie quiz this round",
-                }
+                },
             )
             return
 
         # Get and validate movie guess
         movie = data.get("movie", "").strip()
         if not movie:
-            await ws.send_json(
+            await self._send(
+                ws,
                 {
                     "type": "error",
                     "code": ERR_INVALID_ACTION,
                     "message": "Movie cannot be empty",
-                }
+                },
             )
             return
 
         # Submit guess with server-side timing
-        guess_time = time.time()
+        guess_time = self._receive_time(ws)
         result = game_state.submit_movie_guess(player.name, movie, guess_time)
 
         # Issue #28: Track that player has made a movie guess
         player.has_movie_guess = True
+        self._log_action(OP_MOVIE, player.name, movie=movie, time=guess_time)
 
         # Send acknowledgment
         response: dict = {
@@ -1139,11 +1924,14 @@ class BeatifyWebSocketHandler:
             response["rank"] = result["rank"]
             response["bonus"] = result["bonus"]
 
-        await ws.send_json(response)
+        await self._send(ws, response)
 
         # Issue #28: Check for early reveal when all guesses are complete
         # Note: _trigger_early_reveal() calls end_round() which broadcasts via callback
-        if game_state.phase == GamePhase.PLAYING and game_state.check_all_guesses_complete():
+        if (
+            game_state.phase == GamePhase.PLAYING
+            and game_state.check_all_guesses_complete()
+        ):
             await game_state._trigger_early_reveal()
 
         _LOGGER.debug(
@@ -1154,84 +1942,409 @@ class BeatifyWebSocketHandler:
             result.get("rank"),
         )
 
-    async def broadcast(self, message: dict) -> None:
+    async def broadcast(self, message: dict) -> int:
         """
-        Broadcast message to all connected clients in parallel (Issue #41).
+        Broadcast message to all connected clients (Issue #41).
 
-        Uses asyncio.gather() for parallel sends instead of sequential awaits.
+        The message is serialized once per wire protocol (JSON text and, if
+        any client negotiated it, MessagePack binary) and the frame is then
+        queued for every open socket of that protocol, instead of re-encoding
+        the same dict per connection. Each socket's writer task sends it, so
+        a slow client never delays the caller. Spectators get the messages
+        they render through their own channel (not counted here).
 
         Args:
             message: Message to broadcast
 
+        Returns:
+            Total bytes queued across all sockets that accepted the frame
+
         """
+        await self.spectators.forward(message)
+        if message.get("type") not in TRANSIENT_MESSAGE_TYPES:
+            game_state = self.game_state
+            self._event_log.bind(game_state.game_id if game_state else None)
+            message = self._event_log.append(message)
         if not self.connections:
-            return
+            return 0
 
-        # Build list of send tasks for all open connections
-        tasks = []
-        for ws in list(self.connections):
-            if not ws.closed:
-                tasks.append(self._safe_send(ws, message))
+        targets = [ws for ws in list(self.connections) if not ws.closed]
+        if not targets:
+            return 0
+
+        # Encode once per protocol, share the frame across those connections
+        return await self._send_batches(
+            self._encode_batches(message, targets), message.get("type")
+        )
+
+    def _encode_batches(
+        self,
+        message: dict,
+        sockets: list[web.WebSocketResponse],
+        frames: dict[bool, Frame] | None = None,
+    ) -> list[tuple[Frame, list[web.WebSocketResponse]]]:
+        """
+        Group sockets by wire protocol and encode the message once per group.
+
+        Args:
+            message: Message to encode
+            sockets: Target connections
+            frames: Optional cache of already encoded frames keyed by
+                "is binary"; filled in as frames are encoded
+
+        Returns:
+            (frame, sockets) pairs ready for _send_batches()
+
+        """
+        groups: dict[bool, list[web.WebSocketResponse]] = {}
+        for ws in sockets:
+            groups.setdefault(ws in self._msgpack_sockets, []).append(ws)
+        return [
+            (self._encode(message, binary, frames), group)
+            for binary, group in groups.items()
+        ]
+
+    @staticmethod
+    def _encode(
+        message: dict, binary: bool, frames: dict[bool, Frame] | None = None
+    ) -> Frame:
+        """
+        Encode a message for one wire protocol, reusing a cached frame.
+
+        Args:
+            message: Message to encode
+            binary: True for MessagePack, False for JSON
+            frames: Optional frame cache keyed by ``binary``
+
+        Returns:
+            Encoded frame
+
+        """
+        if frames is not None and binary in frames:
+            return frames[binary]
+        frame = msgpack_dumps(message) if binary else json_dumps(message)
+        if frames is not None:
+            frames[binary] = frame
+        return frame
+
+    async def _send_batches(
+        self,
+        batches: list[tuple[Frame, list[web.WebSocketResponse]]],
+        label: str | None,
+    ) -> int:
+        """
+        Queue pre-encoded frames for groups of sockets.
+
+        Args:
+            batches: (frame, sockets) pairs; each frame is encoded once
+            label: Message type (queue lane, coalescing and logging)
 
-        # Execute all sends in parallel
-        if tasks:
-            await asyncio.gather(*tasks)
+        Returns:
+            Total bytes queued across all sockets that accepted a frame
+
+        """
+        targets = 0
+        bytes_queued = 0
+        for frame, sockets in batches:
+            frame_size = _frame_size(frame)
+            targets += len(sockets)
+            for ws in sockets:
+                if self._queue(ws).put(frame, label):
+                    bytes_queued += frame_size
+
+        self.broadcast_count += 1
+        self.broadcast_bytes_total += bytes_queued
+        _LOGGER.debug(
+            "broadcast %s: %d frame(s) to %d sockets = %d bytes",
+            label,
+            len(batches),
+            targets,
+            bytes_queued,
+        )
+        return bytes_queued
 
-    async def _safe_send(self, ws: web.WebSocketResponse, message: dict) -> None:
+    async def _send(self, ws: web.WebSocketResponse, message: dict) -> None:
         """
-        Send message to a single WebSocket, catching errors.
+        Queue a single message for one WebSocket in its negotiated protocol.
 
         Args:
             ws: WebSocket connection
             message: Message to send
 
         """
-        try:
-            await ws.send_json(message)
-        except Exception as err:  # noqa: BLE001
-            _LOGGER.warning("Failed to send to WebSocket: %s", err)
+        binary = ws in self._msgpack_sockets
+        self._queue(ws).put(self._encode(message, binary), message.get("type"))
+
+    def _queue(self, ws: web.WebSocketResponse) -> OutboundQueue:
+        """Get (or create) the outbound queue of a connection."""
+        queue = self._outbound.get(ws)
+        if queue is None or queue.closed:
+            queue = OutboundQueue(ws, self._write, self._evict, self.outbound_stats)
+            self._outbound[ws] = queue
+        return queue
+
+    def _evict(self, ws: web.WebSocketResponse, reason: str) -> None:
+        """
+        Drop a saturated connection.
+
+        Args:
+            ws: WebSocket connection
+            reason: Why the connection counts as saturated
 
-    async def debounced_broadcast_state(self) -> None:
         """
-        Broadcast state with debouncing for concurrent events (Issue #41).
+        _LOGGER.warning("Evicting saturated WebSocket: %s", reason)
+        from custom_components.beatify.analytics import (
+            ERROR_WEBSOCKET_SATURATED,
+        )
 
-        Batches rapid state changes (like multiple players joining)
-        into a single broadcast after a short delay. This prevents
-        N broadcasts when N players join within the debounce window.
+        self._record_error(ERROR_WEBSOCKET_SATURATED, reason)
+        # Closing ends the connection's receive loop, which cleans up
+        task = asyncio.create_task(self._home(ws.close))
+        self._close_tasks.add(task)
+        task.add_done_callback(self._close_tasks.discard)
 
+    async def _close(self, ws: web.WebSocketResponse, timeout: float = 2.0) -> None:
         """
-        # Cancel any pending broadcast
-        if self._broadcast_debounce_task and not self._broadcast_debounce_task.done():
-            self._broadcast_debounce_task.cancel()
-            try:
-                await self._broadcast_debounce_task
-            except asyncio.CancelledError:
-                pass
+        Close a connection after its queued messages have been written.
 
-        async def delayed_broadcast() -> None:
-            await asyncio.sleep(self._broadcast_debounce_delay)
-            await self.broadcast_state()
+        Args:
+            ws: WebSocket connection
+            timeout: Maximum seconds to wait for the queue to drain
+
+        """
+        queue = self._outbound.get(ws)
+        if queue is not None:
+            await queue.join(timeout)
+        await self._home(ws.close)
+
+    async def drain_outbound(self, timeout: float | None = None) -> None:
+        """
+        Wait until every connection's queued messages have been written.
+
+        Args:
+            timeout: Maximum seconds to wait per connection
+
+        """
+        for queue in list(self._outbound.values()):
+            await queue.join(timeout)
+
+    async def _write(self, ws: web.WebSocketResponse, frame: Frame) -> None:
+        """
+        Write a frame, compressing it only if it is large enough to benefit.
+
+        Clients that negotiated permessage-deflate would otherwise have every
+        frame deflated, including tiny acks where the compression overhead
+        outweighs the savings. Frames below ``compress_threshold`` are sent
+        uncompressed, which the extension allows per message.
+
+        Args:
+            ws: WebSocket connection
+            frame: JSON text or MessagePack bytes
+
+        """
+        level = ws.compress
+        if not level or _frame_size(frame) >= self.compress_threshold:
+            await self._write_frame(ws, frame)
+            if level:
+                self.compressed_frames += 1
+                self.compression_bytes_saved_estimate += self._deflate_saving(
+                    frame, level
+                )
+            return
+
+        # The socket's writer belongs to the home loop: toggle it there
+        await self._home(_send_uncompressed, ws, frame)
+
+    async def _write_frame(self, ws: web.WebSocketResponse, frame: Frame) -> None:
+        """Send a frame as binary (MessagePack) or text (JSON)."""
+        await self._home(
+            ws.send_bytes if isinstance(frame, bytes) else ws.send_str, frame
+        )
+
+    def _deflate_saving(self, frame: Frame, wbits: int) -> int:
+        """
+        Estimate the bytes saved by deflating a frame.
+
+        Uses a fresh deflate context, so clients with context takeover
+        usually save more than this. The result is cached per frame because
+        a broadcast writes the same frame to many sockets.
+
+        Args:
+            frame: Frame being sent
+            wbits: Negotiated window size
+
+        Returns:
+            Estimated bytes saved (never negative)
+
+        """
+        saved = self._deflate_savings.get(frame)
+        if saved is None:
+            data = frame if isinstance(frame, bytes) else frame.encode("utf-8")
+            compressor = zlib.compressobj(wbits=-wbits)
+            compressed = compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH)
+            # The trailing empty block is stripped on the wire (RFC 7692)
+            saved = max(0, len(data) - (len(compressed) - 4))
+            self._deflate_savings[frame] = saved
+            if len(self._deflate_savings) > _DEFLATE_CACHE_SIZE:
+                self._deflate_savings.popitem(last=False)
+        return saved
+
+    async def request_state_broadcast(self) -> None:
+        """
+        Request a rate-capped state broadcast (Issue #41).
 
-        self._broadcast_debounce_task = asyncio.create_task(delayed_broadcast())
+        Player actions (joins, submits, reconnects, leaves, steals, guesses)
+        use this instead of broadcast_state() so a burst of N actions
+        results in a handful of pushes rather than N. Phase transitions
+        are still pushed immediately.
+
+        """
+        game_state = self.game_state
+        phase = game_state.phase.value if game_state else None
+        await self.state_scheduler.request(phase)
 
     async def broadcast_state(self) -> None:
-        """Broadcast current game state to all connected players."""
-        game_state = self.hass.data.get(DOMAIN, {}).get("game")
+        """
+        Broadcast current game state to all connected players.
+
+        Clients that acked a retained state version get a patch from that
+        version; everyone else (new, lagging or legacy clients) gets the
+        full snapshot. Each distinct frame is encoded only once.
+
+        """
+        game_state = self.game_state
         if not game_state:
             _LOGGER.warning("broadcast_state: No game state found in hass.data")
             return
 
+        if self._game_store:
+            # Snapshot on phase/round transitions (no-op otherwise)
+            self._game_store.note_state(game_state)
         state = game_state.get_state()
-        if state:
+        if not state:
             _LOGGER.debug(
-                "broadcast_state: phase=%s, connections=%d",
-                state.get("phase"),
-                len(self.connections),
+                "broadcast_state: get_state() returned None (game not initialized yet)"
             )
-            state_msg = {"type": "state", **state}
-            await self.broadcast(state_msg)
-        else:
-            _LOGGER.debug("broadcast_state: get_state() returned None (game not initialized yet)")
+            return
+        self.state_scheduler.mark_flushed(state.get("phase"))
+        # Spectators (the dashboard) get the full picture, players their view
+        await self.spectators.publish(state)
+        state, personal = game_state.player_view(state)
+
+        _LOGGER.debug(
+            "broadcast_state: phase=%s, connections=%d",
+            state.get("phase"),
+            len(self.connections),
+        )
+        changed = self._state_sync.commit(state)
+        version = self._state_sync.version
+
+        # Log each new version once, as a patch from the last logged one
+        seq: int | None = None
+        patches: dict[int, list[list[Any]] | None] = {}
+        log = self._event_log
+        log.bind(state.get("game_id"))
+        if log.state_version != version:
+            base = log.state_version
+            if base is not None:
+                patches[base] = self._state_sync.patch_from(base)
+            seq = log.append_state(version, patches.get(base))
+
+        full_targets: list[web.WebSocketResponse] = []
+        patch_targets: dict[int, list[web.WebSocketResponse]] = {}
+        for ws in list(self.connections):
+            if ws.closed:
+                continue
+            acked = self._state_acks.get(ws)
+            if acked is None or not self._state_sync.has_version(acked):
+                full_targets.append(ws)
+            elif acked != version:
+                patch_targets.setdefault(acked, []).append(ws)
+            # acked == version: client is already up to date
+
+        if not changed and not full_targets:
+            return
+
+        # Personal messages go out first so the state that follows can show them
+        if personal or self._personal:
+            for ws in list(self.connections):
+                if not ws.closed:
+                    await self._send_personal(ws, game_state, personal)
+
+        full_message = self._state_message(state, commit=False)
+        if seq is not None:
+            full_message["seq"] = seq
+        full_frames: dict[bool, Frame] = {}
+        batches: list[tuple[Frame, list[web.WebSocketResponse]]] = []
+        for base, sockets in patch_targets.items():
+            ops = (
+                patches[base] if base in patches else self._state_sync.patch_from(base)
+            )
+            if ops is None:
+                full_targets.extend(sockets)
+                continue
+            patch_message = {
+                "type": "state_patch",
+                "base": base,
+                "version": version,
+                "ops": ops,
+            }
+            if seq is not None:
+                patch_message["seq"] = seq
+            for patch_frame, group in self._encode_batches(patch_message, sockets):
+                # Compare against the full frame in the same protocol
+                binary = isinstance(patch_frame, bytes)
+                full_frame = self._encode(full_message, binary, full_frames)
+                if len(patch_frame) >= len(full_frame):
+                    full_targets.extend(group)
+                else:
+                    batches.append((patch_frame, group))
+        if full_targets:
+            batches.extend(
+                self._encode_batches(full_message, full_targets, full_frames)
+            )
+
+        await self._send_batches(batches, "state")
+
+    def _state_message(self, state: dict, *, commit: bool = True) -> dict:
+        """
+        Build a full ``state`` message tagged with its state version.
+
+        Args:
+            state: State dict from GameState.get_state()
+            commit: Record the state as a new version first (direct sends)
+
+        Returns:
+            Message dict ready to send
+
+        """
+        if commit:
+            self._state_sync.commit(state)
+        return {"type": "state", "version": self._state_sync.version, **state}
+
+    async def _handle_state_ack(
+        self,
+        ws: web.WebSocketResponse,
+        data: dict,
+        game_state: GameState | None = None,
+    ) -> None:
+        """
+        Record the state version a client has applied.
+
+        Clients opt into delta state sync by acking a state version.
+
+        Args:
+            ws: WebSocket connection
+            data: Message data containing version
+            game_state: Current game state (unused)
+
+        """
+        version = data.get("version")
+        if isinstance(version, bool) or not isinstance(version, int):
+            return
+        if 0 < version <= self._state_sync.version:
+            # Acks can arrive out of order; never move a client backwards
+            self._state_acks[ws] = max(version, self._state_acks.get(ws, 0))
 
     async def broadcast_metadata_update(self, metadata: dict) -> None:
         """
@@ -1259,33 +2372,28 @@ class BeatifyWebSocketHandler:
             ws: Disconnected WebSocket
 
         """
-        game_state = self.hass.data.get(DOMAIN, {}).get("game")
+        game_state = self.game_state
         if not game_state:
             return
 
         # Find player by WebSocket
-        player_name = None
-        player = None
-        for name, p in game_state.players.items():
-            if p.ws == ws:
-                player_name = name
-                player = p
-                player.connected = False
-                break
-
-        if not player_name or not player:
+        player = game_state.get_player_by_ws(ws)
+        if not player:
             return
+        player.connected = False
+        player_name = player.name
 
-        _LOGGER.info("Player disconnected: %s (is_admin: %s)", player_name, player.is_admin)
+        _LOGGER.info(
+            "Player disconnected: %s (is_admin: %s)", player_name, player.is_admin
+        )
 
-        # Broadcast disconnect state immediately
-        await self.broadcast_state()
+        # Broadcast disconnect state (rate-capped)
+        await self.request_state_broadcast()
 
         # Admin disconnect: pause game after grace period (Story 7-1)
         if player.is_admin:
 
             async def pause_after_timeout() -> None:
-                await asyncio.sleep(LOBBY_DISCONNECT_GRACE_PERIOD)
                 # Check if admin still disconnected
                 if player_name in game_state.players:
                     admin = game_state.players[player_name]
@@ -1295,8 +2403,12 @@ class BeatifyWebSocketHandler:
                             await self.broadcast_state()
                             _LOGGER.info("Game paused due to admin disconnect")
 
-            # Store task for cancellation on reconnect
-            self._admin_disconnect_task = asyncio.create_task(pause_after_timeout())
+            # Store timer for cancellation on reconnect
+            if self._admin_disconnect_timer:
+                self._admin_disconnect_timer.cancel()
+            self._admin_disconnect_timer = game_state.timers.call_later(
+                LOBBY_DISCONNECT_GRACE_PERIOD, pause_after_timeout, "admin_disconnect"
+            )
         # Story 11.3: Regular players persist indefinitely - no removal timeout
         # Player stays in game with connected=false, session allows reconnect
         # Score and stats preserved, counts toward MAX_PLAYERS (intentional)
@@ -1314,10 +2426,14 @@ class BeatifyWebSocketHandler:
                 task.cancel()
         self._pending_removals.clear()
 
-        # Cancel admin disconnect task
-        if self._admin_disconnect_task and not self._admin_disconnect_task.done():
-            self._admin_disconnect_task.cancel()
-        self._admin_disconnect_task = None
+        # Cancel admin disconnect timer
+        if self._admin_disconnect_timer:
+            self._admin_disconnect_timer.cancel()
+        self._admin_disconnect_timer = None
+
+        # Drop any scheduled state broadcast
+        self.state_scheduler.cancel()
+        self.spectators.reset()
 
         _LOGGER.debug("Cleaned up all pending game tasks")
 
@@ -0,0 +1,305 @@
+"""Per-room worker event loops for Beatify.
+
+By default every room runs on Home Assistant's event loop, so a slow END
+phase (scoring, highlights, a large state build and its encoding) in one
+room delays every other room and Home Assistant itself. With the
+``room_workers`` option a room's game engine runs on an event loop of its
+own, in a dedicated thread:
+
+    - the room's GameState, its timers and the WebSocket handler's
+      bookkeeping (connections, outbound queues, state sync, encoding) live
+      on the worker loop
+    - the sockets stay on Home Assistant's loop, where aiohttp serves them:
+      inbound messages are handed to the worker once per message, outbound
+      frames are handed back once per write
+    - Home Assistant itself (service calls to the media player, state
+      reads, executor jobs) and the services shared by all rooms (stats,
+      analytics) are reached through HassBridge and HomeProxy, which run
+      every call on Home Assistant's loop
+
+The bridge is thin on purpose: each hop is one ``run_coroutine_threadsafe``
+and nothing but frames, messages and service calls crosses it.
+
+The benefit is loop isolation, not CPU parallelism. Game work, including
+JSON and MessagePack encoding, still holds the GIL, so rooms do not run
+their Python in parallel. What changes is that a long step on a worker is
+preempted at the interpreter's thread switch interval, instead of holding
+Home Assistant's loop (and every other room) until it finishes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds a worker waits for Home Assistant's loop to answer a synchronous call
+HOME_CALL_TIMEOUT = 10.0
+
+# Attribute values HomeProxy hands out as they are (everything else is proxied)
+_PLAIN_TYPES = (
+    type(None),
+    bool,
+    int,
+    float,
+    str,
+    bytes,
+    list,
+    tuple,
+    dict,
+    set,
+    frozenset,
+)
+
+
+async def run_here(func: Callable[..., Any], *args: Any) -> Any:
+    """Call a function on the current loop, awaiting its result if it is awaitable."""
+    result = func(*args)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class RoomWorker:
+    """An event loop in its own thread, running one room's game engine."""
+
+    def __init__(self, name: str, home_loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Initialize worker (call start() before use).
+
+        Args:
+            name: Thread name
+            home_loop: Home Assistant's event loop
+
+        """
+        self.name = name
+        self.home_loop = home_loop
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        # Diagnostics: hops in each direction, and the worker loop's lag
+        self.calls = 0
+        self.home_calls = 0
+        self.lag: float | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the worker loop is running."""
+        return self.loop is not None and self.loop.is_running()
+
+    def start(self) -> None:
+        """Start the worker thread and wait until its loop runs."""
+        if self._thread is not None:
+            return
+        ready = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run_loop, args=(ready,), name=self.name, daemon=True
+        )
+        self._thread.start()
+        ready.wait()
+
+    def _run_loop(self, ready: threading.Event) -> None:
+        """Run the worker loop until stopped (worker thread)."""
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self.loop = loop
+        loop.call_soon(ready.set)
+        try:
+            loop.run_forever()
+        finally:
+            tasks = asyncio.all_tasks(loop)
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+    async def async_stop(self) -> None:
+        """Cancel the worker's tasks, stop its loop and join its thread."""
+        if self._thread is None or self.loop is None:
+            return
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        await asyncio.get_running_loop().run_in_executor(None, self._thread.join)
+        self._thread = None
+        self.loop = None
+        _LOGGER.debug("Room worker %s stopped", self.name)
+
+    def on_worker(self) -> bool:
+        """Whether the caller runs on the worker loop."""
+        return self.loop is not None and _running_loop() is self.loop
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run ``func(*args)`` on the worker loop and return its result.
+
+        Coroutines are awaited on the worker. Called on the worker loop
+        itself, the function runs directly.
+
+        Args:
+            func: Function or coroutine function
+            *args: Positional arguments
+
+        Returns:
+            The function's result
+
+        """
+        if self.on_worker():
+            return await run_here(func, *args)
+        if not self.running:
+            msg = f"Room worker {self.name} is not running"
+            raise RuntimeError(msg)
+        self.calls += 1
+        queued = time.monotonic()
+        future = asyncio.run_coroutine_threadsafe(
+            self._timed(queued, func, *args), self.loop
+        )
+        return await asyncio.wrap_future(future)
+
+    async def _timed(self, queued: float, func: Callable[..., Any], *args: Any) -> Any:
+        """Record how long a call waited for the worker loop, then make it."""
+        self.lag = time.monotonic() - queued
+        return await run_here(func, *args)
+
+    async def call_home(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run ``func(*args)`` on Home Assistant's loop and return its result.
+
+        Args:
+            func: Function or coroutine function
+            *args: Positional arguments
+
+        Returns:
+            The function's result
+
+        """
+        if _running_loop() is self.home_loop:
+            return await run_here(func, *args)
+        self.home_calls += 1
+        future = asyncio.run_coroutine_threadsafe(run_here(func, *args), self.home_loop)
+        return await asyncio.wrap_future(future)
+
+    def call_home_sync(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a synchronous ``func(*args)`` on Home Assistant's loop, blocking.
+
+        Only the worker thread blocks; Home Assistant's loop never waits on
+        a worker synchronously, so this cannot deadlock.
+
+        Args:
+            func: Function
+            *args: Positional arguments
+
+        Returns:
+            The function's result
+
+        """
+        if _running_loop() is self.home_loop:
+            return func(*args)
+        self.home_calls += 1
+        future = asyncio.run_coroutine_threadsafe(run_here(func, *args), self.home_loop)
+        return future.result(HOME_CALL_TIMEOUT)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return worker counters as a JSON-serializable dict."""
+        return {
+            "name": self.name,
+            "running": self.running,
+            "calls": self.calls,
+            "home_calls": self.home_calls,
+            "lag_ms": round(self.lag * 1000, 2) if self.lag is not None else None,
+        }
+
+
+class HomeProxy:
+    """
+    An object owned by Home Assistant's loop, as seen from a room worker.
+
+    Coroutine methods are awaited on Home Assistant's loop, other methods
+    are called there (the worker blocks for the result). Plain data
+    attributes are read directly; other attributes are proxied in turn.
+    """
+
+    def __init__(self, target: Any, worker: RoomWorker) -> None:
+        """
+        Initialize proxy.
+
+        Args:
+            target: Object living on Home Assistant's loop
+            worker: Worker using the object
+
+        """
+        self._target = target
+        self._worker = worker
+
+    def __getattr__(self, name: str) -> Any:
+        """Bridge an attribute of the target."""
+        value = getattr(self._target, name)
+        worker = self._worker
+        if inspect.iscoroutinefunction(value):
+
+            async def call_async(*args: Any, **kwargs: Any) -> Any:
+                return await worker.call_home(lambda: value(*args, **kwargs))
+
+            return call_async
+        if callable(value):
+
+            def call_sync(*args: Any, **kwargs: Any) -> Any:
+                return worker.call_home_sync(lambda: value(*args, **kwargs))
+
+            return call_sync
+        if isinstance(value, _PLAIN_TYPES):
+            return value
+        return HomeProxy(value, worker)
+
+
+class HassBridge:
+    """
+    Home Assistant as seen from a room worker.
+
+    Service calls and state reads run on Home Assistant's loop, and so do
+    executor jobs, so Home Assistant keeps tracking them. Everything else
+    (config, data) is read directly.
+    """
+
+    def __init__(self, hass: HomeAssistant, worker: RoomWorker) -> None:
+        """
+        Initialize bridge.
+
+        Args:
+            hass: Home Assistant instance
+            worker: Worker the bridge serves
+
+        """
+        self._hass = hass
+        self._worker = worker
+        self.services = HomeProxy(hass.services, worker)
+        self.states = HomeProxy(hass.states, worker)
+
+    def __getattr__(self, name: str) -> Any:
+        """Read any other attribute of Home Assistant directly."""
+        return getattr(self._hass, name)
+
+    async def async_add_executor_job(
+        self, target: Callable[..., Any], *args: Any
+    ) -> Any:
+        """Run a blocking function in Home Assistant's executor."""
+        return await self._worker.call_home(
+            self._hass.async_add_executor_job, target, *args
+        )
@@ -0,0 +1,380 @@
+"""Crash-safe persistence of the in-progress game for Beatify.
+
+The game lives in memory; without this store an HA restart or integration
+reload mid-party wipes it. Three files under ``<config>/beatify/game/``
+let setup restore it:
+
+    - ``setup.json``: the song list, written once per game (create/rematch)
+    - ``snapshot.json``: GameState.to_snapshot(), written atomically at every
+      phase transition (game_id, phase or round change)
+    - ``wal.jsonl``: an append-only log of submissions and joins since that
+      snapshot, truncated whenever a new snapshot is written
+
+Each snapshot gets a sequence number and every log record carries the
+number of the snapshot it follows, so records that predate the snapshot on
+disk (a crash between snapshot and truncation) are never replayed.
+
+Writes never block the event loop: serialization happens on the loop,
+file IO in one executor job per flush, and log records arriving while a
+flush runs are batched into the next one. A batch that fails to write is
+kept and retried with the next flush. Per round that is two or three
+snapshots plus a handful of appends, regardless of how often state is
+broadcast.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from custom_components.beatify.game.player import PlayerSession
+from custom_components.beatify.game.state import GamePhase
+from custom_components.beatify.server.codec import json_dumps, json_loads
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from custom_components.beatify.game.state import GameState
+
+_LOGGER = logging.getLogger(__name__)
+
+STORE_VERSION = 1
+
+# Restores slower than this are logged as warnings
+RESTORE_BUDGET_SECONDS = 1.0
+
+SETUP_FILE = "setup.json"
+SNAPSHOT_FILE = "snapshot.json"
+WAL_FILE = "wal.jsonl"
+
+# Log operations replayed on top of the snapshot
+OP_JOIN = "join"
+OP_LEAVE = "leave"
+OP_GUESS = "guess"
+OP_ARTIST = "artist"
+OP_MOVIE = "movie"
+OP_STEAL = "steal"
+
+# Operations that are only valid in the round the snapshot was taken in
+_ROUND_OPS = frozenset({OP_GUESS, OP_ARTIST, OP_MOVIE, OP_STEAL})
+
+
+class GameStore:
+    """Snapshot plus write-ahead log of the running game."""
+
+    def __init__(self, hass: HomeAssistant, directory: Path | None = None) -> None:
+        """
+        Initialize game store.
+
+        Args:
+            hass: Home Assistant instance
+            directory: Storage directory (defaults to <config>/beatify/game)
+
+        """
+        self._hass = hass
+        self._dir = directory or Path(hass.config.path("beatify", "game"))
+        # (game_id, phase, round) of the last snapshot taken
+        self._key: tuple[Any, ...] | None = None
+        self._setup_game_id: str | None = None
+        self._seq = 0
+        # Work queued for the next flush
+        self._pending_clear = False
+        self._pending_setup: str | None = None
+        self._pending_snapshot: str | None = None
+        self._pending_lines: list[str] = []
+        self._flush_task: asyncio.Task | None = None
+        self._write_lock = asyncio.Lock()
+        # Diagnostics
+        self.snapshots_written = 0
+        self.records_written = 0
+        self.write_failures = 0
+        self.last_snapshot_bytes = 0
+        self.last_restore_seconds: float | None = None
+
+    # -- writing ----------------------------------------------------------------
+
+    def note_state(self, game_state: GameState) -> None:
+        """
+        Take a snapshot if the game moved to a new phase or round.
+
+        Called on every state broadcast; cheap when nothing transitioned.
+
+        Args:
+            game_state: Current game state
+
+        """
+        if game_state.game_id is None:
+            if self._key is not None:
+                # Game ended: nothing left to restore
+                self._key = None
+                self._setup_game_id = None
+                self._pending_clear = True
+                self._pending_setup = None
+                self._pending_snapshot = None
+                self._pending_lines.clear()
+                self._schedule_flush()
+            return
+
+        key = (game_state.game_id, game_state.phase.value, game_state.round)
+        if key == self._key:
+            return
+        self._key = key
+        self._seq += 1
+
+        if game_state.game_id != self._setup_game_id:
+            self._setup_game_id = game_state.game_id
+            self._pending_setup = json_dumps(
+                {
+                    "version": STORE_VERSION,
+                    "game_id": game_state.game_id,
+                    "songs": game_state.songs,
+                }
+            )
+        self._pending_snapshot = json_dumps(
+            {
+                "version": STORE_VERSION,
+                "seq": self._seq,
+                "game": game_state.to_snapshot(),
+            }
+        )
+        # Records queued before this point are part of the snapshot
+        self._pending_lines.clear()
+        self._schedule_flush()
+
+    def append(self, op: str, player: str, **fields: Any) -> None:
+        """
+        Log a submission or join made since the last snapshot.
+
+        Args:
+            op: One of the OP_* operations
+            player: Name of the acting player
+            **fields: Operation arguments (JSON-serializable)
+
+        """
+        if self._key is None:
+            return
+        self._pending_lines.append(
+            json_dumps({"seq": self._seq, "op": op, "player": player, **fields})
+        )
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self.async_flush())
+
+    async def async_flush(self) -> None:
+        """Write all queued snapshots and log records."""
+        async with self._write_lock:
+            # Work queued while a batch is being written goes out in the next one
+            while self._pending_clear or self._pending_snapshot or self._pending_lines:
+                clear = self._pending_clear
+                setup = self._pending_setup
+                snapshot = self._pending_snapshot
+                lines = self._pending_lines
+                self._pending_clear = False
+                self._pending_setup = None
+                self._pending_snapshot = None
+                self._pending_lines = []
+                try:
+                    await self._hass.async_add_executor_job(
+                        self._write, clear, setup, snapshot, lines
+                    )
+                except OSError as err:
+                    _LOGGER.error("Failed to persist game, will retry: %s", err)
+                    self.write_failures += 1
+                    self._requeue(clear, setup, snapshot, lines)
+                    return
+                if snapshot:
+                    self.snapshots_written += 1
+                    self.last_snapshot_bytes = len(snapshot)
+                self.records_written += len(lines)
+
+    def _requeue(
+        self, clear: bool, setup: str | None, snapshot: str | None, lines: list[str]
+    ) -> None:
+        """
+        Put a batch that failed to write back in front of the queued work.
+
+        Work queued since the batch was taken supersedes it where it overlaps:
+        a newer clear drops it, and a newer snapshot replaces its snapshot and
+        covers its log records.
+
+        Args:
+            clear: Whether the batch removed the stored game
+            setup: Song list of the batch
+            snapshot: Snapshot of the batch
+            lines: Log records of the batch
+
+        """
+        if self._pending_clear:
+            return
+        self._pending_clear = clear
+        if self._pending_setup is None:
+            self._pending_setup = setup
+        if self._pending_snapshot is None:
+            self._pending_snapshot = snapshot
+            self._pending_lines[:0] = lines
+
+    def _write(
+        self, clear: bool, setup: str | None, snapshot: str | None, lines: list[str]
+    ) -> None:
+        """Apply queued writes (runs in the executor)."""
+        if clear:
+            for name in (SNAPSHOT_FILE, WAL_FILE, SETUP_FILE):
+                (self._dir / name).unlink(missing_ok=True)
+        if not (setup or snapshot or lines):
+            return
+        self._dir.mkdir(mode=0o755, parents=True, exist_ok=True)
+        if setup:
+            self._write_atomic(SETUP_FILE, setup)
+        if snapshot:
+            self._write_atomic(SNAPSHOT_FILE, snapshot)
+            # The snapshot now covers everything logged before it
+            (self._dir / WAL_FILE).write_text(
+                "".join(f"{line}\n" for line in lines), encoding="utf-8"
+            )
+        elif lines:
+            with (self._dir / WAL_FILE).open("a", encoding="utf-8") as wal:
+                wal.write("".join(f"{line}\n" for line in lines))
+
+    def _write_atomic(self, name: str, content: str) -> None:
+        path = self._dir / name
+        temp_path = path.with_suffix(".tmp")
+        temp_path.write_text(content, encoding="utf-8")
+        # Atomic rename (POSIX guarantees atomicity)
+        os.replace(temp_path, path)
+
+    # -- restoring --------------------------------------------------------------
+
+    def _read(self) -> tuple[str, str, list[str]] | None:
+        """Read the stored files (runs in the executor)."""
+        try:
+            setup = (self._dir / SETUP_FILE).read_text(encoding="utf-8")
+            snapshot = (self._dir / SNAPSHOT_FILE).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        try:
+            lines = (self._dir / WAL_FILE).read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            lines = []
+        return setup, snapshot, lines
+
+    async def async_restore(self, game_state: GameState) -> bool:
+        """
+        Restore the stored game into ``game_state``.
+
+        Args:
+            game_state: Fresh game state to restore into
+
+        Returns:
+            True if a game was restored
+
+        """
+        started = time.perf_counter()
+        files = await self._hass.async_add_executor_job(self._read)
+        if files is None:
+            return False
+        try:
+            setup = json_loads(files[0])
+            stored = json_loads(files[1])
+            if setup["version"] != STORE_VERSION or stored["version"] != STORE_VERSION:
+                raise ValueError("unsupported store version")
+            snapshot = stored["game"]
+            if setup["game_id"] != snapshot["game_id"]:
+                raise ValueError("song list belongs to another game")
+            game_state.restore_snapshot(snapshot, setup["songs"])
+        except (ValueError, KeyError, TypeError) as err:
+            _LOGGER.warning("Stored game is unreadable, discarding it: %s", err)
+            game_state.end_game()
+            self._pending_clear = True
+            await self.async_flush()
+            return False
+
+        seq = stored["seq"]
+        replayed = 0
+        for line in files[2]:
+            try:
+                record = json_loads(line)
+            except ValueError:
+                break  # Torn final line from a crash mid-append
+            if record.get("seq") == seq and _replay(game_state, record):
+                replayed += 1
+
+        # Nobody is connected yet: hold the game until the host reconnects,
+        # which resumes it (ending a round whose deadline passed meanwhile)
+        await game_state.pause_game("admin_disconnected")
+
+        # Continue where the stored game left off
+        self._seq = seq
+        self._setup_game_id = game_state.game_id
+        self._key = None  # The restored (paused) state gets a fresh snapshot
+        self.last_restore_seconds = time.perf_counter() - started
+        log = (
+            _LOGGER.warning
+            if self.last_restore_seconds > RESTORE_BUDGET_SECONDS
+            else _LOGGER.info
+        )
+        log(
+            "Restored game %s (round %d, %d players, %d logged actions) in %.0f ms",
+            game_state.game_id,
+            game_state.round,
+            len(game_state.players),
+            replayed,
+            self.last_restore_seconds * 1000,
+        )
+        return True
+
+
+def _replay(game_state: GameState, record: dict[str, Any]) -> bool:
+    """
+    Re-apply one logged action to a restored game.
+
+    Args:
+        game_state: Restored game state
+        record: Log record written by GameStore.append()
+
+    Returns:
+        True if the action was applied
+
+    """
+    op = record["op"]
+    name = record["player"]
+    if op == OP_JOIN:
+        if name in game_state.players:
+            return False
+        player = PlayerSession.from_snapshot(record["session"])
+        game_state.players[player.name] = player
+        return True
+    if op == OP_LEAVE:
+        if name not in game_state.players:
+            return False
+        game_state.remove_player(name)
+        return True
+
+    player = game_state.players.get(name)
+    if player is None or op not in _ROUND_OPS or game_state.phase != GamePhase.PLAYING:
+        return False
+    if op == OP_GUESS:
+        if player.submitted:
+            return False
+        player.bet = record["bet"]
+        player.submit_guess(record["year"], record["time"], record["latency"])
+    elif op == OP_ARTIST:
+        if player.has_artist_guess or not game_state.artist_challenge:
+            return False
+        game_state.submit_artist_guess(name, record["artist"], record["time"])
+        player.has_artist_guess = True
+    elif op == OP_MOVIE:
+        if player.has_movie_guess or not game_state.movie_challenge:
+            return False
+        game_state.submit_movie_guess(name, record["movie"], record["time"])
+        player.has_movie_guess = True
+    elif op == OP_STEAL:
+        if not game_state.use_steal(name, record["target"]).get("success"):
+            return False
+        player.submission_time = record["time"]
+    return True
@@ -16,6 +16,12 @@ let currentView = 'setup';
 let currentGame = null;
 let cachedQRUrl = null;
 
+// Room of this admin page when several games run at once: ?game=<id> manages
+// that game's room, ?room=new starts the next game in a free room
+const pageParams = new URLSearchParams(window.location.search);
+let roomGameId = pageParams.get('game');
+let openNewRoom = pageParams.get('room') === 'new';
+
 // Language state (Story 12.4)
 let selectedLanguage = 'en';
 
@@ -114,12 +120,20 @@ document.addEventListener('DOMContentLoaded', async () => {
     initPlaylistRequests();
 });
 
+/**
+ * Query string selecting this page's room (empty for the default room)
+ * @returns {string}
+ */
+function roomQuery() {
+    return roomGameId ? '?game=' + encodeURIComponent(roomGameId) : '';
+}
+
 /**
  * Fetch and render current status from the API
  */
 async function loadStatus() {
     try {
-        const response = await fetch('/beatify/api/status');
+        const response = await fetch('/beatify/api/status' + roomQuery());
 
         if (!response.ok) {
             throw new Error(`HTTP ${response.status}`);
@@ -1225,7 +1239,7 @@ function showLobbyView(gameData) {
     }
 
     // Update dashboard URL (compact inline link)
-    var dashboardUrl = window.location.origin + '/beatify/dashboard';
+    var dashboardUrl = window.location.origin + '/beatify/dashboard' + roomQuery();
     var dashboardLink = document.getElementById('admin-dashboard-url');
     if (dashboardLink) {
         dashboardLink.href = dashboardUrl;
@@ -1396,7 +1410,7 @@ async function startGame() {
     btn.textContent = 'Starting...';
 
     try {
-        const response = await fetch('/beatify/api/start-game', {
+        const response = await fetch('/beatify/api/start-game' + roomQuery(), {
             method: 'POST',
             headers: { 'Content-Type': 'application/json' },
             body: JSON.stringify({
@@ -1407,7 +1421,8 @@ async function startGame() {
                 difficulty: selectedDifficulty,  // Story 14.1
                 provider: selectedProvider,  // Story 17.2
                 artist_challenge_enabled: artistChallengeEnabled,  // Story 20.7
-                intro_mode_enabled: introModeEnabled  // Issue #23
+                intro_mode_enabled: introModeEnabled,  // Issue #23
+                new_room: openNewRoom
             })
         });
 
@@ -1422,6 +1437,13 @@ async function startGame() {
             console.warn('Game started with warnings:', data.warnings);
         }
 
+        // Pin this page to the game's room so reloads manage the same game
+        if (roomGameId || openNewRoom) {
+            roomGameId = data.game_id;
+            openNewRoom = false;
+            history.replaceState(null, '', window.location.pathname + roomQuery());
+        }
+
         showLobbyView(data);
 
     } catch (err) {
@@ -1468,7 +1490,7 @@ async function confirmEndGame() {
     closeEndGameModal();
 
     try {
-        const response = await fetch('/beatify/api/end-game', { method: 'POST' });
+        const response = await fetch('/beatify/api/end-game' + roomQuery(), { method: 'POST' });
         if (response.ok) {
             cachedQRUrl = null;  // Clear QR cache
             showSetupView();
@@ -1541,7 +1563,7 @@ async function confirmRematch() {
     closeRematchModal();
 
     try {
-        var response = await fetch('/beatify/api/rematch-game', { method: 'POST' });
+        var response = await fetch('/beatify/api/rematch-game' + roomQuery(), { method: 'POST' });
         if (response.ok) {
             // Rematch puts game back in LOBBY with players still connected
             // Reload status to get the new game data and show lobby
@@ -1594,7 +1616,7 @@ async function rejoinGame() {
 
     // Fetch fresh status to get latest player list
     try {
-        var response = await fetch('/beatify/api/status');
+        var response = await fetch('/beatify/api/status' + roomQuery());
         if (response.ok) {
             var status = await response.json();
             if (status.active_game) {
@@ -2307,7 +2329,7 @@ function startLobbyPolling() {
         }
 
         try {
-            var response = await fetch('/beatify/api/status');
+            var response = await fetch('/beatify/api/status' + roomQuery());
             if (!response.ok) return;
 
             var status = await response.json();
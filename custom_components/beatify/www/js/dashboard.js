@@ -23,6 +23,12 @@
     // WebSocket connection
     var ws = null;
     var reconnectAttempts = 0;
+    // Server clock offset: countdowns render server deadlines on the server clock
+    var clockSync = utils.createClockSync(function(msg) {
+        if (ws && ws.readyState === WebSocket.OPEN) {
+            ws.send(JSON.stringify(msg));
+        }
+    });
     var MAX_RECONNECT_ATTEMPTS = 20;
     var MAX_RECONNECT_DELAY_MS = 30000;
 
@@ -51,11 +57,16 @@
     }
 
     /**
-     * Connect to WebSocket as read-only observer (AC 10.4.1)
+     * Connect to the spectator WebSocket as read-only observer (AC 10.4.1)
      */
     function connectWebSocket() {
         var wsProtocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
-        var wsUrl = wsProtocol + '//' + window.location.host + '/beatify/ws';
+        var wsUrl = wsProtocol + '//' + window.location.host + '/beatify/ws/spectate';
+        // Watch a specific room when the dashboard was opened for one
+        var roomGameId = new URLSearchParams(window.location.search).get('game');
+        if (roomGameId) {
+            wsUrl += '?game=' + encodeURIComponent(roomGameId);
+        }
 
         ws = new WebSocket(wsUrl);
 
@@ -64,6 +75,7 @@
             reconnectAttempts = 0;
             // Request current state as read-only observer
             ws.send(JSON.stringify({ type: 'get_state' }));
+            clockSync.start();
         };
 
         ws.onmessage = function(event) {
@@ -97,6 +109,7 @@
      * @param {Object} data - Parsed message data
      */
     function handleServerMessage(data) {
+        if (clockSync.handleMessage(data)) return;
         if (data.type === 'state') {
             // Debug: Log game_performance data (Story 14.4)
             if (data.game_performance) {
@@ -424,7 +437,7 @@
         // Time remaining is already shown in the main timer, but we update the stat too
         var timeEl = document.getElementById('dashboard-time-remaining');
         if (timeEl && data.deadline) {
-            var remaining = Math.max(0, Math.ceil((data.deadline - Date.now()) / 1000));
+            var remaining = Math.max(0, Math.ceil((data.deadline - clockSync.now()) / 1000));
             timeEl.textContent = remaining + 's';
         }
     }
@@ -443,7 +456,7 @@
         timerElement.classList.remove('timer--warning', 'timer--critical');
 
         function updateCountdown() {
-            var now = Date.now();
+            var now = clockSync.now();
             var remaining = Math.max(0, Math.ceil((deadline - now) / 1000));
 
             timerElement.textContent = remaining;
@@ -12,6 +12,46 @@
     const urlParams = new URLSearchParams(window.location.search);
     const gameId = urlParams.get('game');
 
+    /**
+     * WebSocket URL of this game's room (the server routes by game id)
+     * @returns {string}
+     */
+    function getGameWebSocketUrl() {
+        var wsProtocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
+        return wsProtocol + '//' + window.location.host + '/beatify/ws?game=' + encodeURIComponent(gameId);
+    }
+
+    // WebSocket connects that failed in a row; after a few, fall back to an
+    // event stream (Server-Sent Events) for networks that drop WebSockets
+    var SOCKET_FAILURES_BEFORE_SSE = 3;
+    var socketFailures = 0;
+    var useEventStream = false;
+
+    /**
+     * Open the game connection: a WebSocket, or the event stream fallback
+     * @returns {Object} WebSocket, or an event stream socket with the same interface
+     */
+    function openGameSocket() {
+        if (useEventStream) {
+            return utils.createEventStreamSocket('game=' + encodeURIComponent(gameId));
+        }
+        var socket = new WebSocket(getGameWebSocketUrl());
+        var opened = false;
+        socket.addEventListener('open', function() {
+            opened = true;
+            socketFailures = 0;
+        });
+        socket.addEventListener('close', function() {
+            if (opened) return;
+            socketFailures++;
+            if (socketFailures >= SOCKET_FAILURES_BEFORE_SSE && window.EventSource) {
+                console.warn('WebSocket keeps failing, switching to event stream');
+                useEventStream = true;
+            }
+        });
+        return socket;
+    }
+
     // View elements
     const loadingView = document.getElementById('loading-view');
     const notFoundView = document.getElementById('not-found-view');
@@ -1323,21 +1363,23 @@
             return;
         }
 
-        var wsProtocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
-        var wsUrl = wsProtocol + '//' + window.location.host + '/beatify/ws';
-
-        ws = new WebSocket(wsUrl);
+        ws = openGameSocket();
 
         ws.onopen = function() {
             reconnectAttempts = 0;
             isReconnecting = false;
             hideReconnectingOverlay();
 
-            // Send reconnect message with session ID
-            ws.send(JSON.stringify({
-                type: 'reconnect',
-                session_id: sessionId
-            }));
+            // Send reconnect message with session ID (and the last event seen)
+            var reconnectMsg = { type: 'reconnect', session_id: sessionId };
+            if (lastSeq !== null) {
+                reconnectMsg.last_seq = lastSeq;
+            }
+            if (stateVersion !== null) {
+                reconnectMsg.state_version = stateVersion;
+            }
+            ws.send(JSON.stringify(reconnectMsg));
+            clockSync.start();
         };
 
         ws.onmessage = function(event) {
@@ -1839,7 +1881,7 @@
         timerElement.classList.remove('timer--warning', 'timer--critical');
 
         function updateCountdown() {
-            var now = Date.now();
+            var now = clockSync.now();
             var remaining = Math.max(0, Math.ceil((deadline - now) / 1000));
 
             timerElement.textContent = remaining;
@@ -5096,7 +5138,29 @@
     // ============================================
 
     let ws = null;
+    // Server clock offset: countdowns render server deadlines on the server clock
+    const clockSync = utils.createClockSync(function(msg) {
+        if (ws && ws.readyState === WebSocket.OPEN) {
+            ws.send(JSON.stringify(msg));
+        }
+    });
     let playerName = null;
+    // Highest broadcast seq seen: lets a reconnect replay only missed events
+    let lastSeq = null;
+    // Delta state sync: the newest state version we hold, and the bodies of
+    // the versions we acked. The server patches from the newest ack it has
+    // seen, which lags what we hold by a round trip, so a few older bases are
+    // kept (more than the server retains)
+    const STATE_HISTORY_SIZE = 8;
+    let stateVersion = null;
+    let heldStates = {};
+    let heldVersions = [];
+    // Large-room mode: our own player entry, sent separately when the
+    // trimmed player list in the state leaves us out
+    let ownEntry = null;
+    // Large-room mode: our own leaderboard entry and neighbors, sent when
+    // we are not in the trimmed top of the leaderboard
+    let ownRank = null;
     let reconnectAttempts = 0;
     const MAX_RECONNECT_ATTEMPTS = 10;  // Story 7-3: Increased for resilience
     const MAX_RECONNECT_DELAY_MS = 30000;
@@ -5265,21 +5329,22 @@
         // Store name for reconnection (Story 7-3)
         storePlayerName(name);
 
-        const wsProtocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
-        const wsUrl = wsProtocol + '//' + window.location.host + '/beatify/ws';
-
-        ws = new WebSocket(wsUrl);
+        ws = openGameSocket();
 
         ws.onopen = function() {
             reconnectAttempts = 0;
             isReconnecting = false;
             hideReconnectingOverlay();
 
+            // A fresh join starts from a full state
+            clearHeldStates();
+
             var joinMsg = { type: 'join', name: name };
             if (isAdmin) {
                 joinMsg.is_admin = true;
             }
             ws.send(JSON.stringify(joinMsg));
+            clockSync.start();
         };
 
         ws.onmessage = function(event) {
@@ -5320,15 +5385,161 @@
         };
     }
 
+    /**
+     * Acknowledge a state version, so the server sends patches from it
+     * @param {number} version - State version now held
+     */
+    function ackStateVersion(version) {
+        if (ws && ws.readyState === WebSocket.OPEN) {
+            ws.send(JSON.stringify({ type: 'state_ack', version: version }));
+        }
+    }
+
+    /**
+     * Keep a state body as a patch base and acknowledge its version
+     * @param {number} version - State version
+     * @param {Object} body - State without the message fields
+     */
+    function holdState(version, body) {
+        if (!(version in heldStates)) {
+            heldVersions.push(version);
+            while (heldVersions.length > STATE_HISTORY_SIZE) {
+                delete heldStates[heldVersions.shift()];
+            }
+        }
+        heldStates[version] = body;
+        stateVersion = version;
+        ackStateVersion(version);
+    }
+
+    /**
+     * Forget every held state version
+     */
+    function clearHeldStates() {
+        stateVersion = null;
+        heldStates = {};
+        heldVersions = [];
+    }
+
+    /**
+     * Keep the body of a full state message as a base for later patches
+     * @param {Object} data - Full state message with a version
+     */
+    function rememberState(data) {
+        if (stateVersion !== null && data.version < stateVersion) {
+            // Versions restarted (server reloaded): older bases are meaningless
+            clearHeldStates();
+        }
+        var body = JSON.parse(JSON.stringify(data));
+        delete body.type;
+        delete body.version;
+        delete body.seq;
+        holdState(data.version, body);
+    }
+
+    /**
+     * Drop the held states and ask the server for a full one
+     */
+    function requestFullState() {
+        clearHeldStates();
+        if (ws && ws.readyState === WebSocket.OPEN) {
+            ws.send(JSON.stringify({ type: 'get_state' }));
+        }
+    }
+
+    /**
+     * Apply a state_patch to the held state it was built from
+     * @param {Object} data - state_patch message
+     * @returns {Object|null} Full state message to handle, or null to ignore
+     */
+    function applyStatePatchMessage(data) {
+        if (stateVersion === null) {
+            // A full state is on its way (first join or after a failed patch)
+            return null;
+        }
+        // Already applied (e.g. replayed after a reconnect): nothing to do
+        if (data.version <= stateVersion) return null;
+        var base = heldStates[data.base];
+        if (!base) {
+            requestFullState();
+            return null;
+        }
+        var patched;
+        try {
+            patched = utils.applyStatePatch(JSON.parse(JSON.stringify(base)), data.ops);
+        } catch (e) {
+            console.warn('Failed to apply state patch, requesting full state:', e);
+            requestFullState();
+            return null;
+        }
+        holdState(data.version, patched);
+        var message = Object.assign(JSON.parse(JSON.stringify(patched)), {
+            type: 'state',
+            version: data.version
+        });
+        if (typeof data.seq === 'number') {
+            message.seq = data.seq;
+        }
+        return message;
+    }
+
     /**
      * Handle messages from server
      * @param {Object} data - Parsed message data
      */
     function handleServerMessage(data) {
+        // App-level RTT probe: answer right away so the server can measure latency
+        if (data.type === 'ping') {
+            if (ws && ws.readyState === WebSocket.OPEN) {
+                ws.send(JSON.stringify({ type: 'pong', id: data.id }));
+            }
+            return;
+        }
+        if (clockSync.handleMessage(data)) return;
+        if (typeof data.seq === 'number' && (lastSeq === null || data.seq > lastSeq)) {
+            lastSeq = data.seq;
+        }
+        if (data.type === 'state_patch') {
+            data = applyStatePatchMessage(data);
+            if (!data) return;
+        } else if (data.type === 'state' && typeof data.version === 'number') {
+            rememberState(data);
+        }
+        if (data.type === 'player_entry') {
+            ownEntry = data.entry;
+            return;
+        }
+        if (data.type === 'player_rank') {
+            ownRank = data;
+            return;
+        }
+
         const joinBtn = document.getElementById('join-btn');
         const nameInput = document.getElementById('name-input');
 
         if (data.type === 'state') {
+            // Large-room mode: add our own entry to the trimmed player list
+            if (data.players_trimmed && ownEntry && ownEntry.name === playerName) {
+                var listed = (data.players || []).some(function(p) { return p.name === playerName; });
+                if (!listed) {
+                    data.players = (data.players || []).concat([ownEntry]);
+                }
+            }
+            // Large-room mode: append our own entry and neighbors to the top of the leaderboard
+            if (data.leaderboard_trimmed && ownRank && ownRank.entry && ownRank.entry.name === playerName) {
+                var board = data.leaderboard || [];
+                var onBoard = {};
+                board.forEach(function(e) { onBoard[e.name] = true; });
+                if (!onBoard[playerName]) {
+                    [ownRank.above, ownRank.entry, ownRank.below].forEach(function(e) {
+                        if (e && !onBoard[e.name]) {
+                            board = board.concat([e]);
+                            onBoard[e.name] = true;
+                        }
+                    });
+                    data.leaderboard = board;
+                }
+            }
             // Update isAdmin from players list (Story 6.1)
             var players = data.players || [];
             var currentPlayer = players.find(function(p) { return p.name === playerName; });
@@ -5454,7 +5665,7 @@
                 playerName = data.name;
                 storePlayerName(data.name);
                 showWelcomeBackToast(data.name);
-                // State message will follow with full game state
+                // Missed events (data.replay) or a full state message follow
             } else {
                 // Reconnect failed - clear session and show join form
                 clearSessionCookie();
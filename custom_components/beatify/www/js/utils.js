@@ -5,7 +5,9 @@
  * - i18n helpers (waitForI18n, t)
  * - View management (showView)
  * - Localization helpers (getLocalizedSongField)
- * - WebSocket utilities (createWebSocket)
+ * - WebSocket utilities (createWebSocket, createEventStreamSocket)
+ * - Server clock offset (createClockSync)
+ * - Delta state sync (applyStatePatch)
  * - HTML escaping (escapeHtml)
  *
  * This module consolidates duplicated code from admin.js, player.js, and dashboard.js.
@@ -262,6 +264,194 @@ window.BeatifyUtils = (function() {
         };
     }
 
+    /**
+     * Open a Server-Sent Events connection that looks like a WebSocket
+     * (see server/sse.py), for networks and proxies that drop WebSockets.
+     * Messages arrive on an EventSource at /beatify/events; send() POSTs
+     * them, in order, to /beatify/events/send. The stream is not resumed
+     * when it drops: onclose fires, as for a WebSocket, so callers reconnect.
+     * @param {string} query - Query string for both endpoints, without '?'
+     * @returns {Object} Socket with send(), close(), readyState and on* handlers
+     */
+    function createEventStreamSocket(query) {
+        var suffix = query ? '?' + query : '';
+        var source = new EventSource('/beatify/events' + suffix);
+        var connectionId = null;
+        var pending = Promise.resolve();
+        var socket = {
+            readyState: WebSocket.CONNECTING,
+            onopen: null,
+            onmessage: null,
+            onclose: null,
+            onerror: null
+        };
+
+        function finish() {
+            if (socket.readyState === WebSocket.CLOSED) return;
+            source.close();
+            socket.readyState = WebSocket.CLOSED;
+            // Like a WebSocket, report the close after the current task
+            setTimeout(function() {
+                if (socket.onclose) socket.onclose({});
+            }, 0);
+        }
+
+        source.onmessage = function(event) {
+            if (connectionId !== null) {
+                if (socket.onmessage) socket.onmessage({ data: event.data });
+                return;
+            }
+            // The first event names the connection our POSTs belong to
+            var data = JSON.parse(event.data);
+            if (data.type !== 'connected') return;
+            connectionId = data.connection_id;
+            socket.readyState = WebSocket.OPEN;
+            if (socket.onopen) socket.onopen({});
+        };
+
+        source.onerror = function(err) {
+            if (socket.onerror) socket.onerror(err);
+            finish();
+        };
+
+        socket.send = function(text) {
+            if (socket.readyState !== WebSocket.OPEN) return;
+            var message = JSON.parse(text);
+            message.connection_id = connectionId;
+            pending = pending.then(function() {
+                return fetch('/beatify/events/send' + suffix, {
+                    method: 'POST',
+                    headers: { 'Content-Type': 'application/json' },
+                    body: JSON.stringify(message)
+                });
+            }).then(function(response) {
+                // The stream is gone on the server: treat it as a disconnect
+                if (response.status === 404) finish();
+            }).catch(function(err) {
+                if (socket.onerror) socket.onerror(err);
+                finish();
+            });
+        };
+
+        socket.close = finish;
+        return socket;
+    }
+
+    // ==========================================================================
+    // Clock Sync
+    // ==========================================================================
+
+    /**
+     * Estimate the offset between this device's clock and the server clock
+     * (NTP-style four-timestamp exchange, see server/clock_sync.py).
+     * Runs a short burst on start() and one exchange every 30s after that;
+     * the lowest-RTT recent sample wins.
+     * @param {Function} send - Called with a message object to send to the server
+     * @returns {Object} Clock with start(), stop(), handleMessage(), now() and getOffset()
+     */
+    function createClockSync(send) {
+        var BURST_SAMPLES = 5;
+        var RESYNC_INTERVAL_MS = 30000;
+        var MAX_SAMPLES = 8;
+
+        var samples = [];
+        var offset = 0;
+        var rtt = null;
+        var burstLeft = 0;
+        var timer = null;
+
+        function request() {
+            var msg = { type: 'time_sync', t0: Date.now() };
+            if (rtt !== null) {
+                // Report the current estimate so the server can track clock skew
+                msg.offset = Math.round(offset);
+                msg.rtt = Math.round(rtt);
+            }
+            send(msg);
+        }
+
+        function handleMessage(data) {
+            if (data.type !== 'time_sync') return false;
+            var t3 = Date.now();
+            samples.push({
+                offset: ((data.t1 - data.t0) + (data.t2 - t3)) / 2,
+                rtt: Math.max(0, (t3 - data.t0) - (data.t2 - data.t1))
+            });
+            if (samples.length > MAX_SAMPLES) samples.shift();
+            // The fastest exchange suffers least from asymmetric delays
+            var best = samples.reduce(function(a, b) { return b.rtt < a.rtt ? b : a; });
+            offset = best.offset;
+            rtt = best.rtt;
+            if (burstLeft > 0) {
+                burstLeft--;
+                request();
+            }
+            return true;
+        }
+
+        function stop() {
+            if (timer) clearInterval(timer);
+            timer = null;
+            burstLeft = 0;
+        }
+
+        function start() {
+            stop();
+            samples = [];
+            burstLeft = BURST_SAMPLES - 1;
+            request();
+            timer = setInterval(request, RESYNC_INTERVAL_MS);
+        }
+
+        return {
+            start: start,
+            stop: stop,
+            handleMessage: handleMessage,
+            // Current time on the server clock, in ms
+            now: function() { return Date.now() + offset; },
+            getOffset: function() { return offset; }
+        };
+    }
+
+    // ==========================================================================
+    // Delta State Sync
+    // ==========================================================================
+
+    /**
+     * Apply a state_patch's ops (see server/state_sync.py) to a state object.
+     * Ops are ['set', path, value] and ['del', path]; an empty path is the root.
+     * Throws when a path does not exist, so callers can fall back to a full state.
+     * @param {Object} doc - State to patch (modified in place)
+     * @param {Array} ops - Patch operations
+     * @returns {Object} The patched state (a root 'set' replaces it)
+     */
+    function applyStatePatch(doc, ops) {
+        ops.forEach(function(op) {
+            var kind = op[0];
+            var path = op[1];
+            if (!path.length) {
+                if (kind === 'set') doc = op[2];
+                return;
+            }
+            var parent = doc;
+            for (var i = 0; i < path.length - 1; i++) {
+                parent = parent[path[i]];
+                if (parent === null || typeof parent !== 'object') {
+                    throw new Error('state_patch path not found: ' + path.join('.'));
+                }
+            }
+            var key = path[path.length - 1];
+            if (kind === 'set') {
+                parent[key] = op[2];
+            } else if (kind === 'del') {
+                delete parent[key];
+            } else {
+                throw new Error('Unknown state_patch op: ' + kind);
+            }
+        });
+        return doc;
+    }
+
     // ==========================================================================
     // URL Utilities
     // ==========================================================================
@@ -307,7 +497,12 @@ window.BeatifyUtils = (function() {
 
         // WebSocket
         createWebSocket: createWebSocket,
+        createEventStreamSocket: createEventStreamSocket,
         buildWebSocketUrl: buildWebSocketUrl,
+        createClockSync: createClockSync,
+
+        // Delta state sync
+        applyStatePatch: applyStatePatch,
 
         // URL utilities
         getQueryParam: getQueryParam
@@ -0,0 +1,255 @@
+"""
+Round-transition benchmark for large rooms.
+
+Runs the real GameState and BeatifyWebSocketHandler in-process, with N
+in-memory sockets instead of network clients, and times the two round
+transitions the host triggers:
+
+    - reveal: ``end_round()`` (scoring, highlights, analytics) plus the
+      state broadcast it triggers, until every socket has been written
+    - next round: ``start_round()`` plus its state broadcast, likewise
+
+Each player count runs twice, with the full player list sent to every
+player ("full") and in large-room mode ("large_room"), where players get
+the trimmed view. Per mode the report gives p50/max latency per transition
+and the average state bytes written per player per transition.
+
+Usage (from the repository root):
+    python -m tests.load.round_bench
+    python -m tests.load.round_bench --players 50 100 200 500 --rounds 5 --json
+
+Player counts above the cap of a mode lift it for the duration of the run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any
+
+try:
+    import homeassistant  # noqa: F401
+except ImportError:
+    # Outside a HA dev environment, use the HA stubs the unit tests use
+    import conftest  # noqa: F401
+
+from custom_components.beatify.const import DOMAIN, ROUND_DURATION_MAX
+from custom_components.beatify.game.state import GameState
+from custom_components.beatify.server.websocket import BeatifyWebSocketHandler
+from tests.load.swarm import make_songs, percentiles, player_cap
+
+PLAYER_COUNTS = (50, 100, 200, 500)
+MODES = ("full", "large_room")
+
+
+@dataclass
+class BenchConfig:
+    """Benchmark parameters."""
+
+    players: tuple[int, ...] = PLAYER_COUNTS
+    rounds: int = 5
+    bet_rate: float = 0.2
+    seed: int = 1
+
+
+class BenchSocket:
+    """In-memory stand-in for a WebSocketResponse that counts bytes written."""
+
+    def __init__(self) -> None:
+        """Initialize an open socket."""
+        self.closed = False
+        self.compress = 0
+        self.bytes_sent = 0
+        self.frames_sent = 0
+
+    async def send_str(self, data: str) -> None:
+        """Count a text frame."""
+        self.bytes_sent += len(data.encode("utf-8"))
+        self.frames_sent += 1
+
+    async def send_bytes(self, data: bytes) -> None:
+        """Count a binary frame."""
+        self.bytes_sent += len(data)
+        self.frames_sent += 1
+
+    async def close(self) -> None:
+        """Mark the socket closed."""
+        self.closed = True
+
+
+@dataclass
+class TransitionStats:
+    """Timings and traffic of one transition type."""
+
+    latency: list[float] = field(default_factory=list)
+    bytes_per_player: list[float] = field(default_factory=list)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the summary as a JSON-serializable dict."""
+        pct = percentiles(self.latency)
+        return {
+            "p50_ms": pct["p50_ms"],
+            "max_ms": round(max(self.latency) * 1000, 2) if self.latency else None,
+            "bytes_per_player": (
+                round(sum(self.bytes_per_player) / len(self.bytes_per_player))
+                if self.bytes_per_player
+                else None
+            ),
+        }
+
+
+async def _timed(
+    handler: BeatifyWebSocketHandler,
+    sockets: list[BenchSocket],
+    transition: Any,
+    stats: TransitionStats,
+) -> None:
+    """Run one transition and record its latency and bytes written per player."""
+    before = sum(ws.bytes_sent for ws in sockets)
+    started = time.perf_counter()
+    await transition()
+    await handler.drain_outbound()
+    stats.latency.append(time.perf_counter() - started)
+    stats.bytes_per_player.append(
+        (sum(ws.bytes_sent for ws in sockets) - before) / len(sockets)
+    )
+
+
+async def run_mode(
+    players: int, large_room: bool, config: BenchConfig
+) -> dict[str, Any]:
+    """
+    Play ``config.rounds`` rounds with ``players`` in-memory players.
+
+    Args:
+        players: Number of players (the first one is the admin)
+        large_room: Create the game in large-room mode
+        config: Benchmark parameters
+
+    Returns:
+        Report dict for this player count and mode
+
+    """
+    rng = random.Random(config.seed)
+    hass = SimpleNamespace(data={})
+    handler = BeatifyWebSocketHandler(hass)
+    game_state = GameState()
+    game_state.create_game(
+        playlists=["bench.json"],
+        songs=make_songs(config.rounds),
+        media_player="",  # no media player: rounds start without playback
+        base_url="http://localhost:8123",
+        round_duration=ROUND_DURATION_MAX,
+        large_room=large_room,
+    )
+    game_state.set_round_end_callback(handler.broadcast_state)
+    hass.data[DOMAIN] = {"game": game_state, "ws_handler": handler}
+
+    sockets = [BenchSocket() for _ in range(players)]
+    reveal, next_round = TransitionStats(), TransitionStats()
+    with player_cap(players):
+        for i, ws in enumerate(sockets):
+            name = "Host" if i == 0 else f"Player {i}"
+            added, error = game_state.add_player(name, ws)
+            if not added:
+                raise RuntimeError(f"Could not add {name}: {error}")
+            if i == 0:
+                game_state.set_admin(name)
+        handler.connections.update(sockets)
+        await handler.broadcast_state()
+        await handler.drain_outbound()
+
+        async def start_round() -> None:
+            await game_state.start_round(hass)
+            await handler.broadcast_state()
+
+        try:
+            for _ in range(config.rounds):
+                await _timed(handler, sockets, start_round, next_round)
+                started = game_state.round_start_time
+                for player in game_state.players.values():
+                    player.submit_guess(
+                        rng.randint(1950, 2020),
+                        started + rng.uniform(0, ROUND_DURATION_MAX),
+                    )
+                    player.bet = rng.random() < config.bet_rate
+                await _timed(handler, sockets, game_state.end_round, reveal)
+        finally:
+            game_state.cancel_timer()
+            await handler.cleanup_game_tasks()
+            for ws in sockets:
+                # Stops the socket's outbound writer task
+                await handler._connection_closed(ws)
+
+    return {
+        "players": players,
+        "mode": "large_room" if large_room else "full",
+        "reveal": reveal.as_dict(),
+        "next_round": next_round.as_dict(),
+    }
+
+
+async def run_bench(config: BenchConfig) -> list[dict[str, Any]]:
+    """
+    Run every player count in both modes.
+
+    Args:
+        config: Benchmark parameters
+
+    Returns:
+        One report dict per (player count, mode)
+
+    """
+    return [
+        await run_mode(players, mode == "large_room", config)
+        for players in config.players
+        for mode in MODES
+    ]
+
+
+def _print_report(results: list[dict[str, Any]]) -> None:
+    print(
+        f"{'players':>7}  {'mode':<10}  {'reveal p50':>10}  {'reveal max':>10}"
+        f"  {'next p50':>9}  {'next max':>9}  {'reveal B/player':>15}"
+    )
+    for row in results:
+        reveal, next_round = row["reveal"], row["next_round"]
+        print(
+            f"{row['players']:>7}  {row['mode']:<10}  {reveal['p50_ms']:>8} ms"
+            f"  {reveal['max_ms']:>8} ms  {next_round['p50_ms']:>6} ms"
+            f"  {next_round['max_ms']:>6} ms  {reveal['bytes_per_player']:>15}"
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command line entry point."""
+    defaults = BenchConfig()
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--players", type=int, nargs="+", default=list(defaults.players)
+    )
+    parser.add_argument("--rounds", type=int, default=defaults.rounds)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    config = BenchConfig(
+        players=tuple(args.players), rounds=args.rounds, seed=args.seed
+    )
+    results = asyncio.run(run_bench(config))
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+    else:
+        _print_report(results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+"""
+Round-scoring benchmark for large rooms.
+
+Times scoring one round of N players, the part of ``end_round()`` that
+grows with the room, three ways:
+
+    - per_player: ``ScoringService.score_player_round()`` for each player,
+      with the intro submission times sorted once (the earlier end_round)
+    - batch: ``ScoringService.score_round()`` computing round scores in a loop
+    - batch_numpy: ``ScoringService.score_round()`` computing round scores as
+      arrays (skipped when NumPy is not installed)
+
+Rounds are intro rounds with an artist and a movie challenge, so every
+bonus lookup is exercised. The report gives p50/min per mode in
+milliseconds and the speedup of each batch mode over per_player.
+
+Usage (from the repository root):
+    python -m tests.load.scoring_bench
+    python -m tests.load.scoring_bench --players 1000 10000 --repeat 20 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any
+
+try:
+    import homeassistant  # noqa: F401
+except ImportError:
+    # Outside a HA dev environment, use the HA stubs the unit tests use
+    import conftest  # noqa: F401
+
+from custom_components.beatify.const import INTRO_DURATION_SECONDS
+from custom_components.beatify.game.player import PlayerSession
+from custom_components.beatify.game.scoring import NUMPY_AVAILABLE, ScoringService
+from custom_components.beatify.game.state import ArtistChallenge, MovieChallenge
+from tests.load.swarm import percentiles
+
+PLAYER_COUNTS = (100, 500, 2000, 10000)
+MODES = ("per_player", "batch", "batch_numpy")
+CORRECT_YEAR = 1990
+START = 1000.0
+
+
+@dataclass
+class BenchConfig:
+    """Benchmark parameters."""
+
+    players: tuple[int, ...] = PLAYER_COUNTS
+    repeat: int = 10
+    seed: int = 1
+
+
+def _make_round(
+    players: int, rng: random.Random
+) -> tuple[list[PlayerSession], dict[str, Any]]:
+    """Build a room where most players submitted, and the round's arguments."""
+    room = []
+    for i in range(players):
+        player = PlayerSession(name=f"Player {i}", ws=None, streak=rng.randint(0, 4))
+        if rng.random() < 0.9:
+            player.submit_guess(
+                CORRECT_YEAR + rng.randint(-10, 10),
+                START + rng.uniform(0, INTRO_DURATION_SECONDS * 2),
+                rng.uniform(0, 0.1),
+            )
+            player.bet = rng.random() < 0.2
+        room.append(player)
+    movie = MovieChallenge(correct_movie="Fame", options=["Fame", "Grease", "Cats"])
+    for player in rng.sample(room, min(players, 10)):
+        movie.correct_guesses.append({"name": player.name, "time": 1.0})
+    round_args = {
+        "correct_year": CORRECT_YEAR,
+        "round_start_time": START,
+        "round_duration": 30,
+        "difficulty": "normal",
+        "artist_challenge": ArtistChallenge(
+            correct_artist="A", options=["A", "B"], winner=room[-1].name
+        ),
+        "movie_challenge": movie,
+        "is_intro_round": True,
+        "intro_round_start_time": START,
+        "streak_achievements": {f"streak_{n}": 0 for n in (3, 5, 10, 15, 20, 25)},
+        "bet_tracking": {"total_bets": 0, "bets_won": 0},
+        "latency_compensation": True,
+    }
+    return room, round_args
+
+
+def _score(mode: str, room: list[PlayerSession], round_args: dict[str, Any]) -> None:
+    """Score one round in the given mode."""
+    if mode == "per_player":
+        intro_times = ScoringService.intro_submission_times(room, START)
+        for player in room:
+            ScoringService.score_player_round(
+                player, **round_args, all_players=room, intro_times=intro_times
+            )
+    else:
+        ScoringService.score_round(room, **round_args, use_numpy=mode == "batch_numpy")
+
+
+def run_bench(config: BenchConfig) -> list[dict[str, Any]]:
+    """
+    Time every mode at every player count.
+
+    Args:
+        config: Benchmark parameters
+
+    Returns:
+        One report dict per player count
+
+    """
+    modes = [mode for mode in MODES if mode != "batch_numpy" or NUMPY_AVAILABLE]
+    results = []
+    for players in config.players:
+        samples: dict[str, list[float]] = {mode: [] for mode in modes}
+        for i in range(config.repeat):
+            for mode in modes:
+                # Same room for every mode; scoring mutates it, so build it anew
+                room, round_args = _make_round(players, random.Random(config.seed + i))
+                started = time.perf_counter()
+                _score(mode, room, round_args)
+                samples[mode].append(time.perf_counter() - started)
+        row: dict[str, Any] = {"players": players}
+        for mode in modes:
+            row[mode] = {
+                "p50_ms": percentiles(samples[mode])["p50_ms"],
+                "min_ms": round(min(samples[mode]) * 1000, 3),
+            }
+        base = row["per_player"]["p50_ms"]
+        for mode in modes[1:]:
+            p50 = row[mode]["p50_ms"]
+            row[mode]["speedup"] = round(base / p50, 2) if p50 else None
+        results.append(row)
+    return results
+
+
+def _print_report(results: list[dict[str, Any]]) -> None:
+    modes = [mode for mode in MODES if mode in results[0]] if results else []
+    print(f"{'players':>7}" + "".join(f"  {mode + ' p50':>16}" for mode in modes))
+    for row in results:
+        cells = []
+        for mode in modes:
+            cell = f"{row[mode]['p50_ms']} ms"
+            if "speedup" in row[mode]:
+                cell += f" ({row[mode]['speedup']}x)"
+            cells.append(f"  {cell:>16}")
+        print(f"{row['players']:>7}" + "".join(cells))
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command line entry point."""
+    defaults = BenchConfig()
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--players", type=int, nargs="+", default=list(defaults.players)
+    )
+    parser.add_argument("--repeat", type=int, default=defaults.repeat)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    config = BenchConfig(
+        players=tuple(args.players), repeat=args.repeat, seed=args.seed
+    )
+    results = run_bench(config)
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+    else:
+        _print_report(results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
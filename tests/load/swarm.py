@@ -0,0 +1,513 @@
+"""
+WebSocket swarm load test for BeatifyWebSocketHandler.
+
+Boots the real handler and GameState on a local aiohttp test server (with a
+stub ``hass`` and no media player) and drives N simulated players through
+full games over real WebSocket connections: joins, year submits with
+realistic think times, bets, artist and movie guesses, reactions during
+reveal, and mid-round reconnects. Simulated players ack state versions and
+apply state patches like the current player page.
+
+Reports:
+    - submit -> state latency: from sending ``submit`` until a state (full
+      or patch) shows the player as submitted, p50/p95/p99
+    - broadcast fan-out: from the start of broadcast_state() until the last
+      client has received that state version, p50/p95/p99
+    - process CPU seconds per round (server and simulated clients share the
+      process, so this is an upper bound for the server)
+
+Usage (from the repository root):
+    python -m tests.load.swarm --players 60 --rounds 5
+    python -m tests.load.swarm --players 100 --json > run.json
+
+Player counts above MAX_PLAYERS lift the cap for the duration of the run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import json
+import random
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any
+
+from aiohttp import WSMsgType, web
+from aiohttp.test_utils import TestClient, TestServer
+
+try:
+    import homeassistant  # noqa: F401
+except ImportError:
+    # Outside a HA dev environment, use the HA stubs the unit tests use
+    import conftest  # noqa: F401
+
+from custom_components.beatify.const import DOMAIN, ROUND_DURATION_MAX
+from custom_components.beatify.game import state as state_module
+from custom_components.beatify.game.state import GameState
+from custom_components.beatify.server.state_sync import apply_state_patch
+from custom_components.beatify.server.websocket import BeatifyWebSocketHandler
+
+REACTIONS = ("🔥", "😂", "😱", "👏", "🤔")
+
+
+@dataclass
+class SwarmConfig:
+    """Load test parameters."""
+
+    players: int = 30
+    rounds: int = 3
+    # Year submits are spread over this many seconds after a round starts
+    think_time: float = 4.0
+    # Seconds the host stays on the reveal screen
+    reveal_time: float = 1.0
+    bet_rate: float = 0.2
+    artist_rate: float = 0.5
+    movie_rate: float = 0.3
+    reaction_rate: float = 0.3
+    reconnect_rate: float = 0.05
+    # Seconds to wait for all submits before the host advances anyway
+    round_timeout: float = 30.0
+    seed: int = 1
+
+
+def make_songs(count: int) -> list[dict[str, Any]]:
+    """Build playable songs with artist and movie challenges."""
+    return [
+        {
+            "year": 1960 + (i * 7) % 60,
+            "title": f"Song {i}",
+            "artist": f"Artist {i}",
+            "alt_artists": [f"Decoy {i}a", f"Decoy {i}b"],
+            "movie": f"Movie {i}",
+            "movie_choices": [f"Movie {i}", f"Other {i}a", f"Other {i}b"],
+            "_resolved_uri": f"spotify:track:load{i:022d}",
+            "uri": f"spotify:track:load{i:022d}",
+        }
+        for i in range(count)
+    ]
+
+
+def percentiles(samples: list[float]) -> dict[str, float | int | None]:
+    """Return count and nearest-rank p50/p95/p99 in milliseconds."""
+    ordered = sorted(samples)
+
+    def rank(fraction: float) -> float | None:
+        if not ordered:
+            return None
+        index = min(len(ordered) - 1, max(0, int(fraction * len(ordered) + 0.5) - 1))
+        return round(ordered[index] * 1000, 2)
+
+    return {
+        "count": len(ordered),
+        "p50_ms": rank(0.5),
+        "p95_ms": rank(0.95),
+        "p99_ms": rank(0.99),
+    }
+
+
+@dataclass
+class SwarmStats:
+    """Measurements collected during a run."""
+
+    submit_latency: list[float] = field(default_factory=list)
+    broadcast_started: dict[int, float] = field(default_factory=dict)
+    state_received: dict[int, list[float]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+    round_cpu: list[float] = field(default_factory=list)
+    round_wall: list[float] = field(default_factory=list)
+    errors: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    reconnects: int = 0
+    messages_received: int = 0
+
+    def fan_out(self) -> list[float]:
+        """Broadcast start -> last receipt, per broadcast state version."""
+        return [
+            max(self.state_received[version]) - started
+            for version, started in self.broadcast_started.items()
+            if self.state_received.get(version)
+        ]
+
+
+class InstrumentedHandler(BeatifyWebSocketHandler):
+    """Handler that records when each state broadcast starts."""
+
+    def __init__(self, hass: Any, stats: SwarmStats) -> None:
+        """Initialize handler with a stats sink."""
+        super().__init__(hass)
+        self._swarm_stats = stats
+
+    async def broadcast_state(self) -> None:
+        """Broadcast state, timestamping the version it produced."""
+        started = time.perf_counter()
+        before = self._state_sync.version
+        await super().broadcast_state()
+        if self._state_sync.version != before:
+            self._swarm_stats.broadcast_started[self._state_sync.version] = started
+
+
+class SimulatedPlayer:
+    """One phone: a WebSocket client that plays like a person."""
+
+    def __init__(
+        self,
+        name: str,
+        client: TestClient,
+        config: SwarmConfig,
+        stats: SwarmStats,
+        rng: random.Random,
+        *,
+        is_admin: bool = False,
+    ) -> None:
+        """Initialize player."""
+        self.name = name
+        self.client = client
+        self.config = config
+        self.stats = stats
+        self.rng = rng
+        self.is_admin = is_admin
+        self.ws: Any = None
+        self.session_id: str | None = None
+        self.state: dict[str, Any] = {}
+        self.version = 0
+        self.joined = asyncio.Event()
+        self.state_changed = asyncio.Event()
+        self.submitted_round = 0
+        self._submit_sent: float | None = None
+        self._acted_round = 0
+        self._reacted_round = 0
+        self._reader: asyncio.Task | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def phase(self) -> str | None:
+        """Phase of the last state seen."""
+        return self.state.get("phase")
+
+    @property
+    def round(self) -> int:
+        """Round number of the last state seen."""
+        return self.state.get("round", 0)
+
+    async def connect(self) -> None:
+        """Open the socket and join the game."""
+        await self._open()
+        await self.send({"type": "join", "name": self.name, "is_admin": self.is_admin})
+        await self.joined.wait()
+
+    async def send(self, message: dict[str, Any]) -> None:
+        """Send one message."""
+        await self.ws.send_str(json.dumps(message))
+
+    async def close(self) -> None:
+        """Close the socket and stop background tasks."""
+        for task in list(self._tasks):
+            task.cancel()
+        if self.ws is not None:
+            await self.ws.close()
+        if self._reader is not None:
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._reader
+
+    async def _open(self) -> None:
+        self.ws = await self.client.ws_connect("/beatify/ws")
+        self._reader = asyncio.create_task(self._read(self.ws))
+
+    async def _reconnect(self) -> None:
+        """Drop the connection and resume the session on a new one."""
+        old, reader = self.ws, self._reader
+        await old.close()
+        if reader is not None:
+            await reader
+        self.stats.reconnects += 1
+        await self._open()
+        await self.send({"type": "reconnect", "session_id": self.session_id})
+
+    async def _read(self, ws: Any) -> None:
+        async for msg in ws:
+            if msg.type != WSMsgType.TEXT:
+                continue
+            self.stats.messages_received += 1
+            await self._on_message(json.loads(msg.data), time.perf_counter())
+
+    async def _on_message(self, data: dict[str, Any], received: float) -> None:
+        msg_type = data.get("type")
+        if msg_type == "join_ack":
+            self.session_id = data["session_id"]
+        elif msg_type == "error":
+            self.stats.errors[data.get("code", "UNKNOWN")] += 1
+        elif msg_type in ("state", "state_patch"):
+            if msg_type == "state":
+                self.state = {
+                    k: v for k, v in data.items() if k not in ("type", "version", "seq")
+                }
+            elif data["base"] == self.version:
+                self.state = apply_state_patch(self.state, data["ops"])
+            else:
+                # Out of sync: a full state follows once the ack is stale
+                return
+            self.version = data["version"]
+            self.stats.state_received[self.version].append(received)
+            await self.send({"type": "state_ack", "version": self.version})
+            self._on_state(received)
+
+    def _on_state(self, received: float) -> None:
+        self.joined.set()
+        self.state_changed.set()
+
+        if self._submit_sent is not None and self._me().get("submitted"):
+            self.stats.submit_latency.append(received - self._submit_sent)
+            self._submit_sent = None
+
+        if self.phase == "PLAYING" and self.round > self._acted_round:
+            self._acted_round = self.round
+            self._spawn(self._play_round(self.round))
+        elif self.phase == "REVEAL" and self.round > self._reacted_round:
+            self._reacted_round = self.round
+            if self.rng.random() < self.config.reaction_rate:
+                self._spawn(self._react())
+
+    def _me(self) -> dict[str, Any]:
+        for player in self.state.get("players", ()):
+            if player["name"] == self.name:
+                return player
+        return {}
+
+    def _spawn(self, coro: Any) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _play_round(self, round_number: int) -> None:
+        """Guess like a person: think, maybe guess extras, then submit."""
+        config, rng = self.config, self.rng
+        await asyncio.sleep(rng.uniform(0.1, config.think_time))
+
+        if rng.random() < config.reconnect_rate:
+            await self._reconnect()
+
+        artist = self.state.get("artist_challenge")
+        if artist and rng.random() < config.artist_rate:
+            await self.send(
+                {"type": "artist_guess", "artist": rng.choice(artist["options"])}
+            )
+        movie = self.state.get("movie_challenge")
+        if movie and rng.random() < config.movie_rate:
+            await self.send(
+                {"type": "movie_guess", "movie": rng.choice(movie["options"])}
+            )
+
+        if self.phase != "PLAYING" or self.round != round_number:
+            return
+        self._submit_sent = time.perf_counter()
+        await self.send(
+            {
+                "type": "submit",
+                "year": rng.randint(1950, 2025),
+                "bet": rng.random() < config.bet_rate,
+            }
+        )
+        self.submitted_round = round_number
+
+    async def _react(self) -> None:
+        for _ in range(self.rng.randint(1, 3)):
+            await asyncio.sleep(self.rng.uniform(0.05, 0.3))
+            await self.send({"type": "reaction", "emoji": self.rng.choice(REACTIONS)})
+
+    async def wait_for(self, predicate: Any, timeout: float) -> bool:
+        """Wait until a predicate on this player's view holds."""
+        try:
+            async with asyncio.timeout(timeout):
+                while not predicate():
+                    self.state_changed.clear()
+                    await self.state_changed.wait()
+        except TimeoutError:
+            return False
+        return True
+
+
+@contextlib.contextmanager
+def player_cap(players: int):
+    """Lift MAX_PLAYERS for the run if the swarm is larger."""
+    original = state_module.MAX_PLAYERS
+    state_module.MAX_PLAYERS = max(original, players)
+    try:
+        yield
+    finally:
+        state_module.MAX_PLAYERS = original
+
+
+async def run_swarm(config: SwarmConfig) -> dict[str, Any]:
+    """
+    Run one full game with a swarm of simulated players.
+
+    Args:
+        config: Load test parameters
+
+    Returns:
+        Report dict (see module docstring)
+
+    """
+    stats = SwarmStats()
+    rng = random.Random(config.seed)
+    hass = SimpleNamespace(data={})
+    handler = InstrumentedHandler(hass, stats)
+    game_state = GameState()
+    game_state.create_game(
+        playlists=["load.json"],
+        songs=make_songs(config.rounds),
+        media_player="",  # no media player: rounds start without playback
+        base_url="http://localhost:8123",
+        round_duration=ROUND_DURATION_MAX,
+    )
+    game_state.set_round_end_callback(handler.broadcast_state)
+    game_state.set_metadata_update_callback(handler.broadcast_metadata_update)
+    hass.data[DOMAIN] = {"game": game_state, "ws_handler": handler}
+
+    app = web.Application()
+    app.router.add_get("/beatify/ws", handler.handle)
+
+    with player_cap(config.players):
+        async with TestClient(TestServer(app)) as client:
+            admin = SimulatedPlayer(
+                "Host",
+                client,
+                config,
+                stats,
+                random.Random(rng.random()),
+                is_admin=True,
+            )
+            players = [admin] + [
+                SimulatedPlayer(
+                    f"Player {i}", client, config, stats, random.Random(rng.random())
+                )
+                for i in range(1, config.players)
+            ]
+            join_started = time.perf_counter()
+            await admin.connect()
+            await asyncio.gather(*(p.connect() for p in players[1:]))
+            join_time = time.perf_counter() - join_started
+
+            try:
+                rounds_played = await _drive_game(admin, players, config, stats)
+            finally:
+                await asyncio.gather(*(p.close() for p in players))
+                game_state.cancel_timer()
+                await handler.cleanup_game_tasks()
+
+    return {
+        "config": config.__dict__,
+        "rounds_played": rounds_played,
+        "join_time_s": round(join_time, 3),
+        "submit_to_state": percentiles(stats.submit_latency),
+        "broadcast_fan_out": percentiles(stats.fan_out()),
+        "cpu_per_round_s": [round(cpu, 3) for cpu in stats.round_cpu],
+        "wall_per_round_s": [round(wall, 3) for wall in stats.round_wall],
+        "reconnects": stats.reconnects,
+        "messages_received": stats.messages_received,
+        "errors": dict(stats.errors),
+        "server": handler.diagnostics(),
+    }
+
+
+async def _drive_game(
+    admin: SimulatedPlayer,
+    players: list[SimulatedPlayer],
+    config: SwarmConfig,
+    stats: SwarmStats,
+) -> int:
+    """Play every round as the host; return the number of rounds completed."""
+    for round_number in range(1, config.rounds + 1):
+        cpu_started, wall_started = time.process_time(), time.perf_counter()
+        action = "start_game" if round_number == 1 else "next_round"
+        await admin.send({"type": "admin", "action": action})
+        if not await admin.wait_for(
+            lambda n=round_number: admin.phase == "PLAYING" and admin.round == n,
+            config.round_timeout,
+        ):
+            return round_number - 1
+
+        # Everyone submits (or the round times out), then the host moves on
+        # to the reveal if the early reveal did not already happen
+        deadline = time.perf_counter() + config.round_timeout
+        while time.perf_counter() < deadline and any(
+            p.submitted_round < round_number for p in players
+        ):
+            await asyncio.sleep(0.05)
+        await asyncio.sleep(0.2)
+        if admin.phase == "PLAYING":
+            await admin.send({"type": "admin", "action": "next_round"})
+        await admin.wait_for(lambda: admin.phase == "REVEAL", config.round_timeout)
+        await asyncio.sleep(config.reveal_time)
+
+        stats.round_cpu.append(time.process_time() - cpu_started)
+        stats.round_wall.append(time.perf_counter() - wall_started)
+
+    await admin.send({"type": "admin", "action": "next_round"})
+    await admin.wait_for(lambda: admin.phase == "END", config.round_timeout)
+    return config.rounds
+
+
+def _print_report(report: dict[str, Any]) -> None:
+    config = report["config"]
+    print(
+        f"Beatify swarm: {config['players']} players, {report['rounds_played']} rounds"
+    )
+    print(f"  join time:          {report['join_time_s']} s")
+    for key, label in (
+        ("submit_to_state", "submit -> state"),
+        ("broadcast_fan_out", "fan-out"),
+    ):
+        pct = report[key]
+        print(
+            f"  {label + ':':<19} p50 {pct['p50_ms']} ms, p95 {pct['p95_ms']} ms,"
+            f" p99 {pct['p99_ms']} ms (n={pct['count']})"
+        )
+    print(f"  CPU per round:      {report['cpu_per_round_s']} s")
+    print(f"  wall per round:     {report['wall_per_round_s']} s")
+    print(f"  reconnects:         {report['reconnects']}")
+    print(f"  errors:             {report['errors'] or 'none'}")
+    outbound = report["server"]["outbound"]
+    print(
+        f"  outbound queues:    coalesced {outbound['coalesced']}, dropped {outbound['dropped']},"
+        f" evicted {outbound['evicted']}"
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command line entry point."""
+    defaults = SwarmConfig()
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--players", type=int, default=defaults.players)
+    parser.add_argument("--rounds", type=int, default=defaults.rounds)
+    parser.add_argument("--think-time", type=float, default=defaults.think_time)
+    parser.add_argument("--reveal-time", type=float, default=defaults.reveal_time)
+    parser.add_argument("--reconnect-rate", type=float, default=defaults.reconnect_rate)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    config = SwarmConfig(
+        players=args.players,
+        rounds=args.rounds,
+        think_time=args.think_time,
+        reveal_time=args.reveal_time,
+        reconnect_rate=args.reconnect_rate,
+        seed=args.seed,
+    )
+    report = asyncio.run(run_swarm(config))
+    if args.json:
+        json.dump(report, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+    else:
+        _print_report(report)
+    return 0 if report["rounds_played"] == config.rounds else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
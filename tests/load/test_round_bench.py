@@ -0,0 +1,23 @@
+"""Smoke run of the round-transition benchmark (tests/load/round_bench.py)."""
+
+from __future__ import annotations
+
+from custom_components.beatify.const import LARGE_ROOM_VISIBLE_PLAYERS, MAX_PLAYERS
+from tests.load.round_bench import BenchConfig, run_bench
+
+
+async def test_bench_reports_both_modes():
+    players = max(MAX_PLAYERS, LARGE_ROOM_VISIBLE_PLAYERS) + 15
+    config = BenchConfig(players=(players,), rounds=2)
+
+    results = await run_bench(config)
+
+    assert [row["mode"] for row in results] == ["full", "large_room"]
+    for row in results:
+        assert row["players"] == players
+        for transition in ("reveal", "next_round"):
+            assert row[transition]["p50_ms"] is not None
+            assert row[transition]["bytes_per_player"] > 0
+    full, large_room = results
+    # Players get the trimmed list in large-room mode
+    assert large_room["reveal"]["bytes_per_player"] < full["reveal"]["bytes_per_player"]
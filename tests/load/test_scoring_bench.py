@@ -0,0 +1,18 @@
+"""Smoke run of the round-scoring benchmark (tests/load/scoring_bench.py)."""
+
+from __future__ import annotations
+
+from custom_components.beatify.game.scoring import NUMPY_AVAILABLE
+from tests.load.scoring_bench import BenchConfig, run_bench
+
+
+def test_bench_reports_every_mode():
+    results = run_bench(BenchConfig(players=(50,), repeat=2))
+
+    (row,) = results
+    assert row["players"] == 50
+    modes = ["per_player", "batch"] + (["batch_numpy"] if NUMPY_AVAILABLE else [])
+    for mode in modes:
+        assert row[mode]["p50_ms"] is not None
+    for mode in modes[1:]:
+        assert row[mode]["speedup"] is not None
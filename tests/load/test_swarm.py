@@ -0,0 +1,26 @@
+"""Smoke run of the swarm load test (tests/load/swarm.py)."""
+
+from __future__ import annotations
+
+from custom_components.beatify.const import MAX_PLAYERS
+from tests.load.swarm import SwarmConfig, run_swarm
+
+
+async def test_small_swarm_plays_full_game():
+    config = SwarmConfig(
+        players=MAX_PLAYERS + 5,
+        rounds=2,
+        think_time=0.3,
+        reveal_time=0.1,
+        reconnect_rate=0.2,
+    )
+
+    report = await run_swarm(config)
+
+    assert report["rounds_played"] == 2
+    assert report["errors"] == {}
+    assert report["submit_to_state"]["count"] >= config.players
+    assert report["submit_to_state"]["p99_ms"] is not None
+    assert report["broadcast_fan_out"]["count"] > 0
+    assert len(report["cpu_per_round_s"]) == 2
+    assert report["server"]["connections"] == 0
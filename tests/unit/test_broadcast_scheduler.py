@@ -0,0 +1,104 @@
+"""Tests for rate-capped state broadcasts (custom_components/beatify/server/broadcast_scheduler.py)."""
+
+from __future__ import annotations
+
+import asyncio
+
+from custom_components.beatify.server.broadcast_scheduler import BroadcastScheduler
+from tests.unit.test_websocket import make_game_handler
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_scheduler(min_interval: float = 0.02):
+    clock = FakeClock()
+    flushed: list[str | None] = []
+    phase = {"value": "PLAYING"}
+
+    async def flush() -> None:
+        flushed.append(phase["value"])
+        scheduler.mark_flushed(phase["value"])
+
+    scheduler = BroadcastScheduler(flush, min_interval=min_interval, time_fn=clock)
+    return scheduler, clock, flushed, phase
+
+
+class TestBroadcastScheduler:
+    async def test_first_request_flushes_immediately(self):
+        scheduler, _clock, flushed, _ = make_scheduler()
+        await scheduler.request("PLAYING")
+        assert flushed == ["PLAYING"]
+        assert not scheduler.pending
+
+    async def test_burst_coalesced_into_one_trailing_flush(self):
+        scheduler, _clock, flushed, _ = make_scheduler()
+        for _ in range(20):
+            await scheduler.request("PLAYING")
+
+        assert len(flushed) == 1
+        assert scheduler.pending
+
+        await asyncio.sleep(0.05)
+
+        assert len(flushed) == 2
+        assert scheduler.requests == 20
+        assert scheduler.coalesced == 18
+        assert scheduler.flushes == 2
+
+    async def test_request_after_interval_flushes_immediately(self):
+        scheduler, clock, flushed, _ = make_scheduler(min_interval=10)
+        await scheduler.request("PLAYING")
+        clock.now += 10
+        await scheduler.request("PLAYING")
+        assert len(flushed) == 2
+
+    async def test_phase_change_bypasses_rate_cap(self):
+        scheduler, _clock, flushed, phase = make_scheduler(min_interval=10)
+        await scheduler.request("PLAYING")
+        phase["value"] = "REVEAL"
+        await scheduler.request("REVEAL")
+        assert flushed == ["PLAYING", "REVEAL"]
+
+    async def test_direct_broadcast_cancels_trailing_flush(self):
+        scheduler, _clock, flushed, _ = make_scheduler()
+        await scheduler.request("PLAYING")
+        await scheduler.request("PLAYING")
+        assert scheduler.pending
+
+        scheduler.mark_flushed("PLAYING")
+        await asyncio.sleep(0.05)
+
+        assert len(flushed) == 1
+        assert scheduler.coalesced == 1
+
+    async def test_cancel(self):
+        scheduler, _clock, flushed, _ = make_scheduler()
+        await scheduler.request("PLAYING")
+        await scheduler.request("PLAYING")
+        scheduler.cancel()
+        await asyncio.sleep(0.05)
+        assert len(flushed) == 1
+
+
+class TestHandlerRequests:
+    async def test_submit_storm_is_rate_capped(self):
+        handler, game, sockets = make_game_handler(players=3)
+        handler.state_scheduler.min_interval = 0.02
+        await handler.request_state_broadcast()
+        for name in ("P0", "P1", "P2"):
+            game.players[name].connected = False
+            await handler.request_state_broadcast()
+        await handler.drain_outbound()
+
+        assert len(sockets[0].sent) == 1
+        await asyncio.sleep(0.05)
+        await handler.drain_outbound()
+
+        assert len(sockets[0].sent) == 2
+        assert handler.state_scheduler.coalesced == 2
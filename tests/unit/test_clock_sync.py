@@ -0,0 +1,85 @@
+"""Tests for the clock sync exchange (custom_components/beatify/server/clock_sync.py)."""
+
+from __future__ import annotations
+
+import json
+import time
+
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from custom_components.beatify.server.clock_sync import ClockSync, sync_reply
+from custom_components.beatify.server.ratelimit import message_class
+from tests.unit.test_websocket import FakeWebSocket, make_game_handler
+
+
+class TestSyncReply:
+    def test_reply_echoes_t0_with_server_times(self):
+        reply = sync_reply({"type": "time_sync", "t0": 1000}, 12.3456, 12.5)
+        assert reply == {"type": "time_sync", "t0": 1000, "t1": 12345, "t2": 12500}
+
+    def test_missing_or_bad_t0_ignored(self):
+        assert sync_reply({"type": "time_sync"}, 1.0, 1.0) is None
+        assert sync_reply({"type": "time_sync", "t0": "1000"}, 1.0, 1.0) is None
+        assert sync_reply({"type": "time_sync", "t0": True}, 1.0, 1.0) is None
+
+    def test_time_sync_has_own_rate_limit_class(self):
+        assert message_class("time_sync") == "sync"
+
+
+class TestClockSync:
+    def test_reports_build_distribution(self):
+        sync = ClockSync()
+        a, b = FakeWebSocket(), FakeWebSocket()
+
+        sync.handle(a, {"t0": 1, "offset": 5, "rtt": 40}, 1.0, 1.0)
+        sync.handle(a, {"t0": 2, "offset": -7, "rtt": 30}, 1.0, 1.0)
+        sync.handle(b, {"t0": 3, "offset": 90000, "rtt": 120}, 1.0, 1.0)
+        # First request of a burst carries no estimate yet
+        sync.handle(b, {"t0": 4}, 1.0, 1.0)
+
+        assert sync.reports == 3
+        assert sync.clients[a] == (-7.0, 30.0)
+        assert sync.max_skew_ms == 90000
+        dist = sync.distribution()
+        assert dist["<=10ms"] == 2
+        assert dist[">30000ms"] == 1
+        assert sum(dist.values()) == 3
+
+        sync.forget(a)
+        assert list(sync.clients) == [b]
+
+
+class TestHandlerClockSync:
+    async def test_time_sync_answered_and_reported_without_game(self):
+        handler, game, sockets = make_game_handler(players=1)
+        game.game_id = None
+
+        await handler._handle_message(
+            sockets[0], {"type": "time_sync", "t0": 1, "offset": 2500, "rtt": 80}, 100.0
+        )
+        await handler.drain_outbound()
+
+        reply = json.loads(sockets[0].sent[-1])
+        assert reply == {"type": "time_sync", "t0": 1, "t1": 100000, "t2": reply["t2"]}
+        assert reply["t2"] >= reply["t1"]
+        clock = handler.diagnostics()["clock_sync"]
+        assert clock["reports"] == 1
+        assert clock["players"] == {"P0": {"offset_ms": 2500.0, "rtt_ms": 80.0}}
+
+    async def test_spectators_can_sync(self):
+        handler, _game, _sockets = make_game_handler(players=0)
+        app = web.Application()
+        app.router.add_get("/spectate", handler.spectators.handle)
+
+        async with (
+            TestClient(TestServer(app)) as client,
+            client.ws_connect("/spectate") as ws,
+        ):
+            await ws.send_json({"type": "time_sync", "t0": 42})
+            reply = await ws.receive_json(timeout=2)
+            while reply["type"] != "time_sync":
+                reply = await ws.receive_json(timeout=2)
+
+        assert reply["t0"] == 42
+        assert abs(reply["t1"] - time.time() * 1000) < 5000
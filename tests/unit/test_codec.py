@@ -0,0 +1,105 @@
+"""Tests for the JSON codec (custom_components/beatify/server/codec.py)."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from custom_components.beatify.server import codec
+from tests.conftest import make_game_state, make_songs
+
+SAMPLES = [
+    {"type": "state", "phase": "END", "players": [{"name": "Zoë", "score": 12}]},
+    {"emoji": "🔥😂", "text": 'line\nbreak "quoted" \\ slash', "ctrl": "\x00\x1f"},
+    {
+        "ints": [0, -1, 2**53, 2**63 - 1],
+        "floats": [0.1, 1.5, -2.25, 1e-7],
+        "none": None,
+    },
+    {"bools": [True, False], "nested": {"a": {"b": {"c": []}}}, "empty": {}},
+    {1985: "int key", "1990s": 3},
+    [1, "two", 3.0, None],
+    "bare string",
+]
+
+
+class TestStdlibFallback:
+    @pytest.mark.parametrize("value", SAMPLES)
+    def test_round_trip(self, value):
+        expected = json.loads(json.dumps(value))
+        assert codec._stdlib_loads(codec._stdlib_dumps(value)) == expected
+
+
+class TestFastBackendMatchesStdlib:
+    @pytest.fixture(autouse=True)
+    def _require_orjson(self):
+        pytest.importorskip("orjson")
+
+    @pytest.mark.parametrize("value", SAMPLES)
+    def test_dumps_decodes_identically(self, value):
+        assert json.loads(codec._orjson_dumps(value)) == json.loads(json.dumps(value))
+
+    @pytest.mark.parametrize("value", SAMPLES)
+    def test_loads_matches_stdlib(self, value):
+        encoded = json.dumps(value)
+        assert codec._orjson_loads(encoded) == json.loads(encoded)
+        assert codec._orjson_loads(encoded.encode()) == json.loads(encoded)
+
+    def test_big_int_falls_back(self):
+        assert json.loads(codec._orjson_dumps({"n": 2**70})) == {"n": 2**70}
+
+    def test_unserializable_raises_type_error_like_stdlib(self):
+        with pytest.raises(TypeError):
+            codec._orjson_dumps({"obj": object()})
+
+    def test_nan_literal_accepted_like_stdlib(self):
+        assert (
+            codec._orjson_loads('{"a": NaN}')["a"]
+            != codec._orjson_loads('{"a": NaN}')["a"]
+        )
+
+    def test_invalid_json_raises_value_error(self):
+        with pytest.raises(ValueError):
+            codec._orjson_loads("{not json")
+
+    def test_full_game_state_matches(self):
+        state = make_game_state()
+        state.create_game(
+            playlists=["test.json"],
+            songs=make_songs(3),
+            media_player="media_player.test",
+            base_url="http://localhost:8123",
+        )
+        state.add_player("Zoë", None)
+        snapshot = state.get_state()
+        assert json.loads(codec._orjson_dumps(snapshot)) == json.loads(
+            json.dumps(snapshot)
+        )
+
+
+class TestMsgpack:
+    @pytest.fixture(autouse=True)
+    def _require_msgpack(self):
+        pytest.importorskip("msgpack")
+
+    @pytest.mark.parametrize(
+        "value", [v for v in SAMPLES if not isinstance(v, dict) or 1985 not in v]
+    )
+    def test_round_trip_matches_json_schema(self, value):
+        assert codec.msgpack_loads(codec.msgpack_dumps(value)) == json.loads(
+            json.dumps(value)
+        )
+
+    def test_strings_decode_as_text(self):
+        assert codec.msgpack_loads(codec.msgpack_dumps({"name": "Zoë"})) == {
+            "name": "Zoë"
+        }
+
+    def test_invalid_data_raises_value_error(self):
+        with pytest.raises(ValueError):
+            codec.msgpack_loads(b"\xc1")
+
+
+def test_backend_reported():
+    assert codec.JSON_BACKEND in ("orjson", "json")
@@ -0,0 +1,139 @@
+"""Tests for WebSocket handler metrics (custom_components/beatify/server/dispatch.py)."""
+
+from __future__ import annotations
+
+import logging
+
+import pytest
+
+from custom_components.beatify.server.dispatch import (
+    LATENCY_BUCKETS_MS,
+    HandlerMetrics,
+    HandlerStats,
+)
+from tests.unit.test_websocket import make_game_handler
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def timed_handler(clock: FakeClock, seconds: float):
+    async def handler(*_args) -> None:
+        clock.now += seconds
+
+    return handler
+
+
+class TestHandlerStats:
+    def test_bucket_placement(self):
+        stats = HandlerStats()
+        stats.record(0.5)
+        stats.record(5)
+        stats.record(7)
+        stats.record(60_000)
+
+        histogram = stats.as_dict()["histogram"]
+        assert histogram["le_1"] == 1
+        assert histogram["le_5"] == 1
+        assert histogram["le_10"] == 1
+        assert histogram["overflow"] == 1
+        assert sum(histogram.values()) == 4
+        assert len(histogram) == len(LATENCY_BUCKETS_MS) + 1
+
+    def test_percentiles(self):
+        stats = HandlerStats()
+        for _ in range(98):
+            stats.record(3)
+        stats.record(400)
+        stats.record(8000)
+
+        assert stats.percentile(0.5) == 5
+        assert stats.percentile(0.99) == 500
+        assert stats.percentile(1.0) == 8000
+
+    def test_empty(self):
+        stats = HandlerStats()
+        assert stats.percentile(0.5) is None
+        assert stats.as_dict()["avg_ms"] is None
+
+
+class TestHandlerMetrics:
+    async def test_records_calls_and_latency(self):
+        clock = FakeClock()
+        metrics = HandlerMetrics(time_fn=clock)
+
+        await metrics.run("submit", timed_handler(clock, 0.02))
+        await metrics.run("submit", timed_handler(clock, 0.04))
+
+        stats = metrics.as_dict()["submit"]
+        assert stats["calls"] == 2
+        assert stats["errors"] == 0
+        assert stats["avg_ms"] == pytest.approx(30)
+        assert stats["max_ms"] == pytest.approx(40)
+
+    async def test_errors_counted_and_reraised(self):
+        metrics = HandlerMetrics()
+
+        async def broken(*_args) -> None:
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            await metrics.run("join", broken)
+
+        assert metrics.handlers["join"].calls == 1
+        assert metrics.handlers["join"].errors == 1
+
+    async def test_slow_handler_logged(self, caplog):
+        clock = FakeClock()
+        metrics = HandlerMetrics(time_fn=clock)
+
+        with caplog.at_level(logging.WARNING):
+            await metrics.run("admin.start_game", timed_handler(clock, 24))
+
+        assert "admin.start_game" in caplog.text
+        assert metrics.handlers["admin.start_game"].buckets[-2] == 1
+
+
+class TestHandlerDispatch:
+    async def test_message_types_timed(self):
+        handler, _game, sockets = make_game_handler(players=1)
+
+        await handler._handle_message(sockets[0], {"type": "get_state"})
+
+        assert handler.handler_metrics.handlers["get_state"].calls == 1
+
+    async def test_admin_actions_timed_separately(self):
+        handler, game, sockets = make_game_handler(players=1)
+        game.players["P0"].is_admin = True
+
+        await handler._handle_message(
+            sockets[0], {"type": "admin", "action": "set_language", "language": "de"}
+        )
+
+        assert game.language == "de"
+        assert handler.handler_metrics.handlers["admin"].calls == 1
+        assert handler.handler_metrics.handlers["admin.set_language"].calls == 1
+
+    async def test_unknown_types_not_recorded(self):
+        handler, game, sockets = make_game_handler(players=1)
+        game.players["P0"].is_admin = True
+
+        await handler._handle_message(sockets[0], {"type": "bogus"})
+        await handler._handle_message(sockets[0], {"type": "admin", "action": "bogus"})
+
+        assert set(handler.handler_metrics.handlers) == {"admin"}
+
+    async def test_diagnostics(self):
+        handler, _game, sockets = make_game_handler(players=1)
+        await handler._handle_message(sockets[0], {"type": "get_state"})
+
+        diagnostics = handler.diagnostics()
+
+        assert diagnostics["connections"] == 1
+        assert diagnostics["handlers"]["get_state"]["calls"] == 1
+        assert diagnostics["outbound"]["send_failures"] == 0
@@ -0,0 +1,181 @@
+"""Tests for reconnect replay (custom_components/beatify/server/event_log.py)."""
+
+from __future__ import annotations
+
+import json
+
+from custom_components.beatify.server.event_log import EventLog
+from tests.unit.test_websocket import FakeWebSocket, make_game_handler
+
+
+class TestEventLog:
+    def test_events_stamped_and_replayed_after_seq(self):
+        log = EventLog()
+        log.bind("game-1")
+        first = log.append({"type": "song_stopped"})
+        log.append({"type": "volume_changed"})
+
+        assert first == {"type": "song_stopped", "seq": 1}
+        assert [e["type"] for e in log.since(1)] == ["volume_changed"]
+        assert log.since(2) == []
+        assert log.since(0) is None  # nothing was ever sent before seq 1
+        assert log.since(3) is None  # from the future
+        assert log.since("1") is None
+
+    def test_gap_beyond_buffer_needs_snapshot(self):
+        log = EventLog(size=3)
+        log.bind("game-1")
+        for _ in range(5):
+            log.append({"type": "tick"})
+
+        assert log.since(1) is None
+        assert [e["seq"] for e in log.since(2)] == [3, 4, 5]
+
+    def test_new_game_empties_log(self):
+        log = EventLog()
+        log.bind("game-1")
+        log.append({"type": "tick"})
+        log.bind("game-2")
+        log.append({"type": "tick"})
+
+        assert log.since(1) is None
+        assert log.since(2) == []
+
+    def test_state_versions_logged_as_chained_patches(self):
+        log = EventLog()
+        ops = [["set", ["phase"], "PLAYING"]]
+        first = log.append_state(1, None)
+        second = log.append_state(2, ops)
+        # Base no longer retained: logged as a bare marker
+        third = log.append_state(3, None)
+
+        assert log.since(first) == [
+            {"type": "state_patch", "base": 1, "version": 2, "ops": ops, "seq": second},
+            {"type": "state", "version": 3, "seq": third},
+        ]
+
+
+async def disconnect_and_miss_events(handler, game, ws):
+    """Drop P0, then push a state change and a song_stopped it misses."""
+    game.players["P0"].connected = False
+    handler.connections.discard(ws)
+    await handler.broadcast_state()
+    await handler.broadcast({"type": "song_stopped"})
+    await handler.drain_outbound()
+
+
+class TestReconnectReplay:
+    async def test_patch_client_gets_only_missed_events(self):
+        handler, game, (ws, _other) = make_game_handler()
+        await handler.broadcast_state()
+        await handler.drain_outbound()
+        seen = json.loads(ws.sent[-1])
+        await disconnect_and_miss_events(handler, game, ws)
+
+        new_ws = FakeWebSocket()
+        handler.connections.add(new_ws)
+        await handler._handle_message(
+            new_ws,
+            {
+                "type": "reconnect",
+                "session_id": game.players["P0"].session_id,
+                "last_seq": seen["seq"],
+                "state_version": seen["version"],
+            },
+        )
+        handler.state_scheduler.cancel()
+        await handler.drain_outbound()
+
+        replies = [json.loads(frame) for frame in new_ws.sent]
+        assert [r["type"] for r in replies] == [
+            "reconnect_ack",
+            "state_patch",
+            "song_stopped",
+        ]
+        assert replies[0]["replay"] is True
+        assert [r["seq"] for r in replies[1:]] == [seen["seq"] + 1, seen["seq"] + 2]
+        assert handler._state_acks[new_ws] == replies[1]["version"]
+        assert handler.replay_snapshots == 0
+
+    async def test_legacy_client_gets_events_then_one_snapshot(self):
+        handler, game, (ws, _other) = make_game_handler()
+        await handler.broadcast_state()
+        await handler.drain_outbound()
+        seen = json.loads(ws.sent[-1])
+        await disconnect_and_miss_events(handler, game, ws)
+
+        new_ws = FakeWebSocket()
+        await handler._handle_message(
+            new_ws,
+            {
+                "type": "reconnect",
+                "session_id": game.players["P0"].session_id,
+                "last_seq": seen["seq"],
+            },
+        )
+        handler.state_scheduler.cancel()
+        await handler.drain_outbound()
+
+        replies = [json.loads(frame) for frame in new_ws.sent]
+        assert [r["type"] for r in replies] == [
+            "reconnect_ack",
+            "song_stopped",
+            "state",
+        ]
+        assert replies[-1]["seq"] == handler._event_log.seq
+        assert handler.replay_snapshots == 1
+
+    async def test_nothing_missed_sends_no_state(self):
+        handler, game, (ws, _other) = make_game_handler()
+        await handler.broadcast({"type": "song_stopped"})
+        await handler.drain_outbound()
+        seen = json.loads(ws.sent[-1])["seq"]
+        game.players["P0"].connected = False
+
+        new_ws = FakeWebSocket()
+        session_id = game.players["P0"].session_id
+        await handler._handle_message(
+            new_ws, {"type": "reconnect", "session_id": session_id, "last_seq": seen}
+        )
+        handler.state_scheduler.cancel()
+        await handler.drain_outbound()
+
+        assert [json.loads(frame)["type"] for frame in new_ws.sent] == ["reconnect_ack"]
+
+    async def test_unknown_seq_falls_back_to_snapshot(self):
+        handler, game, (_ws, _other) = make_game_handler()
+        game.players["P0"].connected = False
+
+        new_ws = FakeWebSocket()
+        session_id = game.players["P0"].session_id
+        await handler._handle_message(
+            new_ws, {"type": "reconnect", "session_id": session_id, "last_seq": 99}
+        )
+        handler.state_scheduler.cancel()
+        await handler.drain_outbound()
+
+        replies = [json.loads(frame) for frame in new_ws.sent]
+        assert [r["type"] for r in replies] == ["reconnect_ack", "state"]
+        assert replies[0]["replay"] is False
+
+    async def test_takeover_before_drop_skips_state_broadcast(self):
+        handler, game, (ws, _other) = make_game_handler()
+        requests = handler.state_scheduler.requests
+
+        new_ws = FakeWebSocket()
+        session_id = game.players["P0"].session_id
+        await handler._handle_message(
+            new_ws, {"type": "reconnect", "session_id": session_id}
+        )
+        await handler.drain_outbound()
+
+        assert ws.closed
+        assert handler.state_scheduler.requests == requests
+
+    async def test_reactions_not_logged(self):
+        handler, _game, _sockets = make_game_handler()
+        await handler.broadcast(
+            {"type": "player_reaction", "player_name": "P1", "emoji": "🔥"}
+        )
+
+        assert len(handler._event_log) == 0
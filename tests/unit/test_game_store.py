@@ -0,0 +1,362 @@
+"""Tests for crash-safe game persistence (custom_components/beatify/services/game_store.py)."""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.beatify.game.player import PlayerSession
+from custom_components.beatify.game.state import GamePhase, GameState
+from custom_components.beatify.services.game_store import (
+    OP_GUESS,
+    OP_JOIN,
+    OP_STEAL,
+    RESTORE_BUDGET_SECONDS,
+    SNAPSHOT_FILE,
+    WAL_FILE,
+    GameStore,
+)
+from tests.conftest import make_game_state, make_player, make_songs
+
+
+def _make_hass(tmp_path):
+    async def async_add_executor_job(func, *args):
+        return func(*args)
+
+    return SimpleNamespace(
+        config=SimpleNamespace(path=lambda *parts: str(tmp_path.joinpath(*parts))),
+        async_add_executor_job=async_add_executor_job,
+    )
+
+
+def _create_game(state: GameState, players: int = 3) -> None:
+    state.create_game(
+        playlists=["test.json"],
+        songs=make_songs(5),
+        media_player="",  # no media player: rounds start without playback
+        base_url="http://localhost:8123",
+    )
+    for i in range(players):
+        name = f"P{i}"
+        state.players[name] = make_player(name, score=10 * i)
+    state.set_admin("P0")
+
+
+@pytest.fixture
+def hass(tmp_path):
+    return _make_hass(tmp_path)
+
+
+async def _restore(hass) -> tuple[GameState, GameStore, bool]:
+    state = make_game_state()
+    store = GameStore(hass)
+    restored = await store.async_restore(state)
+    return state, store, restored
+
+
+class TestSnapshotRoundTrip:
+    async def test_restores_mid_round_game_paused(self, hass):
+        state = make_game_state()
+        _create_game(state)
+        await state.start_round(hass)
+        state.cancel_timer()
+        store = GameStore(hass)
+        store.note_state(state)
+        await store.async_flush()
+
+        restored_state, _, restored = await _restore(hass)
+
+        assert restored
+        assert restored_state.game_id == state.game_id
+        assert restored_state.round == 1
+        assert restored_state.phase == GamePhase.PAUSED
+        assert restored_state._previous_phase == GamePhase.PLAYING
+        assert restored_state.pause_reason == "admin_disconnected"
+        assert restored_state.disconnected_admin_name == "P0"
+        assert restored_state.current_song == state.current_song
+        assert restored_state.deadline == state.deadline
+        assert (
+            restored_state._playlist_manager.played_uris
+            == state._playlist_manager.played_uris
+        )
+        assert restored_state._playlist_manager.get_remaining_count() == 4
+
+    async def test_players_reclaim_seats_by_session_id(self, hass):
+        state = make_game_state()
+        _create_game(state)
+        state.players["P2"].streak = 3
+        store = GameStore(hass)
+        store.note_state(state)
+        await store.async_flush()
+
+        restored_state, _, _ = await _restore(hass)
+
+        for name, player in state.players.items():
+            restored_player = restored_state.get_player_by_session_id(player.session_id)
+            assert restored_player is not None
+            assert restored_player.name == name
+            assert restored_player.score == player.score
+            assert not restored_player.connected
+        assert restored_state.players["P2"].streak == 3
+        assert restored_state.players.admin.name == "P0"
+
+    async def test_highlights_survive_restore(self, hass):
+        state = make_game_state()
+        _create_game(state)
+        state.highlights_tracker.record_exact_match("P1", "Song 0", 1980, 1)
+        store = GameStore(hass)
+        store.note_state(state)
+        await store.async_flush()
+
+        restored_state, _, _ = await _restore(hass)
+
+        assert (
+            restored_state.highlights_tracker.to_dict()
+            == state.highlights_tracker.to_dict()
+        )
+
+    async def test_no_stored_game(self, hass):
+        state, _, restored = await _restore(hass)
+        assert not restored
+        assert state.game_id is None
+
+    async def test_corrupt_snapshot_is_discarded(self, hass, tmp_path):
+        state = make_game_state()
+        _create_game(state)
+        store = GameStore(hass)
+        store.note_state(state)
+        await store.async_flush()
+        (tmp_path / "beatify" / "game" / SNAPSHOT_FILE).write_text("{not json")
+
+        restored_state, _, restored = await _restore(hass)
+
+        assert not restored
+        assert restored_state.game_id is None
+        assert not (tmp_path / "beatify" / "game" / SNAPSHOT_FILE).exists()
+
+
+class TestWriteAheadLog:
+    async def _playing_game(
+        self, hass, steal_for: str | None = None
+    ) -> tuple[GameState, GameStore]:
+        state = make_game_state()
+        _create_game(state)
+        await state.start_round(hass)
+        state.cancel_timer()
+        if steal_for:
+            state.players[steal_for].steal_available = True
+        store = GameStore(hass)
+        store.note_state(state)
+        await store.async_flush()
+        return state, store
+
+    async def test_submissions_are_replayed(self, hass):
+        state, store = await self._playing_game(hass)
+        started = state.round_start_time
+        store.append(
+            OP_GUESS, "P1", year=1984, time=started + 2.0, latency=0.05, bet=True
+        )
+        await store.async_flush()
+
+        restored_state, _, _ = await _restore(hass)
+
+        player = restored_state.players["P1"]
+        assert player.submitted
+        assert player.current_guess == 1984
+        assert player.submission_time == started + 2.0
+        assert player.submission_latency == 0.05
+        assert player.bet
+        assert not restored_state.players["P2"].submitted
+
+    async def test_steal_is_replayed_with_logged_time(self, hass):
+        state, store = await self._playing_game(hass, steal_for="P2")
+        started = state.round_start_time
+        store.append(
+            OP_GUESS, "P1", year=1990, time=started + 1.0, latency=0.0, bet=False
+        )
+        store.append(OP_STEAL, "P2", target="P1", time=started + 3.0)
+        await store.async_flush()
+
+        restored_state, _, _ = await _restore(hass)
+
+        stealer = restored_state.players["P2"]
+        assert stealer.submitted
+        assert stealer.current_guess == 1990
+        assert stealer.submission_time == started + 3.0
+        assert stealer.steal_used
+
+    async def test_late_joiner_is_replayed(self, hass):
+        _state, store = await self._playing_game(hass)
+        joiner = PlayerSession(name="Late", ws=None, score=5, joined_late=True)
+        store.append(OP_JOIN, "Late", session=joiner.to_snapshot())
+        await store.async_flush()
+
+        restored_state, _, _ = await _restore(hass)
+
+        restored = restored_state.get_player_by_session_id(joiner.session_id)
+        assert restored is not None
+        assert restored.score == 5
+        assert restored.joined_late
+
+    async def test_new_snapshot_truncates_log(self, hass, tmp_path):
+        state, store = await self._playing_game(hass)
+        store.append(
+            OP_GUESS,
+            "P1",
+            year=1984,
+            time=state.round_start_time,
+            latency=0.0,
+            bet=False,
+        )
+        await store.async_flush()
+        wal = tmp_path / "beatify" / "game" / WAL_FILE
+        assert wal.read_text().count("\n") == 1
+
+        await state.end_round()
+        store.note_state(state)
+        await store.async_flush()
+
+        assert wal.read_text() == ""
+        assert store.snapshots_written == 2
+        assert store.records_written == 1
+
+    async def test_records_of_older_snapshot_are_ignored(self, hass, tmp_path):
+        state, _store = await self._playing_game(hass)
+        wal = tmp_path / "beatify" / "game" / WAL_FILE
+        # A crash between the snapshot rename and the log truncation leaves
+        # records tagged with the previous snapshot's sequence number
+        record = {
+            "seq": 0,
+            "op": OP_GUESS,
+            "player": "P1",
+            "year": 1984,
+            "time": state.round_start_time,
+            "latency": 0.0,
+            "bet": False,
+        }
+        wal.write_text(json.dumps(record) + "\n")
+
+        restored_state, _, _ = await _restore(hass)
+
+        assert not restored_state.players["P1"].submitted
+
+    async def test_torn_final_record_is_ignored(self, hass, tmp_path):
+        state, store = await self._playing_game(hass)
+        started = state.round_start_time
+        store.append(OP_GUESS, "P1", year=1984, time=started, latency=0.0, bet=False)
+        await store.async_flush()
+        wal = tmp_path / "beatify" / "game" / WAL_FILE
+        wal.write_text(wal.read_text() + '{"seq": 1, "op": "gu')
+
+        restored_state, _, _ = await _restore(hass)
+
+        assert restored_state.players["P1"].submitted
+
+    async def test_unchanged_phase_writes_nothing(self, hass):
+        state, store = await self._playing_game(hass)
+        for _ in range(10):
+            store.note_state(state)
+        await store.async_flush()
+        assert store.snapshots_written == 1
+
+
+class TestWriteFailure:
+    async def _failing_store(self, hass, tmp_path) -> tuple[GameState, GameStore]:
+        """Store a playing game, then point the store at an unwritable path."""
+        state = make_game_state()
+        _create_game(state)
+        await state.start_round(hass)
+        state.cancel_timer()
+        store = GameStore(hass)
+        store.note_state(state)
+        await store.async_flush()
+        # A file where the directory should be: every write raises OSError
+        (tmp_path / "blocked").write_text("")
+        store._dir = tmp_path / "blocked" / "game"
+        return state, store
+
+    async def test_failed_batch_is_retried(self, hass, tmp_path):
+        state, store = await self._failing_store(hass, tmp_path)
+        started = state.round_start_time
+        store.append(OP_GUESS, "P1", year=1984, time=started, latency=0.0, bet=False)
+        await store.async_flush()
+        assert store.write_failures == 1
+
+        store._dir = tmp_path / "beatify" / "game"
+        store.append(OP_GUESS, "P2", year=1990, time=started, latency=0.0, bet=False)
+        await store.async_flush()
+
+        assert store.records_written == 2
+        restored_state, _, _ = await _restore(hass)
+        assert restored_state.players["P1"].current_guess == 1984
+        assert restored_state.players["P2"].current_guess == 1990
+
+    async def test_newer_snapshot_supersedes_failed_batch(self, hass, tmp_path):
+        state, store = await self._failing_store(hass, tmp_path)
+        started = state.round_start_time
+        store.append(OP_GUESS, "P1", year=1984, time=started, latency=0.0, bet=False)
+        await store.async_flush()
+
+        store._dir = tmp_path / "beatify" / "game"
+        await state.end_round()
+        store.note_state(state)
+        await store.async_flush()
+
+        assert store.snapshots_written == 2
+        assert (tmp_path / "beatify" / "game" / WAL_FILE).read_text() == ""
+
+
+class TestGameEnd:
+    async def test_ended_game_clears_store(self, hass, tmp_path):
+        state = make_game_state()
+        _create_game(state)
+        store = GameStore(hass)
+        store.note_state(state)
+        await store.async_flush()
+        assert (tmp_path / "beatify" / "game" / SNAPSHOT_FILE).exists()
+
+        state.end_game()
+        store.note_state(state)
+        await store.async_flush()
+
+        assert not (tmp_path / "beatify" / "game" / SNAPSHOT_FILE).exists()
+        _, _, restored = await _restore(hass)
+        assert not restored
+
+
+class TestRestoreTime:
+    async def test_large_room_restores_within_budget(self, hass):
+        state = make_game_state()
+        state.create_game(
+            playlists=["test.json"],
+            songs=make_songs(500),
+            media_player="",
+            base_url="http://localhost:8123",
+            large_room=True,
+        )
+        for i in range(500):
+            name = f"Player {i}"
+            state.players[name] = make_player(name, score=i, round_scores=[i] * 20)
+        await state.start_round(hass)
+        state.cancel_timer()
+        store = GameStore(hass)
+        store.note_state(state)
+        for i in range(500):
+            store.append(
+                OP_GUESS,
+                f"Player {i}",
+                year=1990,
+                time=state.round_start_time,
+                latency=0.0,
+                bet=False,
+            )
+        await store.async_flush()
+
+        restored_state, restored_store, restored = await _restore(hass)
+
+        assert restored
+        assert len(restored_state.players) == 500
+        assert all(player.submitted for player in restored_state.players.values())
+        assert restored_store.last_restore_seconds < RESTORE_BUDGET_SECONDS
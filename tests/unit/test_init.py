@@ -0,0 +1,104 @@
+"""Tests for integration setup and unload (custom_components/beatify/__init__.py)."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import ExitStack
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from custom_components import beatify
+from custom_components.beatify.const import DOMAIN
+from tests.conftest import make_songs
+
+
+@pytest.fixture
+async def hass(tmp_path):
+    async def async_add_executor_job(func, *args):
+        return func(*args)
+
+    hass = MagicMock()
+    hass.data = {}
+    hass.loop = asyncio.get_running_loop()
+    hass.config.path = lambda *parts: str(tmp_path.joinpath(*parts))
+    hass.async_add_executor_job = async_add_executor_job
+    hass.http.app = web.Application()
+    return hass
+
+
+@pytest.fixture(autouse=True)
+def _no_discovery(tmp_path):
+    services = MagicMock()
+    services.return_value.load = AsyncMock()
+    with ExitStack() as stack:
+        for name, value in (
+            ("async_ensure_playlist_directory", AsyncMock(return_value=tmp_path)),
+            ("async_get_media_players", AsyncMock(return_value=[])),
+            ("async_discover_playlists", AsyncMock(return_value=[])),
+            ("async_register_static_paths", AsyncMock()),
+            ("StatsService", services),
+            ("AnalyticsStorage", services),
+        ):
+            stack.enter_context(patch.object(beatify, name, value))
+        # HTTP views subclass the stubbed HomeAssistantView
+        for name in dir(beatify):
+            if name.endswith("View"):
+                stack.enter_context(patch.object(beatify, name, MagicMock()))
+        yield
+
+
+def _entry(workers: bool = False) -> SimpleNamespace:
+    return SimpleNamespace(
+        entry_id="entry",
+        options={"room_workers": workers},
+        async_on_unload=MagicMock(),
+        add_update_listener=MagicMock(),
+    )
+
+
+class TestReload:
+    @pytest.mark.parametrize("workers", [False, True])
+    async def test_players_reach_the_reloaded_rooms(self, hass, workers):
+        entry = _entry(workers)
+        await beatify.async_setup_entry(hass, entry)
+        await beatify.async_unload_entry(hass, entry)
+        await beatify.async_setup_entry(hass, entry)
+        rooms = hass.data[DOMAIN]["rooms"]
+        room = rooms.default
+        await room.ws_handler.run_in_room(
+            room.game.create_game,
+            ["test.json"],
+            make_songs(3),
+            "",
+            "http://localhost:8123",
+        )
+        rooms.bind(room)
+
+        try:
+            async with (
+                TestClient(TestServer(hass.http.app)) as client,
+                client.ws_connect(f"/beatify/ws?game={room.game.game_id}") as ws,
+            ):
+                await ws.send_json({"type": "join", "name": "Alice"})
+                messages = [await ws.receive_json() for _ in range(2)]
+
+            assert {m["type"] for m in messages} >= {"join_ack"}
+            assert "Alice" in room.game.players
+            paths = [r.canonical for r in hass.http.app.router.resources()]
+            assert paths.count("/beatify/ws") == 1
+        finally:
+            await beatify.async_unload_entry(hass, entry)
+
+    async def test_unloaded_integration_answers_not_found(self, hass):
+        entry = _entry()
+        await beatify.async_setup_entry(hass, entry)
+        await beatify.async_unload_entry(hass, entry)
+
+        async with TestClient(TestServer(hass.http.app)) as client:
+            response = await client.get("/beatify/ws")
+
+        assert response.status == 404
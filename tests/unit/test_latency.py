@@ -0,0 +1,108 @@
+"""Tests for RTT tracking (custom_components/beatify/server/latency.py)."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from custom_components.beatify.game.state import GamePhase
+from custom_components.beatify.server.latency import MAX_PENDING_PINGS, LatencyTracker
+from tests.unit.test_websocket import make_game_handler
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLatencyTracker:
+    def test_first_sample_sets_estimate(self):
+        clock = FakeClock()
+        tracker = LatencyTracker(time_fn=clock)
+        assert tracker.one_way == 0.0
+
+        ping = tracker.ping()
+        clock.now += 0.2
+        assert tracker.pong(ping["id"]) == pytest.approx(0.2)
+        assert tracker.rtt == pytest.approx(0.2)
+        assert tracker.one_way == pytest.approx(0.1)
+
+    def test_samples_are_smoothed(self):
+        clock = FakeClock()
+        tracker = LatencyTracker(time_fn=clock)
+        for rtt in (0.1, 0.9):
+            ping = tracker.ping()
+            clock.now += rtt
+            tracker.pong(ping["id"])
+
+        assert tracker.rtt == pytest.approx(0.1 + 0.125 * 0.8)
+        assert tracker.as_dict() == {
+            "rtt_ms": 200.0,
+            "last_ms": 900.0,
+            "min_ms": 100.0,
+            "max_ms": 900.0,
+            "samples": 2,
+        }
+
+    def test_unknown_duplicate_and_stale_pongs_ignored(self):
+        tracker = LatencyTracker(time_fn=FakeClock())
+        first = tracker.ping()
+        for _ in range(MAX_PENDING_PINGS):
+            tracker.ping()
+
+        assert tracker.pong(first["id"]) is None
+        assert tracker.pong("1") is None
+        assert tracker.pong(999) is None
+        assert tracker.pong(first["id"] + 1) is not None
+        assert tracker.pong(first["id"] + 1) is None
+        assert tracker.samples == 1
+
+
+class TestHandlerLatency:
+    async def test_ping_pong_recorded_per_player(self):
+        handler, _game, sockets = make_game_handler(players=1)
+        tracker = handler._latency_tracker(sockets[0])
+
+        await handler._send(sockets[0], tracker.ping())
+        await handler.drain_outbound()
+        ping = json.loads(sockets[0].sent[-1])
+        assert ping["type"] == "ping"
+
+        await handler._handle_message(sockets[0], {"type": "pong", "id": ping["id"]})
+        latency = handler.diagnostics()["latency"]
+        assert latency["compensation"] is False
+        assert latency["players"]["P0"]["samples"] == 1
+        assert "pong" not in handler.handler_metrics.handlers
+
+    async def test_pong_without_game_is_not_an_error(self):
+        handler, game, sockets = make_game_handler(players=1)
+        game.game_id = None
+        tracker = handler._latency_tracker(sockets[0])
+        ping = tracker.ping()
+
+        await handler._handle_message(sockets[0], {"type": "pong", "id": ping["id"]})
+        await handler.drain_outbound()
+
+        assert sockets[0].sent == []
+        assert tracker.samples == 1
+
+    async def test_submit_uses_arrival_time_and_latency(self):
+        handler, game, sockets = make_game_handler(players=2)
+        game.phase = GamePhase.PLAYING
+        clock = FakeClock()
+        tracker = handler._latency[sockets[0]] = LatencyTracker(time_fn=clock)
+        ping = tracker.ping()
+        clock.now += 0.3
+        tracker.pong(ping["id"])
+
+        await handler._handle_message(
+            sockets[0], {"type": "submit", "year": 1990}, 1234.5
+        )
+
+        player = game.players["P0"]
+        assert player.submission_time == 1234.5
+        assert player.submission_latency == pytest.approx(0.15)
@@ -0,0 +1,159 @@
+"""Tests for per-connection outbound queues (custom_components/beatify/server/outbound.py)."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+from custom_components.beatify.server.outbound import OutboundQueue, OutboundStats
+from tests.unit.test_websocket import FakeWebSocket, make_handler
+
+
+class Recorder:
+    """Collects written frames; can block writes until released."""
+
+    def __init__(self, blocked: bool = False) -> None:
+        self.frames: list[str] = []
+        self.evicted: list[str] = []
+        self.release = asyncio.Event()
+        if not blocked:
+            self.release.set()
+
+    async def write(self, _ws, frame) -> None:
+        await self.release.wait()
+        self.frames.append(frame)
+
+    def on_evict(self, _ws, reason: str) -> None:
+        self.evicted.append(reason)
+
+
+def make_queue(recorder: Recorder, **kwargs) -> tuple[OutboundQueue, OutboundStats]:
+    stats = OutboundStats()
+    return OutboundQueue(
+        object(), recorder.write, recorder.on_evict, stats, **kwargs
+    ), stats
+
+
+class TestOrdering:
+    async def test_priority_lane_first(self):
+        rec = Recorder()
+        queue, _ = make_queue(rec)
+        queue.put("reaction", "player_reaction")
+        queue.put("meta", "metadata_update")
+        queue.put("ack", "submit_ack")
+
+        await queue.join()
+
+        assert rec.frames == ["ack", "reaction", "meta"]
+
+    async def test_fifo_within_lane(self):
+        rec = Recorder()
+        queue, _ = make_queue(rec)
+        for i in range(5):
+            queue.put(f"m{i}", "error")
+
+        await queue.join()
+
+        assert rec.frames == [f"m{i}" for i in range(5)]
+
+
+class TestCoalescing:
+    async def test_superseded_state_replaced(self):
+        rec = Recorder()
+        queue, stats = make_queue(rec)
+        queue.put("state-1", "state")
+        queue.put("game_ended", "game_ended")
+        queue.put("patch-2", "state_patch")
+        queue.put("state-3", "state")
+
+        await queue.join()
+
+        assert rec.frames == ["game_ended", "state-3"]
+        assert stats.coalesced == 2
+
+    async def test_in_flight_state_not_coalesced(self):
+        rec = Recorder(blocked=True)
+        queue, stats = make_queue(rec)
+        queue.put("state-1", "state")
+        await asyncio.sleep(0)  # writer picks up state-1 and blocks
+        queue.put("state-2", "state")
+        rec.release.set()
+
+        await queue.join()
+
+        assert rec.frames == ["state-1", "state-2"]
+        assert stats.coalesced == 0
+
+
+class TestSaturation:
+    async def test_bulk_dropped_before_priority(self):
+        rec = Recorder(blocked=True)
+        queue, stats = make_queue(rec, maxsize=2)
+        queue.put("reaction", "player_reaction")
+        queue.put("ack-1", "submit_ack")
+        assert queue.put("ack-2", "submit_ack") is True
+        rec.release.set()
+
+        await queue.join()
+
+        assert rec.frames == ["ack-1", "ack-2"]
+        assert stats.dropped == 1
+        assert rec.evicted == []
+
+    async def test_full_priority_queue_evicts(self):
+        rec = Recorder(blocked=True)
+        queue, stats = make_queue(rec, maxsize=2)
+        queue.put("a", "error")
+        queue.put("b", "error")
+
+        assert queue.put("c", "error") is False
+        assert queue.closed
+        assert stats.evicted == 1
+        assert rec.evicted == ["outbound queue full"]
+        assert queue.put("d", "error") is False
+
+    async def test_blocked_send_evicts(self):
+        rec = Recorder(blocked=True)
+        queue, stats = make_queue(rec, send_timeout=0.01)
+        queue.put("a", "error")
+
+        await asyncio.sleep(0.05)
+
+        assert stats.evicted == 1
+        assert rec.evicted and "blocked" in rec.evicted[0]
+
+
+class HangingWebSocket(FakeWebSocket):
+    """Socket whose writes never complete."""
+
+    async def send_str(self, data: str) -> None:
+        await asyncio.Event().wait()
+
+
+class TestHandlerIntegration:
+    async def test_slow_socket_does_not_block_broadcast(self):
+        handler = make_handler()
+        slow, fast = HangingWebSocket(), FakeWebSocket()
+        handler.connections.update([slow, fast])
+
+        await asyncio.wait_for(handler.broadcast({"type": "song_stopped"}), 0.1)
+        await handler._queue(fast).join()
+
+        assert len(fast.sent) == 1
+        handler._queue(slow).close()
+
+    async def test_evicted_socket_closed_and_recorded(self):
+        handler = make_handler()
+        analytics = MagicMock()
+        handler.set_analytics(analytics)
+        ws = HangingWebSocket()
+        handler.connections.add(ws)
+        handler._queue(ws)._send_timeout = 0.01
+
+        await handler.broadcast({"type": "game_ended"})
+        await asyncio.sleep(0.05)
+
+        assert ws.closed
+        assert handler.outbound_stats.evicted == 1
+        analytics.record_error.assert_called_once()
+        assert analytics.record_error.call_args.args[0] == "WEBSOCKET_SATURATED"
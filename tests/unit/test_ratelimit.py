@@ -0,0 +1,131 @@
+"""Tests for inbound rate limiting (custom_components/beatify/server/ratelimit.py)."""
+
+from __future__ import annotations
+
+import json
+
+from aiohttp import WSCloseCode, WSMsgType, web
+from aiohttp.test_utils import TestClient, TestServer
+
+from custom_components.beatify.const import WS_MAX_MESSAGE_SIZE
+from custom_components.beatify.server.ratelimit import (
+    FRAME_CLASS,
+    InboundLimiter,
+    TokenBucket,
+    message_class,
+)
+from tests.unit.test_websocket import make_game_handler
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTokenBucket:
+    def test_burst_then_refill(self):
+        bucket = TokenBucket(burst=3, rate=2.0, now=0.0)
+
+        assert [bucket.take(0.0) for _ in range(4)] == [True, True, True, False]
+        assert bucket.rejected_streak == 1
+        assert bucket.take(0.5)
+        assert bucket.rejected_streak == 0
+        assert not bucket.take(0.5)
+
+    def test_refill_capped_at_burst(self):
+        bucket = TokenBucket(burst=2, rate=100.0, now=0.0)
+        bucket.take(0.0)
+        bucket.take(0.0)
+
+        assert [bucket.take(60.0) for _ in range(3)] == [True, True, False]
+
+
+class TestInboundLimiter:
+    def test_classes_have_separate_budgets(self):
+        clock = FakeClock()
+        limiter = InboundLimiter(
+            {"state": (1, 1.0), "default": (2, 1.0)}, time_fn=clock
+        )
+
+        assert limiter.allow(message_class("get_state"))
+        assert not limiter.allow(message_class("get_state"))
+        assert limiter.allow(message_class("submit"))
+        assert limiter.allow(message_class("join"))
+        assert not limiter.allow(message_class("leave"))
+
+        clock.now += 1
+        assert limiter.allow(message_class("get_state"))
+
+    def test_unknown_class_uses_default_limits(self):
+        limiter = InboundLimiter({"default": (1, 1.0)}, time_fn=FakeClock())
+        assert limiter.allow(FRAME_CLASS)
+        assert not limiter.allow(FRAME_CLASS)
+
+
+class TestHandlerLimits:
+    async def test_get_state_flood_throttled_and_counted(self):
+        handler, _game, sockets = make_game_handler(players=1)
+        ws = sockets[0]
+
+        for _ in range(20):
+            await handler._handle_message(ws, {"type": "get_state"})
+        await handler.drain_outbound()
+
+        replies = [json.loads(frame) for frame in ws.sent]
+        errors = [r for r in replies if r["type"] == "error"]
+        assert len(errors) == 1
+        assert errors[0]["code"] == "RATE_LIMITED"
+        assert handler.handler_metrics.handlers["get_state"].calls == 5
+        assert handler.inbound_throttled == {"state": 15}
+
+        # Other message classes are unaffected
+        await handler._handle_message(ws, {"type": "submit", "year": 1990})
+        assert handler.handler_metrics.handlers["submit"].calls == 1
+
+    async def test_malformed_frames_throttled_before_parsing(self):
+        handler, _game, _sockets = make_game_handler(players=0)
+        app = web.Application()
+        app.router.add_get("/ws", handler.handle)
+
+        async with (
+            TestClient(TestServer(app)) as client,
+            client.ws_connect("/ws") as ws,
+        ):
+            for _ in range(60):
+                await ws.send_str("{not json")
+            reply = await ws.receive_json()
+
+        assert reply["code"] == "RATE_LIMITED"
+        assert 15 <= handler.inbound_throttled[FRAME_CLASS] <= 20
+
+    async def test_oversized_frame_closes_connection(self):
+        handler, _game, _sockets = make_game_handler(players=0)
+        app = web.Application()
+        app.router.add_get("/ws", handler.handle)
+
+        async with (
+            TestClient(TestServer(app)) as client,
+            client.ws_connect("/ws") as ws,
+        ):
+            await ws.send_str("x" * (WS_MAX_MESSAGE_SIZE + 1))
+            msg = await ws.receive()
+
+        assert msg.type == WSMsgType.CLOSE
+        assert msg.data == WSCloseCode.MESSAGE_TOO_BIG
+        assert handler.oversized_messages == 1
+
+    async def test_oversized_sse_message_rejected(self):
+        handler, _game, _sockets = make_game_handler(players=0)
+        app = web.Application()
+        app.router.add_post("/events/send", handler.sse.handle_send)
+
+        async with TestClient(TestServer(app)) as client:
+            resp = await client.post(
+                "/events/send", data=b"x" * (WS_MAX_MESSAGE_SIZE + 1)
+            )
+
+        assert resp.status == 413
+        assert handler.oversized_messages == 1
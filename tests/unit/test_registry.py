@@ -0,0 +1,203 @@
+"""Tests for the indexed player registry (custom_components/beatify/game/registry.py)."""
+
+from __future__ import annotations
+
+import random
+
+from custom_components.beatify.game.player import PlayerSession
+from custom_components.beatify.game.registry import (
+    ROLE_ADMIN,
+    ROLE_PLAYER,
+    PlayerRegistry,
+)
+from tests.conftest import make_game_state, make_songs
+
+
+def _player(name: str, ws: object | None = None) -> PlayerSession:
+    return PlayerSession(name=name, ws=ws if ws is not None else object())
+
+
+class TestIndexes:
+    def test_lookups_after_add(self):
+        registry = PlayerRegistry()
+        alice = _player("Alice")
+        registry["Alice"] = alice
+
+        assert registry.get_by_ws(alice.ws) is alice
+        assert registry.get_by_session(alice.session_id) is alice
+        assert registry.get_by_key("aLiCe") is alice
+        assert registry.by_role(ROLE_PLAYER) == [alice]
+        assert registry.admin is None
+
+    def test_names_match_lower_cased(self):
+        # Same rule as the admin reconnect check: lower(), not casefold()
+        registry = PlayerRegistry([_player("Straße")])
+        assert registry.get_by_key("STRAßE") is registry["Straße"]
+        assert registry.get_by_key("STRASSE") is None
+
+    def test_removal_clears_every_index(self):
+        alice = _player("Alice")
+        registry = PlayerRegistry([alice])
+        del registry["Alice"]
+
+        assert registry.get_by_ws(alice.ws) is None
+        assert registry.get_by_session(alice.session_id) is None
+        assert registry.get_by_key("alice") is None
+        assert registry.by_role(ROLE_PLAYER) == []
+
+    def test_ws_reassignment_followed(self):
+        alice = _player("Alice")
+        registry = PlayerRegistry([alice])
+        old_ws, new_ws = alice.ws, object()
+
+        alice.ws = new_ws
+
+        assert registry.get_by_ws(new_ws) is alice
+        assert registry.get_by_ws(old_ws) is None
+
+    def test_role_change_followed(self):
+        alice, bob = _player("Alice"), _player("Bob")
+        registry = PlayerRegistry([alice, bob])
+
+        bob.is_admin = True
+
+        assert registry.admin is bob
+        assert registry.by_role(ROLE_ADMIN) == [bob]
+        assert registry.by_role(ROLE_PLAYER) == [alice]
+
+    def test_removed_player_no_longer_updates_registry(self):
+        alice = _player("Alice")
+        registry = PlayerRegistry([alice])
+        registry.pop("Alice")
+
+        alice.ws = object()
+        alice.is_admin = True
+
+        assert registry.get_by_ws(alice.ws) is None
+        assert registry.admin is None
+
+    def test_clear_sessions_keeps_players(self):
+        alice = _player("Alice")
+        registry = PlayerRegistry([alice])
+        registry.clear_sessions()
+
+        assert registry.get_by_session(alice.session_id) is None
+        assert registry.session_count == 0
+        assert registry.get_by_ws(alice.ws) is alice
+
+    def test_clear(self):
+        alice = _player("Alice")
+        registry = PlayerRegistry([alice])
+        registry.clear()
+        alice.is_admin = True
+        assert not registry
+        assert registry.admin is None
+
+    def test_indexes_match_linear_scan(self):
+        rng = random.Random(7)
+        registry = PlayerRegistry()
+        retired: list[object] = []
+        for step in range(300):
+            name = f"P{rng.randrange(15)}"
+            action = rng.randrange(4)
+            if action == 0:
+                if name in registry:
+                    retired.append(registry[name].ws)
+                registry[name] = _player(name)
+            elif action == 1:
+                removed = registry.pop(name, None)
+                if removed:
+                    retired.append(removed.ws)
+            elif name in registry and action == 2:
+                retired.append(registry[name].ws)
+                registry[name].ws = object()
+            elif name in registry:
+                registry[name].is_admin = not registry[name].is_admin
+
+            for player in registry.values():
+                assert registry.get_by_ws(player.ws) is player, step
+                assert registry.get_by_session(player.session_id) is player, step
+            assert all(registry.get_by_ws(ws) is None for ws in retired), step
+            admins = {p.name for p in registry.values() if p.is_admin}
+            assert {p.name for p in registry.by_role(ROLE_ADMIN)} == admins
+
+
+class TestProgressCounts:
+    def test_counts_follow_flag_writes(self):
+        alice, bob = _player("Alice"), _player("Bob")
+        registry = PlayerRegistry([alice, bob])
+        assert registry.connected_count == 2
+        assert registry.pending_count("submitted") == 2
+
+        alice.submitted = True
+        assert registry.pending_count("submitted") == 1
+        bob.connected = False
+        assert registry.connected_count == 1
+        assert registry.pending_count("submitted") == 0
+
+        bob.connected = True
+        alice.submitted = False
+        assert registry.pending_count("submitted") == 2
+        assert registry.pending_count("has_artist_guess") == 2
+
+    def test_removed_player_not_counted(self):
+        alice = _player("Alice")
+        registry = PlayerRegistry([alice, _player("Bob")])
+        del registry["Bob"]
+        assert registry.connected_count == 1
+        alice.has_movie_guess = True
+        assert registry.pending_count("has_movie_guess") == 0
+
+    def test_counts_match_scan_under_random_writes(self):
+        rng = random.Random(7)
+        registry = PlayerRegistry(_player(f"P{i}") for i in range(8))
+        flags = ("connected", "submitted", "has_artist_guess", "has_movie_guess")
+        for step in range(300):
+            player = registry[f"P{rng.randrange(8)}"]
+            setattr(player, rng.choice(flags), rng.random() < 0.5)
+            if rng.random() < 0.1:
+                player.reset_round()
+
+            connected = [p for p in registry.values() if p.connected]
+            assert registry.connected_count == len(connected), step
+            for flag in ("submitted", "has_artist_guess", "has_movie_guess"):
+                expected = sum(1 for p in connected if not getattr(p, flag))
+                assert registry.pending_count(flag) == expected, (step, flag)
+
+
+class TestGameStateUsesRegistry:
+    def _state(self):
+        state = make_game_state()
+        state.create_game(
+            playlists=["test.json"],
+            songs=make_songs(3),
+            media_player="media_player.test",
+            base_url="http://localhost:8123",
+        )
+        return state
+
+    def test_reconnect_by_name_is_case_insensitive(self):
+        state = self._state()
+        old_ws, new_ws = object(), object()
+        state.add_player("Alice", old_ws)
+        state.players["Alice"].connected = False
+
+        assert state.add_player("ALICE", new_ws) == (True, None)
+        assert state.get_player_by_ws(new_ws) is state.players["Alice"]
+        assert state.get_player_by_ws(old_ws) is None
+
+    def test_session_lookup_and_removal(self):
+        state = self._state()
+        state.add_player("Alice", object())
+        session_id = state.players["Alice"].session_id
+
+        assert state.get_player_by_session_id(session_id).name == "Alice"
+        state.remove_player("Alice")
+        assert state.get_player_by_session_id(session_id) is None
+
+    def test_end_game_resets_indexes(self):
+        state = self._state()
+        ws = object()
+        state.add_player("Alice", ws)
+        state.end_game()
+        assert state.get_player_by_ws(ws) is None
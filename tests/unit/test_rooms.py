@@ -0,0 +1,166 @@
+"""Tests for concurrent game rooms (custom_components/beatify/server/rooms.py)."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock
+
+from custom_components.beatify.server.rooms import GameRegistry, Room, create_room
+from tests.conftest import make_songs
+from tests.unit.test_websocket import FakeWebSocket
+
+
+def _make_hass() -> MagicMock:
+    hass = MagicMock()
+    hass.data = {}
+    return hass
+
+
+def _start(room: Room, media_player: str = "media_player.kitchen") -> str:
+    room.game.create_game(
+        playlists=["test.json"],
+        songs=make_songs(3),
+        media_player=media_player,
+        base_url="http://localhost:8123",
+    )
+    return room.game.game_id
+
+
+def _make_registry(max_rooms: int = 3) -> GameRegistry:
+    hass = _make_hass()
+    return GameRegistry(hass, create_room(hass), max_rooms=max_rooms)
+
+
+class TestLookup:
+    def test_no_game_id_routes_to_default(self):
+        registry = _make_registry()
+        assert registry.get(None) is registry.default
+        assert registry.get("") is registry.default
+
+    def test_routes_by_game_id(self):
+        registry = _make_registry()
+        game_id = _start(registry.default)
+        assert registry.get(game_id) is registry.default
+
+    def test_unknown_game_id(self):
+        registry = _make_registry()
+        _start(registry.default)
+        assert registry.get("nope") is None
+
+    def test_game_id_survives_rematch(self):
+        registry = _make_registry()
+        room = registry.default
+        first_id = _start(room)
+        registry.bind(room)
+        room.game.rematch_game()
+
+        assert room.game.game_id != first_id
+        assert registry.get(first_id) is room
+        assert registry.get(room.game.game_id) is room
+
+    def test_release_drops_old_ids(self):
+        registry = _make_registry()
+        room = registry.default
+        first_id = _start(room)
+        registry.bind(room)
+        room.game.end_game()
+
+        registry.release(room)
+        second_id = _start(room)
+        registry.bind(room)
+
+        assert registry.get(first_id) is None
+        assert registry.get(second_id) is room
+
+
+class TestOpenRoom:
+    def test_reuses_idle_default_room(self):
+        registry = _make_registry()
+        assert registry.open_room() is registry.default
+        assert len(registry.rooms) == 1
+
+    def test_creates_room_when_default_is_busy(self):
+        registry = _make_registry()
+        _start(registry.default)
+
+        room = registry.open_room()
+
+        assert room is not None
+        assert room is not registry.default
+        assert room.game is not registry.default.game
+        assert room.ws_handler is not registry.default.ws_handler
+        assert len(registry.rooms) == 2
+
+    def test_cap_on_running_games(self):
+        registry = _make_registry(max_rooms=2)
+        _start(registry.default, "media_player.a")
+        _start(registry.open_room(), "media_player.b")
+
+        assert registry.open_room() is None
+
+    def test_ended_game_frees_room(self):
+        registry = _make_registry(max_rooms=2)
+        _start(registry.default, "media_player.a")
+        second = registry.open_room()
+        _start(second, "media_player.b")
+        second.game.end_game()
+
+        assert registry.open_room() is second
+
+    def test_media_player_in_use(self):
+        registry = _make_registry()
+        _start(registry.default, "media_player.kitchen")
+        other = registry.open_room()
+
+        assert registry.media_player_in_use("media_player.kitchen", exclude=other)
+        assert not registry.media_player_in_use(
+            "media_player.kitchen", exclude=registry.default
+        )
+        assert not registry.media_player_in_use("media_player.garden", exclude=other)
+
+
+class TestIsolation:
+    async def test_handler_is_bound_to_its_room(self):
+        registry = _make_registry()
+        _start(registry.default, "media_player.a")
+        other = registry.open_room()
+        _start(other, "media_player.b")
+
+        assert registry.default.ws_handler.game_state is registry.default.game
+        assert other.ws_handler.game_state is other.game
+
+    async def test_broadcast_stays_in_room(self):
+        registry = _make_registry()
+        first = registry.default
+        _start(first, "media_player.a")
+        second = registry.open_room()
+        _start(second, "media_player.b")
+        first_ws, second_ws = FakeWebSocket(), FakeWebSocket()
+        first.ws_handler.connections.add(first_ws)
+        second.ws_handler.connections.add(second_ws)
+
+        await first.ws_handler.broadcast({"type": "song_stopped"})
+        await first.ws_handler.drain_outbound()
+        await second.ws_handler.drain_outbound()
+
+        assert [json.loads(frame)["type"] for frame in first_ws.sent] == [
+            "song_stopped"
+        ]
+        assert second_ws.sent == []
+
+
+class TestRouting:
+    async def test_unknown_game_is_not_found(self):
+        registry = _make_registry()
+        request = MagicMock()
+        request.query = {"game": "nope"}
+
+        for handle in (
+            registry.handle_ws,
+            registry.handle_spectate,
+            registry.handle_sse_stream,
+            registry.handle_sse_send,
+        ):
+            response = await handle(request)
+            assert response.status == 404
+            assert json.loads(response.body)["error"] == "GAME_NOT_FOUND"
@@ -2,9 +2,18 @@
 
 from __future__ import annotations
 
+import random
+
 import pytest
 
+from custom_components.beatify.const import (
+    INTRO_BONUS_TIERS,
+    INTRO_DURATION_SECONDS,
+    LATENCY_COMPENSATION_MAX,
+)
+from custom_components.beatify.game.player import PlayerSession
 from custom_components.beatify.game.scoring import (
+    ScoringService,
     apply_bet_multiplier,
     calculate_accuracy_score,
     calculate_artist_score,
@@ -13,7 +22,8 @@ from custom_components.beatify.game.scoring import (
     calculate_streak_bonus,
     calculate_years_off_text,
 )
-
+from custom_components.beatify.game.state import ArtistChallenge, MovieChallenge
+from tests.conftest import make_player
 
 # ---------------------------------------------------------------------------
 # calculate_accuracy_score
@@ -127,6 +137,17 @@ class TestSpeedMultiplier:
         assert calculate_speed_multiplier(60.0, 60.0) == pytest.approx(1.0)
         assert calculate_speed_multiplier(30.0, 60.0) == pytest.approx(1.5)
 
+    def test_latency_compensation(self):
+        # One-way latency is taken off the elapsed time
+        assert calculate_speed_multiplier(3.1, 30.0, latency=0.1) == pytest.approx(1.9)
+
+    def test_latency_compensation_capped(self):
+        # A very slow connection gets at most LATENCY_COMPENSATION_MAX back
+        capped = 3.0 - LATENCY_COMPENSATION_MAX
+        assert calculate_speed_multiplier(3.0, 30.0, latency=5.0) == pytest.approx(
+            2.0 - capped / 30.0
+        )
+
 
 # ---------------------------------------------------------------------------
 # calculate_round_score
@@ -289,3 +310,172 @@ class TestArtistScore:
         points, match_type = calculate_artist_score("   ", "The Beatles")
         assert points == 0
         assert match_type is None
+
+
+# ---------------------------------------------------------------------------
+# ScoringService.score_player_round: intro speed ranks
+# ---------------------------------------------------------------------------
+
+
+class TestIntroBonusRanks:
+    START = 1000.0
+
+    def _score_all(self, offsets, precompute):
+        players = []
+        for i, offset in enumerate(offsets):
+            player = make_player(f"P{i}")
+            player.submit_guess(1990, self.START + offset)
+            players.append(player)
+        intro_times = (
+            ScoringService.intro_submission_times(players, self.START)
+            if precompute
+            else None
+        )
+        for player in players:
+            ScoringService.score_player_round(
+                player,
+                correct_year=1990,
+                round_start_time=self.START,
+                round_duration=30,
+                difficulty="normal",
+                artist_challenge=None,
+                movie_challenge=None,
+                is_intro_round=True,
+                intro_round_start_time=self.START,
+                all_players=players,
+                streak_achievements={},
+                bet_tracking={"total_bets": 0, "bets_won": 0},
+                intro_times=intro_times,
+            )
+        return [p.intro_bonus for p in players]
+
+    @pytest.mark.parametrize("precompute", [True, False])
+    def test_ranked_by_submission_time(self, precompute):
+        late = INTRO_DURATION_SECONDS + 1
+        bonuses = self._score_all([2.0, 1.0, late, 1.0, 3.0], precompute)
+        # Ties share a rank; submissions after the cutoff get nothing
+        expected = [INTRO_BONUS_TIERS[2], INTRO_BONUS_TIERS[0], 0, INTRO_BONUS_TIERS[0]]
+        expected.append(INTRO_BONUS_TIERS[3] if len(INTRO_BONUS_TIERS) > 3 else 0)
+        assert bonuses == expected
+
+
+# ---------------------------------------------------------------------------
+# ScoringService.score_round: same results as score_player_round
+# ---------------------------------------------------------------------------
+
+
+def _random_round(seed: int) -> tuple[list[PlayerSession], dict]:
+    """Build a random room and round (same seed, same room)."""
+    rng = random.Random(seed)
+    start = 1000.0
+    n = rng.randint(1, 120)
+    players = []
+    for i in range(n):
+        player = PlayerSession(
+            name=f"P{i}",
+            ws=None,
+            score=rng.randint(0, 500),
+            streak=rng.choice([0, 2, 4, 9]),
+        )
+        if rng.random() < 0.85:
+            # Few distinct times so intro ranks tie
+            offset = (
+                rng.choice([None, -0.5, 0.0])
+                if rng.random() < 0.05
+                else rng.randint(0, 80) / 2
+            )
+            player.submit_guess(
+                1990 + rng.randint(-12, 12),
+                None if offset is None else start + offset,
+                rng.choice([0.0, 0.05, 0.4]),
+            )
+            player.bet = rng.random() < 0.3
+        players.append(player)
+    names = [p.name for p in players]
+    movie = MovieChallenge(correct_movie="Fame", options=["Fame", "Grease", "Cats"])
+    for name in rng.sample(names, min(n, rng.randint(0, 5))):
+        movie.correct_guesses.append({"name": name, "time": 1.0})
+    round_args = {
+        "correct_year": rng.choice([1990, 1990, None]),
+        "round_start_time": start,
+        "round_duration": rng.choice([15, 30, 60, 0]),
+        "difficulty": rng.choice(["easy", "normal", "hard", "unknown"]),
+        "artist_challenge": ArtistChallenge(
+            correct_artist="A", options=["A", "B"], winner=rng.choice([*names, None])
+        )
+        if rng.random() < 0.7
+        else None,
+        "movie_challenge": movie if rng.random() < 0.7 else None,
+        "is_intro_round": rng.random() < 0.5,
+        "intro_round_start_time": start,
+        "latency_compensation": rng.random() < 0.5,
+    }
+    return players, round_args
+
+
+def _results(players: list[PlayerSession]) -> list[dict]:
+    """Player snapshots without the per-instance session id and join time."""
+    return [
+        {
+            k: v
+            for k, v in p.to_snapshot().items()
+            if k not in ("session_id", "joined_at")
+        }
+        for p in players
+    ]
+
+
+def _counters() -> tuple[dict[str, int], dict[str, int]]:
+    streaks = {f"streak_{n}": 0 for n in (3, 5, 10, 15, 20, 25)}
+    return streaks, {"total_bets": 0, "bets_won": 0}
+
+
+def _score_per_player(seed: int) -> tuple[list[dict], tuple]:
+    players, round_args = _random_round(seed)
+    streaks, bets = _counters()
+    for player in players:
+        ScoringService.score_player_round(
+            player,
+            **round_args,
+            all_players=players,
+            streak_achievements=streaks,
+            bet_tracking=bets,
+        )
+    return _results(players), (streaks, bets)
+
+
+def _score_batch(seed: int, use_numpy: bool) -> tuple[list[dict], tuple]:
+    players, round_args = _random_round(seed)
+    streaks, bets = _counters()
+    ScoringService.score_round(
+        players,
+        **round_args,
+        streak_achievements=streaks,
+        bet_tracking=bets,
+        use_numpy=use_numpy,
+    )
+    for player in players:
+        assert type(player.round_score) is int
+        assert type(player.speed_multiplier) is float
+    return _results(players), (streaks, bets)
+
+
+class TestScoreRound:
+    @pytest.mark.parametrize("seed", range(100))
+    def test_matches_per_player_scoring(self, seed):
+        assert _score_batch(seed, use_numpy=False) == _score_per_player(seed)
+
+    @pytest.mark.parametrize("seed", range(100))
+    def test_numpy_matches_per_player_scoring(self, seed):
+        pytest.importorskip("numpy")
+        assert _score_batch(seed, use_numpy=True) == _score_per_player(seed)
+
+    def test_movie_bonuses_match_per_player_lookup(self):
+        movie = MovieChallenge(correct_movie="Fame", options=["Fame", "Grease", "Cats"])
+        for name in ("Bob", "Alice", "Carol", "Dave"):
+            movie.correct_guesses.append({"name": name, "time": 1.0})
+
+        bonuses = movie.bonuses()
+
+        for name in ("Alice", "Bob", "Carol", "Dave", "Eve"):
+            assert bonuses.get(name, 0) == movie.get_player_bonus(name)
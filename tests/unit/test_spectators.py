@@ -0,0 +1,134 @@
+"""Tests for the spectator channel (custom_components/beatify/server/spectators.py)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from custom_components.beatify.game.state import GamePhase
+from tests.unit.test_websocket import FakeWebSocket, make_game_handler
+
+
+def make_spectated_handler(spectators: int = 3, interval: float = 0.02):
+    """Create a game handler with N fake spectator sockets attached."""
+    handler, game, players = make_game_handler(players=2)
+    handler.spectators.update_interval = interval
+    watchers = [FakeWebSocket() for _ in range(spectators)]
+    handler.spectators.sockets.update(watchers)
+    return handler, game, players, watchers
+
+
+class TestSpectatorBroadcast:
+    async def test_spectators_kept_out_of_player_connections(self):
+        handler, _game, players, watchers = make_spectated_handler()
+
+        await handler.broadcast_state()
+        await handler.drain_outbound()
+        await handler.spectators.drain()
+
+        assert not set(watchers) & handler.connections
+        assert all(len(ws.sent) == 1 for ws in players)
+        msg = json.loads(watchers[0].sent[0])
+        assert msg["type"] == "state"
+        assert msg["phase"] == "LOBBY"
+        assert "version" not in msg
+
+    async def test_one_frame_shared_by_all_spectators(self):
+        handler, _game, _players, watchers = make_spectated_handler(spectators=50)
+
+        await handler.broadcast_state()
+        await handler.spectators.drain()
+
+        assert len({id(ws.sent[0]) for ws in watchers}) == 1
+        assert handler.spectators.frames_encoded == 1
+        assert handler.spectators.frames_queued == 50
+
+    async def test_updates_rate_limited(self):
+        handler, game, players, watchers = make_spectated_handler()
+        handler.spectators.update_interval = 10
+
+        for name in ("P0", "P1", None):
+            await handler.broadcast_state()
+            await handler.drain_outbound()
+            await handler.spectators.drain()
+            if name:
+                game.players[name].connected = False
+
+        assert len(players[0].sent) == 3
+        assert len(watchers[0].sent) == 1
+        assert handler.spectators.scheduler.pending
+
+    async def test_trailing_update_carries_latest_state(self):
+        handler, game, _players, watchers = make_spectated_handler()
+
+        await handler.broadcast_state()
+        game.players["P0"].connected = False
+        await handler.broadcast_state()
+        game.players["P1"].connected = False
+        await handler.broadcast_state()
+        await asyncio.sleep(0.05)
+        await handler.spectators.drain()
+
+        assert len(watchers[0].sent) == 2
+        latest = json.loads(watchers[0].sent[-1])
+        assert [p["connected"] for p in latest["players"]] == [False, False]
+        assert handler.spectators.frames_encoded == 2
+
+    async def test_phase_change_pushed_immediately(self):
+        handler, game, _players, watchers = make_spectated_handler()
+        handler.spectators.update_interval = 10
+
+        await handler.broadcast_state()
+        await handler.spectators.drain()
+        game.phase = GamePhase.PAUSED
+        await handler.broadcast_state()
+        await handler.spectators.drain()
+
+        assert [json.loads(f)["phase"] for f in watchers[0].sent] == ["LOBBY", "PAUSED"]
+
+    async def test_reactions_forwarded_other_messages_not(self):
+        handler, _game, _players, watchers = make_spectated_handler()
+
+        await handler.broadcast(
+            {"type": "player_reaction", "player_name": "P0", "emoji": "🔥"}
+        )
+        await handler.broadcast({"type": "volume_changed", "level": 0.5})
+        await handler.spectators.drain()
+
+        assert [json.loads(f)["type"] for f in watchers[0].sent] == ["player_reaction"]
+
+    async def test_no_spectators_no_encoding(self):
+        handler, _game, _players, _watchers = make_spectated_handler(spectators=0)
+
+        await handler.broadcast_state()
+
+        assert handler.spectators.frames_encoded == 0
+        assert handler.diagnostics()["spectators"]["connections"] == 0
+
+
+class TestSpectatorEndpoint:
+    async def test_state_on_connect_and_read_only(self):
+        handler, game, _players = make_game_handler(players=1)
+        app = web.Application()
+        app.router.add_get("/ws/spectate", handler.spectators.handle)
+
+        async with (
+            TestClient(TestServer(app)) as client,
+            client.ws_connect("/ws/spectate") as ws,
+        ):
+            assert (await ws.receive_json())["phase"] == "LOBBY"
+            assert len(handler.spectators.sockets) == 1
+            assert len(handler.connections) == 1
+
+            await ws.send_str(json.dumps({"type": "join", "name": "Sneaky"}))
+            await ws.send_str(json.dumps({"type": "get_state"}))
+            msg = await ws.receive_json()
+
+            assert msg["type"] == "state"
+            assert "Sneaky" not in game.players
+
+        await asyncio.sleep(0)
+        assert not handler.spectators.sockets
@@ -0,0 +1,105 @@
+"""Tests for the SSE fallback transport (custom_components/beatify/server/sse.py)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from tests.unit.test_websocket import make_game_handler
+
+
+def make_app(handler) -> web.Application:
+    app = web.Application()
+    app.router.add_get("/events", handler.sse.handle_stream)
+    app.router.add_post("/events/send", handler.sse.handle_send)
+    return app
+
+
+async def read_event(resp) -> dict:
+    """Read the next data event from a stream, skipping comments."""
+    while True:
+        block = await asyncio.wait_for(resp.content.readuntil(b"\n\n"), 2)
+        for line in block.decode().splitlines():
+            if line.startswith("data: "):
+                return json.loads(line[len("data: ") :])
+
+
+class TestSSETransport:
+    async def test_join_and_broadcast_over_stream(self):
+        handler, game, sockets = make_game_handler(players=1)
+
+        async with TestClient(TestServer(make_app(handler))) as client:
+            resp = await client.get("/events")
+            assert resp.headers["Content-Type"] == "text/event-stream"
+            hello = await read_event(resp)
+            assert hello["type"] == "connected"
+            assert len(handler.connections) == 2
+
+            post = await client.post(
+                "/events/send",
+                json={
+                    "connection_id": hello["connection_id"],
+                    "type": "join",
+                    "name": "Eve",
+                },
+            )
+            assert post.status == 200
+
+            assert "Eve" in game.players
+            assert game.players["Eve"].ws is handler.sse.streams[hello["connection_id"]]
+            types = set()
+            while "join_ack" not in types:
+                types.add((await read_event(resp))["type"])
+
+            await handler.broadcast({"type": "song_stopped"})
+            event = await read_event(resp)
+            while event["type"] == "state":
+                event = await read_event(resp)
+            assert event == {"type": "song_stopped", "seq": event["seq"]}
+            await handler.drain_outbound()
+            assert json.loads(sockets[0].sent[-1]) == event
+
+            resp.close()
+
+        await asyncio.sleep(0.05)
+        assert not handler.sse.streams
+        assert not game.players["Eve"].connected
+
+    async def test_unknown_connection_rejected(self):
+        handler, _game, _sockets = make_game_handler(players=0)
+
+        async with TestClient(TestServer(make_app(handler))) as client:
+            post = await client.post(
+                "/events/send", json={"connection_id": "x", "type": "leave"}
+            )
+            assert post.status == 404
+
+            post = await client.post("/events/send", data=b"not json")
+            assert post.status == 400
+
+    async def test_keepalive_comments(self):
+        handler, _game, _sockets = make_game_handler(players=0)
+        handler.sse.keepalive_interval = 0.01
+
+        async with TestClient(TestServer(make_app(handler))) as client:
+            resp = await client.get("/events")
+            await read_event(resp)
+            block = await asyncio.wait_for(resp.content.readuntil(b"\n\n"), 2)
+            assert block == b": keepalive\n\n"
+            resp.close()
+
+    async def test_server_close_ends_stream(self):
+        handler, _game, _sockets = make_game_handler(players=0)
+
+        async with TestClient(TestServer(make_app(handler))) as client:
+            resp = await client.get("/events")
+            await read_event(resp)
+            (conn,) = handler.sse.streams.values()
+
+            await handler._close(conn)
+
+            assert await asyncio.wait_for(resp.content.read(), 2) == b""
+            assert conn not in handler.connections
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -18,11 +19,16 @@ from custom_components.beatify.const import (
     ERR_NO_STEAL_AVAILABLE,
     ERR_NOT_IN_GAME,
     ERR_TARGET_NOT_SUBMITTED,
+    LARGE_ROOM_VISIBLE_PLAYERS,
+    LEADERBOARD_TOP_K,
     MAX_PLAYERS,
+    MAX_PLAYERS_LARGE_ROOM,
 )
 from custom_components.beatify.game.state import (
+    ArtistChallenge,
     GamePhase,
     GameState,
+    MovieChallenge,
     build_artist_options,
     build_movie_options,
 )
@@ -587,3 +593,333 @@ class TestGetState:
         state = self.state.get_state()
         assert "winner" in state
         assert state["winner"]["name"] == "Alice"
+
+
+# ---------------------------------------------------------------------------
+# GameState.get_state memoization
+# ---------------------------------------------------------------------------
+
+
+class TestGetStateMemoization:
+    def setup_method(self):
+        self.state = make_game_state()
+        _create_fresh_game(self.state)
+        self.state.add_player("Alice", MagicMock())
+        self.state.add_player("Bob", MagicMock())
+
+    def test_unchanged_sections_reused(self):
+        first = self.state.get_state()
+        second = self.state.get_state()
+        assert first["players"] is second["players"]
+
+    def test_player_change_rebuilds_section(self):
+        first = self.state.get_state()
+        self.state.players["Bob"].submitted = True
+        second = self.state.get_state()
+        assert second["players"] is not first["players"]
+        assert [p["submitted"] for p in second["players"]] == [False, True]
+
+    def test_player_removal_rebuilds_section(self):
+        self.state.get_state()
+        self.state.remove_player("Bob")
+        assert [p["name"] for p in self.state.get_state()["players"]] == ["Alice"]
+
+    def test_end_sections_cached_until_highlight_recorded(self):
+        self.state.players["Alice"].score = 100
+        self.state.phase = GamePhase.END
+        first = self.state.get_state()
+        second = self.state.get_state()
+        assert first["superlatives"] is second["superlatives"]
+        assert first["share_data"] is second["share_data"]
+
+        self.state.highlights_tracker.record_streak("Alice", 3, 1)
+        third = self.state.get_state()
+        assert third["highlights"] is not first["highlights"]
+        assert len(third["highlights"]) == 1
+        assert third["leaderboard"] is first["leaderboard"]
+
+
+# ---------------------------------------------------------------------------
+# Large-room mode
+# ---------------------------------------------------------------------------
+
+
+class TestLargeRoom:
+    def setup_method(self):
+        self.state = make_game_state()
+        _create_fresh_game(self.state, large_room=True)
+
+    def _fill(self, count: int) -> None:
+        for i in range(count):
+            self.state.add_player(f"Player{i:03d}", MagicMock())
+
+    def test_cap_raised(self):
+        assert self.state.max_players == MAX_PLAYERS_LARGE_ROOM
+        self._fill(MAX_PLAYERS + 1)
+        assert len(self.state.players) == MAX_PLAYERS + 1
+
+    def test_cap_unchanged_by_default(self):
+        state = make_game_state()
+        _create_fresh_game(state)
+        assert state.max_players == MAX_PLAYERS
+
+    def test_small_room_view_is_full_state(self):
+        self._fill(3)
+        state = self.state.get_state()
+        assert self.state.player_view(state) == (state, {})
+
+    def test_view_lists_top_players_and_admin(self):
+        count = LARGE_ROOM_VISIBLE_PLAYERS + 10
+        self._fill(count)
+        for i, player in enumerate(self.state.players.values()):
+            player.score = i
+        self.state.set_admin("Player000")
+        state = self.state.get_state()
+
+        view, personal = self.state.player_view(state)
+
+        names = [p["name"] for p in view["players"]]
+        top = [
+            f"Player{i:03d}" for i in range(count - LARGE_ROOM_VISIBLE_PLAYERS, count)
+        ]
+        assert names == ["Player000", *top]
+        assert view["players_trimmed"] is True
+        assert view["player_count"] == count
+        assert set(personal) == {p["name"] for p in state["players"]} - set(names)
+        own = personal["Player001"]["player_entry"]
+        assert own["type"] == "player_entry"
+        assert own["entry"]["score"] == 1
+        assert len(state["players"]) == count  # not mutated
+
+    def _playing(self, count: int) -> dict:
+        self._fill(count)
+        for i, player in enumerate(self.state.players.values()):
+            player.score = 10 * (count - i)
+            player.previous_rank = count - i
+        self.state.phase = GamePhase.PLAYING
+        return self.state.get_state()
+
+    def test_leaderboard_trimmed_to_top_k_with_stats(self):
+        count = LARGE_ROOM_VISIBLE_PLAYERS + 5
+        state = self._playing(count)
+
+        view, _personal = self.state.player_view(state)
+
+        assert view["leaderboard"] == state["leaderboard"][:LEADERBOARD_TOP_K]
+        assert view["leaderboard_trimmed"] is True
+        scores = [10 * n for n in range(1, count + 1)]
+        assert view["leaderboard_stats"] == {
+            "players": count,
+            "top_score": max(scores),
+            "average_score": round(sum(scores) / count, 1),
+            "median_score": (scores[count // 2 - 1] + scores[count // 2]) / 2,
+        }
+        assert len(state["leaderboard"]) == count  # not mutated
+
+    def test_rank_messages_for_players_below_top_k(self):
+        count = LARGE_ROOM_VISIBLE_PLAYERS + 5
+        state = self._playing(count)
+
+        _view, personal = self.state.player_view(state)
+
+        ranked = {
+            name for name, messages in personal.items() if "player_rank" in messages
+        }
+        assert ranked == {e["name"] for e in state["leaderboard"][LEADERBOARD_TOP_K:]}
+        message = personal["Player020"]["player_rank"]
+        leaderboard = state["leaderboard"]
+        assert message["rank"] == 21
+        assert message["score"] == 10 * (count - 20)
+        assert message["rank_change"] == (count - 20) - 21
+        assert message["total"] == count
+        assert message["entry"] is leaderboard[20]
+        assert message["above"] is leaderboard[19]
+        assert message["below"] is leaderboard[21]
+        assert personal[f"Player{count - 1:03d}"]["player_rank"]["below"] is None
+
+    def test_get_player_rank_uses_live_leaderboard(self):
+        self._playing(LARGE_ROOM_VISIBLE_PLAYERS + 5)
+        assert self.state.get_player_rank("Player000")["rank"] == 1
+        assert self.state.get_player_rank("Player000")["above"] is None
+        assert self.state.get_player_rank("Nobody") is None
+
+    def test_final_leaderboard_trimmed_too(self):
+        count = LARGE_ROOM_VISIBLE_PLAYERS + 5
+        self._playing(count)
+        self.state.phase = GamePhase.END
+        state = self.state.get_state()
+
+        view, personal = self.state.player_view(state)
+
+        assert len(view["leaderboard"]) == LEADERBOARD_TOP_K
+        last = personal[f"Player{count - 1:03d}"]["player_rank"]
+        assert last["rank"] == count
+        assert "best_streak" in last["entry"]
+
+    def test_rematch_preserves_mode(self):
+        self.state.rematch_game()
+        assert self.state.large_room is True
+        self.state.end_game()
+        assert self.state.large_room is False
+
+
+# ---------------------------------------------------------------------------
+# Per-submission checks (O(1) early reveal, movie quiz ranking)
+# ---------------------------------------------------------------------------
+
+
+class TestGuessCompletion:
+    def setup_method(self):
+        self.state = make_game_state()
+        _create_fresh_game(self.state)
+        for name in ("Alice", "Bob", "Carol"):
+            self.state.add_player(name, MagicMock())
+            self.state.players[name].submitted = True
+        self.state.artist_challenge_enabled = True
+        self.state.artist_challenge = ArtistChallenge(
+            correct_artist="A", options=["A", "B"]
+        )
+
+    def test_ignored_artist_challenge_does_not_block(self):
+        assert self.state.check_all_guesses_complete() is True
+
+    def test_started_artist_challenge_waits_for_everyone(self):
+        self.state.players["Alice"].has_artist_guess = True
+        assert self.state.check_all_guesses_complete() is False
+        self.state.players["Bob"].has_artist_guess = True
+        self.state.players["Carol"].connected = False
+        assert self.state.check_all_guesses_complete() is True
+
+    def test_artist_winner_does_not_block(self):
+        self.state.players["Alice"].has_artist_guess = True
+        self.state.artist_challenge.winner = "Alice"
+        assert self.state.check_all_guesses_complete() is True
+
+
+class TestMovieGuessRanking:
+    def setup_method(self):
+        self.state = make_game_state()
+        _create_fresh_game(self.state)
+        self.state.round_start_time = 1000.0
+        self.state.movie_challenge = MovieChallenge(
+            correct_movie="Grease", options=["Grease", "Footloose", "Fame"]
+        )
+
+    def test_ranked_by_time_with_ties_in_arrival_order(self):
+        guess = self.state.submit_movie_guess
+        assert guess("Alice", "Grease", 1003.0)["rank"] == 1
+        assert guess("Bob", "grease", 1001.0)["rank"] == 1
+        assert guess("Carol", "Grease", 1003.0)["rank"] == 3
+        names = [g["name"] for g in self.state.movie_challenge.correct_guesses]
+        assert names == ["Bob", "Alice", "Carol"]
+        assert self.state.movie_challenge.get_player_bonus("Carol") == 1
+
+    def test_second_guess_rejected(self):
+        self.state.submit_movie_guess("Alice", "Fame", 1001.0)
+        result = self.state.submit_movie_guess("Alice", "Grease", 1002.0)
+        assert result == {
+            "correct": False,
+            "already_guessed": True,
+            "rank": None,
+            "bonus": 0,
+        }
+        assert self.state.movie_challenge.correct_guesses == []
+
+
+class TestRoundHighlights:
+    def test_comeback_uses_current_ranks(self):
+        state = make_game_state()
+        _create_fresh_game(state)
+        for i, name in enumerate(("Alice", "Bob", "Carol")):
+            state.add_player(name, MagicMock())
+            player = state.players[name]
+            player.score = 10 * (3 - i)
+            player.previous_rank = i + 1
+            player.submitted = True
+            player.current_guess = 1990
+            player.years_off = 5
+        state.players["Carol"].score = 100
+
+        state._record_round_highlights(1985)
+
+        comebacks = [
+            h for h in state.highlights_tracker.to_dict() if h["type"] == "comeback"
+        ]
+        assert [
+            (h["player"], h["description_params"]["positions"]) for h in comebacks
+        ] == [("Carol", "2")]
+
+
+class TestNextRoundPrefetch:
+    async def _revealed_game(self) -> GameState:
+        state = make_game_state()
+        songs = make_songs(4)
+        for song in songs:
+            song["alt_artists"] = ["Decoy A", "Decoy B"]
+        state.create_game(
+            playlists=["test.json"],
+            songs=songs,
+            media_player="",  # no media player: rounds start without playback
+            base_url="http://localhost:8123",
+        )
+        await state.start_round(MagicMock())
+        await state.end_round()
+        return state
+
+    async def test_next_round_is_prepared_during_reveal(self):
+        state = await self._revealed_game()
+        await asyncio.sleep(0.01)
+
+        prepared = state._prepared_round
+        assert state.phase == GamePhase.REVEAL
+        assert prepared is not None
+        assert prepared.song["uri"] not in state._playlist_manager.played_uris
+        assert prepared.artist_challenge is not None
+
+        await state.start_round(MagicMock())
+
+        assert state.current_song["uri"] == prepared.song["_resolved_uri"]
+        assert state.artist_challenge is prepared.artist_challenge
+        assert state._prepared_round is None
+        state.cancel_timer()
+
+    async def test_changed_settings_rebuild_challenges(self):
+        state = await self._revealed_game()
+        prepared = state.prepare_next_round()
+        state.artist_challenge_enabled = False
+
+        await state.start_round(MagicMock())
+
+        assert state.current_song["uri"] == prepared.song["_resolved_uri"]
+        assert state.artist_challenge is None
+        state.cancel_timer()
+
+    async def test_cached_album_art_skips_metadata_wait(self):
+        state = await self._revealed_game()
+        prepared = state.prepare_next_round()
+        uri = prepared.song["_resolved_uri"]
+        state._discard_prepared_round()
+        state._remember_album_art(uri, "https://art.example/cover.jpg")
+        state._playlist_manager.get_next_song = lambda: prepared.song
+        service = MagicMock()
+        service.play_song = AsyncMock(return_value=True)
+        service.verify_responsive = AsyncMock(return_value=(True, ""))
+        state._media_player_service = service
+
+        assert state.prepare_next_round().album_art == "https://art.example/cover.jpg"
+        await state.start_round(MagicMock())
+
+        assert state.current_song["album_art"] == "https://art.example/cover.jpg"
+        assert not state.metadata_pending
+        assert state._metadata_task is None
+        service.play_song.assert_awaited_once_with(prepared.song)
+        state.cancel_timer()
+
+    async def test_ended_game_drops_prepared_round(self):
+        state = await self._revealed_game()
+        state.prepare_next_round()
+
+        state.end_game()
+
+        assert state._prepared_round is None
+        assert state._prefetch_timer is None
@@ -0,0 +1,168 @@
+"""Tests for versioned state sync (custom_components/beatify/server/state_sync.py)."""
+
+from __future__ import annotations
+
+import copy
+import random
+
+import pytest
+
+from custom_components.beatify.server.state_sync import (
+    StateSync,
+    apply_state_patch,
+    diff_state,
+)
+
+
+def _state(**overrides) -> dict:
+    state = {
+        "game_id": "abc",
+        "phase": "PLAYING",
+        "deadline": None,
+        "players": [
+            {"name": "Alice", "score": 10, "submitted": False},
+            {"name": "Bob", "score": 5, "submitted": False},
+        ],
+    }
+    state.update(overrides)
+    return state
+
+
+# ---------------------------------------------------------------------------
+# diff_state / apply_state_patch
+# ---------------------------------------------------------------------------
+
+
+class TestDiffState:
+    def test_equal_values_produce_no_ops(self):
+        assert diff_state(_state(), _state()) == []
+
+    def test_single_flag_flip_is_one_op(self):
+        new = _state()
+        new["players"][1]["submitted"] = True
+        assert diff_state(_state(), new) == [["set", ["players", 1, "submitted"], True]]
+
+    def test_removed_key(self):
+        old = _state(song={"title": "x"})
+        assert diff_state(old, _state()) == [["del", ["song"]]]
+
+    def test_resized_list_replaced(self):
+        new = _state()
+        new["players"].append({"name": "Cy", "score": 0, "submitted": False})
+        ops = diff_state(_state(), new)
+        assert ops == [["set", ["players"], new["players"]]]
+
+    def test_bool_and_int_are_distinct(self):
+        assert diff_state({"a": 1}, {"a": True}) == [["set", ["a"], True]]
+
+    def test_none_value_round_trips(self):
+        old = _state(deadline=123)
+        new = _state(deadline=None)
+        assert apply_state_patch(copy.deepcopy(old), diff_state(old, new)) == new
+
+    def test_root_replacement(self):
+        assert apply_state_patch([1], diff_state([1], {"a": 1})) == {"a": 1}
+
+    @pytest.mark.parametrize("seed", range(25))
+    def test_patch_reproduces_new_state(self, seed):
+        rng = random.Random(seed)
+
+        def rand_value(depth=0):
+            kind = rng.randrange(6 if depth < 3 else 4)
+            if kind == 0:
+                return rng.randrange(5)
+            if kind == 1:
+                return rng.choice([None, True, False])
+            if kind == 2:
+                return rng.choice(["a", "b", "🔥"])
+            if kind == 3:
+                return rng.random()
+            if kind == 4:
+                return [rand_value(depth + 1) for _ in range(rng.randrange(4))]
+            return {
+                rng.choice("abcde"): rand_value(depth + 1)
+                for _ in range(rng.randrange(4))
+            }
+
+        old, new = rand_value(), rand_value()
+        patched = apply_state_patch(copy.deepcopy(old), diff_state(old, new))
+        assert patched == new
+
+
+# ---------------------------------------------------------------------------
+# StateSync
+# ---------------------------------------------------------------------------
+
+
+class TestStateSync:
+    def test_version_bumps_only_on_change(self):
+        sync = StateSync()
+        assert sync.commit(_state()) is True
+        assert sync.commit(_state()) is False
+        assert sync.version == 1
+        assert sync.commit(_state(phase="REVEAL")) is True
+        assert sync.version == 2
+
+    def test_patch_from_base(self):
+        sync = StateSync()
+        sync.commit(_state())
+        sync.commit(_state(phase="REVEAL"))
+        assert sync.patch_from(1) == [["set", ["phase"], "REVEAL"]]
+
+    def test_old_versions_evicted(self):
+        sync = StateSync(history_size=2)
+        for i in range(4):
+            sync.commit(_state(deadline=i))
+        assert sync.patch_from(1) is None
+        assert sync.has_version(3)
+
+    def test_new_game_drops_history(self):
+        sync = StateSync()
+        sync.commit(_state())
+        sync.commit(_state(game_id="other"))
+        assert sync.version == 2
+        assert sync.patch_from(1) is None
+
+    def test_snapshot_is_detached_from_live_state(self):
+        sync = StateSync()
+        live = _state()
+        sync.commit(live)
+        live["players"][0]["score"] = 999
+        assert sync.snapshot()["players"][0]["score"] == 10
+
+    def test_history_is_immutable_and_shares_unchanged_subtrees(self):
+        sync = StateSync()
+        live = _state()
+        sync.commit(live)
+        first = sync.snapshot()
+        live["players"][1]["submitted"] = True
+        sync.commit(live)
+        second = sync.snapshot()
+
+        assert first["players"][1]["submitted"] is False
+        assert second["players"][1]["submitted"] is True
+        # Only the changed path was copied
+        assert second["players"][0] is first["players"][0]
+        assert apply_state_patch(copy.deepcopy(first), sync.patch_from(1)) == second
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_patches_between_retained_versions(self, seed):
+        rng = random.Random(seed)
+        sync = StateSync(history_size=6)
+        live = _state()
+        clients = {}
+        for _ in range(10):
+            player = rng.choice(live["players"])
+            player["score"] += rng.randint(0, 1)
+            if rng.random() < 0.3:
+                live["players"].append({"name": f"P{rng.random()}", "score": 0})
+            if rng.random() < 0.3:
+                live["phase"] = rng.choice(["PLAYING", "REVEAL"])
+            if sync.commit(live):
+                clients[sync.version] = copy.deepcopy(live)
+        for version, held in clients.items():
+            if sync.has_version(version):
+                patched = apply_state_patch(
+                    copy.deepcopy(held), sync.patch_from(version)
+                )
+                assert patched == live
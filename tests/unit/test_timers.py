@@ -0,0 +1,141 @@
+"""Tests for the per-game timer service (custom_components/beatify/game/timers.py)."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+from custom_components.beatify.game.state import GamePhase, GameState
+from custom_components.beatify.game.timers import TimerService
+from tests.conftest import make_game_state, make_player, make_songs
+
+
+def _recorder(fired: list[str], name: str):
+    async def callback() -> None:
+        fired.append(name)
+
+    return callback
+
+
+async def _playing_game(time_fn=None) -> GameState:
+    state = make_game_state(time_fn)
+    state.create_game(
+        playlists=["test.json"],
+        songs=make_songs(3),
+        media_player="",  # no media player: rounds start without playback
+        base_url="http://localhost:8123",
+    )
+    state.players["P0"] = make_player("P0")
+    state.set_admin("P0")
+    await state.start_round(MagicMock())
+    return state
+
+
+class TestTimerService:
+    async def test_fires_in_deadline_order(self):
+        timers = TimerService()
+        fired: list[str] = []
+        timers.call_later(0.03, _recorder(fired, "late"), "late")
+        timers.call_later(0.01, _recorder(fired, "early"), "early")
+
+        await asyncio.sleep(0.06)
+
+        assert fired == ["early", "late"]
+        assert timers.fired == 2
+        assert timers.scheduled == 0
+
+    async def test_cancelled_timer_does_not_fire(self):
+        timers = TimerService()
+        fired: list[str] = []
+        handle = timers.call_later(0.01, _recorder(fired, "a"), "a")
+        handle.cancel()
+
+        await asyncio.sleep(0.03)
+
+        assert fired == []
+        assert not handle.pending
+
+    async def test_one_sleeping_task_for_all_timers(self):
+        timers = TimerService()
+        fired: list[str] = []
+        handles = [
+            timers.call_later(10.0, _recorder(fired, str(i)), str(i)) for i in range(20)
+        ]
+        tasks = {
+            task for task in asyncio.all_tasks() if task is not asyncio.current_task()
+        }
+
+        assert tasks == {timers._task}
+        assert timers.scheduled == 20
+        timers.cancel_all()
+        assert not any(handle.pending for handle in handles)
+
+    async def test_pause_keeps_remaining_time(self):
+        timers = TimerService()
+        fired: list[str] = []
+        handle = timers.call_later(0.05, _recorder(fired, "a"), "a")
+        await asyncio.sleep(0.02)
+
+        timers.pause(handle)
+        frozen = timers.remaining(handle)
+        await asyncio.sleep(0.06)
+
+        assert fired == []
+        assert handle.paused
+        assert timers.remaining(handle) == frozen
+        timers.resume(handle)
+        await asyncio.sleep(frozen + 0.02)
+        assert fired == ["a"]
+
+    async def test_drift_is_recorded(self):
+        timers = TimerService()
+        timers.call_later(0.01, _recorder([], "a"), "a")
+
+        await asyncio.sleep(0.03)
+
+        stats = timers.as_dict()
+        assert stats["fired"] == 1
+        assert stats["drift_last_ms"] >= 0
+        assert stats["drift_max_ms"] == stats["drift_last_ms"]
+
+
+class TestRoundTimer:
+    async def test_round_ends_when_timer_fires(self):
+        state = await _playing_game()
+        state.cancel_timer()
+        state._start_round_timer(0.01)
+
+        await asyncio.sleep(0.05)
+
+        assert state.phase == GamePhase.REVEAL
+        assert state._round_timer is None
+        assert state.timers.fired >= 1
+
+    async def test_wall_clock_step_does_not_end_round(self):
+        now = [1_000_000.0]
+        state = await _playing_game(lambda: now[0])
+
+        # NTP steps the host clock an hour forward
+        now[0] += 3600
+        await asyncio.sleep(0.01)
+
+        assert state.phase == GamePhase.PLAYING
+        assert not state.is_deadline_passed()
+        state.cancel_timer()
+
+    async def test_pause_and_resume_keep_round_time(self):
+        now = [1_000_000.0]
+        state = await _playing_game(lambda: now[0])
+        remaining = state.timers.remaining(state._round_timer)
+
+        await state.pause_game("admin")
+        paused_remaining = state._round_timer.remaining
+        now[0] += 120  # paused for two minutes
+        await state.resume_game()
+
+        assert state.phase == GamePhase.PLAYING
+        assert state._round_timer.pending and not state._round_timer.paused
+        assert state.timers.remaining(state._round_timer) <= remaining
+        assert 0 < paused_remaining <= remaining
+        assert state.deadline == int((now[0] + paused_remaining) * 1000)
+        state.cancel_timer()
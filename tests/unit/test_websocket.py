@@ -0,0 +1,563 @@
+"""Tests for the Beatify WebSocket handler (custom_components/beatify/server/websocket.py)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from aiohttp import WSMsgType, web
+from aiohttp.test_utils import TestClient, TestServer
+
+from custom_components.beatify.const import (
+    LARGE_ROOM_VISIBLE_PLAYERS,
+    LEADERBOARD_TOP_K,
+)
+from custom_components.beatify.game.state import GamePhase
+from custom_components.beatify.server import codec
+from custom_components.beatify.server.codec import json_dumps
+from custom_components.beatify.server.state_sync import apply_state_patch
+from custom_components.beatify.server.websocket import BeatifyWebSocketHandler
+from custom_components.beatify.services.game_store import OP_GUESS
+from tests.conftest import make_game_state, make_songs
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+class FakeWriter:
+    """Stand-in for aiohttp's WebSocketWriter (only the compress level)."""
+
+    def __init__(self, compress: int) -> None:
+        self.compress = compress
+
+
+class FakeWebSocket:
+    """Minimal stand-in for aiohttp's WebSocketResponse."""
+
+    def __init__(self, fail: bool = False, compress: int = 0) -> None:
+        self.closed = False
+        self.fail = fail
+        self.compress = compress
+        self._writer = FakeWriter(compress)
+        self.sent: list[str | bytes] = []
+        # Writer compress level in effect for each sent frame
+        self.sent_compress: list[int] = []
+
+    async def send_str(self, data: str) -> None:
+        if self.fail:
+            raise ConnectionResetError("socket gone")
+        self.sent.append(data)
+        self.sent_compress.append(getattr(self._writer, "compress", self.compress))
+
+    async def send_bytes(self, data: bytes) -> None:
+        await self.send_str(data)
+
+    async def send_json(self, data: dict) -> None:
+        await self.send_str(json.dumps(data))
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def make_handler() -> BeatifyWebSocketHandler:
+    """Create a handler with an empty hass.data."""
+    hass = MagicMock()
+    hass.data = {}
+    return BeatifyWebSocketHandler(hass)
+
+
+# ---------------------------------------------------------------------------
+# broadcast
+# ---------------------------------------------------------------------------
+
+
+class TestBroadcast:
+    async def test_same_frame_sent_to_every_socket(self):
+        handler = make_handler()
+        sockets = [FakeWebSocket() for _ in range(3)]
+        handler.connections.update(sockets)
+
+        await handler.broadcast({"type": "song_stopped"})
+        await handler.drain_outbound()
+
+        frames = {ws.sent[0] for ws in sockets}
+        assert len(frames) == 1
+        assert json.loads(frames.pop()) == {"type": "song_stopped", "seq": 1}
+
+    async def test_returns_bytes_sent(self):
+        handler = make_handler()
+        handler.connections.update([FakeWebSocket(), FakeWebSocket()])
+        message = {"type": "player_reaction", "player_name": "Zoë", "emoji": "🔥"}
+
+        sent = await handler.broadcast(message)
+        await handler.drain_outbound()
+
+        frame_size = len(json_dumps(message).encode("utf-8"))
+        assert sent == frame_size * 2
+        assert handler.broadcast_bytes_total == sent
+        assert handler.broadcast_count == 1
+
+    async def test_closed_sockets_skipped_and_failures_counted(self):
+        handler = make_handler()
+        closed = FakeWebSocket()
+        closed.closed = True
+        ok = FakeWebSocket()
+        handler.connections.update([ok, closed, FakeWebSocket(fail=True)])
+
+        sent = await handler.broadcast({"type": "game_ended"})
+        await handler.drain_outbound()
+
+        assert sent == 2 * len(json_dumps({"type": "game_ended", "seq": 1}))
+        assert closed.sent == []
+        assert len(ok.sent) == 1
+        assert handler.outbound_stats.send_failures == 1
+
+    async def test_no_connections(self):
+        handler = make_handler()
+        assert await handler.broadcast({"type": "state"}) == 0
+
+    async def test_disconnect_stops_idle_writer(self):
+        handler = make_handler()
+        ws = FakeWebSocket()
+        handler.connections.add(ws)
+        await handler._send(ws, {"type": "song_stopped"})
+        await handler.drain_outbound()
+        queue = handler._outbound[ws]
+
+        await handler._connection_closed(ws)
+        await asyncio.sleep(0)
+
+        assert queue.closed
+        assert queue._task.done()
+
+
+# ---------------------------------------------------------------------------
+# MessagePack subprotocol
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def _require_msgpack():
+    pytest.importorskip("msgpack")
+
+
+@pytest.mark.usefixtures("_require_msgpack")
+class TestMsgpackProtocol:
+    async def test_broadcast_encodes_once_per_protocol(self):
+        handler = make_handler()
+        json_ws, bin_a, bin_b = FakeWebSocket(), FakeWebSocket(), FakeWebSocket()
+        handler.connections.update([json_ws, bin_a, bin_b])
+        handler._msgpack_sockets.update([bin_a, bin_b])
+        message = {"type": "player_reaction", "player_name": "Zoë", "emoji": "🔥"}
+
+        sent = await handler.broadcast(message)
+        await handler.drain_outbound()
+
+        assert json.loads(json_ws.sent[0]) == message
+        assert bin_a.sent[0] is bin_b.sent[0]
+        assert codec.msgpack_loads(bin_a.sent[0]) == message
+        assert sent == len(json_dumps(message).encode("utf-8")) + 2 * len(bin_a.sent[0])
+
+    async def test_direct_send_uses_negotiated_protocol(self):
+        handler = make_handler()
+        ws = FakeWebSocket()
+        handler._msgpack_sockets.add(ws)
+
+        await handler._send(ws, {"type": "pong"})
+        await handler.drain_outbound()
+
+        assert codec.msgpack_loads(ws.sent[0]) == {"type": "pong"}
+
+    async def test_state_patch_sent_as_msgpack(self):
+        handler, game, (delta_ws, legacy_ws) = make_game_handler()
+        handler._msgpack_sockets.add(delta_ws)
+        await handler.broadcast_state()
+        await handler.drain_outbound()
+        base = codec.msgpack_loads(delta_ws.sent[-1])
+        await handler._handle_state_ack(delta_ws, {"version": base["version"]})
+
+        game.players["P1"].connected = False
+        await handler.broadcast_state()
+        await handler.drain_outbound()
+
+        patch = codec.msgpack_loads(delta_ws.sent[-1])
+        assert patch["type"] == "state_patch"
+        assert json.loads(legacy_ws.sent[-1])["type"] == "state"
+        base.pop("version")
+        base.pop("seq")
+        full = json.loads(legacy_ws.sent[-1])
+        full.pop("version")
+        full.pop("seq")
+        assert apply_state_patch(base, patch["ops"]) == full
+
+    async def test_negotiation_over_real_socket(self):
+        handler = make_handler()
+        app = web.Application()
+        app.router.add_get("/ws", handler.handle)
+
+        async with TestClient(TestServer(app)) as client:
+            async with client.ws_connect("/ws", protocols=("beatify.msgpack",)) as ws:
+                assert ws.protocol == "beatify.msgpack"
+                await ws.send_bytes(codec.msgpack_dumps({"type": "join", "name": "A"}))
+                msg = await ws.receive()
+                assert msg.type == WSMsgType.BINARY
+                assert codec.msgpack_loads(msg.data)["type"] == "error"
+
+            async with client.ws_connect("/ws") as ws:
+                assert ws.protocol is None
+                await ws.send_str(json.dumps({"type": "join", "name": "A"}))
+                assert (await ws.receive_json())["type"] == "error"
+
+
+# ---------------------------------------------------------------------------
+# permessage-deflate threshold
+# ---------------------------------------------------------------------------
+
+
+class TestCompressionThreshold:
+    async def test_small_frames_skip_compression(self):
+        handler = make_handler()
+        ws = FakeWebSocket(compress=15)
+        handler.connections.add(ws)
+
+        await handler.broadcast({"type": "state_ack_ok"})
+        await handler.drain_outbound()
+
+        assert ws.sent_compress == [0]
+        assert ws._writer.compress == 15
+        assert handler.compressed_frames == 0
+        assert handler.compression_bytes_saved_estimate == 0
+
+    async def test_large_frames_compressed_and_savings_counted(self):
+        handler = make_handler()
+        sockets = [FakeWebSocket(compress=15), FakeWebSocket(compress=15)]
+        handler.connections.update(sockets)
+        message = {"type": "state", "share": ["🟩🟨⬛"] * 200}
+
+        await handler.broadcast(message)
+        await handler.drain_outbound()
+
+        assert [ws.sent_compress for ws in sockets] == [[15], [15]]
+        assert handler.compressed_frames == 2
+        saved_per_frame = handler.compression_bytes_saved_estimate // 2
+        assert 0 < saved_per_frame < len(json_dumps(message).encode("utf-8"))
+        assert handler.compression_bytes_saved_estimate == saved_per_frame * 2
+
+    async def test_uncompressed_client_untouched(self):
+        handler = make_handler()
+        ws = FakeWebSocket()
+        handler.connections.add(ws)
+
+        await handler.broadcast({"type": "state", "share": ["x"] * 2000})
+        await handler.drain_outbound()
+
+        assert ws.sent_compress == [0]
+        assert handler.compressed_frames == 0
+
+    async def test_writer_restored_after_failed_send(self):
+        handler = make_handler()
+        ws = FakeWebSocket(fail=True, compress=15)
+        handler.connections.add(ws)
+
+        await handler.broadcast({"type": "pong"})
+        await handler.drain_outbound()
+
+        assert handler.outbound_stats.send_failures == 1
+        assert ws._writer.compress == 15
+
+    async def test_writer_without_level_sends_normally(self):
+        handler = make_handler()
+        ws = FakeWebSocket(compress=15)
+        ws._writer = object()
+        handler.connections.add(ws)
+
+        await handler.broadcast({"type": "pong"})
+        await handler.drain_outbound()
+
+        assert [json.loads(frame)["type"] for frame in ws.sent] == ["pong"]
+        assert handler.outbound_stats.send_failures == 0
+
+    async def test_small_frames_unflagged_on_the_wire(self):
+        # Pins the aiohttp internals _send_uncompressed relies on: if the
+        # writer's level stops controlling compression, the tiny frame
+        # arrives with RSV1 (compressed) set and this fails
+        handler = make_handler()
+        handler.compress_threshold = 64
+        app = web.Application()
+        app.router.add_get("/ws", handler.handle)
+        big = {"type": "bulk", "rows": ["repetitive payload"] * 100}
+
+        async with TestServer(app) as server:
+            reader, writer = await asyncio.open_connection(server.host, server.port)
+            writer.write(
+                b"GET /ws HTTP/1.1\r\n"
+                b"Host: localhost\r\n"
+                b"Upgrade: websocket\r\n"
+                b"Connection: Upgrade\r\n"
+                b"Sec-WebSocket-Key: dGhlIHNhbXBsZSBub25jZQ==\r\n"
+                b"Sec-WebSocket-Version: 13\r\n"
+                b"Sec-WebSocket-Extensions: permessage-deflate\r\n\r\n"
+            )
+            headers = await reader.readuntil(b"\r\n\r\n")
+            while not handler.connections:
+                await asyncio.sleep(0)
+            await handler.broadcast({"type": "tiny"})
+            await handler.broadcast(big)
+
+            frames = []
+            while len(frames) < 2:
+                first, second = await reader.readexactly(2)
+                length = second & 0x7F
+                if length == 126:
+                    length = int.from_bytes(await reader.readexactly(2), "big")
+                elif length == 127:
+                    length = int.from_bytes(await reader.readexactly(8), "big")
+                await reader.readexactly(length)
+                if first & 0x0F == WSMsgType.TEXT:
+                    frames.append(bool(first & 0x40))
+            writer.close()
+
+        assert b"permessage-deflate" in headers
+        assert frames == [False, True]
+
+    async def test_mixed_sizes_over_real_socket(self):
+        handler = make_handler()
+        handler.compress_threshold = 64
+        app = web.Application()
+        app.router.add_get("/ws", handler.handle)
+        big = {"type": "bulk", "rows": ["repetitive payload"] * 100}
+
+        async with (
+            TestClient(TestServer(app)) as client,
+            client.ws_connect("/ws", compress=15) as ws,
+        ):
+            await asyncio.sleep(0)
+            for _ in range(2):
+                await handler.broadcast({"type": "tiny"})
+                await handler.broadcast(big)
+            received = [await ws.receive_json() for _ in range(4)]
+
+        assert [{k: v for k, v in r.items() if k != "seq"} for r in received] == [
+            {"type": "tiny"},
+            big,
+        ] * 2
+        assert [r["seq"] for r in received] == [1, 2, 3, 4]
+        assert handler.compressed_frames == 2
+        assert handler.compression_bytes_saved_estimate > 0
+
+
+# ---------------------------------------------------------------------------
+# broadcast_state (versioned delta sync)
+# ---------------------------------------------------------------------------
+
+
+def make_game_handler(players: int = 2, **create_kwargs):
+    """Create a handler wired to a real GameState in LOBBY with N players."""
+    handler = make_handler()
+    game = make_game_state()
+    game.create_game(
+        playlists=["test.json"],
+        songs=make_songs(3),
+        media_player="media_player.test",
+        base_url="http://localhost:8123",
+        **create_kwargs,
+    )
+    sockets = []
+    for i in range(players):
+        ws = FakeWebSocket()
+        game.add_player(f"P{i}", ws)
+        sockets.append(ws)
+    handler.hass.data = {"beatify": {"game": game}}
+    handler.connections.update(sockets)
+    return handler, game, sockets
+
+
+class TestBroadcastStateDelta:
+    async def test_legacy_clients_get_full_versioned_state(self):
+        handler, _game, sockets = make_game_handler()
+
+        await handler.broadcast_state()
+        await handler.drain_outbound()
+
+        msg = json.loads(sockets[0].sent[-1])
+        assert msg["type"] == "state"
+        assert msg["version"] == 1
+        assert msg["phase"] == "LOBBY"
+
+    async def test_acked_client_gets_patch(self):
+        handler, game, (delta_ws, legacy_ws) = make_game_handler()
+        await handler.broadcast_state()
+        await handler.drain_outbound()
+        base = json.loads(delta_ws.sent[-1])
+        await handler._handle_state_ack(delta_ws, {"version": base["version"]})
+
+        game.players["P1"].connected = False
+        await handler.broadcast_state()
+        await handler.drain_outbound()
+
+        patch = json.loads(delta_ws.sent[-1])
+        full = json.loads(legacy_ws.sent[-1])
+        assert patch["type"] == "state_patch"
+        assert patch["base"] == 1
+        assert patch["version"] == 2
+        assert full["type"] == "state"
+        assert len(delta_ws.sent[-1]) < len(legacy_ws.sent[-1])
+        base.pop("version")
+        base.pop("seq")
+        full.pop("version")
+        full.pop("seq")
+        assert apply_state_patch(base, patch["ops"]) | {"type": "state"} == full
+
+    async def test_broadcast_before_ack_patches_from_acked_base(self):
+        handler, game, (delta_ws, legacy_ws) = make_game_handler()
+        await handler.broadcast_state()
+        await handler.drain_outbound()
+        base = json.loads(delta_ws.sent[-1])
+        await handler._handle_state_ack(delta_ws, {"version": base["version"]})
+
+        game.players["P1"].connected = False
+        await handler.broadcast_state()
+        await handler.drain_outbound()
+        first = json.loads(delta_ws.sent[-1])
+        # The ack for the first patch is still in flight
+        game.players["P1"].connected = True
+        game.players["P1"].score = 7
+        await handler.broadcast_state()
+        await handler.drain_outbound()
+        second = json.loads(delta_ws.sent[-1])
+        full = json.loads(legacy_ws.sent[-1])
+
+        assert (first["base"], first["version"]) == (1, 2)
+        assert (second["base"], second["version"]) == (1, 3)
+        for msg in (base, full):
+            msg.pop("version")
+            msg.pop("seq")
+        assert apply_state_patch(base, second["ops"]) | {"type": "state"} == full
+
+    async def test_up_to_date_client_skipped_when_unchanged(self):
+        handler, _game, (delta_ws, legacy_ws) = make_game_handler()
+        await handler.broadcast_state()
+        await handler.drain_outbound()
+        await handler._handle_state_ack(delta_ws, {"version": 1})
+
+        await handler.broadcast_state()
+        await handler.drain_outbound()
+
+        assert len(delta_ws.sent) == 1
+        assert len(legacy_ws.sent) == 2
+
+    async def test_invalid_ack_ignored(self):
+        handler, _game, (ws, _) = make_game_handler()
+        await handler.broadcast_state()
+        await handler.drain_outbound()
+        await handler._handle_state_ack(ws, {"version": 99})
+        await handler._handle_state_ack(ws, {"version": "1"})
+        assert ws not in handler._state_acks
+
+
+class TestLargeRoomBroadcast:
+    async def test_hidden_players_get_own_entry_once(self):
+        handler, game, sockets = make_game_handler(
+            LARGE_ROOM_VISIBLE_PLAYERS + 2, large_room=True
+        )
+        for i, player in enumerate(game.players.values()):
+            player.score = 100 - i
+        hidden_ws, visible_ws = sockets[-1], sockets[0]
+
+        await handler.broadcast_state()
+        await handler.drain_outbound()
+
+        entry, state = (json.loads(frame) for frame in hidden_ws.sent)
+        assert entry == {"type": "player_entry", "entry": game.get_players_state()[-1]}
+        assert state["type"] == "state"
+        assert state["players_trimmed"] is True
+        assert len(state["players"]) == LARGE_ROOM_VISIBLE_PLAYERS
+        assert [json.loads(f)["type"] for f in visible_ws.sent] == ["state"]
+
+        # Unchanged entry is not resent; a changed one is
+        game.players["P0"].streak = 2
+        await handler.broadcast_state()
+        await handler.drain_outbound()
+        assert [json.loads(f)["type"] for f in hidden_ws.sent[2:]] == ["state"]
+
+        game.players[f"P{len(sockets) - 1}"].submitted = True
+        await handler.broadcast_state()
+        await handler.drain_outbound()
+        assert [json.loads(f)["type"] for f in hidden_ws.sent[3:]] == [
+            "player_entry",
+            "state",
+        ]
+
+    async def test_low_ranked_players_get_rank_message_on_change(self):
+        handler, game, sockets = make_game_handler(
+            LARGE_ROOM_VISIBLE_PLAYERS + 2, large_room=True
+        )
+        for i, player in enumerate(game.players.values()):
+            player.score = 100 - i
+        game.phase = GamePhase.PLAYING
+        top_ws, low_ws = sockets[0], sockets[-1]
+
+        await handler.broadcast_state()
+        await handler.drain_outbound()
+
+        frames = [json.loads(frame) for frame in low_ws.sent]
+        assert [f["type"] for f in frames] == ["player_entry", "player_rank", "state"]
+        assert frames[1]["rank"] == len(sockets)
+        assert frames[1]["above"]["name"] == f"P{len(sockets) - 2}"
+        assert len(frames[2]["leaderboard"]) == LEADERBOARD_TOP_K
+        assert frames[2]["leaderboard_stats"]["players"] == len(sockets)
+        assert [json.loads(f)["type"] for f in top_ws.sent] == ["state"]
+
+        # Only the rank changed: the player list entry is not resent
+        game.players[f"P{len(sockets) - 2}"].score = 0
+        await handler.broadcast_state()
+        await handler.drain_outbound()
+        frames = [json.loads(frame) for frame in low_ws.sent[3:]]
+        assert [f["type"] for f in frames] == ["player_rank", "state"]
+        assert frames[0]["rank"] == len(sockets) - 1
+
+    async def test_spectators_get_full_player_list(self):
+        handler, game, _sockets = make_game_handler(
+            LARGE_ROOM_VISIBLE_PLAYERS + 2, large_room=True
+        )
+        published = []
+
+        async def publish(state):
+            published.append(state)
+
+        handler.spectators.publish = publish
+        await handler.broadcast_state()
+        await handler.drain_outbound()
+
+        assert len(published[0]["players"]) == len(game.players)
+        assert "players_trimmed" not in published[0]
+
+
+class TestGameStoreHooks:
+    async def test_broadcast_offers_state_to_store(self):
+        handler, game, _sockets = make_game_handler()
+        store = MagicMock()
+        handler.set_game_store(store)
+
+        await handler.broadcast_state()
+        await handler.drain_outbound()
+
+        store.note_state.assert_called_once_with(game)
+
+    async def test_submission_is_logged(self):
+        handler, game, sockets = make_game_handler()
+        store = MagicMock()
+        handler.set_game_store(store)
+        game.phase = GamePhase.PLAYING
+
+        await handler._handle_submit(sockets[1], {"year": 1990, "bet": True}, game)
+        await handler.drain_outbound()
+
+        store.append.assert_called_once()
+        op, player = store.append.call_args.args
+        assert (op, player) == (OP_GUESS, "P1")
+        assert store.append.call_args.kwargs["year"] == 1990
+        assert store.append.call_args.kwargs["bet"] is True
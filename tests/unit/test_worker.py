@@ -0,0 +1,269 @@
+"""Tests for per-room worker event loops (custom_components/beatify/server/worker.py)."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from functools import partial
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from custom_components.beatify.game.state import GamePhase
+from custom_components.beatify.server.rooms import GameRegistry, create_room
+from custom_components.beatify.server.worker import HassBridge, HomeProxy, RoomWorker
+from tests.conftest import make_songs
+from tests.unit.test_websocket import FakeWebSocket
+
+
+class ThreadRecordingSocket(FakeWebSocket):
+    """Fake socket that remembers which thread wrote each frame."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.threads: set[int] = set()
+
+    async def send_str(self, data: str) -> None:
+        self.threads.add(threading.get_ident())
+        await super().send_str(data)
+
+
+class ThreadRecordingWriter:
+    """Fake writer that remembers which thread changed its compress level."""
+
+    def __init__(self, compress: int) -> None:
+        self._compress = compress
+        self.threads: set[int] = set()
+
+    @property
+    def compress(self) -> int:
+        return self._compress
+
+    @compress.setter
+    def compress(self, level: int) -> None:
+        self.threads.add(threading.get_ident())
+        self._compress = level
+
+
+class SharedService:
+    """Stand-in for a service owned by Home Assistant's loop."""
+
+    def __init__(self) -> None:
+        self.threads: list[int] = []
+        self.count = 7
+        self.child = None
+
+    def record(self, value: int) -> int:
+        self.threads.append(threading.get_ident())
+        return value * 2
+
+    async def record_async(self, value: int) -> int:
+        self.threads.append(threading.get_ident())
+        await asyncio.sleep(0)
+        return value + 1
+
+
+def _make_hass() -> MagicMock:
+    hass = MagicMock()
+    hass.data = {}
+    hass.loop = asyncio.get_running_loop()
+    hass.services.async_call = AsyncMock()
+    return hass
+
+
+@pytest.fixture
+async def worker():
+    room_worker = RoomWorker("test_worker", asyncio.get_running_loop())
+    room_worker.start()
+    yield room_worker
+    await room_worker.async_stop()
+
+
+class TestRoomWorker:
+    async def test_runs_on_worker_thread(self, worker):
+        async def where() -> int:
+            await asyncio.sleep(0)
+            return threading.get_ident()
+
+        assert await worker.run(where) != threading.get_ident()
+        assert await worker.run(lambda: 41 + 1) == 42
+        assert worker.calls == 2
+
+    async def test_exceptions_propagate(self, worker):
+        def fail() -> None:
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            await worker.run(fail)
+
+    async def test_call_home_runs_on_home_thread(self, worker):
+        home = threading.get_ident()
+
+        async def on_worker() -> int:
+            return await worker.call_home(threading.get_ident)
+
+        assert await worker.run(on_worker) == home
+        assert worker.home_calls == 1
+
+    async def test_busy_worker_does_not_stall_home_loop(self, worker):
+        def busy() -> None:
+            # Pure Python work holding the interpreter
+            deadline = time.monotonic() + 0.3
+            while time.monotonic() < deadline:
+                pass
+
+        ticks = 0
+
+        async def tick() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        await worker.run(busy)
+        ticker.cancel()
+
+        assert ticks >= 5
+
+    async def test_stopped_worker_rejects_calls(self):
+        room_worker = RoomWorker("stopped", asyncio.get_running_loop())
+        with pytest.raises(RuntimeError):
+            await room_worker.run(lambda: None)
+
+
+class TestHomeProxy:
+    async def test_methods_run_on_home_thread(self, worker):
+        service = SharedService()
+        proxy = HomeProxy(service, worker)
+
+        async def use() -> tuple[int, int, int]:
+            return proxy.record(4), await proxy.record_async(4), proxy.count
+
+        assert await worker.run(use) == (8, 5, 7)
+        assert service.threads == [threading.get_ident()] * 2
+
+    async def test_objects_are_proxied(self, worker):
+        service = SharedService()
+        service.child = SharedService()
+        proxy = HomeProxy(service, worker)
+
+        assert isinstance(proxy.child, HomeProxy)
+        assert await worker.run(lambda: proxy.child.record(1)) == 2
+        assert service.child.threads == [threading.get_ident()]
+
+    async def test_service_calls_cross_to_home_loop(self, worker):
+        hass = _make_hass()
+        bridge = HassBridge(hass, worker)
+
+        await worker.run(bridge.services.async_call, "media_player", "media_stop", {})
+
+        hass.services.async_call.assert_awaited_once_with(
+            "media_player", "media_stop", {}
+        )
+        assert bridge.data is hass.data
+
+
+class TestWorkerRoom:
+    async def test_room_engine_runs_on_worker(self):
+        hass = _make_hass()
+        room = create_room(hass, worker_name="test_room")
+        handler, game = room.ws_handler, room.game
+        try:
+            create = partial(
+                game.create_game,
+                playlists=["test.json"],
+                songs=make_songs(3),
+                media_player="",  # no media player: rounds start without playback
+                base_url="http://localhost:8123",
+            )
+            await handler.run_in_room(create)
+            await handler.run_in_room(game.start_round, handler.hass)
+
+            assert game.phase == GamePhase.PLAYING
+            assert game.timers._task.get_loop() is room.worker.loop
+            await handler.run_in_room(game.cancel_timer)
+        finally:
+            await room.worker.async_stop()
+
+    async def test_frames_are_written_on_home_loop(self):
+        hass = _make_hass()
+        room = create_room(hass, worker_name="test_room")
+        handler = room.ws_handler
+        ws = ThreadRecordingSocket()
+        try:
+            await handler.run_in_room(handler.connections.add, ws)
+            await handler.run_in_room(handler.broadcast, {"type": "song_stopped"})
+            await handler.run_in_room(handler.drain_outbound)
+
+            assert len(ws.sent) == 1
+            assert ws.threads == {threading.get_ident()}
+            assert handler.diagnostics()["worker"]["home_calls"] >= 1
+        finally:
+            await room.worker.async_stop()
+
+    async def test_uncompressed_frames_toggle_writer_on_home_loop(self):
+        hass = _make_hass()
+        room = create_room(hass, worker_name="test_room")
+        handler = room.ws_handler
+        ws = ThreadRecordingSocket()
+        ws.compress = 15
+        ws._writer = ThreadRecordingWriter(15)
+        try:
+            await handler.run_in_room(handler.connections.add, ws)
+            await handler.run_in_room(handler.broadcast, {"type": "song_stopped"})
+            await handler.run_in_room(handler.drain_outbound)
+
+            assert ws.sent_compress == [0]
+            assert ws._writer.compress == 15
+            assert ws._writer.threads == {threading.get_ident()}
+        finally:
+            await room.worker.async_stop()
+
+    async def test_join_over_real_socket(self):
+        hass = _make_hass()
+        registry = GameRegistry(hass, create_room(hass, worker_name="test_room"))
+        room = registry.default
+        create = partial(
+            room.game.create_game,
+            playlists=["test.json"],
+            songs=make_songs(3),
+            media_player="",
+            base_url="http://localhost:8123",
+        )
+        await room.ws_handler.run_in_room(create)
+        app = web.Application()
+        app.router.add_get("/ws", registry.handle_ws)
+
+        try:
+            async with (
+                TestClient(TestServer(app)) as client,
+                client.ws_connect(f"/ws?game={room.game.game_id}") as ws,
+            ):
+                await ws.send_json({"type": "join", "name": "Alice"})
+                messages = [await ws.receive_json() for _ in range(2)]
+
+            assert {m["type"] for m in messages} >= {"join_ack"}
+            assert "Alice" in room.game.players
+        finally:
+            await registry.async_shutdown()
+
+    async def test_registry_opens_worker_rooms(self):
+        hass = _make_hass()
+        registry = GameRegistry(hass, create_room(hass), workers=True)
+        registry.default.game.create_game(
+            playlists=["test.json"],
+            songs=make_songs(3),
+            media_player="media_player.a",
+            base_url="http://localhost:8123",
+        )
+
+        room = registry.open_room()
+
+        assert room.worker is not None and room.worker.running
+        assert registry.default.worker is None
+        await registry.async_shutdown()
+        assert not room.worker.running